@@ -17,7 +17,6 @@ https://110.249.223.67/publish
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def air_quality_hebei() -> pd.DataFrame:
@@ -27,6 +26,8 @@ def air_quality_hebei() -> pd.DataFrame:
     :return: city = "", 返回所有地区的数据; city="唐山市", 返回唐山市的数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "http://218.11.10.130:8080/api/hour/130000.xml"
     r = requests.get(url)
     soup = BeautifulSoup(r.content, features="xml")
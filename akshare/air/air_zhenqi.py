@@ -15,7 +15,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from py_mini_racer import MiniRacer
 
 from akshare.utils import demjson
 
@@ -112,6 +111,8 @@ def air_quality_watch_point(
     :return: 指定城市指定日期区间的观测点空气质量
     :rtype: pandas.DataFrame
     """
+    from py_mini_racer import MiniRacer
+
     start_date = "-".join([start_date[:4], start_date[4:6], start_date[6:]])
     end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
     url = "https://www.zq12369.com/api/zhenqiapi.php"
@@ -159,6 +160,8 @@ def air_quality_hist(
     :return: 指定城市和数据频率下在指定时间段内的空气质量数据
     :rtype: pandas.DataFrame
     """
+    from py_mini_racer import MiniRacer
+
     start_date = "-".join([start_date[:4], start_date[4:6], start_date[6:]])
     end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
     url = "https://www.zq12369.com/api/newzhenqiapi.php"
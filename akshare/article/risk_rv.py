@@ -10,7 +10,6 @@ import json
 import pandas as pd
 import requests
 import urllib3
-from bs4 import BeautifulSoup
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -61,6 +60,8 @@ def article_oman_rv(symbol: str = "FTSE", index: str = "rk_th2") -> pd.DataFrame
     | .STI      | Straits Times Index                       | January 03, 2000   | November 28, 2019 |
     | .STOXX50E | EURO STOXX 50                             | January 03, 2000   | November 28, 2019 |
     """
+    from bs4 import BeautifulSoup
+
     url = "https://realized.oxford-man.ox.ac.uk/theme/js/visualization-data.js?20191111113154"
     res = requests.get(url)
     soup = BeautifulSoup(res.text, "lxml")
@@ -87,6 +88,8 @@ def article_oman_rv_short(symbol: str = "FTSE") -> pd.DataFrame:
 
     The volatility data can be visually explored. We make the complete up-to-date dataset available for download. Lists of assets covered and realized measures available are also available.
     """
+    from bs4 import BeautifulSoup
+
     url = "https://realized.oxford-man.ox.ac.uk/theme/js/front-page-chart.js"
     headers = {
         "Accept": "*/*",
@@ -151,6 +154,8 @@ def article_rlab_rv(symbol: str = "39693") -> pd.DataFrame:
     4. “The Distribution of Exchange Rate Volatility”, by Torben Andersen, Tim Bollerslev, Francis X. Diebold, and Paul Labys. Journal of the American Statistical Association, 96 (2001), 42-55.
     5. “Econometric Analysis of Realized Volatility and Its Use in Estimating Stochastic Volatility Models”, by Ole E Barndorff‐Nielsen and Neil Shephard. Journal of the Royal Statistical Society: Series B, 64 (2002), 253-280.
     """
+    from bs4 import BeautifulSoup
+
     print("由于服务器在国外, 请稍后, 如果访问失败, 请使用代理工具")
     url = "https://dachxiu.chicagobooth.edu/data.php"
     payload = {"ticker": symbol}
@@ -8,7 +8,6 @@ http://webapi.cninfo.com.cn/#/thematicStatistics
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
 
@@ -40,6 +39,8 @@ def bond_treasure_issue_cninfo(
     :return: 国债发行
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1120"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
@@ -136,6 +137,8 @@ def bond_local_government_issue_cninfo(
     :return: 地方债发行
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1121"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
@@ -232,6 +235,8 @@ def bond_corporate_issue_cninfo(
     :return: 企业债发行
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1122"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
@@ -332,6 +337,8 @@ def bond_cov_issue_cninfo(
     :return: 可转债发行
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1123"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
@@ -485,6 +492,8 @@ def bond_cov_stock_issue_cninfo() -> pd.DataFrame:
     :return: 可转债转股
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1124"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
@@ -10,7 +10,6 @@ import datetime
 import re
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.bond.cons import (
@@ -21,7 +20,12 @@ from akshare.bond.cons import (
 )
 from akshare.stock.cons import hk_js_decode
 from akshare.utils import demjson
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.func import (
+    em_filter_rows,
+    em_kline_range,
+    em_time_window,
+    fetch_paginated_data,
+)
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -71,6 +75,8 @@ def bond_zh_hs_cov_daily(symbol: str = "sh010107") -> pd.DataFrame:
     :return: 指定沪深可转债代码的日 K 线数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     r = requests.get(
         zh_sina_bond_hs_cov_hist_url.format(
             symbol, datetime.datetime.now().strftime("%Y_%m_%d")
@@ -151,6 +157,7 @@ def bond_zh_hs_cov_min(
     :return: 分时行情
     :rtype: pandas.DataFrame
     """
+    start_key, end_key = em_time_window(start_date, end_date)
     market_type = {"sh": "1", "sz": "0"}
     if period == "1":
         url = "https://push2.eastmoney.com/api/qt/stock/trends2/get"
@@ -166,21 +173,18 @@ def bond_zh_hs_cov_min(
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+            em_filter_rows(data_json["data"]["trends"], start_key, end_key),
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "最新价",
+            ],
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "最新价",
-        ]
-        temp_df.index = pd.to_datetime(temp_df["时间"])
-        temp_df = temp_df[start_date:end_date]
-        temp_df.reset_index(drop=True, inplace=True)
         temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
         temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
         temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
@@ -203,35 +207,35 @@ def bond_zh_hs_cov_min(
             "secid": f"{market_type[symbol[:2]]}.{symbol[2:]}",
             "klt": period,
             "fqt": adjust_map[adjust],
-            "lmt": "66",
-            "end": "20500000",
+            **em_kline_range(start_key, end_key),
             "iscca": "1",
             "fields1": "f1,f2,f3,f4,f5",
             "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
             "ut": "7eea3edcaed734bea9cbfc24409ed989",
             "forcect": "1",
         }
+        if params["beg"] == "0":
+            # 未指定开始时间时只请求最近的 66 根 K 线
+            del params["beg"]
+            params["lmt"] = "66"
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+            em_filter_rows(data_json["data"]["klines"], start_key, end_key),
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
-        temp_df.index = pd.to_datetime(temp_df["时间"])
-        temp_df = temp_df[start_date:end_date]
-        temp_df.reset_index(drop=True, inplace=True)
         temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
         temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
         temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
@@ -11,7 +11,6 @@ import re
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.bond.cons import (
     zh_sina_bond_hs_count_url,
@@ -124,6 +123,8 @@ def bond_zh_hs_daily(symbol: str = "sh010107") -> pd.DataFrame:
     :return: 指定沪深债券代码的日 K 线数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     r = requests.get(
         zh_sina_bond_hs_hist_url.format(
             symbol, datetime.datetime.now().strftime("%Y_%m_%d")
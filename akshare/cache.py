@@ -0,0 +1,380 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 接口结果缓存
+按规范化后的调用参数缓存接口返回的数据, 不同类型的接口使用不同的有效期:
+realtime    实时行情, 有效期为数秒
+intraday    分时行情, 有效期为一个 K 线周期
+historical  历史行情, 结束日期早于今天的数据不再变化, 永久有效; 前复权数据每日更新
+daily       每个交易日更新一次的数据
+缓存默认关闭, 通过 akshare.cache.enable() 开启, 例如:
+import akshare as ak
+ak.cache.enable(policy={"realtime": 3, "stock_zh_a_spot_em": 10}, backend="memory")
+"""
+
+import datetime
+import functools
+import hashlib
+import inspect
+import json
+import pathlib
+import pickle
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+# 各类接口的默认有效期, 单位: 秒; None 表示永久有效
+DEFAULT_POLICY = {
+    "realtime": 3,
+    "intraday": 60,
+    "historical": 300,
+    "daily": 3600,
+}
+
+_state = {
+    "enabled": False,
+    "policy": {},
+    "store": None,
+}
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+class MemoryStore:
+    """
+    内存缓存, 按数据占用的字节数做 LRU 淘汰
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires, size = item
+            if expires is not None and expires < time.time():
+                del self._data[key]
+                self.current_bytes -= size
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, expires: Optional[float]) -> None:
+        size = _size_of(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self.current_bytes -= self._data.pop(key)[2]
+            self._data[key] = (value, expires, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes and self._data:
+                _, (_, _, old_size) = self._data.popitem(last=False)
+                self.current_bytes -= old_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.current_bytes = 0
+
+
+class DiskStore:
+    """
+    磁盘缓存, 数据框保存为 Parquet 或 Arrow IPC 文件, 其他类型的数据使用 pickle 保存
+    Arrow IPC 文件使用内存映射读取, 缓存命中时数值列不复制数据, 这些列为只读
+    Parquet 和 Arrow IPC 格式需要安装 pyarrow
+    """
+
+    def __init__(self, path: str, file_format: str = "parquet"):
+        if file_format not in ("parquet", "arrow", "pickle"):
+            raise ValueError("file_format 只能为 parquet, arrow 或 pickle")
+        if file_format != "pickle":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "Parquet 和 Arrow IPC 格式需要安装 pyarrow: pip install pyarrow"
+                )
+        self.path = pathlib.Path(path).expanduser()
+        self.file_format = file_format
+
+    def _meta_path(self, key: str) -> pathlib.Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    def get(self, key: str):
+        meta_path = self._meta_path(key)
+        if not meta_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta["expires"] is not None and meta["expires"] < time.time():
+                return None
+            data_path = meta_path.with_suffix(f".{meta['format']}")
+            if meta["format"] == "parquet":
+                return pd.read_parquet(data_path)
+            elif meta["format"] == "arrow":
+                from akshare.utils.serialize import read_arrow
+
+                return read_arrow(data_path)
+            with open(data_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def set(self, key: str, value, expires: Optional[float]) -> None:
+        from akshare.utils.cache import _atomic_write
+
+        file_format = self.file_format
+        if not isinstance(value, pd.DataFrame):
+            file_format = "pickle"
+        meta_path = self._meta_path(key)
+        data_path = meta_path.with_suffix(f".{file_format}")
+        try:
+            if file_format == "parquet":
+                data = value.to_parquet(index=True)
+            elif file_format == "arrow":
+                import pyarrow as pa
+
+                table = pa.Table.from_pandas(value)
+                sink = pa.BufferOutputStream()
+                # 文件格式可按批随机读取, 读取时使用内存映射
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+                data = sink.getvalue()
+            else:
+                data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # 部分数据框包含混合类型的字段, 无法转换为 Arrow 格式时不缓存
+            return
+        meta = {"expires": expires, "format": file_format, "created": time.time()}
+        try:
+            _atomic_write(data_path, data)
+            _atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            # Windows 下内存映射中的缓存文件不能被替换, 写入失败时不缓存, 不影响本次返回的数据
+            warnings.warn(f"缓存写入失败: {e}")
+
+    def clear(self) -> None:
+        if not self.path.exists():
+            return
+        for item in self.path.rglob("*"):
+            if item.is_file():
+                item.unlink()
+
+
+def _size_of(value) -> int:
+    """
+    估算数据占用的字节数
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+def enable(
+    policy: Dict[str, Optional[float]] = None,
+    backend: str = "memory",
+    max_bytes: int = 256 * 1024 * 1024,
+    path: str = None,
+    file_format: str = "parquet",
+) -> None:
+    """
+    开启接口结果缓存
+    :param policy: 有效期设置, 单位为秒, None 表示永久有效; 键可以是接口类型(realtime, intraday, historical, daily)或接口名称
+    :type policy: dict
+    :param backend: choice of {"memory", "disk"}
+    :type backend: str
+    :param max_bytes: 内存缓存占用的最大字节数
+    :type max_bytes: int
+    :param path: 磁盘缓存的目录; 为空时使用 AKSHARE_CACHE_DIR 下的 result 目录
+    :type path: str
+    :param file_format: 磁盘缓存的文件格式, choice of {"parquet", "arrow", "pickle"}
+    :type file_format: str
+    """
+    if backend == "memory":
+        store = MemoryStore(max_bytes=max_bytes)
+    elif backend == "disk":
+        if path is None:
+            from akshare.utils.cache import cache_root
+
+            root = cache_root()
+            if root is None:
+                raise ValueError(
+                    "请设置 path 参数, 或通过环境变量 AKSHARE_CACHE_DIR 设置缓存目录"
+                )
+            path = root / "result"
+        store = DiskStore(path=path, file_format=file_format)
+    else:
+        raise ValueError("backend 只能为 memory 或 disk")
+    _state["policy"] = dict(policy) if policy is not None else {}
+    _state["store"] = store
+    _state["enabled"] = True
+
+
+def disable() -> None:
+    """
+    关闭接口结果缓存
+    """
+    _state["enabled"] = False
+    _state["store"] = None
+
+
+def is_enabled() -> bool:
+    """
+    接口结果缓存是否开启
+    """
+    return _state["enabled"]
+
+
+def clear() -> None:
+    """
+    清空缓存数据和命中统计
+    """
+    if _state["store"] is not None:
+        _state["store"].clear()
+    with _stats_lock:
+        _stats.clear()
+
+
+def stats() -> pd.DataFrame:
+    """
+    缓存命中统计
+    :return: 各接口的命中次数、未命中次数和命中率
+    :rtype: pandas.DataFrame
+    """
+    with _stats_lock:
+        temp_df = pd.DataFrame(
+            [
+                {"name": key, "hits": value["hits"], "misses": value["misses"]}
+                for key, value in _stats.items()
+            ],
+            columns=["name", "hits", "misses"],
+        )
+    total = temp_df["hits"] + temp_df["misses"]
+    temp_df["hit_rate"] = (temp_df["hits"] / total).where(total > 0)
+    return temp_df
+
+
+def _record(name: str, hit: bool) -> None:
+    with _stats_lock:
+        item = _stats.setdefault(name, {"hits": 0, "misses": 0})
+        item["hits" if hit else "misses"] += 1
+
+
+def _normalize(value):
+    """
+    规范化调用参数, 使等价的参数得到相同的缓存键
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in sorted(value.items())}
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return repr(value)
+
+
+def _to_date_str(value) -> Optional[str]:
+    """
+    参数中的日期转换为 YYYYMMDD 格式
+    """
+    if value is None:
+        return None
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.strftime("%Y%m%d")
+    digits = "".join(item for item in str(value) if item.isdigit())
+    return digits[:8] if len(digits) >= 8 else None
+
+
+def _ttl(name: str, family: str, arguments: dict, end_date_param: str):
+    """
+    计算本次调用结果的有效期; enable 中按接口名称或接口类型设置的有效期优先
+    :return: 有效期, 单位为秒; None 表示永久有效
+    :rtype: float or None
+    """
+    policy = _state["policy"]
+    if name in policy:
+        return policy[name]
+    if family in policy:
+        return policy[family]
+    if family == "historical":
+        # 前复权价格在每次除权除息后重新计算, 历史数据也会变化, 按每日更新处理
+        if str(arguments.get("adjust", "")).startswith("qfq"):
+            return DEFAULT_POLICY["daily"]
+        end_date = _to_date_str(arguments.get(end_date_param))
+        today = datetime.date.today().strftime("%Y%m%d")
+        if end_date is not None and end_date < today:
+            return None
+    if family == "intraday":
+        period = str(arguments.get("period", ""))
+        if period.isdigit():
+            return int(period) * 60
+    return DEFAULT_POLICY.get(family, DEFAULT_POLICY["daily"])
+
+
+def cached(family: str = "daily", end_date_param: str = "end_date") -> Callable:
+    """
+    接口结果缓存装饰器; 缓存关闭时直接调用原接口
+    :param family: 接口类型, choice of {"realtime", "intraday", "historical", "daily"}
+    :type family: str
+    :param end_date_param: historical 类型接口表示结束日期的参数名
+    :type end_date_param: str
+    :return: 装饰器
+    :rtype: callable
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        name = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            store = _state["store"]
+            if not _state["enabled"] or store is None:
+                return func(*args, **kwargs)
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                return func(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            key_source = json.dumps(
+                [func.__module__, name, _normalize(arguments)],
+                ensure_ascii=False,
+                sort_keys=True,
+            )
+            key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+            value = store.get(key)
+            if value is not None:
+                _record(name, hit=True)
+                return value.copy() if hasattr(value, "copy") else value
+            _record(name, hit=False)
+            value = func(*args, **kwargs)
+            if value is None or (isinstance(value, pd.DataFrame) and value.empty):
+                return value
+            ttl = _ttl(name, family, arguments, end_date_param)
+            expires = None if ttl is None else time.time() + ttl
+            store.set(key, value.copy() if hasattr(value, "copy") else value, expires)
+            return value
+
+        wrapper.cache_family = family
+        return wrapper
+
+    return decorator
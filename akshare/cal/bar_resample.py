@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: K 线周期转换
+由日线合成周线、月线, 由 1 分钟线合成 5、15、30、60 分钟线和日线, 同一份行情数据可以得到所有周期,
+无需按周期分别请求 stock_zh_a_hist, index_zh_a_hist, fund_etf_hist_em, futures_hist_em 和 *_hist_min_em
+分钟线按交易时段划分: A 股午间休市, 期货夜盘和上午小节休息不计入 K 线时长, 夜盘归属下一个交易日;
+周线和月线按交易日所在的自然周和自然月划分, 长假所在的周只包含实际的交易日, 以周内最后一个交易日为日期
+例如:
+import akshare as ak
+daily_df = ak.stock_zh_a_hist(symbol="000001", period="daily", adjust="qfq")
+weekly_df = ak.bar_resample(daily_df, period="weekly")
+monthly_df = ak.bar_resample(daily_df, period="monthly")
+"""
+
+import datetime
+from typing import List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# 各类品种的连续交易时段, 按交易日内的先后顺序排列; 夜盘可以跨过零点, 如 ("21:00", "02:30")
+BAR_SESSIONS = {
+    "stock": [("09:30", "11:30"), ("13:00", "15:00")],
+    "futures": [
+        ("21:00", "23:00"),
+        ("09:00", "10:15"),
+        ("10:30", "11:30"),
+        ("13:30", "15:00"),
+    ],
+    "futures_day": [("09:00", "10:15"), ("10:30", "11:30"), ("13:30", "15:00")],
+    "futures_cffex": [("09:30", "11:30"), ("13:00", "15:00")],
+    "futures_bond": [("09:30", "11:30"), ("13:00", "15:15")],
+}
+
+# 交易日从前一个自然日的 18:00 开始, 夜盘属于下一个交易日
+_DAY_START = 18 * 60
+
+_TIME_COLUMNS = ["时间", "日期", "datetime", "date"]
+_FIRST_COLUMNS = ["开盘", "open"]
+_CLOSE_COLUMNS = ["收盘", "close"]
+_HIGH_COLUMNS = ["最高", "high"]
+_LOW_COLUMNS = ["最低", "low"]
+_SUM_COLUMNS = ["成交量", "成交额", "换手率", "volume", "amount", "turnover"]
+_CHANGE_COLUMNS = ["涨跌额", "涨跌", "change"]
+_PCT_COLUMNS = ["涨跌幅", "pct_change"]
+_AMPLITUDE_COLUMNS = ["振幅", "amplitude"]
+_AVG_COLUMNS = ["均价", "avg_price"]
+
+
+def _find_column(columns, candidates: List[str]):
+    """
+    返回 candidates 中第一个存在于 columns 的字段, 不存在时返回 None
+    """
+    for item in candidates:
+        if item in columns:
+            return item
+    return None
+
+
+def _session_arrays(sessions: List[Tuple[str, str]]) -> Tuple[np.ndarray, ...]:
+    """
+    交易时段转换为以交易日开始时刻为原点的分钟数
+    :param sessions: 交易时段, e.g., [("09:30", "11:30"), ("13:00", "15:00")]
+    :type sessions: list
+    :return: 各时段的开始时刻, 时长, 之前各时段的累计时长, 全天总时长
+    :rtype: tuple
+    """
+    start_list = []
+    length_list = []
+    for start, end in sessions:
+        start_minute = (_clock_minute(start) - _DAY_START) % 1440
+        end_minute = (_clock_minute(end) - _DAY_START) % 1440
+        start_list.append(start_minute)
+        length_list.append(end_minute - start_minute)
+    starts = np.array(start_list, dtype="int64")
+    lengths = np.array(length_list, dtype="int64")
+    if (lengths <= 0).any() or (np.diff(starts) <= 0).any():
+        raise ValueError("交易时段需按时间先后排列, 且每个时段的结束时刻晚于开始时刻")
+    cum_before = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    return starts, lengths, cum_before, int(lengths.sum())
+
+
+def _clock_minute(value: str) -> int:
+    """
+    HH:MM 格式的时刻转换为零点起的分钟数
+    """
+    hour, minute = value.split(":")
+    return int(hour) * 60 + int(minute)
+
+
+def _has_night_session(sessions: List[Tuple[str, str]]) -> bool:
+    """
+    交易时段是否包含夜盘
+    """
+    return any(
+        _clock_minute(start) >= _DAY_START or _clock_minute(end) < 6 * 60
+        for start, end in sessions
+    )
+
+
+def _trading_day(ts: pd.Series, night: bool) -> pd.Series:
+    """
+    计算每根 K 线所属的交易日; 有夜盘时, 夜盘和零点后的交易属于下一个交易日
+    :param ts: K 线时间
+    :type ts: pandas.Series
+    :param night: 是否包含夜盘
+    :type night: bool
+    :return: 交易日
+    :rtype: pandas.Series
+    """
+    if not night:
+        return ts.dt.normalize()
+    from akshare.futures.cons import get_calendar
+
+    shifted = (ts + pd.Timedelta(minutes=1440 - _DAY_START)).dt.normalize()
+    trade_days = np.sort(
+        pd.to_datetime(pd.Series(get_calendar()), format="%Y%m%d")
+        .to_numpy()
+        .astype("datetime64[ns]")
+    )
+    shifted_values = shifted.to_numpy().astype("datetime64[ns]")
+    pos = np.searchsorted(trade_days, shifted_values, side="left")
+    in_calendar = pos < len(trade_days)
+    # 交易日历未覆盖的日期按工作日处理, 周五夜盘属于下周一
+    weekdays = np.busday_offset(
+        shifted_values.astype("datetime64[D]"), 0, roll="forward"
+    ).astype("datetime64[ns]")
+    day = np.where(
+        in_calendar, trade_days[np.minimum(pos, len(trade_days) - 1)], weekdays
+    )
+    return pd.Series(day, index=ts.index)
+
+
+def _format_like(values: pd.Series, sample, with_time: bool) -> pd.Series:
+    """
+    按原始数据的时间格式输出 K 线时间
+    :param values: K 线时间
+    :type values: pandas.Series
+    :param sample: 原始数据中的时间
+    :type sample: object
+    :param with_time: 是否包含时分
+    :type with_time: bool
+    :return: 与原始数据格式一致的 K 线时间
+    :rtype: pandas.Series
+    """
+    if isinstance(sample, str):
+        if not with_time:
+            return values.dt.strftime("%Y%m%d" if sample.isdigit() else "%Y-%m-%d")
+        return values.dt.strftime(
+            "%Y-%m-%d %H:%M" if len(sample) == 16 else "%Y-%m-%d %H:%M:%S"
+        )
+    if isinstance(sample, datetime.date) and not isinstance(
+        sample, datetime.datetime
+    ):
+        return values.dt.date
+    return values
+
+
+def bar_resample(
+    bar_df: pd.DataFrame,
+    period: str = "weekly",
+    sessions: Union[str, List[Tuple[str, str]]] = "stock",
+    time_column: str = None,
+    symbol_column: str = None,
+) -> pd.DataFrame:
+    """
+    K 线周期转换
+    开盘取第一根, 收盘取最后一根, 最高和最低取极值, 成交量、成交额和换手率求和, 持仓量等其他字段取最后一根;
+    均价为周期内的成交额除以成交量; 涨跌额、涨跌幅和振幅相对上一周期的收盘价重新计算, 上一周期的收盘价优先由原始数据的涨跌额推算, 与东方财富网的口径一致
+    分钟线的时间为区间的结束时刻, 如 A 股 5 分钟线 09:35 包含 09:30 的集合竞价和 09:31-09:35, 60 分钟线为 10:30, 11:30, 14:00, 15:00
+    :param bar_df: 原始 K 线, 如 stock_zh_a_hist 返回的日线或 stock_zh_a_hist_min_em 返回的 1 分钟线; 也支持 open, high, low, close 等英文字段
+    :type bar_df: pandas.DataFrame
+    :param period: choice of {"daily", "weekly", "monthly"} 或分钟数, e.g., "5", "15", "30", "60"
+    :type period: str
+    :param sessions: 交易时段, BAR_SESSIONS 中的名称 {"stock", "futures", "futures_day", "futures_cffex", "futures_bond"} 或交易时段列表, 只影响分钟线和夜盘的划分
+    :type sessions: str or list
+    :param time_column: 时间字段; 为空时依次查找 时间, 日期, datetime, date
+    :type time_column: str
+    :param symbol_column: 代码字段; 为空时按单个品种计算
+    :type symbol_column: str
+    :return: 转换后的 K 线, 字段与原始数据一致
+    :rtype: pandas.DataFrame
+    """
+    period = str(period)
+    if period not in ("daily", "weekly", "monthly") and not (
+        period.isdigit() and int(period) > 0
+    ):
+        raise ValueError("period 只能为 daily, weekly, monthly 或分钟数")
+    if bar_df.empty:
+        return bar_df.copy()
+    session_list = BAR_SESSIONS[sessions] if isinstance(sessions, str) else sessions
+    columns = bar_df.columns
+    if time_column is None:
+        time_column = _find_column(columns, _TIME_COLUMNS)
+    close_column = _find_column(columns, _CLOSE_COLUMNS)
+    if time_column is None or close_column is None:
+        raise ValueError("bar_df 需包含时间和收盘价字段")
+    change_column = _find_column(columns, _CHANGE_COLUMNS)
+    pct_column = _find_column(columns, _PCT_COLUMNS)
+    amplitude_column = _find_column(columns, _AMPLITUDE_COLUMNS)
+    high_column = _find_column(columns, _HIGH_COLUMNS)
+    low_column = _find_column(columns, _LOW_COLUMNS)
+    avg_column = _find_column(columns, _AVG_COLUMNS)
+    volume_column = _find_column(columns, ["成交量", "volume"])
+    amount_column = _find_column(columns, ["成交额", "amount"])
+    by = [symbol_column] if symbol_column is not None else []
+
+    temp_df = bar_df.reset_index(drop=True)
+    sample = temp_df[time_column].iloc[0]
+    temp_df["_ts"] = pd.to_datetime(temp_df[time_column]).astype("datetime64[ns]")
+    temp_df.sort_values(by + ["_ts"], kind="stable", inplace=True)
+    ts = temp_df["_ts"]
+    close = temp_df[close_column].astype("float64")
+    # 每根 K 线的前收盘价, 用于计算第一个周期的涨跌
+    if change_column is not None:
+        temp_df["_pre_close"] = close - temp_df[change_column].astype("float64")
+    else:
+        temp_df["_pre_close"] = np.nan
+    if pct_column is not None:
+        temp_df["_pct_pre_close"] = close / (
+            1 + temp_df[pct_column].astype("float64") / 100
+        )
+    else:
+        temp_df["_pct_pre_close"] = np.nan
+
+    # 成交额 / (成交量 * 价格) 为每手的数量乘以合约乘数, 用于将成交额 / 成交量换算为均价
+    volume_unit = np.nan
+    if (
+        avg_column is not None
+        and volume_column is not None
+        and amount_column is not None
+    ):
+        volume = temp_df[volume_column].astype("float64")
+        unit = (temp_df[amount_column].astype("float64") / (volume * close))[
+            (volume > 0) & (close > 0)
+        ].median()
+        if np.isfinite(unit) and unit > 0:
+            volume_unit = float(f"{unit:.2g}")
+
+    night = _has_night_session(session_list)
+    day = _trading_day(ts, night)
+    if period == "daily":
+        temp_df["_key"] = day
+        temp_df["_label"] = day
+    elif period == "weekly":
+        temp_df["_key"] = day - pd.to_timedelta(day.dt.weekday, unit="D")
+        temp_df["_label"] = day
+    elif period == "monthly":
+        temp_df["_key"] = day.dt.year * 100 + day.dt.month
+        temp_df["_label"] = day
+    else:
+        starts, lengths, cum_before, total = _session_arrays(session_list)
+        minute = int(period)
+        clock = ((ts.dt.hour * 60 + ts.dt.minute).to_numpy() - _DAY_START) % 1440
+        idx = np.clip(np.searchsorted(starts, clock, side="right") - 1, 0, None)
+        # 开盘前的集合竞价并入第一根 K 线, 休市时段的数据并入前一个时段的最后一根 K 线
+        within = np.clip(clock - starts[idx], 1, lengths[idx])
+        offset = cum_before[idx] + within
+        bin_index = (offset + minute - 1) // minute
+        label_offset = np.minimum(bin_index * minute, total)
+        label_session = np.searchsorted(cum_before + lengths, label_offset, side="left")
+        label_clock = starts[label_session] + label_offset - cum_before[label_session]
+        temp_df["_key"] = day.to_numpy().astype("datetime64[ns]").astype(
+            "int64"
+        ) * 10000 + bin_index.astype("int64")
+        temp_df["_label"] = ts.dt.floor("min") + pd.to_timedelta(
+            label_clock - clock, unit="min"
+        )
+
+    agg_dict = {}
+    for item in columns:
+        if item == time_column or item in by:
+            continue
+        if item in _FIRST_COLUMNS:
+            agg_dict[item] = "first"
+        elif item == high_column:
+            agg_dict[item] = "max"
+        elif item == low_column:
+            agg_dict[item] = "min"
+        elif item in _SUM_COLUMNS:
+            agg_dict[item] = "sum"
+        else:
+            agg_dict[item] = "last"
+    agg_dict.update(
+        {"_pre_close": "first", "_pct_pre_close": "first", "_label": "last"}
+    )
+    result_df = temp_df.groupby(by + ["_key"], sort=False).agg(agg_dict)
+    result_df.reset_index(inplace=True)
+
+    result_close = result_df[close_column].astype("float64")
+    if by:
+        prev_close = result_close.groupby(result_df[symbol_column]).shift(1)
+    else:
+        prev_close = result_close.shift(1)
+    pre_close = (
+        result_df["_pre_close"].fillna(prev_close).fillna(result_df["_pct_pre_close"])
+    )
+    if change_column is not None:
+        result_df[change_column] = (result_close - pre_close).round(4)
+    if pct_column is not None:
+        result_df[pct_column] = ((result_close / pre_close - 1) * 100).round(2)
+    if amplitude_column is not None and high_column is not None:
+        result_df[amplitude_column] = (
+            (result_df[high_column] - result_df[low_column]) / pre_close * 100
+        ).round(2)
+    # 均价为周期内的成交量加权均价
+    if not np.isnan(volume_unit):
+        result_volume = result_df[volume_column].astype("float64")
+        result_df[avg_column] = (
+            result_df[amount_column].astype("float64")
+            / result_volume.where(result_volume > 0)
+            / volume_unit
+        ).fillna(result_df[avg_column])
+    if "换手率" in result_df.columns:
+        result_df["换手率"] = result_df["换手率"].round(2)
+    result_df[time_column] = _format_like(
+        result_df["_label"], sample, with_time=period.isdigit()
+    )
+    result_df = result_df[list(columns)]
+    return result_df
+
+
+if __name__ == "__main__":
+    from akshare.stock_feature.stock_hist_em import (
+        stock_zh_a_hist,
+        stock_zh_a_hist_min_em,
+    )
+
+    stock_zh_a_hist_df = stock_zh_a_hist(symbol="000001", period="daily", adjust="")
+    bar_resample_df = bar_resample(stock_zh_a_hist_df, period="weekly")
+    print(bar_resample_df)
+
+    stock_zh_a_hist_min_em_df = stock_zh_a_hist_min_em(symbol="000001", period="1")
+    bar_resample_df = bar_resample(stock_zh_a_hist_min_em_df, period="15")
+    print(bar_resample_df)
@@ -154,6 +154,344 @@ def volatility_yz_rv(data: pd.DataFrame) -> pd.DataFrame:
     return yang_zhang_rv_df
 
 
+# 各类估计量的名称
+RV_ESTIMATORS = ["yz", "parkinson", "gk", "rs"]
+
+# 单个统计量在区间内需要累加的分量
+_RV_SUM_COLUMNS = ["n", "n_o", "o", "o2", "c", "c2", "rs", "rs_o", "pk", "gk"]
+
+
+def _rv_prepare(
+    data: pd.DataFrame, symbol_column: str = "symbol", time_column: str = "datetime"
+) -> pd.DataFrame:
+    """
+    统一多只标的分钟行情面板的字段名称, 并按标的和时间排序
+    支持 open/high/low/close, Open/High/Low/Close 以及 开盘/最高/最低/收盘 字段, 时间可以在索引中
+    :param data: 分钟行情面板
+    :type data: pandas.DataFrame
+    :param symbol_column: 标的代码字段; 数据中没有该字段时视为单个标的
+    :type symbol_column: str
+    :param time_column: 时间字段
+    :type time_column: str
+    :return: 包含 symbol, datetime, open, high, low, close 字段的行情
+    :rtype: pandas.DataFrame
+    """
+    column_map = {
+        "Open": "open",
+        "High": "high",
+        "Low": "low",
+        "Close": "close",
+        "开盘": "open",
+        "最高": "high",
+        "最低": "low",
+        "收盘": "close",
+        "Date": "datetime",
+        "时间": "datetime",
+        time_column: "datetime",
+        symbol_column: "symbol",
+    }
+    temp_df = data
+    if "datetime" not in temp_df.columns and not any(
+        item in temp_df.columns for item in ["Date", "时间", time_column]
+    ):
+        temp_df = temp_df.rename_axis("datetime").reset_index()
+    temp_df = temp_df.rename(columns=column_map)
+    if "symbol" not in temp_df.columns:
+        temp_df = temp_df.assign(symbol="")
+    temp_df = temp_df[["symbol", "datetime", "open", "high", "low", "close"]].copy()
+    temp_df["datetime"] = pd.to_datetime(temp_df["datetime"])
+    for item in ["open", "high", "low", "close"]:
+        temp_df[item] = pd.to_numeric(temp_df[item], errors="coerce")
+    temp_df = temp_df[temp_df["open"] > 0]
+    temp_df.sort_values(["symbol", "datetime"], inplace=True, kind="stable")
+    temp_df.reset_index(drop=True, inplace=True)
+    return temp_df
+
+
+def _rv_components(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    逐根 K 线计算各估计量的分量, 各标的的第一根 K 线没有前收盘价, 不参与隔夜分量的计算
+    :param temp_df: _rv_prepare 整理后的行情, 可以额外包含 prev_close 字段
+    :type temp_df: pandas.DataFrame
+    :return: 各分量, 与 temp_df 的行一一对应
+    :rtype: pandas.DataFrame
+    """
+    open_ = temp_df["open"].to_numpy(dtype="float64")
+    high = temp_df["high"].to_numpy(dtype="float64")
+    low = temp_df["low"].to_numpy(dtype="float64")
+    close = temp_df["close"].to_numpy(dtype="float64")
+    symbol = temp_df["symbol"].to_numpy()
+    prev_close = np.empty(len(close))
+    prev_close[:] = np.nan
+    if len(close) > 1:
+        same = symbol[1:] == symbol[:-1]
+        prev_close[1:] = np.where(same, close[:-1], np.nan)
+    if "prev_close" in temp_df.columns:
+        prev_close = np.where(
+            np.isnan(prev_close), temp_df["prev_close"].to_numpy(dtype="float64"), prev_close
+        )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = np.log(high / open_)
+        d = np.log(low / open_)
+        c = np.log(close / open_)
+        o = np.log(open_ / prev_close)
+        hl = np.log(high / low)
+    rs = u * (u - c) + d * (d - c)
+    valid_o = np.isfinite(o)
+    o = np.where(valid_o, o, 0.0)
+    yz_c = np.where(valid_o, c, 0.0)
+    return pd.DataFrame(
+        {
+            "n": np.ones(len(close)),
+            "n_o": valid_o.astype("float64"),
+            "o": o,
+            "o2": o * o,
+            "c": yz_c,
+            "c2": yz_c * yz_c,
+            "rs": rs,
+            "rs_o": np.where(valid_o, rs, 0.0),
+            "pk": hl * hl / (4 * np.log(2)),
+            "gk": 0.5 * hl * hl - (2 * np.log(2) - 1) * c * c,
+        }
+    )
+
+
+def _rv_from_sums(sums: pd.DataFrame, estimators: list) -> pd.DataFrame:
+    """
+    根据区间内各分量的累加值计算波动率, 方差均为样本方差(自由度 n-1)
+    :param sums: 区间内各分量的累加值
+    :type sums: pandas.DataFrame
+    :param estimators: 估计量, 见 RV_ESTIMATORS
+    :type estimators: list
+    :return: 各估计量的波动率, 与 sums 的行一一对应
+    :rtype: pandas.DataFrame
+    """
+    n = sums["n"].to_numpy()
+    n_o = sums["n_o"].to_numpy()
+    result = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if "yz" in estimators:
+            var_o = (sums["o2"] - sums["o"] ** 2 / n_o).to_numpy() / (n_o - 1)
+            var_c = (sums["c2"] - sums["c"] ** 2 / n_o).to_numpy() / (n_o - 1)
+            var_rs = sums["rs_o"].to_numpy() / n_o
+            k = 0.34 / (1.34 + (n_o + 1) / (n_o - 1))
+            yz = var_o + k * var_c + (1 - k) * var_rs
+            result["yz"] = np.where(n_o > 1, np.sqrt(np.maximum(yz, 0)), np.nan)
+        for item in ["parkinson", "gk", "rs"]:
+            if item in estimators:
+                column = "pk" if item == "parkinson" else item
+                value = sums[column].to_numpy() / n
+                result[item] = np.where(n > 0, np.sqrt(np.maximum(value, 0)), np.nan)
+    return pd.DataFrame(result, index=sums.index)
+
+
+def _rv_rolling_sums(
+    symbol: np.ndarray, components: pd.DataFrame, window: int
+) -> pd.DataFrame:
+    """
+    按标的分组的滚动求和: 整个面板只做一次累加, 再用窗口首尾的累加值相减
+    :param symbol: 各行的标的代码, 已按标的排序
+    :type symbol: numpy.ndarray
+    :param components: 各分量
+    :type components: pandas.DataFrame
+    :param window: 窗口长度, 单位: K 线根数
+    :type window: int
+    :return: 窗口内各分量的累加值
+    :rtype: pandas.DataFrame
+    """
+    size = len(symbol)
+    position = np.arange(size)
+    is_start = np.ones(size, dtype=bool)
+    if size > 1:
+        is_start[1:] = symbol[1:] != symbol[:-1]
+    group_start = np.maximum.accumulate(np.where(is_start, position, 0))
+    window_start = np.maximum(position - window + 1, group_start)
+    values = components[_RV_SUM_COLUMNS].to_numpy()
+    cum_values = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+    sums = cum_values[position + 1] - cum_values[window_start]
+    sums_df = pd.DataFrame(sums, columns=_RV_SUM_COLUMNS)
+    sums_df["n"] = (position - window_start + 1).astype("float64")
+    return sums_df
+
+
+def volatility_rv_rolling(
+    data: pd.DataFrame,
+    window: int = 48,
+    estimators: list = None,
+    symbol_column: str = "symbol",
+    time_column: str = "datetime",
+    min_periods: int = None,
+) -> pd.DataFrame:
+    """
+    波动率-已实现波动率-滚动窗口
+    对多只标的的分钟行情面板一次性计算最近 window 根 K 线的 Yang-Zhang, Parkinson, Garman-Klass 和
+    Rogers-Satchell 波动率; 结果为单根 K 线尺度的波动率, 与 volatility_yz_rv 一致
+    :param data: 分钟行情面板, 需包含 开高低收 和时间字段; 多只标的时需包含 symbol_column 字段
+    :type data: pandas.DataFrame
+    :param window: 窗口长度, 单位: K 线根数
+    :type window: int
+    :param estimators: 估计量, 默认为全部, choice of {"yz", "parkinson", "gk", "rs"}
+    :type estimators: list
+    :param symbol_column: 标的代码字段
+    :type symbol_column: str
+    :param time_column: 时间字段
+    :type time_column: str
+    :param min_periods: 窗口内最少的 K 线根数, 不足时为空值; 默认为 window
+    :type min_periods: int
+    :return: 每根 K 线对应窗口的波动率
+    :rtype: pandas.DataFrame
+    """
+    estimators = RV_ESTIMATORS if estimators is None else list(estimators)
+    min_periods = window if min_periods is None else min_periods
+    temp_df = _rv_prepare(data, symbol_column=symbol_column, time_column=time_column)
+    components = _rv_components(temp_df)
+    sums_df = _rv_rolling_sums(temp_df["symbol"].to_numpy(), components, window)
+    rv_df = _rv_from_sums(sums_df, estimators)
+    rv_df.loc[sums_df["n"].to_numpy() < min_periods] = np.nan
+    result_df = pd.concat([temp_df[["symbol", "datetime"]], rv_df], axis=1)
+    return result_df
+
+
+def _rv_daily_sums(temp_df: pd.DataFrame, components: pd.DataFrame) -> pd.DataFrame:
+    """
+    按标的和交易日汇总各分量
+    """
+    sums_df = components[_RV_SUM_COLUMNS].groupby(
+        [
+            temp_df["symbol"].rename("symbol"),
+            temp_df["datetime"].dt.normalize().rename("date"),
+        ],
+        sort=True,
+    ).sum()
+    return sums_df
+
+
+def _rv_daily_result(sums_df: pd.DataFrame, estimators: list) -> pd.DataFrame:
+    """
+    根据按交易日汇总的分量计算波动率
+    """
+    result_df = _rv_from_sums(sums_df, estimators).reset_index()
+    result_df["date"] = result_df["date"].dt.date
+    return result_df
+
+
+def volatility_rv_daily(
+    data: pd.DataFrame,
+    estimators: list = None,
+    symbol_column: str = "symbol",
+    time_column: str = "datetime",
+) -> pd.DataFrame:
+    """
+    波动率-已实现波动率-按交易日
+    对多只标的的分钟行情面板按交易日分组一次性计算 Yang-Zhang, Parkinson, Garman-Klass 和
+    Rogers-Satchell 波动率; 每个交易日第一根 K 线的隔夜分量使用前一交易日的收盘价
+    :param data: 分钟行情面板, 需包含 开高低收 和时间字段; 多只标的时需包含 symbol_column 字段
+    :type data: pandas.DataFrame
+    :param estimators: 估计量, 默认为全部, choice of {"yz", "parkinson", "gk", "rs"}
+    :type estimators: list
+    :param symbol_column: 标的代码字段
+    :type symbol_column: str
+    :param time_column: 时间字段
+    :type time_column: str
+    :return: 每只标的每个交易日的波动率
+    :rtype: pandas.DataFrame
+    """
+    estimators = RV_ESTIMATORS if estimators is None else list(estimators)
+    temp_df = _rv_prepare(data, symbol_column=symbol_column, time_column=time_column)
+    sums_df = _rv_daily_sums(temp_df, _rv_components(temp_df))
+    return _rv_daily_result(sums_df, estimators)
+
+
+class RealizedVolatilityEngine:
+    """
+    已实现波动率增量计算
+    每只标的只保留最近 window 根 K 线和当日各分量的累加值, 新的 K 线到达时只计算新增部分
+    例如每 5 分钟调用一次 update 传入全市场最新的 K 线:
+    engine = RealizedVolatilityEngine(window=48)
+    rolling_df = engine.update(new_bar_df)
+    daily_df = engine.daily()
+    """
+
+    def __init__(
+        self,
+        window: int = 48,
+        estimators: list = None,
+        symbol_column: str = "symbol",
+        time_column: str = "datetime",
+    ):
+        self.window = window
+        self.estimators = RV_ESTIMATORS if estimators is None else list(estimators)
+        self.symbol_column = symbol_column
+        self.time_column = time_column
+        self._buffer = None
+        self._daily_sums = None
+
+    def update(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        加入新的 K 线, 已经处理过的 K 线(时间不晚于该标的最新 K 线)会被忽略
+        :param data: 新的分钟行情, 字段要求同 volatility_rv_rolling
+        :type data: pandas.DataFrame
+        :return: 新 K 线对应窗口的滚动波动率
+        :rtype: pandas.DataFrame
+        """
+        new_df = _rv_prepare(
+            data, symbol_column=self.symbol_column, time_column=self.time_column
+        )
+        new_df.drop_duplicates(["symbol", "datetime"], keep="last", inplace=True)
+        if self._buffer is not None and not self._buffer.empty:
+            last_time = self._buffer.groupby("symbol")["datetime"].max()
+            new_df = new_df[
+                ~(new_df["datetime"] <= new_df["symbol"].map(last_time))
+            ]
+            temp_df = pd.concat([self._buffer, new_df], ignore_index=True)
+            temp_df.sort_values(["symbol", "datetime"], inplace=True, kind="stable")
+            temp_df.reset_index(drop=True, inplace=True)
+        else:
+            temp_df = new_df.assign(prev_close=np.nan, is_new=True)
+        temp_df["is_new"] = temp_df["is_new"].fillna(True).astype(bool)
+        components = _rv_components(temp_df)
+        sums_df = _rv_rolling_sums(
+            temp_df["symbol"].to_numpy(), components, self.window
+        )
+        rv_df = _rv_from_sums(sums_df, self.estimators)
+        rv_df.loc[sums_df["n"].to_numpy() < self.window] = np.nan
+        is_new = temp_df["is_new"].to_numpy()
+
+        daily_sums = _rv_daily_sums(
+            temp_df[is_new].reset_index(drop=True),
+            components[is_new].reset_index(drop=True),
+        )
+        if self._daily_sums is None:
+            self._daily_sums = daily_sums
+        else:
+            self._daily_sums = self._daily_sums.add(daily_sums, fill_value=0)
+
+        # 保留每只标的最近 window 根 K 线, 以及其中第一根 K 线的前收盘价
+        temp_df["prev_close"] = temp_df.groupby("symbol")["close"].shift(1).fillna(
+            temp_df["prev_close"]
+        )
+        self._buffer = (
+            temp_df.groupby("symbol", sort=False)
+            .tail(self.window)
+            .assign(is_new=False)
+            .reset_index(drop=True)
+        )
+        result_df = pd.concat(
+            [temp_df[["symbol", "datetime"]], rv_df], axis=1
+        )[is_new].reset_index(drop=True)
+        return result_df
+
+    def daily(self) -> pd.DataFrame:
+        """
+        截至目前各标的各交易日的波动率
+        :return: 每只标的每个交易日的波动率
+        :rtype: pandas.DataFrame
+        """
+        if self._daily_sums is None:
+            return pd.DataFrame(columns=["symbol", "date"] + self.estimators)
+        return _rv_daily_result(self._daily_sums, self.estimators)
+
+
 if __name__ == "__main__":
     futures_df = rv_from_futures_zh_minute_sina(symbol="IF2008", period="1")
     volatility_yz_rv_df = volatility_yz_rv(data=futures_df)
@@ -168,3 +506,9 @@ if __name__ == "__main__":
     )
     volatility_yz_rv_df = volatility_yz_rv(data=stock_df)
     print(volatility_yz_rv_df)
+
+    volatility_rv_rolling_df = volatility_rv_rolling(data=stock_df, window=48)
+    print(volatility_rv_rolling_df)
+
+    volatility_rv_daily_df = volatility_rv_daily(data=stock_df)
+    print(volatility_rv_daily_df)
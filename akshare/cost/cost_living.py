@@ -10,7 +10,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def _get_region() -> dict:
@@ -19,6 +18,8 @@ def _get_region() -> dict:
     :return: 主要板块
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.expatistan.com/cost-of-living/index"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
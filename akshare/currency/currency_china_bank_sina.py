@@ -11,7 +11,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 
@@ -29,6 +28,8 @@ def _currency_boc_sina_map(
     :return: 外汇 symbol 和代码映射
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+
     url = "http://biz.finance.sina.com.cn/forex/forex.php"
     params = {
         "startdate": "-".join([start_date[:4], start_date[4:6], start_date[6:]]),
@@ -69,6 +70,8 @@ def currency_boc_sina(
     :return: 中行人民币牌价历史数据查询
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     data_dict = _currency_boc_sina_map(start_date=start_date, end_date=end_date)
     url = "http://biz.finance.sina.com.cn/forex/forex.php"
     params = {
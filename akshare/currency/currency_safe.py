@@ -12,7 +12,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def currency_boc_safe() -> pd.DataFrame:
@@ -22,6 +21,8 @@ def currency_boc_safe() -> pd.DataFrame:
     :return: 人民币汇率中间价
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.safe.gov.cn/safe/2020/1218/17833.html"
     r = requests.get(url)
     r.encoding = "utf8"
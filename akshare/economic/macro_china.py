@@ -9,6 +9,7 @@ import datetime
 import json
 import math
 import time
+from typing import Dict
 
 import pandas as pd
 import requests
@@ -17,6 +18,7 @@ from akshare.economic.cons import (
     JS_CHINA_ENERGY_DAILY_URL,
 )
 from akshare.utils import demjson
+from akshare.utils.shared_source import shared_source
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -1327,23 +1329,51 @@ def macro_china_mobile_number() -> pd.DataFrame:
     return temp_df
 
 
-def macro_china_vegetable_basket() -> pd.DataFrame:
-    """
-    菜篮子产品批发价格指数
-    https://data.eastmoney.com/cjsj/hyzs_list_EMI00009275.html
-    :return: 菜篮子产品批发价格指数
+# 东方财富-行业指标中的价格指数: 接口名称 -> 指标代码; macro_china_price_index_all 将所有指数合并为一次请求
+EM_PRICE_INDEX_IDS = {
+    "macro_china_vegetable_basket": "EMI00009275",
+    "macro_china_agricultural_product": "EMI00009274",
+    "macro_china_agricultural_index": "EMI00662543",
+    "macro_china_energy_index": "EMI00662539",
+    "macro_china_commodity_price_index": "EMI00662535",
+    "macro_china_construction_index": "EMI00662541",
+    "macro_china_construction_price_index": "EMI00237146",
+}
+
+_EM_INDUSTRY_INDEX_COLUMNS = {
+    "REPORT_DATE": "日期",
+    "INDICATOR_ID": "指标代码",
+    "INDICATOR_VALUE": "最新值",
+    "CHANGE_RATE": "涨跌幅",
+    "CHANGERATE_3M": "近3月涨跌幅",
+    "CHANGERATE_6M": "近6月涨跌幅",
+    "CHANGERATE_1Y": "近1年涨跌幅",
+    "CHANGERATE_2Y": "近2年涨跌幅",
+    "CHANGERATE_3Y": "近3年涨跌幅",
+}
+
+
+@shared_source(ttl=3600)
+def _em_industry_index_source(indicator_ids: tuple) -> pd.DataFrame:
+    """
+    东方财富-行业指标-多个指标的原始数据, 合并为一次分页请求
+    https://data.eastmoney.com/cjsj/hyzs_list_EMI00662539.html
+    :param indicator_ids: 指标代码, e.g., ("EMI00662539", "EMI00662535")
+    :type indicator_ids: tuple
+    :return: 所有指标的数据, 包含 指标代码 字段
     :rtype: pandas.DataFrame
     """
     url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
+    id_str = ",".join(f'"{item}"' for item in indicator_ids)
     params = {
-        "sortColumns": "REPORT_DATE",
-        "sortTypes": "-1",
+        # 多个指标的日期相同, 加上指标代码保证分页时的排序唯一, 避免跨页漏行
+        "sortColumns": "REPORT_DATE,INDICATOR_ID",
+        "sortTypes": "-1,1",
         "pageSize": "500",
         "pageNumber": "1",
         "reportName": "RPT_INDUSTRY_INDEX",
-        "columns": "REPORT_DATE,INDICATOR_VALUE,CHANGE_RATE,CHANGERATE_3M,CHANGERATE_6M,CHANGERATE_1Y,"
-                   "CHANGERATE_2Y,CHANGERATE_3Y",
-        "filter": '(INDICATOR_ID="EMI00009275")',
+        "columns": ",".join(_EM_INDUSTRY_INDEX_COLUMNS),
+        "filter": f"(INDICATOR_ID in ({id_str}))",
         "source": "WEB",
         "client": "WEB",
     }
@@ -1358,30 +1388,71 @@ def macro_china_vegetable_basket() -> pd.DataFrame:
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
         big_df = pd.concat([big_df, temp_df], ignore_index=True)
-    big_df.drop_duplicates(inplace=True)
-    big_df.columns = [
-        "日期",
-        "最新值",
-        "涨跌幅",
-        "近3月涨跌幅",
-        "近6月涨跌幅",
-        "近1年涨跌幅",
-        "近2年涨跌幅",
-        "近3年涨跌幅",
-    ]
-    big_df["日期"] = pd.to_datetime(big_df["日期"]).dt.date
-    big_df["最新值"] = pd.to_numeric(big_df["最新值"])
-    big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"])
-    big_df["近3月涨跌幅"] = pd.to_numeric(big_df["近3月涨跌幅"])
-    big_df["近6月涨跌幅"] = pd.to_numeric(big_df["近6月涨跌幅"])
-    big_df["近1年涨跌幅"] = pd.to_numeric(big_df["近1年涨跌幅"])
-    big_df["近2年涨跌幅"] = pd.to_numeric(big_df["近2年涨跌幅"])
-    big_df["近3年涨跌幅"] = pd.to_numeric(big_df["近3年涨跌幅"])
-    big_df.sort_values(["日期"], inplace=True)
-    big_df.reset_index(inplace=True, drop=True)
+    big_df = big_df.reindex(columns=list(_EM_INDUSTRY_INDEX_COLUMNS))
+    big_df.columns = list(_EM_INDUSTRY_INDEX_COLUMNS.values())
+    big_df["日期"] = pd.to_datetime(big_df["日期"], errors="coerce").dt.date
+    for item in big_df.columns[2:]:
+        big_df[item] = pd.to_numeric(big_df[item], errors="coerce")
     return big_df
 
 
+def _em_industry_index_view(
+    indicator_id: str, indicator_ids: tuple = None
+) -> pd.DataFrame:
+    """
+    东方财富-行业指标-从共享数据源中截取指定指标
+    :param indicator_id: 指标代码, e.g., "EMI00662539"
+    :type indicator_id: str
+    :param indicator_ids: 与该指标一起请求的指标代码, 为空时只请求该指标
+    :type indicator_ids: tuple
+    :return: 指定指标的数据
+    :rtype: pandas.DataFrame
+    """
+    source_df = _em_industry_index_source(indicator_ids or (indicator_id,))
+    temp_df = source_df[source_df["指标代码"] == indicator_id].drop(columns="指标代码")
+    temp_df = temp_df.drop_duplicates().sort_values(["日期"])
+    temp_df.reset_index(inplace=True, drop=True)
+    return temp_df
+
+
+def _em_price_index_view(name: str, combined: bool = False) -> pd.DataFrame:
+    """
+    东方财富-行业指标-价格指数
+    :param name: EM_PRICE_INDEX_IDS 中的接口名称
+    :type name: str
+    :param combined: 是否从所有价格指数的合并请求中截取; 否则只请求该指数
+    :type combined: bool
+    :return: 价格指数
+    :rtype: pandas.DataFrame
+    """
+    return _em_industry_index_view(
+        EM_PRICE_INDEX_IDS[name],
+        tuple(EM_PRICE_INDEX_IDS.values()) if combined else None,
+    )
+
+
+def macro_china_price_index_all() -> Dict[str, pd.DataFrame]:
+    """
+    东方财富-行业指标-所有价格指数, 只请求一次数据
+    https://data.eastmoney.com/cjsj/hyzs_list_EMI00662539.html
+    :return: 接口名称对应的价格指数, 接口名称为 EM_PRICE_INDEX_IDS 的键
+    :rtype: dict
+    """
+    return {
+        name: _em_price_index_view(name, combined=True) for name in EM_PRICE_INDEX_IDS
+    }
+
+
+def macro_china_vegetable_basket() -> pd.DataFrame:
+    """
+    菜篮子产品批发价格指数
+    https://data.eastmoney.com/cjsj/hyzs_list_EMI00009275.html
+    :return: 菜篮子产品批发价格指数
+    :rtype: pandas.DataFrame
+    """
+    return _em_price_index_view("macro_china_vegetable_basket")
+
+
 def macro_china_agricultural_product() -> pd.DataFrame:
     """
     农产品批发价格总指数
@@ -1389,52 +1460,7 @@ def macro_china_agricultural_product() -> pd.DataFrame:
     :return: 农产品批发价格总指数
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-    params = {
-        "sortColumns": "REPORT_DATE",
-        "sortTypes": "-1",
-        "pageSize": "500",
-        "pageNumber": "1",
-        "reportName": "RPT_INDUSTRY_INDEX",
-        "columns": "REPORT_DATE,INDICATOR_VALUE,CHANGE_RATE,CHANGERATE_3M,CHANGERATE_6M,CHANGERATE_1Y,"
-                   "CHANGERATE_2Y,CHANGERATE_3Y",
-        "filter": '(INDICATOR_ID="EMI00009274")',
-        "source": "WEB",
-        "client": "WEB",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-    big_df.drop_duplicates(inplace=True)
-    big_df.columns = [
-        "日期",
-        "最新值",
-        "涨跌幅",
-        "近3月涨跌幅",
-        "近6月涨跌幅",
-        "近1年涨跌幅",
-        "近2年涨跌幅",
-        "近3年涨跌幅",
-    ]
-    big_df["日期"] = pd.to_datetime(big_df["日期"]).dt.date
-    big_df["最新值"] = pd.to_numeric(big_df["最新值"])
-    big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"])
-    big_df["近3月涨跌幅"] = pd.to_numeric(big_df["近3月涨跌幅"])
-    big_df["近6月涨跌幅"] = pd.to_numeric(big_df["近6月涨跌幅"])
-    big_df["近1年涨跌幅"] = pd.to_numeric(big_df["近1年涨跌幅"])
-    big_df["近2年涨跌幅"] = pd.to_numeric(big_df["近2年涨跌幅"])
-    big_df["近3年涨跌幅"] = pd.to_numeric(big_df["近3年涨跌幅"])
-    big_df.sort_values(["日期"], inplace=True)
-    big_df.reset_index(inplace=True, drop=True)
-    return big_df
+    return _em_price_index_view("macro_china_agricultural_product")
 
 
 def macro_china_agricultural_index() -> pd.DataFrame:
@@ -1444,52 +1470,7 @@ def macro_china_agricultural_index() -> pd.DataFrame:
     :return: 农副指数
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-    params = {
-        "sortColumns": "REPORT_DATE",
-        "sortTypes": "-1",
-        "pageSize": "500",
-        "pageNumber": "1",
-        "reportName": "RPT_INDUSTRY_INDEX",
-        "columns": "REPORT_DATE,INDICATOR_VALUE,CHANGE_RATE,CHANGERATE_3M,CHANGERATE_6M,CHANGERATE_1Y,"
-                   "CHANGERATE_2Y,CHANGERATE_3Y",
-        "filter": '(INDICATOR_ID="EMI00662543")',
-        "source": "WEB",
-        "client": "WEB",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-    big_df.drop_duplicates(inplace=True)
-    big_df.columns = [
-        "日期",
-        "最新值",
-        "涨跌幅",
-        "近3月涨跌幅",
-        "近6月涨跌幅",
-        "近1年涨跌幅",
-        "近2年涨跌幅",
-        "近3年涨跌幅",
-    ]
-    big_df["日期"] = pd.to_datetime(big_df["日期"]).dt.date
-    big_df["最新值"] = pd.to_numeric(big_df["最新值"])
-    big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"])
-    big_df["近3月涨跌幅"] = pd.to_numeric(big_df["近3月涨跌幅"])
-    big_df["近6月涨跌幅"] = pd.to_numeric(big_df["近6月涨跌幅"])
-    big_df["近1年涨跌幅"] = pd.to_numeric(big_df["近1年涨跌幅"])
-    big_df["近2年涨跌幅"] = pd.to_numeric(big_df["近2年涨跌幅"])
-    big_df["近3年涨跌幅"] = pd.to_numeric(big_df["近3年涨跌幅"])
-    big_df.sort_values(["日期"], inplace=True)
-    big_df.reset_index(inplace=True, drop=True)
-    return big_df
+    return _em_price_index_view("macro_china_agricultural_index")
 
 
 def macro_china_energy_index() -> pd.DataFrame:
@@ -1499,52 +1480,7 @@ def macro_china_energy_index() -> pd.DataFrame:
     :return: 能源指数
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-    params = {
-        "sortColumns": "REPORT_DATE",
-        "sortTypes": "-1",
-        "pageSize": "500",
-        "pageNumber": "1",
-        "reportName": "RPT_INDUSTRY_INDEX",
-        "columns": "REPORT_DATE,INDICATOR_VALUE,CHANGE_RATE,CHANGERATE_3M,CHANGERATE_6M,CHANGERATE_1Y,"
-                   "CHANGERATE_2Y,CHANGERATE_3Y",
-        "filter": '(INDICATOR_ID="EMI00662539")',
-        "source": "WEB",
-        "client": "WEB",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-    big_df.drop_duplicates(inplace=True)
-    big_df.columns = [
-        "日期",
-        "最新值",
-        "涨跌幅",
-        "近3月涨跌幅",
-        "近6月涨跌幅",
-        "近1年涨跌幅",
-        "近2年涨跌幅",
-        "近3年涨跌幅",
-    ]
-    big_df["日期"] = pd.to_datetime(big_df["日期"]).dt.date
-    big_df["最新值"] = pd.to_numeric(big_df["最新值"])
-    big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"])
-    big_df["近3月涨跌幅"] = pd.to_numeric(big_df["近3月涨跌幅"])
-    big_df["近6月涨跌幅"] = pd.to_numeric(big_df["近6月涨跌幅"])
-    big_df["近1年涨跌幅"] = pd.to_numeric(big_df["近1年涨跌幅"])
-    big_df["近2年涨跌幅"] = pd.to_numeric(big_df["近2年涨跌幅"])
-    big_df["近3年涨跌幅"] = pd.to_numeric(big_df["近3年涨跌幅"])
-    big_df.sort_values(["日期"], inplace=True)
-    big_df.reset_index(inplace=True, drop=True)
-    return big_df
+    return _em_price_index_view("macro_china_energy_index")
 
 
 def macro_china_commodity_price_index() -> pd.DataFrame:
@@ -1554,52 +1490,7 @@ def macro_china_commodity_price_index() -> pd.DataFrame:
     :return: 大宗商品价格
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-    params = {
-        "sortColumns": "REPORT_DATE",
-        "sortTypes": "-1",
-        "pageSize": "500",
-        "pageNumber": "1",
-        "reportName": "RPT_INDUSTRY_INDEX",
-        "columns": "REPORT_DATE,INDICATOR_VALUE,CHANGE_RATE,CHANGERATE_3M,CHANGERATE_6M,CHANGERATE_1Y,"
-                   "CHANGERATE_2Y,CHANGERATE_3Y",
-        "filter": '(INDICATOR_ID="EMI00662535")',
-        "source": "WEB",
-        "client": "WEB",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-    big_df.drop_duplicates(inplace=True)
-    big_df.columns = [
-        "日期",
-        "最新值",
-        "涨跌幅",
-        "近3月涨跌幅",
-        "近6月涨跌幅",
-        "近1年涨跌幅",
-        "近2年涨跌幅",
-        "近3年涨跌幅",
-    ]
-    big_df["日期"] = pd.to_datetime(big_df["日期"]).dt.date
-    big_df["最新值"] = pd.to_numeric(big_df["最新值"])
-    big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"])
-    big_df["近3月涨跌幅"] = pd.to_numeric(big_df["近3月涨跌幅"])
-    big_df["近6月涨跌幅"] = pd.to_numeric(big_df["近6月涨跌幅"])
-    big_df["近1年涨跌幅"] = pd.to_numeric(big_df["近1年涨跌幅"])
-    big_df["近2年涨跌幅"] = pd.to_numeric(big_df["近2年涨跌幅"])
-    big_df["近3年涨跌幅"] = pd.to_numeric(big_df["近3年涨跌幅"])
-    big_df.sort_values(["日期"], inplace=True)
-    big_df.reset_index(inplace=True, drop=True)
-    return big_df
+    return _em_price_index_view("macro_china_commodity_price_index")
 
 
 def macro_global_sox_index() -> pd.DataFrame:
@@ -1719,55 +1610,7 @@ def macro_china_construction_index() -> pd.DataFrame:
     :return: 建材指数
     :rtype: pandas.DataFrame
     """
-    import warnings
-
-    warnings.filterwarnings(action="ignore", category=FutureWarning)
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-    params = {
-        "sortColumns": "REPORT_DATE",
-        "sortTypes": "-1",
-        "pageSize": "500",
-        "pageNumber": "1",
-        "reportName": "RPT_INDUSTRY_INDEX",
-        "columns": "REPORT_DATE,INDICATOR_VALUE,CHANGE_RATE,CHANGERATE_3M,CHANGERATE_6M,"
-                   "CHANGERATE_1Y,CHANGERATE_2Y,CHANGERATE_3Y",
-        "filter": '(INDICATOR_ID="EMI00662541")',
-        "source": "WEB",
-        "client": "WEB",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    big_df.drop_duplicates(inplace=True)
-    big_df.columns = [
-        "日期",
-        "最新值",
-        "涨跌幅",
-        "近3月涨跌幅",
-        "近6月涨跌幅",
-        "近1年涨跌幅",
-        "近2年涨跌幅",
-        "近3年涨跌幅",
-    ]
-    big_df["日期"] = pd.to_datetime(big_df["日期"], errors="coerce").dt.date
-    big_df["最新值"] = pd.to_numeric(big_df["最新值"], errors="coerce")
-    big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"], errors="coerce")
-    big_df["近3月涨跌幅"] = pd.to_numeric(big_df["近3月涨跌幅"], errors="coerce")
-    big_df["近6月涨跌幅"] = pd.to_numeric(big_df["近6月涨跌幅"], errors="coerce")
-    big_df["近1年涨跌幅"] = pd.to_numeric(big_df["近1年涨跌幅"], errors="coerce")
-    big_df["近2年涨跌幅"] = pd.to_numeric(big_df["近2年涨跌幅"], errors="coerce")
-    big_df["近3年涨跌幅"] = pd.to_numeric(big_df["近3年涨跌幅"], errors="coerce")
-    big_df.sort_values(by=["日期"], inplace=True)
-    big_df.reset_index(inplace=True, drop=True)
-    return big_df
+    return _em_price_index_view("macro_china_construction_index")
 
 
 def macro_china_construction_price_index() -> pd.DataFrame:
@@ -1777,52 +1620,7 @@ def macro_china_construction_price_index() -> pd.DataFrame:
     :return: 建材价格指数
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-    params = {
-        "sortColumns": "REPORT_DATE",
-        "sortTypes": "-1",
-        "pageSize": "500",
-        "pageNumber": "1",
-        "reportName": "RPT_INDUSTRY_INDEX",
-        "columns": "REPORT_DATE,INDICATOR_VALUE,CHANGE_RATE,CHANGERATE_3M,CHANGERATE_6M,CHANGERATE_1Y,"
-                   "CHANGERATE_2Y,CHANGERATE_3Y",
-        "filter": '(INDICATOR_ID="EMI00237146")',
-        "source": "WEB",
-        "client": "WEB",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-    big_df.drop_duplicates(inplace=True)
-    big_df.columns = [
-        "日期",
-        "最新值",
-        "涨跌幅",
-        "近3月涨跌幅",
-        "近6月涨跌幅",
-        "近1年涨跌幅",
-        "近2年涨跌幅",
-        "近3年涨跌幅",
-    ]
-    big_df["日期"] = pd.to_datetime(big_df["日期"]).dt.date
-    big_df["最新值"] = pd.to_numeric(big_df["最新值"])
-    big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"])
-    big_df["近3月涨跌幅"] = pd.to_numeric(big_df["近3月涨跌幅"])
-    big_df["近6月涨跌幅"] = pd.to_numeric(big_df["近6月涨跌幅"])
-    big_df["近1年涨跌幅"] = pd.to_numeric(big_df["近1年涨跌幅"])
-    big_df["近2年涨跌幅"] = pd.to_numeric(big_df["近2年涨跌幅"])
-    big_df["近3年涨跌幅"] = pd.to_numeric(big_df["近3年涨跌幅"])
-    big_df.sort_values(["日期"], inplace=True)
-    big_df.reset_index(inplace=True, drop=True)
-    return big_df
+    return _em_price_index_view("macro_china_construction_price_index")
 
 
 def macro_china_lpi_index() -> pd.DataFrame:
@@ -1996,53 +1794,7 @@ def _em_macro_1(em_id) -> pd.DataFrame:
     :return: 处理后的数据
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-    ind_id = '"' + em_id + '"'
-    params = {
-        "sortColumns": "REPORT_DATE",
-        "sortTypes": "-1",
-        "pageSize": "500",
-        "pageNumber": "1",
-        "reportName": "RPT_INDUSTRY_INDEX",
-        "columns": "REPORT_DATE,INDICATOR_VALUE,CHANGE_RATE,CHANGERATE_3M,"
-                   "CHANGERATE_6M,CHANGERATE_1Y,CHANGERATE_2Y,CHANGERATE_3Y",
-        "filter": "(INDICATOR_ID=" + ind_id + ")",
-        "source": "WEB",
-        "client": "WEB",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-    big_df.drop_duplicates(inplace=True)
-    big_df.columns = [
-        "日期",
-        "最新值",
-        "涨跌幅",
-        "近3月涨跌幅",
-        "近6月涨跌幅",
-        "近1年涨跌幅",
-        "近2年涨跌幅",
-        "近3年涨跌幅",
-    ]
-    big_df["日期"] = pd.to_datetime(big_df["日期"], errors="coerce").dt.date
-    big_df["最新值"] = pd.to_numeric(big_df["最新值"], errors="coerce")
-    big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"], errors="coerce")
-    big_df["近3月涨跌幅"] = pd.to_numeric(big_df["近3月涨跌幅"], errors="coerce")
-    big_df["近6月涨跌幅"] = pd.to_numeric(big_df["近6月涨跌幅"], errors="coerce")
-    big_df["近1年涨跌幅"] = pd.to_numeric(big_df["近1年涨跌幅"], errors="coerce")
-    big_df["近2年涨跌幅"] = pd.to_numeric(big_df["近2年涨跌幅"], errors="coerce")
-    big_df["近3年涨跌幅"] = pd.to_numeric(big_df["近3年涨跌幅"], errors="coerce")
-    big_df.sort_values(by=["日期"], inplace=True)
-    big_df.reset_index(inplace=True, drop=True)
-    return big_df
+    return _em_industry_index_view(em_id)
 
 
 def macro_shipping_bci() -> pd.DataFrame:
@@ -3706,6 +3458,9 @@ def macro_china_real_estate() -> pd.DataFrame:
 
 
 if __name__ == "__main__":
+    macro_china_price_index_all_dict = macro_china_price_index_all()
+    print(macro_china_price_index_all_dict)
+
     # 企业商品价格指数
     macro_china_qyspjg_df = macro_china_qyspjg()
     print(macro_china_qyspjg_df)
@@ -10,13 +10,14 @@ import time
 from functools import lru_cache
 from typing import Union, Literal, List, Dict
 
-import jsonpath as jp
 import numpy as np
 import pandas as pd
 import requests
 import urllib3
 from urllib3.exceptions import InsecureRequestWarning
 
+from akshare.cache import cached
+
 # 忽略InsecureRequestWarning警告
 urllib3.disable_warnings(InsecureRequestWarning)
 
@@ -68,6 +69,8 @@ def _get_code_from_nbs_tree(tree: List[Dict], name: str, target: str = "id") ->
     :param target: 指标编码属性名
     :return: 指标编码
     """
+    import jsonpath as jp
+
     expr = f'$[?(@.name == "{name}")].{target}'
     ret = jp.jsonpath(tree, expr)
     if ret is False:
@@ -75,6 +78,7 @@ def _get_code_from_nbs_tree(tree: List[Dict], name: str, target: str = "id") ->
     return ret[0]
 
 
+@cached(family="daily")
 def macro_china_nbs_nation(
     kind: Literal["月度数据", "季度数据", "年度数据"], path: str, period: str = "LAST10"
 ) -> pd.DataFrame:
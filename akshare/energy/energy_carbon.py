@@ -23,7 +23,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 from akshare.utils import demjson
@@ -80,6 +79,8 @@ def energy_carbon_bj() -> pd.DataFrame:
     :return: 北京市碳排放权公开交易行情
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.bjets.com.cn/article/jyxx/"
     r = requests.get(url, verify=False, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -138,6 +139,8 @@ def energy_carbon_sz() -> pd.DataFrame:
     :return: 国内碳情每日行情数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "http://www.cerx.cn/dailynewsCN/index.htm"
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -170,6 +173,8 @@ def energy_carbon_eu() -> pd.DataFrame:
     :return: 国际碳情每日行情数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "http://www.cerx.cn/dailynewsOuter/index.htm"
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -202,6 +207,8 @@ def energy_carbon_hb() -> pd.DataFrame:
     :return: 现货交易数据-配额-每日概况行情数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.hbets.cn/"
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
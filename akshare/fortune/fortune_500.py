@@ -13,7 +13,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 
@@ -25,6 +24,8 @@ def _fortune_rank_year_url_map() -> dict:
     :return: 年份和网址映射
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.fortunechina.com/fortune500/index.htm"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -8,7 +8,6 @@ https://www.bloomberg.com/billionaires/
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def index_bloomberg_billionaires_hist(year: str = "2021") -> pd.DataFrame:
@@ -20,6 +19,8 @@ def index_bloomberg_billionaires_hist(year: str = "2021") -> pd.DataFrame:
     :return: 彭博亿万富豪指数历史数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = f"https://stats.areppim.com/listes/list_billionairesx{year[-2:]}xwor.htm"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, "lxml")
@@ -69,6 +70,8 @@ def index_bloomberg_billionaires() -> pd.DataFrame:
     :return: 彭博亿万富豪指数
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.bloomberg.com/billionaires"
     headers = {
         "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9",
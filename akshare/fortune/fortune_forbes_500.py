@@ -8,7 +8,6 @@ https://www.forbeschina.com/lists
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def forbes_rank(symbol: str = "2021福布斯中国创投人100") -> pd.DataFrame:
@@ -21,6 +20,8 @@ def forbes_rank(symbol: str = "2021福布斯中国创投人100") -> pd.DataFrame
     :return: 具体指标的榜单
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.forbeschina.com/lists"
     r = requests.get(url, verify=False)
     soup = BeautifulSoup(r.text, "lxml")
@@ -10,7 +10,6 @@ import warnings
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.DataFrame:
@@ -24,6 +23,8 @@ def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.Dat
     :return: 指定 indicator 和 year 的数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.hurun.net/zh-CN/Rank/HsRankDetails?pagetype=rich"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, "lxml")
@@ -21,7 +21,6 @@ import time
 from io import StringIO
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.utils import demjson
@@ -345,6 +344,8 @@ def fund_open_fund_info_em(
     :return: 指定基金指定指标的数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     from akshare.utils.cons import headers
 
     url = f"https://fund.eastmoney.com/pingzhongdata/{symbol}.js"  # 各类数据都在里面
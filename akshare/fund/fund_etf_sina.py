@@ -7,7 +7,6 @@ https://vip.stock.finance.sina.com.cn/fund_center/index.html#jjhqetf
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.stock.cons import hk_js_decode
@@ -122,6 +121,8 @@ def fund_etf_hist_sina(symbol: str = "sh510050") -> pd.DataFrame:
     :return: 日行情数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = f"https://finance.sina.com.cn/realstock/company/{symbol}/hisdata_klc2/klc_kl.js"
     r = requests.get(url)
     js_code = py_mini_racer.MiniRacer()
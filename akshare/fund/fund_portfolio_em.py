@@ -10,7 +10,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils import demjson
 
@@ -26,6 +25,8 @@ def fund_portfolio_hold_em(symbol: str = "000001", date: str = "2024") -> pd.Dat
     :return: 基金持仓
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://fundf10.eastmoney.com/FundArchivesDatas.aspx"
     params = {
         "type": "jjcc",
@@ -112,6 +113,8 @@ def fund_portfolio_bond_hold_em(
     :return: 债券持仓
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://fundf10.eastmoney.com/FundArchivesDatas.aspx"
     params = {
         "type": "zqcc",
@@ -242,6 +245,8 @@ def fund_portfolio_change_em(
     :return: 重大变动
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     indicator_map = {
         "累计买入": "1",
         "累计卖出": "2",
@@ -8,7 +8,6 @@ https://fund.eastmoney.com/data/fundrating.html
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def fund_rating_all() -> pd.DataFrame:
@@ -18,6 +17,8 @@ def fund_rating_all() -> pd.DataFrame:
     :return: 基金评级总汇
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://fund.eastmoney.com/data/fundrating.html"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -97,6 +98,8 @@ def fund_rating_sh(date: str = "20230630") -> pd.DataFrame:
     :return: 上海证券评级
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://fund.eastmoney.com/data/fundrating_3.html"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, "lxml")
@@ -195,6 +198,8 @@ def fund_rating_zs(date: str = "20230331") -> pd.DataFrame:
     :return: 招商证券评级-混合型
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://fund.eastmoney.com/data/fundrating_2.html"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, "lxml")
@@ -282,6 +287,8 @@ def fund_rating_ja(date: str = "20230331") -> pd.DataFrame:
     :return: 济安金信评级
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://fund.eastmoney.com/data/fundrating_4.html"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, "lxml")
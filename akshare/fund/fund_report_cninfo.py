@@ -7,7 +7,6 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
@@ -36,6 +35,8 @@ def fund_report_stock_cninfo(date: str = "20210630") -> pd.DataFrame:
     :return: 基金重仓股
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1112"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
@@ -103,6 +104,8 @@ def fund_report_industry_allocation_cninfo(date: str = "20210630") -> pd.DataFra
     :return: 基金行业配置
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1113"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
@@ -165,6 +168,8 @@ def fund_report_asset_allocation_cninfo() -> pd.DataFrame:
     :return: 基金资产配置
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1114"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
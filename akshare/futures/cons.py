@@ -460,6 +460,28 @@ OUTPUT_COLUMNS = [
     "variety",
 ]
 
+FUTURES_DAILY_NUMERIC_COLUMNS = [
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "open_interest",
+    "turnover",
+    "settle",
+    "pre_settle",
+]
+
+# 交易所网站并发请求时的限速, 单位: 次/秒
+FUTURES_EXCHANGE_RATE_LIMIT = {
+    "CFFEX": 2,
+    "CZCE": 2,
+    "SHFE": 2,
+    "DCE": 1,
+    "INE": 2,
+    "GFEX": 1,
+}
+
 OPTION_OUTPUT_COLUMNS = [
     "symbol",
     "date",
@@ -605,6 +627,21 @@ def last_trading_day(day):
         return last_day
 
 
+def get_current_trading_day() -> str:
+    """
+    当前所属的交易日, 交易日历未覆盖的日期按工作日处理
+    :return string YYYYMMDD
+    """
+    today = datetime.date.today()
+    today_str = today.strftime("%Y%m%d")
+    calendar = get_calendar()
+    if today_str <= calendar[-1]:
+        return max(item for item in calendar if item <= today_str)
+    while today.weekday() >= 5:
+        today -= datetime.timedelta(days=1)
+    return today.strftime("%Y%m%d")
+
+
 def get_latest_data_date(day):
     """
     获取最新的有数据的交易日
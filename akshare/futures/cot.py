@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/21 15:00
+Date: 2026/10/19 15:00
 Desc: 期货-中国-交易所-会员持仓数据接口
 大连商品交易所、上海期货交易所、郑州商品交易所、中国金融期货交易所、广州期货交易所
 采集前 20 会员持仓数据;
@@ -20,16 +20,28 @@ import re
 import time
 import warnings
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link
 from akshare.futures.symbol_var import symbol_varieties
+from akshare.utils.cache import (
+    cache_root,
+    fetch_raw,
+    is_excel,
+    is_immutable_date,
+    is_json,
+    is_zip,
+    list_keys,
+    load_object,
+    save_object,
+)
+from akshare.utils.ratelimit import get_rate_limiter
 
 calendar = cons.get_calendar()
 rank_columns = [
@@ -89,21 +101,21 @@ def get_rank_sum_daily(
         if end_day is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-    records = pd.DataFrame()
-    while start_day <= end_day:
-        print(start_day)
-        if start_day.strftime("%Y%m%d") in calendar:
-            data = get_rank_sum(start_day, vars_list)
-            if data is False:
-                print(
-                    f"{start_day.strftime('%Y-%m-%d')}日交易所数据连接失败，已超过20次，您的地址被网站墙了，请保存好返回数据，稍后从该日期起重试"
-                )
-                return records.reset_index(drop=True)
-            records = pd.concat(objs=[records, data], ignore_index=True)
-        else:
-            warnings.warn(f"{start_day.strftime('%Y%m%d')}非交易日")
-        start_day += datetime.timedelta(days=1)
-
+    start_day = start_day.strftime("%Y%m%d")
+    end_day = end_day.strftime("%Y%m%d")
+    trade_date_list = [item for item in calendar if start_day <= item <= end_day]
+    records_list = []
+    for trade_date in trade_date_list:
+        data = get_rank_sum(trade_date, vars_list)
+        if data is False:
+            print(
+                f"{trade_date}日交易所数据连接失败，已超过20次，您的地址被网站墙了，请保存好返回数据，稍后从该日期起重试"
+            )
+            break
+        records_list.append(data)
+    if len(records_list) == 0:
+        return pd.DataFrame()
+    records = pd.concat(objs=records_list, ignore_index=True)
     return records.reset_index(drop=True)
 
 
@@ -138,32 +150,29 @@ def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols
     czce_var = [i for i in vars_list if i in cons.market_exchange_symbols["czce"]]
     cffex_var = [i for i in vars_list if i in cons.market_exchange_symbols["cffex"]]
     gfex_var = [i for i in vars_list if i in cons.market_exchange_symbols["gfex"]]
+    exchange_var_dict = {
+        "DCE": dce_var,
+        "SHFE": shfe_var,
+        "CZCE": czce_var,
+        "CFFEX": cffex_var,
+        "GFEX": gfex_var,
+    }
+    exchange_var_dict = {
+        key: value for key, value in exchange_var_dict.items() if len(value) > 0
+    }
     big_dict = {}
-    if len(dce_var) > 0:
-        data = futures_dce_position_rank(date, dce_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(shfe_var) > 0:
-        data = get_shfe_rank_table(date, shfe_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(czce_var) > 0:
-        data = get_rank_table_czce(date)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(cffex_var) > 0:
-        data = get_cffex_rank_table(date, cffex_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(gfex_var) > 0:
-        data = futures_gfex_position_rank(date, gfex_var)
+    with ThreadPoolExecutor(max_workers=max(len(exchange_var_dict), 1)) as executor:
+        data_list = list(
+            executor.map(
+                lambda item: _rank_table_exchange(item[0], date, item[1]),
+                exchange_var_dict.items(),
+            )
+        )
+    for data in data_list:
         if data is False:
             return False
-        big_dict.update(data)
+        if data:
+            big_dict.update(data)
     records = pd.DataFrame()
 
     for symbol, table in big_dict.items():
@@ -272,48 +281,216 @@ def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols
     return records.reset_index(drop=True)
 
 
-def get_shfe_rank_table(
-    date: str = None, vars_list: list = cons.contract_symbols
-) -> dict:
+# 各交易所持仓排名数据的开始日期
+rank_start_date = {
+    "DCE": "20060104",
+    "SHFE": "20020107",
+    "CZCE": "20151008",
+    "CFFEX": "20100416",
+    "GFEX": "20231110",
+}
+
+
+def _rank_table_fetch(exchange: str, date: datetime.date, vars_list: list):
     """
-    上海期货交易所会员成交及持仓排名表
-    https://www.shfe.com.cn/
-    https://tsite.shfe.com.cn/statements/dataview.html?paramid=kx
-    注：该交易所只公布每个品种内部的标的排名，没有公布品种的总排名
-    数据从 20020107 开始，每交易日 16:30 左右更新数据
+    请求单个交易所单个交易日的持仓排名明细
+    :param exchange: 交易所代码
+    :type exchange: str
     :param date: 交易日
-    :type date: str
-    :param vars_list: 合约品种如 RB、AL等列表; 为空时为所有商品
+    :type date: datetime.date
+    :param vars_list: 合约品种列表
     :type vars_list: list
-    :return: 上海期货交易所会员成交及持仓排名表
+    :return: 持仓排名明细, 键为合约代码; 以及是否所有品种都请求成功
+    :rtype: tuple
+    """
+    get_rate_limiter(
+        exchange, rate=cons.FUTURES_EXCHANGE_RATE_LIMIT[exchange]
+    ).acquire()
+    if exchange == "DCE":
+        data, complete = futures_dce_position_rank(date, vars_list), True
+    elif exchange == "SHFE":
+        data, complete = _shfe_rank_table(date, vars_list)
+    elif exchange == "CZCE":
+        data, complete = get_rank_table_czce(date), True
+    elif exchange == "CFFEX":
+        data, complete = _cffex_rank_table(date, vars_list)
+    elif exchange == "GFEX":
+        data, complete = _gfex_rank_table(date, vars_list)
+    else:
+        raise ValueError(f"不支持的交易所: {exchange}")
+    if data is None:
+        return {}, False
+    # 单个合约请求失败时部分接口以空字典或空表代替该合约的明细
+    complete = complete and all(
+        isinstance(value, pd.DataFrame) and not value.empty for value in data.values()
+    )
+    return data, complete
+
+
+def _rank_store_fetch(exchange: str, date_str: str):
+    """
+    请求单个交易所单个交易日所有品种的持仓排名明细并保存到持仓排名库
+    所有品种都请求成功时才保存, 没有数据的交易日保存为空字典, 不再重复请求
+    :param exchange: 交易所代码
+    :type exchange: str
+    :param date_str: 交易日, e.g., "20240105"
+    :type date_str: str
+    :return: 持仓排名明细, 键为合约代码; 以及是否已保存
+    :rtype: tuple
+    """
+    all_vars_list = [
+        item
+        for item in cons.contract_symbols
+        if item in cons.market_exchange_symbols[exchange.lower()]
+    ]
+    data, complete = _rank_table_fetch(
+        exchange, cons.convert_date(date_str), all_vars_list
+    )
+    if complete:
+        save_object(f"rank_store/{exchange}", date_str, data)
+    return data, complete
+
+
+def _rank_table_exchange(exchange: str, date, vars_list: list):
+    """
+    单个交易所单个交易日的持仓排名明细; 设置了本地缓存目录时, 历史交易日的明细保存在持仓排名库中
+    持仓排名库保存该交易所所有品种的明细, 由调用方按品种筛选
+    :param exchange: 交易所代码
+    :type exchange: str
+    :param date: 交易日
+    :type date: str or datetime.date
+    :param vars_list: 合约品种列表
+    :type vars_list: list
+    :return: 持仓排名明细, 键为合约代码
     :rtype: dict
-    rank                        排名                        int
-    vol_party_name              成交量排序的当前名次会员        string(中文)
-    vol                         该会员成交量                  int
-    vol_chg                     该会员成交量变化量             int
-    long_party_name             持多单排序的当前名次会员        string(中文)
-    long_open_interest          该会员持多单                  int
-    long_open_interest_chg      该会员持多单变化量             int
-    short_party_name            持空单排序的当前名次会员        string(中文)
-    short_open_interest         该会员持空单                  int
-    short_open_interest_chg     该会员持空单变化量             int
-    symbol                      标的合约                     string
-    var                         品种                        string
-    date                        日期                        string YYYYMMDD
+    """
+    date = cons.convert_date(date)
+    date_str = date.strftime("%Y%m%d")
+    use_store = cache_root() is not None and is_immutable_date(date_str)
+    if not use_store:
+        return _rank_table_fetch(exchange, date, vars_list)[0]
+    data = load_object(f"rank_store/{exchange}", date_str)
+    if data is None:
+        data = _rank_store_fetch(exchange, date_str)[0]
+    return {key: value.copy() for key, value in data.items()}
+
+
+def get_rank_store_last_date(exchange: str = "DCE") -> str:
+    """
+    持仓排名库中指定交易所最后一个已保存的交易日
+    :param exchange: choice of {"DCE", "SHFE", "CZCE", "CFFEX", "GFEX"}
+    :type exchange: str
+    :return: 最后一个已保存的交易日; 尚未保存时返回 None
+    :rtype: str
+    """
+    key_list = list_keys(f"rank_store/{exchange.upper()}")
+    return key_list[-1] if key_list else None
+
+
+def get_rank_store_update(
+    start_day: str = None,
+    end_day: str = None,
+    exchange_list: list = None,
+    max_workers: int = 4,
+) -> pd.DataFrame:
+    """
+    增量更新本地持仓排名库: 按交易所、按交易日保存持仓排名明细, 已保存的交易日不再请求
+    多个交易日和交易所并发请求, 每个交易所单独限速; 任务中断后再次调用即可从中断处继续
+    需要先通过环境变量 AKSHARE_CACHE_DIR 或 akshare.utils.context.set_cache_dir 设置缓存目录
+    :param start_day: 开始日期; 为空时从最后一个已保存交易日的下一个交易日开始, 尚未保存时从数据开始日期开始;
+    指定时请求该日期之后所有未保存的交易日, 可用于补齐之前请求失败留下的空缺
+    :type start_day: str
+    :param end_day: 结束日期; 为空时为最近一个已固定的交易日
+    :type end_day: str
+    :param exchange_list: 交易所列表, e.g., ["DCE", "SHFE"]; 为空时为所有交易所
+    :type exchange_list: list
+    :param max_workers: 并发请求的线程数
+    :type max_workers: int
+    :return: 本次更新的结果
+    :rtype: pandas.DataFrame
+    exchange   交易所
+    date       交易日
+    count      合约数量, 没有数据的交易日为 0, 请求失败或部分品种请求失败时为空
+    """
+    if cache_root() is None:
+        raise ValueError(
+            "请先通过环境变量 AKSHARE_CACHE_DIR 或 set_cache_dir 设置缓存目录"
+        )
+    if exchange_list is None:
+        exchange_list = list(rank_start_date.keys())
+    exchange_list = [item.upper() for item in exchange_list]
+    if end_day is None:
+        end_day = cons.last_trading_day(
+            cons.get_latest_data_date(datetime.datetime.now())
+        )
+    end_day = cons.convert_date(end_day).strftime("%Y%m%d")
+    task_list = []
+    for exchange in exchange_list:
+        stored_set = set(list_keys(f"rank_store/{exchange}"))
+        if start_day is not None:
+            exchange_start_day = cons.convert_date(start_day).strftime("%Y%m%d")
+        else:
+            last_date = get_rank_store_last_date(exchange)
+            if last_date is None:
+                exchange_start_day = rank_start_date[exchange]
+            else:
+                exchange_start_day = (
+                    cons.convert_date(last_date) + datetime.timedelta(days=1)
+                ).strftime("%Y%m%d")
+        exchange_start_day = max(exchange_start_day, rank_start_date[exchange])
+        task_list.extend(
+            (exchange, item)
+            for item in calendar
+            if exchange_start_day <= item <= end_day and item not in stored_set
+        )
+
+    def _update(task):
+        exchange, date = task
+        try:
+            data, complete = _rank_store_fetch(exchange, date)
+        except Exception as e:
+            warnings.warn(f"{exchange} {date} 持仓排名请求失败: {e}")
+            return None
+        return len(data) if complete else None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        count_list = list(executor.map(_update, task_list))
+    temp_df = pd.DataFrame(task_list, columns=["exchange", "date"])
+    temp_df["count"] = pd.to_numeric(pd.Series(count_list, dtype="object"))
+    return temp_df
+
+
+def _shfe_rank_table(date, vars_list: list):
+    """
+    上海期货交易所会员成交及持仓排名表, 同时返回是否请求成功
+    :param date: 交易日
+    :type date: str or datetime.date
+    :param vars_list: 合约品种列表
+    :type vars_list: list
+    :return: 持仓排名明细和请求是否成功
+    :rtype: tuple
     """
     date = cons.convert_date(date) if date is not None else datetime.date.today()
     if date < datetime.date(year=2002, month=1, day=7):
         print("shfe数据源开始日期为 20020107，跳过")
-        return {}
+        return {}, True
     if date.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
-        return {}
+        return {}, True
     url = cons.SHFE_VOL_RANK_URL_20250701 % (date.strftime("%Y%m%d"))
-    r = requests_link(url, encoding="utf-8", headers=cons.shfe_headers)
     try:
-        context = json.loads(r.text)
+        content = fetch_raw(
+            exchange="SHFE",
+            date=date.strftime("%Y%m%d"),
+            product="rank",
+            fetch=lambda: requests_link(
+                url, encoding="utf-8", headers=cons.shfe_headers
+            ).content,
+            validate=is_json,
+        )
+        context = json.loads(content)
     except:  # noqa: E722
-        return {}
+        return {}, False
     df = pd.DataFrame(context["o_cursor"])
 
     df = df.rename(
@@ -335,7 +512,7 @@ def get_shfe_rank_table(
     )
 
     if len(df.columns) < 3:
-        return {}
+        return {}, True
     df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
     df = df.map(lambda x: None if x == "" else x)
     df["variety"] = df["symbol"].apply(lambda x: symbol_varieties(x))
@@ -359,7 +536,39 @@ def get_shfe_rank_table(
             df_symbol = df_var[df_var["symbol"] == symbol].copy()
             df_symbol["symbol"] = df_symbol["symbol"].str.upper()
             big_dict[symbol] = df_symbol.reset_index(drop=True)
-    return big_dict
+    return big_dict, True
+
+
+def get_shfe_rank_table(
+    date: str = None, vars_list: list = cons.contract_symbols
+) -> dict:
+    """
+    上海期货交易所会员成交及持仓排名表
+    https://www.shfe.com.cn/
+    https://tsite.shfe.com.cn/statements/dataview.html?paramid=kx
+    注：该交易所只公布每个品种内部的标的排名，没有公布品种的总排名
+    数据从 20020107 开始，每交易日 16:30 左右更新数据
+    :param date: 交易日
+    :type date: str
+    :param vars_list: 合约品种如 RB、AL等列表; 为空时为所有商品
+    :type vars_list: list
+    :return: 上海期货交易所会员成交及持仓排名表
+    :rtype: dict
+    rank                        排名                        int
+    vol_party_name              成交量排序的当前名次会员        string(中文)
+    vol                         该会员成交量                  int
+    vol_chg                     该会员成交量变化量             int
+    long_party_name             持多单排序的当前名次会员        string(中文)
+    long_open_interest          该会员持多单                  int
+    long_open_interest_chg      该会员持多单变化量             int
+    short_party_name            持空单排序的当前名次会员        string(中文)
+    short_open_interest         该会员持空单                  int
+    short_open_interest_chg     该会员持空单变化量             int
+    symbol                      标的合约                     string
+    var                         品种                        string
+    date                        日期                        string YYYYMMDD
+    """
+    return _shfe_rank_table(date, vars_list)[0]
 
 
 def _czce_df_read(url, skip_rows, encoding="utf-8", header=0):
@@ -450,8 +659,14 @@ def get_rank_table_czce(date: str = "20251103") -> dict:
             f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date.year}/"
             f"{date.isoformat().replace('-', '')}/FutureDataHolding.xls"
         )
-    r = requests.get(url, headers=headers)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    content = fetch_raw(
+        exchange="CZCE",
+        date=date.strftime("%Y%m%d"),
+        product="rank",
+        fetch=lambda: requests.get(url, headers=headers).content,
+        validate=is_excel,
+    )
+    temp_df = pd.read_excel(BytesIO(content))
 
     temp_pinzhong_index = [
         item + 1
@@ -519,6 +734,8 @@ def _get_dce_contract_list(date, var):
     :param var: 合约品种
     :return: list 公布了持仓排名的合约列表
     """
+    from bs4 import BeautifulSoup
+
     url = "http://portal.dce.com.cn/publicweb/quotesdata/memberDealPosiQuotes.html"
     headers = {
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;"
@@ -545,10 +762,19 @@ def _get_dce_contract_list(date, var):
         "contract": "",
     }
 
-    while 1:
+    for _ in range(20):
         try:
-            r = requests.post(url, params=params, headers=headers)
-            soup = BeautifulSoup(r.text, "lxml")
+            get_rate_limiter(
+                "DCE", rate=cons.FUTURES_EXCHANGE_RATE_LIMIT["DCE"]
+            ).acquire()
+            content = fetch_raw(
+                exchange="DCE",
+                date=date.strftime("%Y%m%d"),
+                product=f"contract_{var.lower()}",
+                fetch=lambda: requests.post(url, params=params, headers=headers).content,
+                validate=lambda x: x.find(b'name="contract"') > -1,
+            )
+            soup = BeautifulSoup(content, "lxml")
             contract_list = [
                 re.findall(
                     r"\d+",
@@ -561,14 +787,150 @@ def _get_dce_contract_list(date, var):
         except:  # noqa: E722
             time.sleep(5)
             continue
+    return []
+
+
+def _dce_rank_contract(date: datetime.date, date_string: str, var: str, symbol: str):
+    """
+    大连商品交易所-单个合约的前 20 会员持仓排名
+    :param date: 交易日
+    :type date: datetime.date
+    :param date_string: 调用方传入的交易日字符串, 写入返回数据的 date 字段
+    :type date_string: str
+    :param var: 合约品种
+    :type var: str
+    :param symbol: 具体合约, e.g., "v2105"
+    :type symbol: str
+    :return: 持仓排名
+    :rtype: pandas.DataFrame
+    """
+    get_rate_limiter("DCE", rate=cons.FUTURES_EXCHANGE_RATE_LIMIT["DCE"]).acquire()
+    url = cons.DCE_VOL_RANK_URL_1 % (
+        var.lower(),
+        symbol,
+        var.lower(),
+        date.year,
+        date.month - 1,
+        date.day,
+    )
+    try:
+        content = fetch_raw(
+            exchange="DCE",
+            date=date.strftime("%Y%m%d"),
+            product=f"rank_{symbol}",
+            fetch=lambda: requests.get(url[:-3] + "excel").content,
+            validate=is_excel,
+        )
+        temp_df = pd.read_excel(BytesIO(content), header=0, skiprows=3)
+        temp_df.dropna(how="any", axis=0, inplace=True)
+        temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
+        del temp_df["名次.1"]
+        del temp_df["名次.2"]
+        temp_df.rename(
+            columns={
+                "名次": "rank",
+                "会员简称": "vol_party_name",
+                "成交量": "vol",
+                "增减": "vol_chg",
+                "会员简称.1": "long_party_name",
+                "持买单量": "long_open_interest",
+                "增减.1": "long_open_interest_chg",
+                "会员简称.2": "short_party_name",
+                "持卖单量": "short_open_interest",
+                "增减.2": "short_open_interest_chg",
+            },
+            inplace=True,
+        )
+        temp_df["symbol"] = symbol.upper()
+        temp_df["var"] = var
+        temp_df["date"] = date_string
+        temp_df = temp_df.map(
+            lambda x: str(x).replace("-", "0") if x == "-" else x
+        )
+        temp_df["rank"] = range(1, len(temp_df) + 1)
+        temp_df["vol"] = temp_df["vol"].astype(float)
+        temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
+        temp_df["long_open_interest"] = temp_df["long_open_interest"].astype(
+            float
+        )
+        temp_df["long_open_interest_chg"] = temp_df[
+            "long_open_interest_chg"
+        ].astype(float)
+        temp_df["short_open_interest"] = temp_df["short_open_interest"].astype(
+            float
+        )
+        temp_df["short_open_interest_chg"] = temp_df[
+            "short_open_interest_chg"
+        ].astype(float)
+        return temp_df
+    except:  # noqa: E722
+        temp_url = "http://portal.dce.com.cn/publicweb/quotesdata/memberDealPosiQuotes.html"
+        payload = {
+            "memberDealPosiQuotes.variety": var.lower(),
+            "memberDealPosiQuotes.trade_type": "0",
+            "year": date.year,
+            "month": date.month - 1,
+            "day": str(date.day).zfill(2),
+            "contract.contract_id": symbol,
+            "contract.variety_id": var.lower(),
+            "contract": "",
+        }
+        r = requests.post(temp_url, data=payload)
+        if r.status_code != 200:
+            return {}
+        else:
+            temp_df = pd.read_html(StringIO(r.text))[1].iloc[:-1, :]
+            del temp_df["名次.1"]
+            del temp_df["名次.2"]
+            temp_df.rename(
+                columns={
+                    "名次": "rank",
+                    "会员简称": "vol_party_name",
+                    "成交量": "vol",
+                    "增减": "vol_chg",
+                    "会员简称.1": "long_party_name",
+                    "持买单量": "long_open_interest",
+                    "增减.1": "long_open_interest_chg",
+                    "会员简称.2": "short_party_name",
+                    "持卖单量": "short_open_interest",
+                    "增减.2": "short_open_interest_chg",
+                },
+                inplace=True,
+            )
+            temp_df["symbol"] = symbol.upper()
+            temp_df["var"] = var
+            temp_df["date"] = date_string
+            temp_df = temp_df.map(
+                lambda x: str(x).replace("-", "0") if x == "-" else x
+            )
+            temp_df["rank"] = range(1, len(temp_df) + 1)
+            temp_df["vol"] = temp_df["vol"].astype(float)
+            temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
+            temp_df["long_open_interest"] = temp_df[
+                "long_open_interest"
+            ].astype(float)
+            temp_df["long_open_interest_chg"] = temp_df[
+                "long_open_interest_chg"
+            ].astype(float)
+            temp_df["short_open_interest"] = temp_df[
+                "short_open_interest"
+            ].astype(float)
+            temp_df["short_open_interest_chg"] = temp_df[
+                "short_open_interest_chg"
+            ].astype(float)
+            return temp_df
 
 
-def get_dce_rank_table(date: str = "20230706", vars_list=cons.contract_symbols) -> dict:
+def get_dce_rank_table(
+    date: str = "20230706", vars_list=cons.contract_symbols, max_workers: int = 4
+) -> dict:
     """
     大连商品交易所前 20 会员持仓排名数据明细, 由于交易所网站问题, 需要 20200720 之后才有数据
     注: 该交易所只公布标的合约排名
     :param date: 日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date 对象, 为空时为当天
     :param vars_list: 合约品种如 RB、AL 等列表为空时为所有商品, 数据从 20060104 开始，每交易日 16:30 左右更新数据
+    :param max_workers: 并发请求的线程数, 所有请求共用大连商品交易所的限速
+    :type max_workers: int
     :return: 持仓排名
     :rtype: pandas.DataFrame
 
@@ -597,160 +959,65 @@ def get_dce_rank_table(date: str = "20230706", vars_list=cons.contract_symbols)
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
         return {}
     vars_list = [i for i in vars_list if i in cons.market_exchange_symbols["dce"]]
-    big_dict = {}
-    for var in vars_list:
-        # var = 'V'
-        symbol_list = _get_dce_contract_list(date, var)
-        for symbol in symbol_list:
-            # print(symbol)
-            url = cons.DCE_VOL_RANK_URL_1 % (
-                var.lower(),
-                symbol,
-                var.lower(),
-                date.year,
-                date.month - 1,
-                date.day,
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        symbol_list_list = list(
+            executor.map(lambda var: _get_dce_contract_list(date, var), vars_list)
+        )
+        task_list = [
+            (var, symbol)
+            for var, symbol_list in zip(vars_list, symbol_list_list)
+            for symbol in symbol_list
+        ]
+        data_list = list(
+            executor.map(
+                lambda task: _dce_rank_contract(date, date_string, task[0], task[1]),
+                task_list,
             )
-            try:
-                temp_df = pd.read_excel(url[:-3] + "excel", header=0, skiprows=3)
-                temp_df.dropna(how="any", axis=0, inplace=True)
-                temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
-                del temp_df["名次.1"]
-                del temp_df["名次.2"]
-                temp_df.rename(
-                    columns={
-                        "名次": "rank",
-                        "会员简称": "vol_party_name",
-                        "成交量": "vol",
-                        "增减": "vol_chg",
-                        "会员简称.1": "long_party_name",
-                        "持买单量": "long_open_interest",
-                        "增减.1": "long_open_interest_chg",
-                        "会员简称.2": "short_party_name",
-                        "持卖单量": "short_open_interest",
-                        "增减.2": "short_open_interest_chg",
-                    },
-                    inplace=True,
-                )
-                temp_df["symbol"] = symbol.upper()
-                temp_df["var"] = var
-                temp_df["date"] = date_string
-                temp_df = temp_df.map(
-                    lambda x: str(x).replace("-", "0") if x == "-" else x
-                )
-                temp_df["rank"] = range(1, len(temp_df) + 1)
-                temp_df["vol"] = temp_df["vol"].astype(float)
-                temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
-                temp_df["long_open_interest"] = temp_df["long_open_interest"].astype(
-                    float
-                )
-                temp_df["long_open_interest_chg"] = temp_df[
-                    "long_open_interest_chg"
-                ].astype(float)
-                temp_df["short_open_interest"] = temp_df["short_open_interest"].astype(
-                    float
-                )
-                temp_df["short_open_interest_chg"] = temp_df[
-                    "short_open_interest_chg"
-                ].astype(float)
-                big_dict[symbol] = temp_df
-            except:  # noqa: E722
-                temp_url = "http://portal.dce.com.cn/publicweb/quotesdata/memberDealPosiQuotes.html"
-                payload = {
-                    "memberDealPosiQuotes.variety": var.lower(),
-                    "memberDealPosiQuotes.trade_type": "0",
-                    "year": date.year,
-                    "month": date.month - 1,
-                    "day": str(date.day).zfill(2),
-                    "contract.contract_id": symbol,
-                    "contract.variety_id": var.lower(),
-                    "contract": "",
-                }
-                r = requests.post(temp_url, data=payload)
-                if r.status_code != 200:
-                    big_dict[symbol] = {}
-                else:
-                    temp_df = pd.read_html(StringIO(r.text))[1].iloc[:-1, :]
-                    del temp_df["名次.1"]
-                    del temp_df["名次.2"]
-                    temp_df.rename(
-                        columns={
-                            "名次": "rank",
-                            "会员简称": "vol_party_name",
-                            "成交量": "vol",
-                            "增减": "vol_chg",
-                            "会员简称.1": "long_party_name",
-                            "持买单量": "long_open_interest",
-                            "增减.1": "long_open_interest_chg",
-                            "会员简称.2": "short_party_name",
-                            "持卖单量": "short_open_interest",
-                            "增减.2": "short_open_interest_chg",
-                        },
-                        inplace=True,
-                    )
-                    temp_df["symbol"] = symbol.upper()
-                    temp_df["var"] = var
-                    temp_df["date"] = date_string
-                    temp_df = temp_df.map(
-                        lambda x: str(x).replace("-", "0") if x == "-" else x
-                    )
-                    temp_df["rank"] = range(1, len(temp_df) + 1)
-                    temp_df["vol"] = temp_df["vol"].astype(float)
-                    temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
-                    temp_df["long_open_interest"] = temp_df[
-                        "long_open_interest"
-                    ].astype(float)
-                    temp_df["long_open_interest_chg"] = temp_df[
-                        "long_open_interest_chg"
-                    ].astype(float)
-                    temp_df["short_open_interest"] = temp_df[
-                        "short_open_interest"
-                    ].astype(float)
-                    temp_df["short_open_interest_chg"] = temp_df[
-                        "short_open_interest_chg"
-                    ].astype(float)
-                    big_dict[symbol] = temp_df
+        )
+    big_dict = {task[1]: data for task, data in zip(task_list, data_list)}
     return big_dict
 
 
-def get_cffex_rank_table(date: str = "20190805", vars_list=cons.contract_symbols):
+def _cffex_rank_content(url: str, headers: dict):
     """
-    中国金融期货交易所前 20 会员持仓排名数据明细
-    http://www.cffex.com.cn/ccpm/
-    注：该交易所既公布品种排名，也公布标的排名
-    :param date: 日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
-    :param vars_list: 合约品种如RB、AL等列表 为空时为所有商品, 数据从20100416开始，每交易日16:30左右更新数据
-    :return: 持仓排名
-    :rtype: pandas.DataFrame
-    :rfield:
-    rank                        排名                        int
-    vol_party_name              成交量排序的当前名次会员        string(中文)
-    vol                         该会员成交量                  int
-    vol_chg                     该会员成交量变化量             int
-    long_party_name             持多单排序的当前名次会员        string(中文)
-    long_open_interest          该会员持多单                  int
-    long_open_interest_chg      该会员持多单变化量             int
-    short_party_name            持空单排序的当前名次会员        string(中文)
-    short_open_interest         该会员持空单                  int
-    short_open_interest_chg     该会员持空单变化量             int
-    symbol                      标的合约                     string
-    var                         品种                        string
-    date                        日期                        string YYYYMMDD
+    中国金融期货交易所-持仓排名原始文件
+    :param url: 文件地址
+    :type url: str
+    :param headers: 请求头
+    :type headers: dict
+    :return: 文件内容; 请求失败时返回 None
+    :rtype: bytes or None
+    """
+    r = requests.get(url, headers=headers)
+    if r.status_code != 200:
+        return None
+    return r.content
 
+
+def _cffex_rank_table(date, vars_list: list):
+    """
+    中国金融期货交易所前 20 会员持仓排名数据明细, 同时返回是否所有品种都请求成功
+    :param date: 交易日
+    :type date: str or datetime.date
+    :param vars_list: 合约品种列表
+    :type vars_list: list
+    :return: 持仓排名明细和是否所有品种都请求成功; 请求失败时持仓排名明细为 None
+    :rtype: tuple
     """
     vars_list = [i for i in vars_list if i in cons.market_exchange_symbols["cffex"]]
     date = cons.convert_date(date) if date is not None else datetime.date.today()
     if date < datetime.date(2010, 4, 16):
         print(Exception("CFFEX 数据源开始日期为 20100416，跳过"))
-        return {}
+        return {}, True
     if date.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
-        return {}
+        return {}, True
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/81.0.4044.138 Safari/537.36",
     }
     big_dict = {}
+    complete = True
     for var in vars_list:
         # print(var)
         # var = "IF"
@@ -761,13 +1028,19 @@ def get_cffex_rank_table(date: str = "20190805", vars_list=cons.contract_symbols
         )
         # url = 'http://www.cffex.com.cn/sj/ccpm/201908/05/IF_1.csv'
         # url = 'http://www.cffex.com.cn/sj/ccpm/202308/08/IF_1.csv'
-        r = requests.get(url, headers=headers)
+        content = fetch_raw(
+            exchange="CFFEX",
+            date=date.strftime("%Y%m%d"),
+            product=f"rank_{var}",
+            fetch=lambda: _cffex_rank_content(url, headers),
+        )
         # 20200316 开始数据结构变化，统一格式
-        if r.status_code == 200:
+        if content is not None:
             try:
                 # 当所需要的合约没有数据时
-                temp_df = pd.read_table(BytesIO(r.content), encoding="gbk", header=None)
+                temp_df = pd.read_table(BytesIO(content), encoding="gbk", header=None)
             except:  # noqa: E722
+                complete = False
                 continue
             need_index = temp_df.iloc[:, 0].str.contains("交易日")
             if sum(need_index) > 2:
@@ -778,9 +1051,9 @@ def get_cffex_rank_table(date: str = "20190805", vars_list=cons.contract_symbols
                 table = table.iloc[2:, :].copy()
                 table.reset_index(inplace=True, drop=True)
             else:
-                table = pd.read_csv(BytesIO(r.content), encoding="gbk")
+                table = pd.read_csv(BytesIO(content), encoding="gbk")
         else:
-            return
+            return None, False
         table = table.dropna(how="any")
         table = table.map(lambda x: x.strip() if isinstance(x, str) else x)
         del table["交易日"]
@@ -789,7 +1062,35 @@ def get_cffex_rank_table(date: str = "20190805", vars_list=cons.contract_symbols
             table_cut.columns = ["symbol", "rank"] + rank_columns
             table_cut = _table_cut_cal(pd.DataFrame(table_cut), symbol)
             big_dict[symbol] = table_cut.reset_index(drop=True)
-    return big_dict
+    return big_dict, complete
+
+
+def get_cffex_rank_table(date: str = "20190805", vars_list=cons.contract_symbols):
+    """
+    中国金融期货交易所前 20 会员持仓排名数据明细
+    http://www.cffex.com.cn/ccpm/
+    注：该交易所既公布品种排名，也公布标的排名
+    :param date: 日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
+    :param vars_list: 合约品种如RB、AL等列表 为空时为所有商品, 数据从20100416开始，每交易日16:30左右更新数据
+    :return: 持仓排名
+    :rtype: pandas.DataFrame
+    :rfield:
+    rank                        排名                        int
+    vol_party_name              成交量排序的当前名次会员        string(中文)
+    vol                         该会员成交量                  int
+    vol_chg                     该会员成交量变化量             int
+    long_party_name             持多单排序的当前名次会员        string(中文)
+    long_open_interest          该会员持多单                  int
+    long_open_interest_chg      该会员持多单变化量             int
+    short_party_name            持空单排序的当前名次会员        string(中文)
+    short_open_interest         该会员持空单                  int
+    short_open_interest_chg     该会员持空单变化量             int
+    symbol                      标的合约                     string
+    var                         品种                        string
+    date                        日期                        string YYYYMMDD
+
+    """
+    return _cffex_rank_table(date, vars_list)[0]
 
 
 def _table_cut_cal(table_cut, symbol):
@@ -841,9 +1142,15 @@ def futures_dce_position_rank(
         "tradeType": "1",
         "lang": "zh",
     }
-    r = requests.post(url, json=payload)
+    content = fetch_raw(
+        exchange="DCE",
+        date=date_str,
+        product="rank",
+        fetch=lambda: requests.post(url, json=payload).content,
+        validate=is_zip,
+    )
     big_dict = dict()
-    with zipfile.ZipFile(BytesIO(r.content), mode="r") as z:
+    with zipfile.ZipFile(BytesIO(content), mode="r") as z:
         for i in z.namelist():
             file_name = i
             if not file_name.startswith(date_str):
@@ -1058,6 +1365,8 @@ def futures_dce_position_rank_other(date: str = "20160104"):
     :return: 合约具体名称列表
     :rtype: list
     """
+    from bs4 import BeautifulSoup
+
     date = cons.convert_date(date) if date is not None else datetime.date.today()
     if date.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
@@ -1188,8 +1497,14 @@ def __futures_gfex_contract_list(symbol: str = "si", date: str = "20240729") ->
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/119.0.0.0 Safari/537.36"
     }
-    r = requests.post(url=url, data=payload, headers=headers)
-    data_json = r.json()
+    content = fetch_raw(
+        exchange="GFEX",
+        date=date,
+        product=f"contract_{symbol}",
+        fetch=lambda: requests.post(url=url, data=payload, headers=headers).content,
+        validate=is_json,
+    )
+    data_json = json.loads(content)
     temp_df = pd.DataFrame(data_json["data"])
     if temp_df.empty:
         return []
@@ -1231,8 +1546,14 @@ def __futures_gfex_contract_data(
                 "data_type": page,
             }
         )
-        r = requests.post(url=url, data=payload, headers=headers)
-        data_json = r.json()
+        content = fetch_raw(
+            exchange="GFEX",
+            date=date,
+            product=f"rank_{contract_id}_{page}",
+            fetch=lambda: requests.post(url=url, data=payload, headers=headers).content,
+            validate=is_json,
+        )
+        data_json = json.loads(content)
         temp_df = pd.DataFrame(data_json["data"])
         if "qtySub" in temp_df.columns:
             temp_df.rename(
@@ -1289,21 +1610,20 @@ def __futures_gfex_contract_data(
     return big_df
 
 
-def futures_gfex_position_rank(date: str = "20231113", vars_list: list = None):
+def _gfex_rank_table(date, vars_list: list = None):
     """
-    广州期货交易所-日成交持仓排名
-    http://www.gfex.com.cn/gfex/rcjccpm/hqsj_tjsj.shtml
-    :param date: 开始日期; 广州期货交易所的日成交持仓排名从 20231110 开始
-    :type date: str
+    广州期货交易所-日成交持仓排名, 同时返回是否所有合约都请求成功
+    :param date: 交易日
+    :type date: str or datetime.date
     :param vars_list: 商品代码列表
     :type vars_list: list
-    :return: 日成交持仓排名
-    :rtype: pandas.DataFrame
+    :return: 日成交持仓排名和是否所有合约都请求成功
+    :rtype: tuple
     """
     date = cons.convert_date(date) if date is not None else datetime.date.today()
     if date.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
-        return {}
+        return {}, True
     date = date.strftime("%Y%m%d")
     if vars_list is None:
         vars_list = __futures_gfex_vars_list()
@@ -1316,7 +1636,7 @@ def futures_gfex_position_rank(date: str = "20231113", vars_list: list = None):
                 symbol=item.lower(), date=date
             )
         except:  # noqa: E722
-            return big_dict
+            return big_dict, False
         for name in futures_contract_list:
             try:
                 temp_df = __futures_gfex_contract_data(
@@ -1324,8 +1644,22 @@ def futures_gfex_position_rank(date: str = "20231113", vars_list: list = None):
                 )
                 big_dict[name] = temp_df
             except:  # noqa: E722
-                return big_dict
-    return big_dict
+                return big_dict, False
+    return big_dict, True
+
+
+def futures_gfex_position_rank(date: str = "20231113", vars_list: list = None):
+    """
+    广州期货交易所-日成交持仓排名
+    http://www.gfex.com.cn/gfex/rcjccpm/hqsj_tjsj.shtml
+    :param date: 开始日期; 广州期货交易所的日成交持仓排名从 20231110 开始
+    :type date: str
+    :param vars_list: 商品代码列表
+    :type vars_list: list
+    :return: 日成交持仓排名
+    :rtype: pandas.DataFrame
+    """
+    return _gfex_rank_table(date, vars_list)[0]
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/12/12 17:00
+Date: 2026/10/19 15:00
 Desc: 生意社网站采集大宗商品现货价格及相应基差数据, 数据时间段从 20110104-至今
 备注：现期差 = 现货价格 - 期货价格(这里的期货价格为结算价)
 黄金为 元/克, 白银为 元/千克, 玻璃现货为 元/平方米, 鸡蛋现货为 元/公斤, 鸡蛋期货为 元/500千克, 其余为 元/吨.
@@ -14,20 +14,55 @@ Desc: 生意社网站采集大宗商品现货价格及相应基差数据, 数据
 """
 
 import datetime
+import functools
 import re
-import time
 import warnings
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from typing import List, Optional
 
 import pandas as pd
+import requests
 
+from akshare.cache import cached
 from akshare.futures import cons
 from akshare.futures.requests_fun import pandas_read_html_link
 from akshare.futures.symbol_var import chinese_to_english
+from akshare.utils.cache import fetch_raw
+from akshare.utils.ratelimit import get_rate_limiter
 
 calendar = cons.get_calendar()
 
 
+# 生意社网站的请求频率, 单位: 次/秒
+SPOT_PRICE_RATE_LIMIT = 2
+
+# 现货价格表中的表头和交易所分组行
+_SPOT_PRICE_SKIP_NAMES = [
+    "商品",
+    "价格",
+    "上海期货交易所",
+    "郑州商品交易所",
+    "大连商品交易所",
+    "广州期货交易所",
+    # 某些天网站没有数据，比如 20180912，此时返回"暂无数据"，但并不是网站被墙了
+    "暂无数据",
+]
+
+# 现货价格的单位换算: 鸡蛋现货为元/公斤, 期货为元/500千克; 玻璃现货为元/平方米, 元/平方米*80=元/吨;
+# 生猪现货为元/公斤, 元/公斤*1000=元/吨(http://www.100ppi.com/sf/959.html), 其余为元/吨
+_SPOT_PRICE_UNIT = {"JD": 500, "FG": 80, "LH": 1000}
+
+_SPOT_PRICE_COLUMNS = [
+    "symbol",
+    "spot_price",
+    "near_contract",
+    "near_contract_price",
+    "dominant_contract",
+    "dominant_contract_price",
+]
+
+
 def futures_spot_price_daily(
     start_day: str = "20210201",
     end_day: str = "20210208",
@@ -54,6 +89,34 @@ def futures_spot_price_daily(
     dom_basis_rate    主力合约相对现货的基差率        float
     date              日期                          string YYYYMMDD
     """
+    temp_df = futures_spot_price_range(
+        start_day=start_day, end_day=end_day, vars_list=vars_list
+    )
+    if len(temp_df) > 0:
+        return temp_df
+
+
+def futures_spot_price_range(
+    start_day: str = "20240102",
+    end_day: str = "20241231",
+    vars_list: list = cons.contract_symbols,
+    max_workers: int = 4,
+) -> pd.DataFrame:
+    """
+    指定时间段内大宗商品现货价格及相应基差
+    多个交易日并发请求并统一限速, 历史交易日的网页缓存到本地; 所有交易日的数据合并后一次计算基差
+    https://www.100ppi.com/sf/
+    :param start_day: 开始日期 format: YYYY-MM-DD 或 YYYYMMDD 或 datetime.date 对象; 为空时为当天
+    :type start_day: str
+    :param end_day: 结束日期 format: YYYY-MM-DD 或 YYYYMMDD 或 datetime.date 对象; 为空时为最近的交易日
+    :type end_day: str
+    :param vars_list: 合约品种如 ["RB", "AL"]; 默认为所有商品
+    :type vars_list: list
+    :param max_workers: 并发请求的线程数; 设置为 1 时逐日请求
+    :type max_workers: int
+    :return: 现货价格及相应基差, 字段与 futures_spot_price 一致
+    :rtype: pandas.DataFrame
+    """
     start_day = (
         cons.convert_date(start_day) if start_day is not None else datetime.date.today()
     )
@@ -62,20 +125,26 @@ def futures_spot_price_daily(
         if end_day is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-    df_list = []
-    while start_day <= end_day:
-        temp_df = futures_spot_price(start_day, vars_list)
-        if temp_df is False:
-            return pd.concat(df_list).reset_index(drop=True)
-        elif temp_df is not None:
-            df_list.append(temp_df)
-        start_day += datetime.timedelta(days=1)
-    if len(df_list) > 0:
-        temp_df = pd.concat(df_list)
-        temp_df.reset_index(drop=True, inplace=True)
-        return temp_df
+    start_day = max(start_day, datetime.date(2011, 1, 4)).strftime("%Y%m%d")
+    end_day = end_day.strftime("%Y%m%d")
+    date_list = [
+        datetime.datetime.strptime(item, "%Y%m%d").date()
+        for item in calendar
+        if start_day <= item <= end_day
+    ]
+    if max_workers <= 1 or len(date_list) <= 1:
+        table_list = [_futures_spot_price_table(item) for item in date_list]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            table_list = list(executor.map(_futures_spot_price_table, date_list))
+    table_list = [item for item in table_list if item is not None]
+    if len(table_list) == 0:
+        return _spot_price_records(pd.DataFrame(columns=["date"] + _SPOT_PRICE_COLUMNS))
+    records = _spot_price_records(pd.concat(table_list, ignore_index=True))
+    return _spot_price_select(records, vars_list)
 
 
+@cached(family="historical", end_date_param="date")
 def futures_spot_price(
     date: str = "20240430", vars_list: list = cons.contract_symbols
 ) -> pd.DataFrame:
@@ -106,163 +175,150 @@ def futures_spot_price(
     if date.strftime("%Y%m%d") not in calendar:
         warnings.warn(f"{date.strftime('%Y%m%d')}非交易日")
         return pd.DataFrame()
-    u1 = "https://www.100ppi.com/sf/"
-    u2 = f'https://www.100ppi.com/sf/day-{date.strftime("%Y-%m-%d")}.html'
-    i = 1
-    while True:
-        for url in [u2, u1]:
+    table_df = _futures_spot_price_table(date)
+    if table_df is None:
+        return pd.DataFrame()
+    return _spot_price_select(_spot_price_records(table_df), vars_list)
+
+
+def _spot_price_read_html(content: bytes) -> list:
+    """
+    解析生意社现货价格网页中的表格
+    :param content: 网页内容
+    :type content: bytes
+    :return: 网页中的表格
+    :rtype: list
+    """
+    return pd.read_html(StringIO(content.decode("utf-8", errors="ignore")))
+
+
+def _spot_price_page_date(tables: list) -> str:
+    """
+    生意社现货价格网页标题中的日期; 请求的日期没有数据时网站会返回其他日期的网页
+    :param tables: 网页中的表格
+    :type tables: list
+    :return: 网页的日期, e.g., "20240430"
+    :rtype: str
+    """
+    return "".join(re.findall(r"[0-9]", str(tables[0].loc[1, 1])))[3:11]
+
+
+def _futures_spot_price_table(date: datetime.date) -> Optional[pd.DataFrame]:
+    """
+    生意社-指定交易日的现货价格和期货价格原始表格
+    历史交易日的网页缓存到本地; 请求失败时重试 5 次, 请求频率由 SPOT_PRICE_RATE_LIMIT 控制
+    :param date: 交易日
+    :type date: datetime.date
+    :return: 原始表格, 第一列为日期; 网站没有该交易日的数据时返回 None
+    :rtype: pandas.DataFrame or None
+    """
+    date_str = date.strftime("%Y%m%d")
+    url_list = [
+        f'https://www.100ppi.com/sf/day-{date.strftime("%Y-%m-%d")}.html',
+        "https://www.100ppi.com/sf/",
+    ]
+    limiter = get_rate_limiter("100PPI", rate=SPOT_PRICE_RATE_LIMIT)
+
+    def fetch(url: str) -> bytes:
+        limiter.acquire()
+        r = requests.get(url, timeout=20)
+        r.raise_for_status()
+        return r.content
+
+    for i in range(1, 6):
+        for url_index, url in enumerate(url_list):
+            parsed = {}
+
+            def validate(data: bytes) -> bool:
+                parsed["tables"] = _spot_price_read_html(data)
+                return _spot_price_page_date(parsed["tables"]) == date_str
+
             try:
-                # url = u2
-                r = pandas_read_html_link(url)
-                string = r[0].loc[1, 1]
-                news = "".join(re.findall(r"[0-9]", string))
-                if news[3:11] == date.strftime("%Y%m%d"):
-                    records = _check_information(r[1], date)
-                    records.index = records["symbol"]
-                    var_list_in_market = [i for i in vars_list if i in records.index]
-                    temp_df = records.loc[var_list_in_market, :]
-                    temp_df.reset_index(drop=True, inplace=True)
-                    return temp_df
-                else:
-                    time.sleep(3)
-            except Exception as e:  # noqa: E722
+                content = fetch_raw(
+                    exchange="100PPI",
+                    date=date_str,
+                    product="sf",
+                    fetch=lambda: fetch(url),
+                    validate=validate,
+                    # 首页是最新交易日的数据, 不缓存
+                    immutable=None if url_index == 0 else False,
+                )
+                tables = parsed.get("tables") or _spot_price_read_html(content)
+                if _spot_price_page_date(tables) == date_str:
+                    table_df = tables[1].loc[:, [0, 1, 2, 3, 5, 6]]
+                    table_df.columns = _SPOT_PRICE_COLUMNS
+                    table_df.insert(0, "date", date_str)
+                    return table_df
+            except Exception as e:
                 print(
                     f"{date.strftime('%Y-%m-%d')}日生意社数据连接失败[错误信息:{e}]，第{str(i)}次尝试，最多5次"
                 )
-                i += 1
-                if i > 5:
-                    print(
-                        f"{date.strftime('%Y-%m-%d')}日生意社数据连接失败, 如果当前交易日是 2018-09-12, "
-                        f"由于生意社源数据缺失, 无法访问, 否则为重复访问已超过5次，您的地址被网站墙了，"
-                        f"请保存好返回数据，稍后从该日期起重试"
-                    )
-                    return pd.DataFrame()
+                break
+        else:
+            # 历史网页和首页都不是该交易日的数据, 如 2018-09-12 生意社源数据缺失
+            return None
+    print(
+        f"{date.strftime('%Y-%m-%d')}日生意社数据连接失败, 重复访问已超过5次，您的地址被网站墙了，"
+        f"请保存好返回数据，稍后从该日期起重试"
+    )
+    return None
 
 
-def _check_information(df_data, date):
+@functools.lru_cache(maxsize=None)
+def _spot_name_to_symbol(name: str) -> Optional[str]:
     """
-    数据验证和计算模块
-    :param df_data: pandas.DataFrame 采集的数据
-    :param date: datetime.date 具体某一天 YYYYMMDD
-    :return: pandas.DataFrame
-    中间数据
-    symbol  spot_price near_contract  ...  near_basis_rate dom_basis_rate      date
-     CU    49620.00        cu1811  ...        -0.002418      -0.003426  20181108
-     RB     4551.54        rb1811  ...        -0.013521      -0.134359  20181108
-     ZN    22420.00        zn1811  ...        -0.032114      -0.076271  20181108
-     AL    13900.00        al1812  ...         0.005396       0.003957  20181108
-     AU      274.10        au1811  ...         0.005655       0.020430  20181108
-     WR     4806.25        wr1903  ...        -0.180026      -0.237035  20181108
-     RU    10438.89        ru1811  ...        -0.020969       0.084406  20181108
-     PB    18600.00        pb1811  ...        -0.001344      -0.010215  20181108
-     AG     3542.67        ag1811  ...        -0.000754       0.009408  20181108
-     BU     4045.53        bu1811  ...        -0.129904      -0.149679  20181108
-     HC     4043.33        hc1811  ...        -0.035449      -0.088128  20...
+    现货价格表中的商品名称转换为品种代码
+    :param name: 商品名称, e.g., "螺纹钢"
+    :type name: str
+    :return: 品种代码, e.g., "RB"; 无法识别的名称返回 None
+    :rtype: str or None
     """
-    df_data = df_data.loc[:, [0, 1, 2, 3, 5, 6]]
-    df_data.columns = [
-        "symbol",
-        "spot_price",
-        "near_contract",
-        "near_contract_price",
-        "dominant_contract",
-        "dominant_contract_price",
-    ]
-    records = pd.DataFrame()
-    for string in df_data["symbol"].tolist():
-        news = "".join(re.findall(r"[\u4e00-\u9fa5]", string))
-        if news == "":
-            news = string.strip()
-
-        """
-        if string == "PTA":
-            news = "PTA"
-        else:
-            news = "".join(re.findall(r"[\u4e00-\u9fa5]", string))
-        """
-
-        if news != "" and news not in [
-            "商品",
-            "价格",
-            "上海期货交易所",
-            "郑州商品交易所",
-            "大连商品交易所",
-            "广州期货交易所",
-            # 某些天网站没有数据，比如 20180912，此时返回"暂无数据"，但并不是网站被墙了
-            "暂无数据",
-        ]:
-            symbol = chinese_to_english(news)
-            record = pd.DataFrame(df_data[df_data["symbol"] == string])
-            record.loc[:, "symbol"] = symbol
-            record.loc[:, "spot_price"] = record.loc[:, "spot_price"].astype(float)
-            if (
-                symbol == "JD"
-            ):  # 鸡蛋现货为元/公斤, 鸡蛋期货为元/500千克, 其余元/吨(http://www.100ppi.com/sf/)
-                record.loc[:, "spot_price"] = float(record["spot_price"].iloc[0]) * 500
-            elif (
-                symbol == "FG"
-            ):  # 上表中现货单位为元/平方米, 期货单位为元/吨. 换算公式：元/平方米*80=元/吨(http://www.100ppi.com/sf/959.html)
-                record.loc[:, "spot_price"] = float(record["spot_price"].iloc[0]) * 80
-            elif (
-                symbol == "LH"
-            ):  # 上表中现货单位为元/公斤, 期货单位为元/吨. 换算公式：元/公斤*1000=元/吨(http://www.100ppi.com/sf/959.html)
-                record.loc[:, "spot_price"] = float(record["spot_price"].iloc[0]) * 1000
-            records = pd.concat([records, record])
-
-    # 20241129:如果某日没有数据，直接返回返回空表
-    if records.empty:
-        records = df_data.iloc[0:0]
-        records["near_basis"] = pd.Series(dtype="float")
-        records["dom_basis"] = pd.Series(dtype="float")
-        records["near_basis_rate"] = pd.Series(dtype="float")
-        records["dom_basis_rate"] = pd.Series(dtype="float")
-        records["date"] = pd.Series(dtype="object")
-        return records
-
-    records.loc[:, ["near_contract_price", "dominant_contract_price", "spot_price"]] = (
-        records.loc[
-            :, ["near_contract_price", "dominant_contract_price", "spot_price"]
-        ].astype("float")
-    )
+    try:
+        return chinese_to_english(name)
+    except ValueError:
+        return None
 
-    records.loc[:, "near_contract"] = records["near_contract"].replace(
-        r"[^0-9]*(\d*)$", r"\g<1>", regex=True
-    )
-    records.loc[:, "dominant_contract"] = records["dominant_contract"].replace(
-        r"[^0-9]*(\d*)$", r"\g<1>", regex=True
-    )
 
-    records.loc[:, "near_month"] = records.loc[:, "near_contract"]
-    records.loc[:, "near_contract"] = records["symbol"] + records.loc[
-        :, "near_contract"
-    ].astype("int").astype("str")
-    records.loc[:, "dominant_month"] = records.loc[:, "dominant_contract"]
-    records.loc[:, "dominant_contract"] = records["symbol"] + records.loc[
-        :, "dominant_contract"
-    ].astype("int").astype("str")
-
-    records["near_contract"] = records["near_contract"].apply(
-        lambda x: x.lower()
-        if x[:-4]
-        in cons.market_exchange_symbols["shfe"] + cons.market_exchange_symbols["dce"]
-        else x
-    )
-    records.loc[:, "dominant_contract"] = records.loc[:, "dominant_contract"].apply(
-        lambda x: x.lower()
-        if x[:-4]
-        in cons.market_exchange_symbols["shfe"] + cons.market_exchange_symbols["dce"]
-        else x
-    )
-    records.loc[:, "near_contract"] = records.loc[:, "near_contract"].apply(
-        lambda x: x[:-4] + x[-3:]
-        if x[:-4] in cons.market_exchange_symbols["czce"]
-        else x
-    )
-    records.loc[:, "dominant_contract"] = records.loc[:, "dominant_contract"].apply(
-        lambda x: x[:-4] + x[-3:]
-        if x[:-4] in cons.market_exchange_symbols["czce"]
-        else x
+def _spot_price_records(df_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    数据验证和基差计算, 多个交易日的数据一次计算
+    :param df_data: 原始表格, 包含 date 和 _SPOT_PRICE_COLUMNS 字段
+    :type df_data: pandas.DataFrame
+    :return: 现货价格及相应基差
+    :rtype: pandas.DataFrame
+    """
+    records = df_data.reset_index(drop=True)
+    name = records["symbol"].astype(str)
+    chinese_name = name.str.replace("[^\u4e00-\u9fa5]", "", regex=True)
+    name = chinese_name.where(chinese_name != "", name.str.strip())
+    symbol_map = {item: _spot_name_to_symbol(item) for item in name.unique()}
+    symbol = name.map(symbol_map).where(~name.isin(_SPOT_PRICE_SKIP_NAMES))
+    records = records[symbol.notna()].copy()
+    records["symbol"] = symbol[symbol.notna()].astype(str)
+
+    for item in ["spot_price", "near_contract_price", "dominant_contract_price"]:
+        records[item] = pd.to_numeric(records[item], errors="coerce").astype("float64")
+    records["spot_price"] = records["spot_price"] * records["symbol"].map(
+        _SPOT_PRICE_UNIT
+    ).fillna(1)
+
+    lower_symbol_list = (
+        cons.market_exchange_symbols["shfe"] + cons.market_exchange_symbols["dce"]
     )
+    is_lower = records["symbol"].isin(lower_symbol_list)
+    is_czce = records["symbol"].isin(cons.market_exchange_symbols["czce"])
+    contract_symbol = records["symbol"].where(~is_lower, records["symbol"].str.lower())
+    for contract, month in [
+        ("near_contract", "near_month"),
+        ("dominant_contract", "dominant_month"),
+    ]:
+        records[month] = (
+            records[contract].astype(str).str.extract(r"(\d*)$", expand=False)
+        )
+        month_number = pd.to_numeric(records[month], errors="coerce")
+        month_str = month_number.astype("Int64").astype("str")
+        month_str = month_str.where(~is_czce, month_str.str[-3:])
+        records[contract] = (contract_symbol + month_str).where(month_number.notna())
 
     records["near_basis"] = records["near_contract_price"] - records["spot_price"]
     records["dom_basis"] = records["dominant_contract_price"] - records["spot_price"]
@@ -272,11 +328,47 @@ def _check_information(df_data, date):
     records["dom_basis_rate"] = (
         records["dominant_contract_price"] / records["spot_price"] - 1
     )
-    # records.loc[:, "date"] = date.strftime("%Y%m%d")
-    records.insert(0, "date", date.strftime("%Y%m%d"))
+    records.reset_index(drop=True, inplace=True)
     return records
 
 
+def _spot_price_select(records: pd.DataFrame, vars_list: list) -> pd.DataFrame:
+    """
+    按 vars_list 的顺序筛选品种, 多个交易日时按日期排列
+    :param records: 现货价格及相应基差
+    :type records: pandas.DataFrame
+    :param vars_list: 合约品种列表
+    :type vars_list: list
+    :return: 筛选后的数据
+    :rtype: pandas.DataFrame
+    """
+    var_list = list(dict.fromkeys(item for item in vars_list))
+    order = pd.Series(range(len(var_list)), index=var_list)
+    temp_df = records[records["symbol"].isin(var_list)].copy()
+    temp_df["_order"] = temp_df["symbol"].map(order)
+    temp_df.sort_values(["date", "_order"], kind="stable", inplace=True)
+    del temp_df["_order"]
+    temp_df.reset_index(drop=True, inplace=True)
+    return temp_df
+
+
+def _check_information(df_data, date):
+    """
+    数据验证和计算模块
+    :param df_data: pandas.DataFrame 采集的数据
+    :param date: datetime.date 具体某一天 YYYYMMDD
+    :return: pandas.DataFrame
+    中间数据
+    symbol  spot_price near_contract  ...  near_basis_rate dom_basis_rate      date
+     CU    49620.00        cu1811  ...        -0.002418      -0.003426  20181108
+     RB     4551.54        rb1811  ...        -0.013521      -0.134359  20181108
+    """
+    df_data = df_data.loc[:, [0, 1, 2, 3, 5, 6]]
+    df_data.columns = _SPOT_PRICE_COLUMNS
+    df_data.insert(0, "date", date.strftime("%Y%m%d"))
+    return _spot_price_records(df_data)
+
+
 def _join_head(content: pd.DataFrame) -> List:
     headers = []
     for s1, s2 in zip(content.iloc[0], content.iloc[1]):
@@ -358,6 +450,11 @@ def futures_spot_price_previous(date: str = "20240430") -> pd.DataFrame:
 
 
 if __name__ == "__main__":
+    futures_spot_price_range_df = futures_spot_price_range(
+        start_day="20240102", end_day="20241231", vars_list=["RB", "CU", "MA"]
+    )
+    print(futures_spot_price_range_df)
+
     futures_spot_price_daily_df = futures_spot_price_daily(
         start_day="20250708", end_day="20250709", vars_list=["BZ", "RB"]
     )
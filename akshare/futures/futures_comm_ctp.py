@@ -11,7 +11,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def futures_fees_info() -> pd.DataFrame:
@@ -21,6 +20,8 @@ def futures_fees_info() -> pd.DataFrame:
     :return: 期货交易费用参照表
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "http://openctp.cn/fees.html"
     r = requests.get(url)
     r.encoding = "utf-8"
@@ -10,7 +10,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def _futures_comm_qihuo_process(df: pd.DataFrame, name: str = None) -> pd.DataFrame:
@@ -24,6 +23,8 @@ def _futures_comm_qihuo_process(df: pd.DataFrame, name: str = None) -> pd.DataFr
     :return: 处理后的数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     import urllib3
 
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -10,7 +10,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def futures_contract_detail(symbol: str = "AP2101") -> pd.DataFrame:
@@ -47,6 +46,8 @@ def futures_contract_detail_em(symbol: str = "v2602F") -> pd.DataFrame:
     :return: 期货合约详情
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = f"https://quote.eastmoney.com/qihuo/{symbol}.html"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
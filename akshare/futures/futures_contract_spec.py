@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 期货品种交易参数库
+按品种汇总交易所、合约乘数、最小变动价位和交易保证金比例, 供实时行情按合约代码批量关联
+数据来源依次为: 国泰君安期货-交易日历数据表(所有交易所), 大商所、广期所和郑商所的合约信息, akshare.futures.cons 中的品种列表
+交易参数按交易日缓存; 设置了本地缓存目录时保存在磁盘上, 同一交易日只请求一次
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
+import pandas as pd
+
+from akshare.futures import cons
+from akshare.futures.futures_rule import futures_rule
+from akshare.futures_derivative.futures_contract_info_czce import (
+    futures_contract_info_czce,
+)
+from akshare.futures_derivative.futures_contract_info_dce import (
+    futures_contract_info_dce,
+)
+from akshare.futures_derivative.futures_contract_info_gfex import (
+    futures_contract_info_gfex,
+)
+from akshare.utils.cache import load_object, save_object
+
+FUTURES_EXCHANGE_NAME = {
+    "cffex": "中国金融期货交易所",
+    "dce": "大连商品交易所",
+    "czce": "郑州商品交易所",
+    "shfe": "上海期货交易所",
+    "ine": "上海国际能源交易中心",
+    "gfex": "广州期货交易所",
+}
+
+FUTURES_CONTRACT_SPEC_COLUMNS = [
+    "exchange",
+    "exchange_name",
+    "variety_name",
+    "multiplier",
+    "tick_size",
+    "margin_rate",
+]
+
+# 交易所简称
+_EXCHANGE_ALIAS = {
+    "中金所": "cffex",
+    "大商所": "dce",
+    "郑商所": "czce",
+    "上期所": "shfe",
+    "能源中心": "ine",
+    "上期能源": "ine",
+    "广期所": "gfex",
+}
+
+_SPEC_NAMESPACE = "futures_contract_spec"
+
+_spec_memory: Dict[str, pd.DataFrame] = {}
+_spec_lock = threading.Lock()
+
+
+def futures_variety(symbol: pd.Series) -> pd.Series:
+    """
+    合约代码对应的品种代码, e.g., "V2309" -> "V", "ta309" -> "TA"
+    :param symbol: 合约代码
+    :type symbol: pandas.Series
+    :return: 品种代码
+    :rtype: pandas.Series
+    """
+    return symbol.astype(str).str.extract(r"^([A-Za-z]+)", expand=False).str.upper()
+
+
+def _number(series: pd.Series) -> pd.Series:
+    """
+    提取带单位字符串中的数值, e.g., "10吨/手" -> 10
+    """
+    return pd.to_numeric(
+        series.astype(str)
+        .str.replace(",", "")
+        .str.extract(r"(-?\d+\.?\d*)", expand=False),
+        errors="coerce",
+    )
+
+
+def _base_spec() -> pd.DataFrame:
+    """
+    akshare.futures.cons 中的品种列表, 只包含品种和交易所
+    """
+    row_list = [
+        (variety, exchange)
+        for exchange, variety_list in cons.market_exchange_symbols.items()
+        for variety in variety_list
+    ]
+    temp_df = pd.DataFrame(row_list, columns=["variety", "exchange"])
+    return temp_df.drop_duplicates(subset=["variety"]).set_index("variety")
+
+
+def _rule_spec(date: str) -> pd.DataFrame:
+    """
+    国泰君安期货-交易日历数据表, 所有交易所的品种交易参数; 从指定交易日开始向前最多尝试 5 个交易日
+    """
+    calendar = cons.get_calendar()
+    date_list = [date] + [item for item in calendar if item < date][-4:][::-1]
+    for item in date_list:
+        try:
+            temp_df = futures_rule(date=item)
+        except Exception:
+            continue
+        if temp_df is None or temp_df.empty or "代码" not in temp_df.columns:
+            continue
+        temp_df = temp_df.copy()
+        temp_df["variety"] = futures_variety(temp_df["代码"])
+        spec_df = pd.DataFrame(
+            {
+                "variety": temp_df["variety"],
+                "exchange_name": temp_df.get("交易所"),
+                "variety_name": temp_df.get("品种"),
+                "multiplier": temp_df.get("合约乘数"),
+                "tick_size": temp_df.get("最小变动价位"),
+                "margin_rate": temp_df.get("交易保证金比例"),
+            }
+        )
+        spec_df = spec_df.dropna(subset=["variety"])
+        return spec_df.drop_duplicates(subset=["variety"]).set_index("variety")
+    return pd.DataFrame()
+
+
+def _exchange_spec(date: str) -> pd.DataFrame:
+    """
+    大商所、广期所和郑商所的合约信息, 包含交易单位和最小变动价位; 上期所、能源中心和中金所的合约信息不包含这两项
+    """
+    task_dict = {
+        "dce": (
+            futures_contract_info_dce,
+            {},
+            ("合约", "品种名称", "交易单位", "最小变动价位", None),
+        ),
+        "gfex": (
+            futures_contract_info_gfex,
+            {},
+            ("合约代码", "品种", "交易单位", "最小变动单位", None),
+        ),
+        "czce": (
+            futures_contract_info_czce,
+            {"date": date},
+            ("产品代码", "产品名称", "交易单位", "最小变动价位", "交易保证金率"),
+        ),
+    }
+
+    def _fetch(exchange):
+        func, kwargs, columns = task_dict[exchange]
+        try:
+            temp_df = func(**kwargs)
+        except Exception:
+            return None
+        symbol, name, unit, tick, margin = columns
+        if temp_df is None or temp_df.empty or symbol not in temp_df.columns:
+            return None
+        spec_df = pd.DataFrame(
+            {
+                "variety": futures_variety(temp_df[symbol]),
+                "exchange": exchange,
+                "exchange_name": FUTURES_EXCHANGE_NAME[exchange],
+                "variety_name": temp_df.get(name),
+                "multiplier": _number(temp_df[unit]) if unit in temp_df else None,
+                "tick_size": _number(temp_df[tick]) if tick in temp_df else None,
+                "margin_rate": (
+                    _number(temp_df[margin]) if margin and margin in temp_df else None
+                ),
+            }
+        )
+        return spec_df.dropna(subset=["variety"])
+
+    with ThreadPoolExecutor(max_workers=len(task_dict)) as ex:
+        frame_list = [item for item in ex.map(_fetch, task_dict) if item is not None]
+    if not frame_list:
+        return pd.DataFrame()
+    big_df = pd.concat(frame_list, ignore_index=True)
+    return big_df.drop_duplicates(subset=["variety"]).set_index("variety")
+
+
+def _build_spec(date: str) -> Tuple[pd.DataFrame, bool]:
+    """
+    合并各数据源, 靠前的数据源优先
+    :return: 品种交易参数和是否完整; 交易规则请求成功, 或所有品种都有合约乘数和最小变动价位时为完整
+    :rtype: tuple
+    """
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        rule_future = ex.submit(_rule_spec, date)
+        exchange_future = ex.submit(_exchange_spec, date)
+        rule_df = rule_future.result()
+        exchange_df = exchange_future.result()
+    spec_df = _base_spec()
+    for source_df in [exchange_df, rule_df]:
+        if source_df.empty:
+            continue
+        spec_df = source_df.combine_first(spec_df)
+    spec_df = spec_df.reindex(columns=FUTURES_CONTRACT_SPEC_COLUMNS)
+    # 交易所名称优先, 能源中心的品种在 cons 中归入上期所
+    name_map = {value: key for key, value in FUTURES_EXCHANGE_NAME.items()}
+    name_map.update(_EXCHANGE_ALIAS)
+    spec_df["exchange"] = (
+        spec_df["exchange_name"].map(name_map).fillna(spec_df["exchange"])
+    )
+    spec_df["exchange_name"] = spec_df["exchange"].map(FUTURES_EXCHANGE_NAME)
+    for item in ["multiplier", "tick_size", "margin_rate"]:
+        spec_df[item] = pd.to_numeric(spec_df[item], errors="coerce")
+    spec_df.index.name = "variety"
+    base_index = _base_spec().index
+    complete = not rule_df.empty or bool(
+        spec_df.reindex(base_index)[["multiplier", "tick_size"]].notna().all().all()
+    )
+    return spec_df.sort_index(), complete
+
+
+def futures_contract_spec(date: str = None, refresh: bool = False) -> pd.DataFrame:
+    """
+    期货品种交易参数库
+    :param date: 交易日; 为空时为当前交易日
+    :type date: str
+    :param refresh: 是否忽略缓存重新请求
+    :type refresh: bool
+    :return: 品种交易参数, 索引为大写的品种代码
+    :rtype: pandas.DataFrame
+    exchange        交易所代码, e.g., "dce"
+    exchange_name   交易所名称
+    variety_name    品种名称
+    multiplier      合约乘数
+    tick_size       最小变动价位
+    margin_rate     交易保证金比例, 单位: %
+    """
+    if date is None:
+        date = cons.get_current_trading_day()
+    date = str(date).replace("-", "")
+    with _spec_lock:
+        spec_df = None if refresh else _spec_memory.get(date)
+        if spec_df is None and not refresh:
+            spec_df = load_object(_SPEC_NAMESPACE, date)
+        if spec_df is None:
+            spec_df, complete = _build_spec(date)
+            # 交易规则请求失败时部分交易所的品种缺少交易参数, 不缓存
+            if complete:
+                save_object(_SPEC_NAMESPACE, date, spec_df)
+                _spec_memory[date] = spec_df
+        else:
+            _spec_memory[date] = spec_df
+    return spec_df.copy()
+
+
+def futures_contract_spec_join(
+    symbol: pd.Series, spec_df: pd.DataFrame = None
+) -> pd.DataFrame:
+    """
+    按合约代码关联品种交易参数
+    :param symbol: 合约代码, e.g., pd.Series(["V2309", "IF2309"])
+    :type symbol: pandas.Series
+    :param spec_df: 品种交易参数; 为空时使用当前交易日的交易参数库
+    :type spec_df: pandas.DataFrame
+    :return: 与 symbol 对齐的交易参数
+    :rtype: pandas.DataFrame
+    """
+    if spec_df is None:
+        spec_df = futures_contract_spec()
+    temp_df = spec_df.reindex(futures_variety(symbol).tolist())
+    temp_df.index = symbol.index
+    return temp_df
+
+
+if __name__ == "__main__":
+    futures_contract_spec_df = futures_contract_spec()
+    print(futures_contract_spec_df)
+
+    futures_contract_spec_join_df = futures_contract_spec_join(
+        pd.Series(["V2309", "IF2309", "TA309"])
+    )
+    print(futures_contract_spec_join_df)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/11/30 18:00
+Date: 2026/10/19 15:00
 Desc: 期货日线行情
 """
 
@@ -9,6 +9,7 @@ import datetime
 import json
 import re
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO, StringIO
 
 import numpy as np
@@ -17,6 +18,15 @@ import requests
 
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link
+from akshare.utils.cache import (
+    fetch_raw,
+    is_immutable_date,
+    is_json,
+    is_zip,
+    load_frame,
+    save_frame,
+)
+from akshare.utils.ratelimit import get_rate_limiter
 
 calendar = cons.get_calendar()
 
@@ -35,8 +45,15 @@ def _futures_daily_czce(
     :rtype: pandas.DataFrame
     """
     url = f"http://www.czce.com.cn/cn/exchange/{dataset}.zip"
-    r = requests.get(url)
-    with zipfile.ZipFile(BytesIO(r.content)) as file:
+    content = fetch_raw(
+        exchange="CZCE",
+        date=dataset[-4:],
+        product="datahistory",
+        fetch=lambda: requests.get(url).content,
+        validate=is_zip,
+        immutable=is_immutable_date(f"{dataset[-4:]}1231"),
+    )
+    with zipfile.ZipFile(BytesIO(content)) as file:
         with file.open(f"{dataset}.txt") as my_file:
             data = my_file.read().decode("gb2312")
             data_df = pd.read_table(StringIO(data), sep=r"|", header=1)
@@ -123,9 +140,15 @@ def get_cffex_daily(date: str = "20100416") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/108.0.0.0 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    content = fetch_raw(
+        exchange="CFFEX",
+        date=day.strftime("%Y%m%d"),
+        product="daily",
+        fetch=lambda: requests.get(url, headers=headers).content,
+        validate=is_zip,
+    )
     try:
-        with zipfile.ZipFile(BytesIO(r.content)) as file:
+        with zipfile.ZipFile(BytesIO(content)) as file:
             with file.open(f"{date}_1.csv") as my_file:
                 data = my_file.read().decode("gb2312")
                 data_df = pd.read_csv(StringIO(data))
@@ -229,9 +252,15 @@ def get_gfex_daily(date: str = "20221223") -> pd.DataFrame:
         "X-Requested-With": "XMLHttpRequest",
         "content-type": "application/x-www-form-urlencoded",
     }
-    r = requests.post(url, data=payload, headers=headers)
+    content = fetch_raw(
+        exchange="GFEX",
+        date=day.strftime("%Y%m%d"),
+        product="daily",
+        fetch=lambda: requests.post(url, data=payload, headers=headers).content,
+        validate=lambda x: len(json.loads(x)["data"]) > 0,
+    )
     try:
-        data_json = r.json()
+        data_json = json.loads(content)
     except:  # noqa: E722
         return pd.DataFrame()
     result_df = pd.DataFrame(data_json["data"])
@@ -288,10 +317,16 @@ def get_ine_daily(date: str = "20241129") -> pd.DataFrame:
         # warnings.warn(f"{day.strftime('%Y%m%d')}非交易日")
         return pd.DataFrame()
     url = f"https://www.ine.cn/data/tradedata/future/dailydata/kx{day.strftime('%Y%m%d')}.dat"
-    r = requests.get(url, headers=cons.shfe_headers)
+    content = fetch_raw(
+        exchange="INE",
+        date=day.strftime("%Y%m%d"),
+        product="daily",
+        fetch=lambda: requests.get(url, headers=cons.shfe_headers).content,
+        validate=is_json,
+    )
     result_df = pd.DataFrame()
     try:
-        data_json = r.json()
+        data_json = json.loads(content)
     except:  # noqa: E722
         return pd.DataFrame()
     temp_df = pd.DataFrame(data_json["o_curinstrument"]).iloc[:-1, :]
@@ -365,12 +400,23 @@ def get_czce_daily(date: str = "20050525") -> pd.DataFrame:
             url = u % (day.strftime("%Y"), day.strftime("%Y%m%d"))
         listed_columns = cons.CZCE_COLUMNS
         output_columns = cons.OUTPUT_COLUMNS
-        try:
+
+        def _fetch_czce_daily() -> bytes:
             r = requests.get(url, headers=headers)
+            # 出错页面不能保存到原始数据库中
+            r.raise_for_status()
             if datetime.date(2015, 11, 12) <= day <= datetime.date(2017, 12, 27):
-                html = str(r.content, encoding="gbk")
-            else:
-                html = r.text
+                return str(r.content, encoding="gbk").encode("utf-8")
+            return r.text.encode("utf-8")
+
+        try:
+            html = fetch_raw(
+                exchange="CZCE",
+                date=day.strftime("%Y%m%d"),
+                product="daily",
+                fetch=_fetch_czce_daily,
+                validate=lambda x: x.decode("utf-8").find("您的访问出错了") < 0,
+            ).decode("utf-8")
         except requests.exceptions.HTTPError as reason:
             if reason.response.status_code != 404:
                 print(
@@ -479,10 +525,16 @@ def get_shfe_daily(date: str = "20220415") -> pd.DataFrame:
         return pd.DataFrame()
     try:
         json_data = json.loads(
-            requests_link(
-                cons.SHFE_DAILY_URL_20250630 % (day.strftime("%Y%m%d")),
-                headers=cons.shfe_headers,
-            ).text
+            fetch_raw(
+                exchange="SHFE",
+                date=day.strftime("%Y%m%d"),
+                product="daily",
+                fetch=lambda: requests_link(
+                    cons.SHFE_DAILY_URL_20250630 % (day.strftime("%Y%m%d")),
+                    headers=cons.shfe_headers,
+                ).content,
+                validate=is_json,
+            )
         )
     except requests.HTTPError as reason:
         if reason.response != 404:
@@ -547,8 +599,14 @@ def get_dce_daily(date: str = "20251027") -> pd.DataFrame:
         "tradeType": "1",
         "varietyId": "all",
     }
-    r = requests.post(url, json=payload)
-    data_json = r.json()
+    content = fetch_raw(
+        exchange="DCE",
+        date=day.strftime("%Y%m%d"),
+        product="daily",
+        fetch=lambda: requests.post(url, json=payload).content,
+        validate=lambda x: len(json.loads(x)["data"]) > 0,
+    )
+    data_json = json.loads(content)
     temp_df = pd.DataFrame(data_json['data'])
     temp_df.rename(columns={
         "variety": "品种名称",
@@ -631,34 +689,73 @@ def get_dce_daily(date: str = "20251027") -> pd.DataFrame:
     return temp_df
 
 
+_futures_daily_func_map = {
+    "CFFEX": get_cffex_daily,
+    "CZCE": get_czce_daily,
+    "SHFE": get_shfe_daily,
+    "DCE": get_dce_daily,
+    "INE": get_ine_daily,
+    "GFEX": get_gfex_daily,
+}
+
+
+def _futures_daily_one_day(market: str, date: str, use_cache: bool) -> pd.DataFrame:
+    """
+    获取单个交易所单个交易日的日交易数据, 历史交易日数据优先从本地缓存读取
+    :param market: 交易所代码
+    :type market: str
+    :param date: 交易日, e.g., "20240105"
+    :type date: str
+    :param use_cache: 是否使用本地缓存
+    :type use_cache: bool
+    :return: 单日交易数据
+    :rtype: pandas.DataFrame
+    """
+    cacheable = use_cache and is_immutable_date(date)
+    if cacheable:
+        cached_df = load_frame(f"futures_daily/{market}", date)
+        if cached_df is not None:
+            return cached_df
+    with get_rate_limiter(market, rate=cons.FUTURES_EXCHANGE_RATE_LIMIT[market]):
+        temp_df = _futures_daily_func_map[market](date=date)
+    if temp_df is None or temp_df.empty:
+        return pd.DataFrame()
+    temp_df = temp_df.reindex(columns=cons.OUTPUT_COLUMNS)
+    temp_df = temp_df[~temp_df["symbol"].astype(str).str.contains("efp")]
+    temp_df["date"] = date
+    temp_df["market"] = market
+    if cacheable:
+        save_frame(f"futures_daily/{market}", date, temp_df)
+    return temp_df
+
+
 def get_futures_daily(
     start_date: str = "20220208",
     end_date: str = "20220208",
     market: str = "CFFEX",
+    max_workers: int = 4,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
     """
     交易所日交易数据
+    只请求交易日历中的交易日, 多个交易日并发请求, 每个交易所单独限速; 历史交易日的数据会缓存到本地
     :param start_date: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
     :type start_date: str
     :param end_date: 结束数据 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
     :type end_date: str
-    :param market: 'CFFEX' 中金所, 'CZCE' 郑商所,  'SHFE' 上期所, 'DCE' 大商所 之一, 'INE' 上海国际能源交易中心, "GFEX" 广州期货交易所。默认为中金所
+    :param market: 'CFFEX' 中金所, 'CZCE' 郑商所,  'SHFE' 上期所, 'DCE' 大商所 之一, 'INE' 上海国际能源交易中心, "GFEX" 广州期货交易所, "ALL" 所有交易所。默认为中金所
     :type market: str
+    :param max_workers: 并发请求的线程数; 设置为 1 时逐日请求
+    :type max_workers: int
+    :param use_cache: 是否使用本地缓存, 缓存目录参见 akshare.utils.cache
+    :type use_cache: bool
     :return: 交易所日交易数据
     :rtype: pandas.DataFrame
     """
-    if market.upper() == "CFFEX":
-        f = get_cffex_daily
-    elif market.upper() == "CZCE":
-        f = get_czce_daily
-    elif market.upper() == "SHFE":
-        f = get_shfe_daily
-    elif market.upper() == "DCE":
-        f = get_dce_daily
-    elif market.upper() == "INE":
-        f = get_ine_daily
-    elif market.upper() == "GFEX":
-        f = get_gfex_daily
+    if market.upper() == "ALL":
+        market_list = list(_futures_daily_func_map.keys())
+    elif market.upper() in _futures_daily_func_map:
+        market_list = [market.upper()]
     else:
         print("Invalid Market Symbol")
         return pd.DataFrame()
@@ -673,22 +770,43 @@ def get_futures_daily(
         if end_date is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-
-    df_list = list()
-    while start_date <= end_date:
-        df = f(date=str(start_date).replace("-", ""))
-        if not df.empty:
-            df_list.append(df)
-        start_date += datetime.timedelta(days=1)
-
-    if len(df_list) == 0:
+    start_date = start_date.strftime("%Y%m%d")
+    end_date = end_date.strftime("%Y%m%d")
+    trade_date_list = [item for item in calendar if start_date <= item <= end_date]
+    task_list = [
+        (item_market, item_date)
+        for item_date in trade_date_list
+        for item_market in market_list
+    ]
+    if len(task_list) == 0:
         return pd.DataFrame()
-    elif len(df_list) > 0:
-        temp_df = pd.concat(df_list).reset_index(drop=True)
-        temp_df = temp_df[~temp_df["symbol"].str.contains("efp")]
-        return temp_df
+
+    if max_workers <= 1 or len(task_list) == 1:
+        df_list = [
+            _futures_daily_one_day(item_market, item_date, use_cache)
+            for item_market, item_date in task_list
+        ]
     else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            df_list = list(
+                executor.map(
+                    lambda task: _futures_daily_one_day(task[0], task[1], use_cache),
+                    task_list,
+                )
+            )
+    df_list = [item for item in df_list if not item.empty]
+    if len(df_list) == 0:
         return pd.DataFrame()
+    temp_df = pd.concat(df_list, ignore_index=True)
+    temp_df["symbol"] = temp_df["symbol"].astype(str).str.strip()
+    temp_df["variety"] = temp_df["variety"].astype(str).str.strip()
+    for item in cons.FUTURES_DAILY_NUMERIC_COLUMNS:
+        temp_df[item] = pd.to_numeric(temp_df[item], errors="coerce").astype(
+            "float64"
+        )
+    if len(market_list) == 1:
+        del temp_df["market"]
+    return temp_df
 
 
 if __name__ == "__main__":
@@ -697,6 +815,11 @@ if __name__ == "__main__":
     )
     print(get_futures_daily_df)
 
+    get_futures_daily_all_df = get_futures_daily(
+        start_date="20250701", end_date="20250710", market="ALL"
+    )
+    print(get_futures_daily_all_df)
+
     get_dce_daily_df = get_dce_daily(date="20251029")
     print(get_dce_daily_df)
 
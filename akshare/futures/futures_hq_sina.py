@@ -11,9 +11,9 @@ from typing import Union, List
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils import demjson
+from akshare.utils.sina_hq import sina_hq_fetch
 
 
 def _get_real_name_list() -> list:
@@ -109,41 +109,13 @@ def futures_foreign_commodity_realtime(symbol: Union[str, List[str]]) -> pd.Data
     :return: 行情数据
     :rtype: pandas.DataFrame
     """
-    if isinstance(symbol, list):
-        payload = "?list=" + ",".join(["hf_" + item for item in symbol])
-    else:
+    from bs4 import BeautifulSoup
+
+    if not isinstance(symbol, list):
         symbol = symbol.split(",")
-        payload = "?list=" + ",".join(["hf_" + item for item in symbol])
-    url = "https://hq.sinajs.cn/" + payload
-    headers = {
-        "Accept": "*/*",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Connection": "keep-alive",
-        "Host": "hq.sinajs.cn",
-        "Pragma": "no-cache",
-        "Referer": "https://finance.sina.com.cn/",
-        "sec-ch-ua": '" Not;A Brand";v="99", "Google Chrome";v="97", "Chromium";v="97"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"Windows"',
-        "Sec-Fetch-Dest": "script",
-        "Sec-Fetch-Mode": "no-cors",
-        "Sec-Fetch-Site": "cross-site",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/97.0.4692.71 Safari/537.36",
-    }
-    r = requests.get(url, headers=headers)
-    data_text = r.text
-    data_df = pd.DataFrame(
-        [
-            item.strip().split("=")[1].split(",")
-            for item in data_text.split(";")
-            if item.strip() != ""
-        ]
-    )
-    data_df.iloc[:, 0] = data_df.iloc[:, 0].str.replace('"', "")
-    data_df.iloc[:, -1] = data_df.iloc[:, -1].str.replace('"', "")
+    # 多个品种合并为少量 list= 请求
+    raw_dict = sina_hq_fetch(["hf_" + item for item in symbol])
+    data_df = pd.DataFrame([raw_dict.get("hf_" + item) or [""] for item in symbol])
 
     # 处理伦敦金 XAU 的情况
     if len(data_df.columns) == 14:
@@ -257,12 +229,10 @@ def futures_foreign_commodity_realtime(symbol: Union[str, List[str]]) -> pd.Data
     price_mul["price"] = pd.to_numeric(price_mul["price"], errors="coerce")
 
     # 获取汇率数据
-    url = "https://hq.sinajs.cn/?list=USDCNY"
-    r = requests.get(url, headers=headers)
-    data_text = r.text
+    usd_rmb_list = sina_hq_fetch(["USDCNY"])["USDCNY"]
     usd_rmb = float(
-        data_text[data_text.find('"') + 1 : data_text.find(",美元人民币")].split(",")[
-            -1
+        usd_rmb_list[
+            [item.startswith("美元人民币") for item in usd_rmb_list].index(True) - 1
         ]
     )
 
@@ -12,7 +12,6 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 @lru_cache(maxsize=32)
@@ -23,6 +22,8 @@ def __get_99_symbol_map() -> pd.DataFrame:
     :return: 品种代码对照表
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.99qh.com/data/stockIn"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 新浪财经-期货-主力合约批量识别
+https://vip.stock.finance.sina.com.cn/quotes_service/view/qihuohangqing.html#titlePos_1
+所有交易所的品种列表只请求一次, 各品种的合约列表并发请求, 合并后按持仓量和成交量一次性排序得到主力合约
+主力合约映射按交易日缓存, 只缓存所有品种都请求成功的结果; 设置了本地缓存目录时保存在磁盘上, 可用于查询主力合约的切换记录
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import pandas as pd
+import requests
+
+from akshare.futures import cons
+from akshare.futures.cons import (
+    zh_match_main_contract_payload,
+    zh_match_main_contract_url,
+    zh_subscribe_exchange_symbol_url,
+)
+from akshare.utils import demjson
+from akshare.utils.cache import list_keys, load_object, save_object
+from akshare.utils.ratelimit import get_rate_limiter
+
+MAIN_CONTRACT_EXCHANGE_LIST = ["czce", "dce", "shfe", "cffex", "gfex"]
+
+MAIN_CONTRACT_RATE_LIMIT = 5
+
+_MAIN_CONTRACT_NAMESPACE = "futures_main_contract"
+
+_main_contract_memory: Dict[str, pd.DataFrame] = {}
+_main_contract_lock = threading.Lock()
+
+
+def _exchange_node_dict() -> Dict[str, List[Tuple[str, str]]]:
+    """
+    各交易所的品种名称和新浪行情节点, 只请求一次品种列表
+    """
+    r = requests.get(zh_subscribe_exchange_symbol_url, timeout=15)
+    r.encoding = "gbk"
+    data_text = r.text
+    data_json = demjson.decode(
+        data_text[data_text.find("{") : data_text.find("};") + 1]
+    )
+    return {
+        exchange: [(item[0], item[1]) for item in data_json[exchange][1:]]
+        for exchange in MAIN_CONTRACT_EXCHANGE_LIST
+        if exchange in data_json
+    }
+
+
+def _decode_node(text: str) -> list:
+    """
+    合约列表为标准 JSON, 解析失败时退回到 demjson
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return demjson.decode(text)
+
+
+def _node_request(node: str) -> list:
+    """
+    请求单个品种按持仓量排序的合约列表
+    """
+    params = dict(zh_match_main_contract_payload, node=node)
+    with get_rate_limiter(
+        "vip.stock.finance.sina.com.cn", rate=MAIN_CONTRACT_RATE_LIMIT
+    ):
+        r = requests.get(zh_match_main_contract_url, params=params, timeout=15)
+    return _decode_node(r.text) or []
+
+
+def futures_main_contract_rank(node_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    从所有品种的合约列表中识别主力合约: 剔除连续合约后, 每个品种取持仓量最大的合约, 持仓量相同时取成交量较大的合约
+    :param node_df: 合约列表, 需包含 node, symbol, position, volume 列
+    :type node_df: pandas.DataFrame
+    :return: 每个品种一行的主力合约
+    :rtype: pandas.DataFrame
+    """
+    if node_df.empty:
+        return node_df
+    temp_df = node_df.copy()
+    temp_df["position"] = pd.to_numeric(temp_df["position"], errors="coerce")
+    temp_df["volume"] = pd.to_numeric(temp_df["volume"], errors="coerce")
+    # 连续合约(如 V0, IF0)与主力合约的行情相同, 排序前剔除
+    continuous = temp_df["symbol"].astype(str).str.fullmatch(r"[A-Za-z]+0")
+    temp_df = temp_df[~continuous]
+    # 保持品种的原有顺序
+    order = {node: i for i, node in enumerate(node_df["node"].drop_duplicates())}
+    temp_df = temp_df.assign(_order=temp_df["node"].map(order))
+    temp_df = temp_df.sort_values(
+        ["_order", "position", "volume"],
+        ascending=[True, False, False],
+        na_position="last",
+        kind="stable",
+    )
+    temp_df = temp_df.drop_duplicates(subset=["node"], keep="first")
+    temp_df = temp_df.drop(columns="_order").reset_index(drop=True)
+    return temp_df
+
+
+def _main_contract_fetch(max_workers: int, retries: int = 1) -> Tuple[pd.DataFrame, bool]:
+    """
+    并发请求所有交易所的合约列表并识别主力合约; 请求失败的品种重试 retries 次
+    :return: 主力合约和是否所有品种都请求成功
+    :rtype: tuple
+    """
+    node_list = [
+        (exchange, name, node)
+        for exchange, item_list in _exchange_node_dict().items()
+        for name, node in item_list
+    ]
+
+    def _fetch(task):
+        exchange, name, node = task
+        try:
+            data_json = _node_request(node)
+        except Exception:
+            return task, None
+        temp_df = pd.DataFrame(data_json or [])
+        if temp_df.empty:
+            return task, temp_df
+        temp_df.insert(0, "variety", name)
+        temp_df.insert(0, "node", node)
+        temp_df.insert(0, "exchange", exchange)
+        return task, temp_df
+
+    frame_list = []
+    task_list = node_list
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(1)
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as ex:
+            result_list = list(ex.map(_fetch, task_list))
+        frame_list.extend(
+            item for _, item in result_list if item is not None and not item.empty
+        )
+        task_list = [task for task, item in result_list if item is None]
+        if not task_list:
+            break
+    complete = not task_list
+    if not frame_list:
+        return pd.DataFrame(), complete
+    big_df = futures_main_contract_rank(pd.concat(frame_list, ignore_index=True))
+    big_df = big_df[
+        [
+            "exchange",
+            "variety",
+            "node",
+            "symbol",
+            "name",
+            "trade",
+            "position",
+            "volume",
+        ]
+    ]
+    big_df["trade"] = pd.to_numeric(big_df["trade"], errors="coerce")
+    return big_df, complete
+
+
+def futures_main_contract_sina(
+    exchange: str = "all", refresh: bool = False, max_workers: int = 8
+) -> pd.DataFrame:
+    """
+    新浪财经-期货-所有品种的主力合约
+    https://vip.stock.finance.sina.com.cn/quotes_service/view/qihuohangqing.html#titlePos_1
+    :param exchange: choice of {"all", "czce", "dce", "shfe", "cffex", "gfex"}
+    :type exchange: str
+    :param refresh: 是否忽略当前交易日的缓存重新请求
+    :type refresh: bool
+    :param max_workers: 并发请求数
+    :type max_workers: int
+    :return: 主力合约
+    :rtype: pandas.DataFrame
+    exchange    交易所
+    variety     品种名称
+    node        新浪行情节点
+    symbol      主力合约
+    name        合约名称
+    trade       最新价
+    position    持仓量
+    volume      成交量
+    """
+    if exchange != "all" and exchange not in MAIN_CONTRACT_EXCHANGE_LIST:
+        raise ValueError(
+            f"exchange 只能为 all, {', '.join(MAIN_CONTRACT_EXCHANGE_LIST)}"
+        )
+    date = cons.get_current_trading_day()
+    with _main_contract_lock:
+        temp_df = None if refresh else _main_contract_memory.get(date)
+        if temp_df is None and not refresh:
+            temp_df = load_object(_MAIN_CONTRACT_NAMESPACE, date)
+        if temp_df is None:
+            temp_df, complete = _main_contract_fetch(max_workers=max_workers)
+            # 部分品种请求失败时返回已获取的结果, 不缓存, 避免当天后续调用和切换记录缺少这些品种
+            if complete and not temp_df.empty:
+                save_object(_MAIN_CONTRACT_NAMESPACE, date, temp_df)
+                _main_contract_memory[date] = temp_df
+    if exchange != "all" and not temp_df.empty:
+        temp_df = temp_df[temp_df["exchange"] == exchange]
+    return temp_df.reset_index(drop=True)
+
+
+def futures_main_contract_roll_sina(
+    start_date: str = "19900101", end_date: str = "22220101"
+) -> pd.DataFrame:
+    """
+    主力合约的切换记录, 由已缓存的每日主力合约映射得到
+    需要先通过环境变量 AKSHARE_CACHE_DIR 或 akshare.utils.context.set_cache_dir 设置缓存目录, 否则只包含本进程内获取过的交易日
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :return: 主力合约的切换记录
+    :rtype: pandas.DataFrame
+    date        切换日期
+    exchange    交易所
+    variety     品种名称
+    from        原主力合约
+    to          新主力合约
+    """
+    columns = ["date", "exchange", "variety", "from", "to"]
+    date_list = sorted(
+        set(list_keys(_MAIN_CONTRACT_NAMESPACE)) | set(_main_contract_memory)
+    )
+    date_list = [item for item in date_list if start_date <= item <= end_date]
+    frame_list = []
+    for date in date_list:
+        temp_df = _main_contract_memory.get(date)
+        if temp_df is None:
+            temp_df = load_object(_MAIN_CONTRACT_NAMESPACE, date)
+        if temp_df is None or temp_df.empty:
+            continue
+        temp_df = temp_df[["exchange", "variety", "node", "symbol"]].copy()
+        temp_df["date"] = date
+        frame_list.append(temp_df)
+    if not frame_list:
+        return pd.DataFrame(columns=columns)
+    big_df = pd.concat(frame_list, ignore_index=True)
+    big_df.sort_values(["node", "date"], kind="stable", inplace=True)
+    big_df["from"] = big_df.groupby("node")["symbol"].shift(1)
+    big_df = big_df[big_df["from"].notna() & (big_df["from"] != big_df["symbol"])]
+    big_df = big_df.rename(columns={"symbol": "to"})[columns]
+    big_df.sort_values(["date", "exchange"], kind="stable", inplace=True)
+    big_df.reset_index(drop=True, inplace=True)
+    return big_df
+
+
+if __name__ == "__main__":
+    futures_main_contract_sina_df = futures_main_contract_sina(exchange="all")
+    print(futures_main_contract_sina_df)
+
+    futures_main_contract_roll_sina_df = futures_main_contract_roll_sina()
+    print(futures_main_contract_roll_sina_df)
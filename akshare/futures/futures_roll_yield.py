@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/16 17:40
+Date: 2026/10/19 15:00
 Desc: 中国期货各合约展期收益率
 日线数据从 daily_bar 函数获取, 需要在收盘后运行
 """
@@ -11,6 +11,7 @@ import re
 import warnings
 
 import math
+import numpy as np
 import pandas as pd
 
 from akshare.futures import cons
@@ -19,6 +20,12 @@ from akshare.futures.symbol_var import symbol_market, symbol_varieties
 
 calendar = cons.get_calendar()
 
+# 计算展期收益率时排除的品种(股指期权)
+ROLL_YIELD_EXCLUDE_VARIETIES = ["IO", "MO", "HO"]
+
+# 计算横截面展期收益率时使用的交易所
+ROLL_YIELD_MARKET_LIST = ["DCE", "CFFEX", "SHFE", "CZCE", "GFEX"]
+
 
 def get_roll_yield(date=None, var="BB", symbol1=None, symbol2=None, df=None):
     """
@@ -71,6 +78,141 @@ def get_roll_yield(date=None, var="BB", symbol1=None, symbol2=None, df=None):
         return math.log(close2 / close1) / c * 12, symbol1, symbol2
 
 
+def _contract_month_diff(symbol1: pd.Series, symbol2: pd.Series) -> np.ndarray:
+    """
+    两个合约交割月份相差的月数, 即 symbol1 的交割月份减去 symbol2 的交割月份
+    郑商所合约代码的年份只有一位, 跨十年时按相差不超过 5 年折算
+    :param symbol1: 合约 1, 如 rb1810
+    :type symbol1: pandas.Series
+    :param symbol2: 合约 2, 如 rb1812
+    :type symbol2: pandas.Series
+    :return: 相差的月数
+    :rtype: numpy.ndarray
+    """
+    digit1 = symbol1.str.replace(r"\D", "", regex=True)
+    digit2 = symbol2.str.replace(r"\D", "", regex=True)
+    month1 = digit1.str[:-2].astype(int) * 12 + digit1.str[-2:].astype(int)
+    month2 = digit2.str[:-2].astype(int) * 12 + digit2.str[-2:].astype(int)
+    diff = (month1 - month2).to_numpy()
+    short_year = ((digit1.str.len() == 3) | (digit2.str.len() == 3)).to_numpy()
+    return np.where(short_year, (diff + 60) % 120 - 60, diff)
+
+
+def _roll_yield_panel(daily_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    根据日线数据计算每个交易日每个品种的展期收益率
+    每个交易日每个品种按持仓量取前两个合约, 持仓量最大的为主力合约, 交割月份较早的为近月合约
+    展期收益率 = ln(近月合约收盘价 / 远月合约收盘价) / 相差月数 * 12
+    :param daily_df: get_futures_daily 返回的日线数据, 可以包含多个交易日和多个交易所
+    :type daily_df: pandas.DataFrame
+    :return: 展期收益率
+    :rtype: pandas.DataFrame
+    """
+    columns = [
+        "date",
+        "variety",
+        "roll_yield",
+        "near_by",
+        "deferred",
+        "dominant",
+        "near_by_close",
+        "deferred_close",
+    ]
+    if daily_df.empty:
+        return pd.DataFrame(columns=columns)
+    temp_df = daily_df[["date", "symbol", "variety", "close", "open_interest"]].copy()
+    temp_df["symbol"] = temp_df["symbol"].astype(str)
+    temp_df = temp_df[
+        ~temp_df["symbol"].str.contains("efp")
+        & ~temp_df["variety"].isin(ROLL_YIELD_EXCLUDE_VARIETIES)
+        & temp_df["symbol"].str.contains(r"\d{3}$")
+    ]
+    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
+    temp_df["open_interest"] = pd.to_numeric(
+        temp_df["open_interest"], errors="coerce"
+    )
+    temp_df.sort_values(
+        ["date", "variety", "open_interest"],
+        ascending=[True, True, False],
+        kind="stable",
+        inplace=True,
+    )
+    temp_df["rank"] = temp_df.groupby(["date", "variety"]).cumcount()
+    first_df = temp_df[temp_df["rank"] == 0].set_index(["date", "variety"])
+    second_df = temp_df[temp_df["rank"] == 1].set_index(["date", "variety"])
+    merge_df = first_df[["symbol", "close"]].join(
+        second_df[["symbol", "close"]], lsuffix="_1", rsuffix="_2", how="inner"
+    )
+    diff = _contract_month_diff(merge_df["symbol_1"], merge_df["symbol_2"])
+    later = diff > 0
+    merge_df["dominant"] = merge_df["symbol_1"]
+    merge_df["near_by"] = np.where(later, merge_df["symbol_2"], merge_df["symbol_1"])
+    merge_df["deferred"] = np.where(later, merge_df["symbol_1"], merge_df["symbol_2"])
+    merge_df["near_by_close"] = np.where(
+        later, merge_df["close_2"], merge_df["close_1"]
+    )
+    merge_df["deferred_close"] = np.where(
+        later, merge_df["close_1"], merge_df["close_2"]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        merge_df["roll_yield"] = (
+            np.log(merge_df["near_by_close"] / merge_df["deferred_close"])
+            / np.abs(diff)
+            * 12
+        )
+    merge_df = merge_df[
+        (diff != 0) & (merge_df["close_1"] > 0) & (merge_df["close_2"] > 0)
+    ]
+    merge_df = merge_df.reset_index()[columns]
+    merge_df.reset_index(drop=True, inplace=True)
+    return merge_df
+
+
+def get_roll_yield_range(
+    start_day: str = "20230801",
+    end_day: str = "20230810",
+    var: str = None,
+    max_workers: int = 4,
+) -> pd.DataFrame:
+    """
+    展期收益率-区间
+    日线数据通过 get_futures_daily 一次性获取整个区间(并发请求, 历史交易日读取本地缓存), 再按交易日和品种分组计算
+    :param start_day: 开始日期 format：YYYYMMDD
+    :type start_day: str
+    :param end_day: 结束日期 format：YYYYMMDD
+    :type end_day: str
+    :param var: 合约品种如 "RB", 也可以是品种列表; 为空时计算全部品种
+    :type var: str or list
+    :param max_workers: 并发请求的线程数
+    :type max_workers: int
+    :return: 每个交易日每个品种的展期收益率, 近月合约, 远月合约和主力合约
+    :rtype: pandas.DataFrame
+    """
+    if var is None:
+        var_list = None
+        market_list = ROLL_YIELD_MARKET_LIST
+    else:
+        var_list = [var] if isinstance(var, str) else list(var)
+        var_list = [item.upper() for item in var_list]
+        market_list = sorted({symbol_market(item) for item in var_list} - {None})
+    df_list = [
+        get_futures_daily(
+            start_date=start_day,
+            end_date=end_day,
+            market=market,
+            max_workers=max_workers,
+        )
+        for market in market_list
+    ]
+    df_list = [item for item in df_list if not item.empty]
+    if not df_list:
+        return _roll_yield_panel(pd.DataFrame())
+    daily_df = pd.concat(df_list, ignore_index=True)
+    if var_list is not None:
+        daily_df = daily_df[daily_df["variety"].isin(var_list)]
+    return _roll_yield_panel(daily_df)
+
+
 def get_roll_yield_bar(
     type_method: str = "var",
     var: str = "RB",
@@ -108,55 +250,26 @@ def get_roll_yield_bar(
         return df
 
     if type_method == "var":
-        df = pd.DataFrame()
-        for market in ["dce", "cffex", "shfe", "czce", "gfex"]:
-            df = pd.concat(
-                [
-                    df,
-                    get_futures_daily(start_date=date, end_date=date, market=market),
-                ]
-            )
-        var_list = list(set(df["variety"]))
-        for i_remove in ["IO", "MO", "HO"]:
-            if i_remove in var_list:
-                var_list.remove(i_remove)
-        df_l = pd.DataFrame()
-        for var in var_list:
-            ry = get_roll_yield(date, var, df=df)
-            if ry:
-                df_l = pd.concat(
-                    [
-                        df_l,
-                        pd.DataFrame(
-                            [ry],
-                            index=[var],
-                            columns=["roll_yield", "near_by", "deferred"],
-                        ),
-                    ]
-                )
+        df = pd.concat(
+            [
+                get_futures_daily(start_date=date, end_date=date, market=market)
+                for market in ROLL_YIELD_MARKET_LIST
+            ]
+        )
+        panel_df = _roll_yield_panel(df)
+        df_l = panel_df.set_index("variety")[["roll_yield", "near_by", "deferred"]]
+        df_l.index.name = None
         df_l["date"] = date
         df_l = df_l.sort_values("roll_yield")
         return df_l
 
     if type_method == "date":
-        df_l = pd.DataFrame()
-        while start_day <= end_day:
-            try:
-                ry = get_roll_yield(start_day, var)
-                if ry:
-                    df_l = pd.concat(
-                        [
-                            df_l,
-                            pd.DataFrame(
-                                [ry],
-                                index=[start_day],
-                                columns=["roll_yield", "near_by", "deferred"],
-                            ),
-                        ]
-                    )
-            except:  # noqa: E722
-                pass
-            start_day += datetime.timedelta(days=1)
+        panel_df = get_roll_yield_range(start_day=start_day, end_day=end_day, var=var)
+        df_l = panel_df[["roll_yield", "near_by", "deferred"]].copy()
+        df_l.index = [
+            datetime.datetime.strptime(item, "%Y%m%d").date()
+            for item in panel_df["date"]
+        ]
         return df_l
 
 
@@ -177,3 +290,8 @@ if __name__ == "__main__":
 
     get_roll_yield_bar_symbol = get_roll_yield_bar(type_method="var", date="20210201")
     print(get_roll_yield_bar_symbol)
+
+    get_roll_yield_range_df = get_roll_yield_range(
+        start_day="20230801", end_day="20230831"
+    )
+    print(get_roll_yield_range_df)
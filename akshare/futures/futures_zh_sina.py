@@ -13,15 +13,12 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
-import py_mini_racer
-
-from akshare.futures.cons import (
-    zh_subscribe_exchange_symbol_url,
-    zh_match_main_contract_url,
-    zh_match_main_contract_payload,
-)
-from akshare.futures.futures_contract_detail import futures_contract_detail
+
+from akshare.futures.cons import zh_subscribe_exchange_symbol_url
+from akshare.futures.futures_contract_spec import futures_contract_spec_join
+from akshare.futures.futures_main_contract import futures_main_contract_sina
 from akshare.utils import demjson
+from akshare.utils.sina_hq import sina_hq_fetch
 
 
 @lru_cache()
@@ -177,29 +174,11 @@ def match_main_contract(symbol: str = "cffex") -> str:
     :return: 主力合约的字符串
     :rtype: str
     """
-    subscribe_exchange_list = []
-    exchange_symbol_list = zh_subscribe_exchange_symbol(symbol).iloc[:, 1].tolist()
-    for item in exchange_symbol_list:
-        # item = 'sngz_qh'
-        zh_match_main_contract_payload.update({"node": item})
-        res = requests.get(
-            zh_match_main_contract_url, params=zh_match_main_contract_payload
-        )
-        data_json = demjson.decode(res.text)
-        data_df = pd.DataFrame(data_json)
-        try:
-            main_contract = data_df[data_df.iloc[:, 3:].duplicated()]
-            print(main_contract["symbol"].values[0])
-            subscribe_exchange_list.append(main_contract["symbol"].values[0])
-        except:  # noqa: E722
-            if len(data_df) == 1:
-                subscribe_exchange_list.append(data_df["symbol"].values[0])
-                print(data_df["symbol"].values[0])
-            else:
-                print(item, "无主力合约")
-            continue
-    print(f"{symbol}主力合约获取成功")
-    return ",".join([item for item in subscribe_exchange_list])
+    # 所有交易所的主力合约一次并发获取, 并按交易日缓存
+    temp_df = futures_main_contract_sina(exchange=symbol)
+    if temp_df.empty:
+        return ""
+    return ",".join(temp_df["symbol"].tolist())
 
 
 def futures_zh_spot(
@@ -214,48 +193,23 @@ def futures_zh_spot(
     :type symbol: str
     :param market: CF 为商品期货
     :type market: str
-    :param adjust: '1' or '0'；字符串的 0 或 1；返回合约、交易所和最小变动单位的实时数据, 返回数据会变慢
+    :param adjust: '1' or '0'；字符串的 0 或 1；返回合约、交易所、最小变动价位、合约乘数和保证金比例的实时数据
     :type adjust: str
     :return: 期货的实时行情数据
     :rtype: pandas.DataFrame
     """
-    file_data = "Math.round(Math.random() * 2147483648).toString(16)"
-    ctx = py_mini_racer.MiniRacer()
-    rn_code = ctx.eval(file_data)
     subscribe_list = ",".join(["nf_" + item.strip() for item in symbol.split(",")])
-    url = f"https://hq.sinajs.cn/rn={rn_code}&list={subscribe_list}"
-    headers = {
-        "Accept": "*/*",
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Host": "hq.sinajs.cn",
-        "Pragma": "no-cache",
-        "Proxy-Connection": "keep-alive",
-        "Referer": "https://vip.stock.finance.sina.com.cn/",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/97.0.4692.71 Safari/537.36",
-    }
-    r = requests.get(url, headers=headers)
+    # 多个合约合并为少量 list= 请求
+    raw_dict = sina_hq_fetch(subscribe_list.split(","))
     data_df = pd.DataFrame(
-        [
-            item.strip().split("=")[1].split(",")
-            for item in r.text.split(";")
-            if item.strip() != ""
-        ]
+        [raw_dict.get(code) or [""] for code in subscribe_list.split(",")]
     )
-    data_df.iloc[:, 0] = data_df.iloc[:, 0].str.replace('"', "")
-    data_df.iloc[:, -1] = data_df.iloc[:, -1].str.replace('"', "")
     if adjust == "1":
         contract_name_list = [item.split("_")[1] for item in subscribe_list.split(",")]
-        contract_min_list = []
-        contract_exchange_list = []
-        for contract_name in contract_name_list:
-            temp_df = futures_contract_detail(symbol=contract_name)
-            exchange_name = temp_df[temp_df["item"] == "上市交易所"]["value"].values[0]
-            contract_exchange_list.append(exchange_name)
-            contract_min = temp_df[temp_df["item"] == "最小变动价位"]["value"].values[0]
-            contract_min_list.append(contract_min)
+        # 交易所和交易参数从按交易日缓存的品种交易参数库中批量关联, 不再逐个合约请求
+        spec_df = futures_contract_spec_join(pd.Series(contract_name_list))
+        contract_exchange_list = spec_df["exchange_name"].tolist()
+        contract_min_list = spec_df["tick_size"].tolist()
         if market == "CF":
             data_df.columns = [
                 "symbol",
@@ -309,6 +263,8 @@ def futures_zh_spot(
             data_df["exchange"] = contract_exchange_list
             data_df["contract"] = contract_name_list
             data_df["contract_min_change"] = contract_min_list
+            data_df["contract_multiplier"] = spec_df["multiplier"].tolist()
+            data_df["margin_rate"] = spec_df["margin_rate"].tolist()
 
             data_df["open"] = pd.to_numeric(data_df["open"], errors="coerce")
             data_df["high"] = pd.to_numeric(data_df["high"], errors="coerce")
@@ -400,6 +356,8 @@ def futures_zh_spot(
             data_df["exchange"] = contract_exchange_list
             data_df["contract"] = contract_name_list
             data_df["contract_min_change"] = contract_min_list
+            data_df["contract_multiplier"] = spec_df["multiplier"].tolist()
+            data_df["margin_rate"] = spec_df["margin_rate"].tolist()
             data_df["open"] = pd.to_numeric(data_df["open"], errors="coerce")
             data_df["high"] = pd.to_numeric(data_df["high"], errors="coerce")
             data_df["low"] = pd.to_numeric(data_df["low"], errors="coerce")
@@ -1,12 +1,13 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/21 15:00
+Date: 2026/10/19 15:00
 Desc: 每日注册仓单数据
 大连商品交易所, 上海期货交易所, 郑州商品交易所, 广州期货交易所
 """
 
 import datetime
+import json
 import re
 import warnings
 from io import BytesIO
@@ -18,6 +19,7 @@ import requests
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link, pandas_read_html_link
 from akshare.futures.symbol_var import chinese_to_english
+from akshare.utils.cache import fetch_raw, is_excel, is_json
 
 calendar = cons.get_calendar()
 shfe_20100126 = pd.DataFrame(
@@ -56,8 +58,14 @@ def get_dce_receipt(date: str = None, vars_list: List = cons.contract_symbols):
         "tradeDate": date.strftime("%Y%m%d"),
         "varietyId": "all",
     }
-    r = requests.post(url, json=payload)
-    data_json = r.json()
+    content = fetch_raw(
+        exchange="DCE",
+        date=date.strftime("%Y%m%d"),
+        product="receipt",
+        fetch=lambda: requests.post(url, json=payload).content,
+        validate=is_json,
+    )
+    data_json = json.loads(content)
     temp_df = pd.DataFrame(data_json['data']['entityList'])
     records = pd.DataFrame()
     for x in temp_df.to_dict(orient="records"):
@@ -177,9 +185,17 @@ def get_shfe_receipt_2(
         warnings.warn("%s 非交易日" % date.strftime("%Y%m%d"))
         return pd.DataFrame()
     url = cons.SHFE_RECEIPT_URL_20250701 % date
-    r = requests_link(url, encoding="utf-8", headers=cons.shfe_headers)
     try:
-        context = r.json()
+        content = fetch_raw(
+            exchange="SHFE",
+            date=date,
+            product="receipt",
+            fetch=lambda: requests_link(
+                url, encoding="utf-8", headers=cons.shfe_headers
+            ).content,
+            validate=is_json,
+        )
+        context = json.loads(content)
     except:  # noqa: E722
         return pd.DataFrame()
     data = pd.DataFrame(context["o_cursor"])
@@ -361,8 +377,16 @@ def get_czce_receipt_3(
         url = f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date[:4]}/{date}/FutureDataWhsheet.xlsx"
     else:
         url = f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date[:4]}/{date}/FutureDataWhsheet.xls"
-    r = requests_link(url, encoding="utf-8", headers=cons.shfe_headers)
-    temp_df = pd.read_excel(BytesIO(r.content))
+    content = fetch_raw(
+        exchange="CZCE",
+        date=date,
+        product="receipt",
+        fetch=lambda: requests_link(
+            url, encoding="utf-8", headers=cons.shfe_headers
+        ).content,
+        validate=is_excel,
+    )
+    temp_df = pd.read_excel(BytesIO(content))
     temp_df = temp_df[
         [
             bool(1 - item)
@@ -485,8 +509,14 @@ def get_gfex_receipt(
         "X-Requested-With": "XMLHttpRequest",
         "content-type": "application/x-www-form-urlencoded",
     }
-    r = requests.post(url, data=payload, headers=headers)
-    data_json = r.json()
+    content = fetch_raw(
+        exchange="GFEX",
+        date=date.strftime("%Y%m%d"),
+        product="receipt",
+        fetch=lambda: requests.post(url, data=payload, headers=headers).content,
+        validate=is_json,
+    )
+    data_json = json.loads(content)
     temp_df = pd.DataFrame(data_json["data"])
     temp_df = temp_df[temp_df["variety"].str.contains("小计")]
     result_df = temp_df[["wbillQty", "diff"]].copy()
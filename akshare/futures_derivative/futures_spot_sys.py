@@ -10,7 +10,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def __get_sys_spot_futures_dict() -> dict:
@@ -20,6 +19,8 @@ def __get_sys_spot_futures_dict() -> dict:
     :return: 品种和网址字典
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.100ppi.com/sf/792.html"
     res = requests.get(url)
     soup = BeautifulSoup(res.text, features="lxml")
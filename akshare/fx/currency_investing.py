@@ -9,7 +9,6 @@ https://cn.investing.com/currencies/eur-usd-historical-data
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -22,6 +21,8 @@ def currency_pair_map(symbol: str = "美元") -> pd.DataFrame:
     :return: 指定货币的所有可获取货币对的数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     region_code = []
     region_name = []
     headers = {
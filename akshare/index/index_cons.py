@@ -12,7 +12,6 @@ from io import BytesIO, StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils import demjson
 
@@ -93,6 +92,8 @@ def index_stock_cons(symbol: str = "399639") -> pd.DataFrame:
     :return: 最新股票指数的成份股目录
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vII_NewestComponent/indexid/{symbol}.phtml"
     r = requests.get(url)
     r.encoding = "gb2312"
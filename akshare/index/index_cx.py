@@ -1,35 +1,71 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2025/8/7 18:30
+Date: 2026/10/19 15:00
 Desc: 财新数据-指数报告-数字经济指数
 https://yun.ccxe.com.cn/indices/dei
+所有指数共用同一个接口和相同的数据格式, 每个指数的原始数据在有效期内只请求和解析一次
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
 import pandas as pd
 import requests
 
-
-def index_pmi_com_cx() -> pd.DataFrame:
-    """
-    财新数据-指数报告-财新中国 PMI-综合 PMI
-    https://yun.ccxe.com.cn/indices/pmi
-    :return: 财新中国 PMI-综合 PMI
+from akshare.utils.shared_source import shared_source
+
+# 接口名称 -> (请求参数, 指数字段, 变化字段)
+CX_INDEX_VIEWS = {
+    "index_pmi_com_cx": ({"type": "com"}, "综合PMI", "变化值"),
+    "index_pmi_man_cx": ({"type": "man"}, "制造业PMI", "变化值"),
+    "index_pmi_ser_cx": ({"type": "ser"}, "服务业PMI", "变化值"),
+    "index_dei_cx": ({"type": "dei"}, "数字经济指数", "变化值"),
+    "index_ii_cx": ({"type": "ii"}, "产业指数", "变化值"),
+    "index_si_cx": ({"type": "si"}, "溢出指数", "变化值"),
+    "index_fi_cx": ({"type": "fi"}, "融合指数", "变化值"),
+    "index_bi_cx": ({"type": "bi"}, "基础指数", "变化值"),
+    "index_nei_cx": ({"type": "nei"}, "中国新经济指数", "变化值"),
+    "index_li_cx": ({"type": "li"}, "劳动力投入指数", "变化值"),
+    "index_ci_cx": ({"type": "ci"}, "资本投入指数", "变化值"),
+    "index_ti_cx": ({"type": "ti"}, "科技投入指数", "变化值"),
+    "index_neaw_cx": ({"type": "neaw"}, "新经济行业入职平均工资水平", "变化值"),
+    "index_awpr_cx": ({"type": "awpr"}, "新经济入职工资溢价水平", "变化值"),
+    "index_cci_cx": (
+        {"type": "cci", "code": "1000050", "month": "-1"},
+        "大宗商品指数",
+        "变化值",
+    ),
+    "index_qli_cx": (
+        {"type": "qli", "code": "1000050", "month": "-1"},
+        "高质量因子指数",
+        "变化幅度",
+    ),
+    "index_ai_cx": ({"type": "ai", "code": "1000050", "month": "-1"}, "AI策略指数", "变化幅度"),
+    "index_bei_cx": (
+        {"type": "ind", "code": "930927", "month": "-1"},
+        "基石经济指数",
+        "变化幅度",
+    ),
+    "index_neei_cx": ({"type": "ind", "code": "930928", "month": "1"}, "新动能指数", "变化幅度"),
+}
+
+
+@shared_source(ttl=3600)
+def _cx_index_trend(params: tuple) -> pd.DataFrame:
+    """
+    财新数据-指数走势的原始数据
+    https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo
+    :param params: 请求参数, e.g., (("type", "com"),)
+    :type params: tuple
+    :return: 指数走势, 字段为 变化值, 指数, 日期
     :rtype: pandas.DataFrame
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "com"}
-    r = requests.get(url, params=params)
+    r = requests.get(url, params=dict(params))
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "综合PMI", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "综合PMI",
-            "变化值",
-        ]
-    ]
+    temp_df.columns = ["变化值", "指数", "日期"]
     temp_df["日期"] = (
         pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
         .dt.tz_convert("Asia/Shanghai")
@@ -38,6 +74,45 @@ def index_pmi_com_cx() -> pd.DataFrame:
     return temp_df
 
 
+def _cx_index_view(name: str) -> pd.DataFrame:
+    """
+    财新数据-指定指数的走势
+    :param name: CX_INDEX_VIEWS 中的接口名称
+    :type name: str
+    :return: 指数走势
+    :rtype: pandas.DataFrame
+    """
+    params, value_column, change_column = CX_INDEX_VIEWS[name]
+    temp_df = _cx_index_trend(tuple(params.items()))
+    temp_df = temp_df.rename(columns={"指数": value_column, "变化值": change_column})
+    return temp_df[["日期", value_column, change_column]]
+
+
+def index_cx_all(max_workers: int = 4) -> Dict[str, pd.DataFrame]:
+    """
+    财新数据-指数报告-所有指数
+    每个指数只请求一次, 多个指数并发请求
+    https://yun.ccxe.com.cn/indices/pmi
+    :param max_workers: 并发请求数
+    :type max_workers: int
+    :return: 接口名称对应的指数走势, 接口名称为 CX_INDEX_VIEWS 的键
+    :rtype: dict
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        view_list = list(executor.map(_cx_index_view, CX_INDEX_VIEWS))
+    return dict(zip(CX_INDEX_VIEWS, view_list))
+
+
+def index_pmi_com_cx() -> pd.DataFrame:
+    """
+    财新数据-指数报告-财新中国 PMI-综合 PMI
+    https://yun.ccxe.com.cn/indices/pmi
+    :return: 财新中国 PMI-综合 PMI
+    :rtype: pandas.DataFrame
+    """
+    return _cx_index_view("index_pmi_com_cx")
+
+
 def index_pmi_man_cx() -> pd.DataFrame:
     """
     财新数据-指数报告-财新中国 PMI-制造业 PMI
@@ -45,25 +120,7 @@ def index_pmi_man_cx() -> pd.DataFrame:
     :return: 财新中国 PMI-制造业 PMI
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "man"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "制造业PMI", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "制造业PMI",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_pmi_man_cx")
 
 
 def index_pmi_ser_cx() -> pd.DataFrame:
@@ -73,25 +130,7 @@ def index_pmi_ser_cx() -> pd.DataFrame:
     :return: 财新中国 PMI-服务业 PMI
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "ser"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "服务业PMI", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "服务业PMI",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_pmi_ser_cx")
 
 
 def index_dei_cx() -> pd.DataFrame:
@@ -101,25 +140,7 @@ def index_dei_cx() -> pd.DataFrame:
     :return: 数字经济指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "dei"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "数字经济指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "数字经济指数",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_dei_cx")
 
 
 def index_ii_cx() -> pd.DataFrame:
@@ -129,25 +150,7 @@ def index_ii_cx() -> pd.DataFrame:
     :return: 产业指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "ii"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "产业指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "产业指数",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_ii_cx")
 
 
 def index_si_cx() -> pd.DataFrame:
@@ -157,25 +160,7 @@ def index_si_cx() -> pd.DataFrame:
     :return: 溢出指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "si"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "溢出指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "溢出指数",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_si_cx")
 
 
 def index_fi_cx() -> pd.DataFrame:
@@ -185,25 +170,7 @@ def index_fi_cx() -> pd.DataFrame:
     :return: 融合指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "fi"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "融合指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "融合指数",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_fi_cx")
 
 
 def index_bi_cx() -> pd.DataFrame:
@@ -213,25 +180,7 @@ def index_bi_cx() -> pd.DataFrame:
     :return: 基础指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "bi"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "基础指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "基础指数",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_bi_cx")
 
 
 def index_nei_cx() -> pd.DataFrame:
@@ -241,25 +190,7 @@ def index_nei_cx() -> pd.DataFrame:
     :return: 中国新经济指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "nei"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "中国新经济指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "中国新经济指数",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_nei_cx")
 
 
 def index_li_cx() -> pd.DataFrame:
@@ -269,25 +200,7 @@ def index_li_cx() -> pd.DataFrame:
     :return: 劳动力投入指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "li"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "劳动力投入指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "劳动力投入指数",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_li_cx")
 
 
 def index_ci_cx() -> pd.DataFrame:
@@ -297,25 +210,7 @@ def index_ci_cx() -> pd.DataFrame:
     :return: 资本投入指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "ci"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "资本投入指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "资本投入指数",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_ci_cx")
 
 
 def index_ti_cx() -> pd.DataFrame:
@@ -325,25 +220,7 @@ def index_ti_cx() -> pd.DataFrame:
     :return: 科技投入指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "ti"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "科技投入指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "科技投入指数",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_ti_cx")
 
 
 def index_neaw_cx() -> pd.DataFrame:
@@ -353,25 +230,7 @@ def index_neaw_cx() -> pd.DataFrame:
     :return: 新经济行业入职平均工资水平
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "neaw"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "新经济行业入职平均工资水平", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "新经济行业入职平均工资水平",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_neaw_cx")
 
 
 def index_awpr_cx() -> pd.DataFrame:
@@ -381,25 +240,7 @@ def index_awpr_cx() -> pd.DataFrame:
     :return: 新经济入职工资溢价水平
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {"type": "awpr"}
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "新经济入职工资溢价水平", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "新经济入职工资溢价水平",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_awpr_cx")
 
 
 def index_cci_cx() -> pd.DataFrame:
@@ -409,29 +250,7 @@ def index_cci_cx() -> pd.DataFrame:
     :return: 大宗商品指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {
-        "type": "cci",
-        "code": "1000050",
-        "month": "-1",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化值", "大宗商品指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "大宗商品指数",
-            "变化值",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_cci_cx")
 
 
 def index_qli_cx() -> pd.DataFrame:
@@ -441,29 +260,7 @@ def index_qli_cx() -> pd.DataFrame:
     :return: 高质量因子
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {
-        "type": "qli",
-        "code": "1000050",
-        "month": "-1",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化幅度", "高质量因子指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "高质量因子指数",
-            "变化幅度",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_qli_cx")
 
 
 def index_ai_cx() -> pd.DataFrame:
@@ -473,29 +270,7 @@ def index_ai_cx() -> pd.DataFrame:
     :return: AI策略指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {
-        "type": "ai",
-        "code": "1000050",
-        "month": "-1",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化幅度", "AI策略指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "AI策略指数",
-            "变化幅度",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_ai_cx")
 
 
 def index_bei_cx() -> pd.DataFrame:
@@ -505,29 +280,7 @@ def index_bei_cx() -> pd.DataFrame:
     :return: 基石经济指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {
-        "type": "ind",
-        "code": "930927",
-        "month": "-1",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化幅度", "基石经济指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "基石经济指数",
-            "变化幅度",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_bei_cx")
 
 
 def index_neei_cx() -> pd.DataFrame:
@@ -537,32 +290,13 @@ def index_neei_cx() -> pd.DataFrame:
     :return: 新动能指数
     :rtype: pandas.DataFrame
     """
-    url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
-    params = {
-        "type": "ind",
-        "code": "930928",
-        "month": "1",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame(data_json["data"])
-    temp_df.columns = ["变化幅度", "新动能指数", "日期"]
-    temp_df = temp_df[
-        [
-            "日期",
-            "新动能指数",
-            "变化幅度",
-        ]
-    ]
-    temp_df["日期"] = (
-        pd.to_datetime(temp_df["日期"], unit="ms", utc=True)
-        .dt.tz_convert("Asia/Shanghai")
-        .dt.date
-    )
-    return temp_df
+    return _cx_index_view("index_neei_cx")
 
 
 if __name__ == "__main__":
+    index_cx_all_dict = index_cx_all()
+    print(index_cx_all_dict)
+
     index_pmi_com_cx_df = index_pmi_com_cx()
     print(index_pmi_com_cx_df)
 
@@ -9,7 +9,6 @@ https://infogram.com/world-container-index-1h17493095xl4zj
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils import demjson
 
@@ -24,6 +23,8 @@ def drewry_wci_index(symbol: str = "composite") -> pd.DataFrame:
     :return: Drewry 集装箱指数
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     symbol_map = {
         "composite": 0,
         "shanghai-rotterdam": 1,
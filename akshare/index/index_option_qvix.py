@@ -1,38 +1,85 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2023/10/19 16:00
+Date: 2026/10/19 15:00
 Desc: 50 ETF 期权波动率指数 QVIX
 300 ETF 期权波动率指数 QVIX
 http://1.optbbs.com/s/vix.shtml?50ETF
 http://1.optbbs.com/s/vix.shtml?300ETF
+所有品种的日线在同一个文件 k.csv 中, 文件在有效期内只下载和解析一次, 各接口从中截取对应的字段
 """
 
+from typing import Dict
+
 import pandas as pd
-from functools import lru_cache
+
+from akshare.utils.shared_source import shared_source
+
+# k.csv 中各品种开盘价所在的列, 之后三列依次为最高价、最低价和收盘价
+QVIX_DAILY_COLUMNS = {
+    "50etf": 1,
+    "300etf": 9,
+    "500etf": 67,
+    "cyb": 71,
+    "kcb": 83,
+    "100etf": 75,
+    "300index": 17,
+    "1000index": 25,
+    "50index": 79,
+}
 
 
-@lru_cache
-def __get_optbbs_daily() -> pd.DataFrame:
+@shared_source(ttl=300)
+def _optbbs_daily() -> pd.DataFrame:
     """
-    读取原始数据
+    读取并解析所有品种的日线数据
     http://1.optbbs.com/d/csv/d/k.csv
-    :return: 原始数据
+    :return: 日线数据, 第一列为日期, 其余列为数值
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/k.csv"
     temp_df = pd.read_csv(url, encoding="gbk")
+    date_series = pd.to_datetime(temp_df.iloc[:, 0], errors="coerce").dt.date
+    temp_df = pd.concat(
+        [date_series, temp_df.iloc[:, 1:].apply(pd.to_numeric, errors="coerce")],
+        axis=1,
+    )
     return temp_df
 
 
-def index_option_50etf_qvix() -> pd.DataFrame:
+@shared_source(ttl=60)
+def _optbbs_minute(name: str) -> pd.DataFrame:
     """
-    50ETF 期权波动率指数 QVIX
-    http://1.optbbs.com/s/vix.shtml?50ETF
-    :return: 50ETF 期权波动率指数 QVIX
+    读取并解析分时数据
+    :param name: 文件名, e.g., "vix50"
+    :type name: str
+    :return: 分时数据
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, :5]
+    url = f"http://1.optbbs.com/d/csv/d/{name}.csv"
+    temp_df = pd.read_csv(url).iloc[:, :2]
+    temp_df.columns = [
+        "time",
+        "qvix",
+    ]
+    temp_df["qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
+    return temp_df
+
+
+def _qvix_daily_view(symbol: str, source_df: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    从日线数据中截取指定品种
+    :param symbol: QVIX_DAILY_COLUMNS 中的品种
+    :type symbol: str
+    :param source_df: 日线数据, 为空时读取共享数据源
+    :type source_df: pandas.DataFrame
+    :return: 指定品种的 QVIX 日线
+    :rtype: pandas.DataFrame
+    """
+    if source_df is None:
+        source_df = _optbbs_daily()
+    start = QVIX_DAILY_COLUMNS[symbol]
+    temp_df = source_df.iloc[:, [0, start, start + 1, start + 2, start + 3]].copy()
     temp_df.columns = [
         "date",
         "open",
@@ -40,14 +87,32 @@ def index_option_50etf_qvix() -> pd.DataFrame:
         "low",
         "close",
     ]
-    temp_df.loc[:, "date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df.loc[:, "open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df.loc[:, "high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df.loc[:, "low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df.loc[:, "close"] = pd.to_numeric(temp_df["close"], errors="coerce")
     return temp_df
 
 
+def index_option_qvix_all() -> Dict[str, pd.DataFrame]:
+    """
+    所有品种的期权波动率指数 QVIX 日线, 只下载一次数据
+    http://1.optbbs.com/s/vix.shtml?50ETF
+    :return: 品种对应的 QVIX 日线, 品种为 QVIX_DAILY_COLUMNS 的键
+    :rtype: dict
+    """
+    source_df = _optbbs_daily()
+    return {
+        symbol: _qvix_daily_view(symbol, source_df) for symbol in QVIX_DAILY_COLUMNS
+    }
+
+
+def index_option_50etf_qvix() -> pd.DataFrame:
+    """
+    50ETF 期权波动率指数 QVIX
+    http://1.optbbs.com/s/vix.shtml?50ETF
+    :return: 50ETF 期权波动率指数 QVIX
+    :rtype: pandas.DataFrame
+    """
+    return _qvix_daily_view("50etf")
+
+
 def index_option_50etf_min_qvix() -> pd.DataFrame:
     """
     50 ETF 期权波动率指数 QVIX
@@ -55,14 +120,7 @@ def index_option_50etf_min_qvix() -> pd.DataFrame:
     :return: 50 ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vix50.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _optbbs_minute("vix50").copy()
 
 
 def index_option_300etf_qvix() -> pd.DataFrame:
@@ -72,20 +130,7 @@ def index_option_300etf_qvix() -> pd.DataFrame:
     :return: 300 ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 9, 10, 11, 12]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df.loc[:, "date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df.loc[:, "open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df.loc[:, "high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df.loc[:, "low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df.loc[:, "close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily_view("300etf")
 
 
 def index_option_300etf_min_qvix() -> pd.DataFrame:
@@ -95,14 +140,7 @@ def index_option_300etf_min_qvix() -> pd.DataFrame:
     :return: 300 ETF 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vix300.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _optbbs_minute("vix300").copy()
 
 
 def index_option_500etf_qvix() -> pd.DataFrame:
@@ -112,20 +150,7 @@ def index_option_500etf_qvix() -> pd.DataFrame:
     :return: 500 ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 67, 68, 69, 70]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df.loc[:, "date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df.loc[:, "open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df.loc[:, "high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df.loc[:, "low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df.loc[:, "close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily_view("500etf")
 
 
 def index_option_500etf_min_qvix() -> pd.DataFrame:
@@ -135,14 +160,7 @@ def index_option_500etf_min_qvix() -> pd.DataFrame:
     :return: 500 ETF 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vix500.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _optbbs_minute("vix500").copy()
 
 
 def index_option_cyb_qvix() -> pd.DataFrame:
@@ -152,20 +170,7 @@ def index_option_cyb_qvix() -> pd.DataFrame:
     :return: 创业板 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 71, 72, 73, 74]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df.loc[:, "date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df.loc[:, "open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df.loc[:, "high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df.loc[:, "low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df.loc[:, "close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily_view("cyb")
 
 
 def index_option_cyb_min_qvix() -> pd.DataFrame:
@@ -175,14 +180,7 @@ def index_option_cyb_min_qvix() -> pd.DataFrame:
     :return: 创业板 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vixcyb.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _optbbs_minute("vixcyb").copy()
 
 
 def index_option_kcb_qvix() -> pd.DataFrame:
@@ -192,20 +190,7 @@ def index_option_kcb_qvix() -> pd.DataFrame:
     :return: 科创板 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 83, 84, 85, 86]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df.loc[:, "date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df.loc[:, "open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df.loc[:, "high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df.loc[:, "low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df.loc[:, "close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily_view("kcb")
 
 
 def index_option_kcb_min_qvix() -> pd.DataFrame:
@@ -215,14 +200,7 @@ def index_option_kcb_min_qvix() -> pd.DataFrame:
     :return: 科创板 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vixkcb.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _optbbs_minute("vixkcb").copy()
 
 
 def index_option_100etf_qvix() -> pd.DataFrame:
@@ -232,20 +210,7 @@ def index_option_100etf_qvix() -> pd.DataFrame:
     :return: 深证100ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 75, 76, 77, 78]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df.loc[:, "date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df.loc[:, "open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df.loc[:, "high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df.loc[:, "low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df.loc[:, "close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily_view("100etf")
 
 
 def index_option_100etf_min_qvix() -> pd.DataFrame:
@@ -255,14 +220,7 @@ def index_option_100etf_min_qvix() -> pd.DataFrame:
     :return: 深证100ETF 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vix100.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _optbbs_minute("vix100").copy()
 
 
 def index_option_300index_qvix() -> pd.DataFrame:
@@ -272,20 +230,7 @@ def index_option_300index_qvix() -> pd.DataFrame:
     :return: 中证300股指 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 17, 18, 19, 20]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df.loc[:, "date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df.loc[:, "open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df.loc[:, "high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df.loc[:, "low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df.loc[:, "close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily_view("300index")
 
 
 def index_option_300index_min_qvix() -> pd.DataFrame:
@@ -295,14 +240,7 @@ def index_option_300index_min_qvix() -> pd.DataFrame:
     :return: 中证300股指 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vixindex.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _optbbs_minute("vixindex").copy()
 
 
 def index_option_1000index_qvix() -> pd.DataFrame:
@@ -312,20 +250,7 @@ def index_option_1000index_qvix() -> pd.DataFrame:
     :return: 中证1000股指 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 25, 26, 27, 28]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df.loc[:, "date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df.loc[:, "open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df.loc[:, "high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df.loc[:, "low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df.loc[:, "close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily_view("1000index")
 
 
 def index_option_1000index_min_qvix() -> pd.DataFrame:
@@ -335,14 +260,7 @@ def index_option_1000index_min_qvix() -> pd.DataFrame:
     :return: 中证1000股指 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vixindex1000.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _optbbs_minute("vixindex1000").copy()
 
 
 def index_option_50index_qvix() -> pd.DataFrame:
@@ -352,20 +270,7 @@ def index_option_50index_qvix() -> pd.DataFrame:
     :return: 上证50股指 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 79, 80, 81, 82]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df.loc[:, "date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df.loc[:, "open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df.loc[:, "high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df.loc[:, "low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df.loc[:, "close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily_view("50index")
 
 
 def index_option_50index_min_qvix() -> pd.DataFrame:
@@ -375,17 +280,13 @@ def index_option_50index_min_qvix() -> pd.DataFrame:
     :return: 上证50股指 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vix50index.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _optbbs_minute("vix50index").copy()
 
 
 if __name__ == "__main__":
+    index_option_qvix_all_dict = index_option_qvix_all()
+    print(index_option_qvix_all_dict)
+
     index_option_50etf_qvix_df = index_option_50etf_qvix()
     print(index_option_50etf_qvix_df)
 
@@ -12,7 +12,6 @@ import re
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from functools import lru_cache
 
@@ -127,6 +126,8 @@ def stock_hk_index_daily_sina(symbol: str = "CES100") -> pd.DataFrame:
     :return: 历史行情数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = f"https://finance.sina.com.cn/stock/hkstock/{symbol}/klc_kl.js"
     params = {"d": "2023_5_01"}
     res = requests.get(url, params=params)
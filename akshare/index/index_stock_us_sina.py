@@ -8,7 +8,6 @@ https://stock.finance.sina.com.cn/usstock/quotes/.IXIC.html
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.stock.cons import (
     zh_js_decode,
@@ -24,6 +23,8 @@ def index_us_stock_sina(symbol: str = ".INX") -> pd.DataFrame:
     :return: 美股指数行情
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = f"https://finance.sina.com.cn/staticdata/us/{symbol}"
     r = requests.get(url)
     js_code = py_mini_racer.MiniRacer()
@@ -11,7 +11,6 @@ import datetime
 import re
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.index.cons import (
@@ -299,6 +298,8 @@ def stock_zh_index_daily(symbol: str = "sh000922") -> pd.DataFrame:
     :return: 历史行情数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     params = {"d": "2020_2_4"}
     res = requests.get(zh_sina_index_stock_hist_url.format(symbol), params=params)
     js_code = py_mini_racer.MiniRacer()
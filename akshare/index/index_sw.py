@@ -11,7 +11,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils.cons import headers
 
@@ -23,6 +22,8 @@ def sw_index_first_info() -> pd.DataFrame:
     :return: 分类
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://legulegu.com/stockdata/sw-industry-overview"
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -81,6 +82,8 @@ def sw_index_second_info() -> pd.DataFrame:
     :return: 分类
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://legulegu.com/stockdata/sw-industry-overview"
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -143,6 +146,8 @@ def sw_index_third_info() -> pd.DataFrame:
     :return: 分类
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://legulegu.com/stockdata/sw-industry-overview"
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
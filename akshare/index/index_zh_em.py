@@ -10,7 +10,13 @@ from functools import lru_cache
 import pandas as pd
 import requests
 
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.func import (
+    EM_TRENDS_NDAYS,
+    em_filter_rows,
+    em_kline_range,
+    em_time_window,
+    fetch_paginated_data,
+)
 
 
 @lru_cache()
@@ -195,15 +201,17 @@ def index_zh_a_hist_min_em(
     :return: 每日分时行情
     :rtype: pandas.DataFrame
     """
+    start_key, end_key = em_time_window(start_date, end_date)
     code_id_dict = index_code_id_map_em()
     if period == "1":
         url = "https://push2his.eastmoney.com/api/qt/stock/trends2/get"
+        ndays = EM_TRENDS_NDAYS
         try:
             params = {
                 "fields1": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f11,f12,f13",
                 "fields2": "f51,f52,f53,f54,f55,f56,f57,f58",
                 "iscr": "0",
-                "ndays": "5",
+                "ndays": ndays,
                 "secid": f"{code_id_dict[symbol]}.{symbol}",
             }
         except KeyError:
@@ -211,7 +219,7 @@ def index_zh_a_hist_min_em(
                 "fields1": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f11,f12,f13",
                 "fields2": "f51,f52,f53,f54,f55,f56,f57,f58",
                 "iscr": "0",
-                "ndays": "5",
+                "ndays": ndays,
                 "secid": f"1.{symbol}",
             }
             r = requests.get(url, params=params)
@@ -221,7 +229,7 @@ def index_zh_a_hist_min_em(
                     "fields1": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f11,f12,f13",
                     "fields2": "f51,f52,f53,f54,f55,f56,f57,f58",
                     "iscr": "0",
-                    "ndays": "5",
+                    "ndays": ndays,
                     "secid": f"0.{symbol}",
                 }
                 r = requests.get(url, params=params)
@@ -231,27 +239,24 @@ def index_zh_a_hist_min_em(
                         "fields1": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f11,f12,f13",
                         "fields2": "f51,f52,f53,f54,f55,f56,f57,f58",
                         "iscr": "0",
-                        "ndays": "5",
+                        "ndays": ndays,
                         "secid": f"47.{symbol}",
                     }
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["trends"]]
+            em_filter_rows(data_json["data"]["trends"], start_key, end_key),
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "均价",
+            ],
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "均价",
-        ]
-        temp_df.index = pd.to_datetime(temp_df["时间"], errors="coerce")
-        temp_df = temp_df[start_date:end_date]
-        temp_df.reset_index(drop=True, inplace=True)
         temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
         temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
         temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
@@ -271,8 +276,7 @@ def index_zh_a_hist_min_em(
                 "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
                 "klt": period,
                 "fqt": "1",
-                "beg": "0",
-                "end": "20500000",
+                **em_kline_range(start_key, end_key),
             }
         except:  # noqa: E722
             params = {
@@ -282,8 +286,7 @@ def index_zh_a_hist_min_em(
                 "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
                 "klt": period,
                 "fqt": "1",
-                "beg": "0",
-                "end": "20500000",
+                **em_kline_range(start_key, end_key),
             }
             r = requests.get(url, params=params)
             data_json = r.json()
@@ -295,8 +298,7 @@ def index_zh_a_hist_min_em(
                     "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
                     "klt": period,
                     "fqt": "1",
-                    "beg": "0",
-                    "end": "20500000",
+                    **em_kline_range(start_key, end_key),
                 }
                 r = requests.get(url, params=params)
                 data_json = r.json()
@@ -308,30 +310,26 @@ def index_zh_a_hist_min_em(
                         "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
                         "klt": period,
                         "fqt": "1",
-                        "beg": "0",
-                        "end": "20500000",
+                        **em_kline_range(start_key, end_key),
                     }
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
-            [item.split(",") for item in data_json["data"]["klines"]]
+            em_filter_rows(data_json["data"]["klines"], start_key, end_key),
+            columns=[
+                "时间",
+                "开盘",
+                "收盘",
+                "最高",
+                "最低",
+                "成交量",
+                "成交额",
+                "振幅",
+                "涨跌幅",
+                "涨跌额",
+                "换手率",
+            ],
         )
-        temp_df.columns = [
-            "时间",
-            "开盘",
-            "收盘",
-            "最高",
-            "最低",
-            "成交量",
-            "成交额",
-            "振幅",
-            "涨跌幅",
-            "涨跌额",
-            "换手率",
-        ]
-        temp_df.index = pd.to_datetime(temp_df["时间"], errors="coerce")
-        temp_df = temp_df[start_date:end_date]
-        temp_df.reset_index(drop=True, inplace=True)
         temp_df["开盘"] = pd.to_numeric(temp_df["开盘"], errors="coerce")
         temp_df["收盘"] = pd.to_numeric(temp_df["收盘"], errors="coerce")
         temp_df["最高"] = pd.to_numeric(temp_df["最高"], errors="coerce")
@@ -14,7 +14,6 @@ import os
 
 import pandas as pd  # type: ignore
 import requests
-import py_mini_racer  # type: ignore
 
 
 def _get_js_path(name: str = "", module_file: str = "") -> str:
@@ -55,6 +54,8 @@ def decrypt(origin_data: str = "") -> str:
     :return: 解密后的字符串
     :rtype: str
     """
+    import py_mini_racer
+
     file_data = _get_file_content(file_name="jm.js")
     ctx = py_mini_racer.MiniRacer()
     ctx.eval(file_data)
@@ -10,7 +10,6 @@ import re
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 
@@ -23,6 +22,8 @@ def news_cctv(date: str = "20240424") -> pd.DataFrame:
     :return: 新闻联播文字稿
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     if int(date) <= int("20130708"):
         url = f"https://cctv.cntv.cn/lm/xinwenlianbo/{date}.shtml"
         r = requests.get(url)
@@ -11,11 +11,12 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 @lru_cache()
 def option_comm_symbol() -> pd.DataFrame:
+    from bs4 import BeautifulSoup
+
     import urllib3
 
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -44,6 +45,8 @@ def option_comm_info(symbol: str = "工业硅期权") -> pd.DataFrame:
     :return: 期权手续费
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     import urllib3
 
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -8,7 +8,6 @@ https://stock.finance.sina.com.cn/futures/view/optionsDP.php
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils import demjson
 
@@ -22,6 +21,8 @@ def option_commodity_contract_sina(symbol: str = "玉米期权") -> pd.DataFrame
     :return: e.g., {'黄金期权': ['au2012', 'au2008', 'au2010', 'au2104', 'au2102', 'au2106', 'au2108']}
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+
     url = "https://stock.finance.sina.com.cn/futures/view/optionsDP.php/pg_o/dce"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, "lxml")
@@ -65,6 +66,8 @@ def option_commodity_contract_table_sina(
     :return: 合约实时行情
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://stock.finance.sina.com.cn/futures/view/optionsDP.php/pg_o/dce"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, "lxml")
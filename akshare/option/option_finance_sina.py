@@ -18,10 +18,10 @@ from typing import Dict, List, Tuple
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.option.option_em import option_current_em
 from akshare.utils.func import set_df_columns
+from akshare.utils.sina_hq import sina_hq_fetch, sina_hq_frame
 
 
 # 期权-中金所-上证50指数
@@ -32,6 +32,8 @@ def option_cffex_sz50_list_sina() -> Dict[str, List[str]]:
     :return: 中金所-上证 50 指数-所有合约
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+
     url = "https://stock.finance.sina.com.cn/futures/view/optionsCffexDP.php/ho/cffex"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -49,6 +51,8 @@ def option_cffex_hs300_list_sina() -> Dict[str, List[str]]:
     :return: 中金所-沪深300指数-所有合约
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+
     url = "https://stock.finance.sina.com.cn/futures/view/optionsCffexDP.php"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -65,6 +69,8 @@ def option_cffex_zz1000_list_sina() -> Dict[str, List[str]]:
     :return: 中金所-中证 1000 指数-所有合约
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+
     url = "https://stock.finance.sina.com.cn/futures/view/optionsCffexDP.php/mo/cffex"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -547,28 +553,8 @@ def option_sse_spot_price_sina(symbol: str = "10003720") -> pd.DataFrame:
     :return: 期权量价数据
     :rtype: pandas.DataFrame
     """
-    url = f"https://hq.sinajs.cn/list=CON_OP_{symbol}"
-    headers = {
-        "Accept": "*/*",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Connection": "keep-alive",
-        "Host": "hq.sinajs.cn",
-        "Pragma": "no-cache",
-        "Referer": "https://stock.finance.sina.com.cn/",
-        "sec-ch-ua": '" Not;A Brand";v="99", "Google Chrome";v="97", "Chromium";v="97"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"Windows"',
-        "Sec-Fetch-Dest": "script",
-        "Sec-Fetch-Mode": "no-cors",
-        "Sec-Fetch-Site": "cross-site",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/97.0.4692.71 Safari/537.36",
-    }
-    r = requests.get(url, headers=headers)
-    data_text = r.text
-    data_list = data_text[data_text.find('"') + 1 : data_text.rfind('"')].split(",")
+    code = f"CON_OP_{symbol}"
+    data_list = sina_hq_fetch([code]).get(code) or [""]
     field_list = [
         "买量",
         "买价",
@@ -628,22 +614,8 @@ def option_sse_underlying_spot_price_sina(
     :return: 期权标的物的信息
     :rtype: pandas.DataFrame
     """
-    url = f"https://hq.sinajs.cn/list={symbol}"
-    headers = {
-        "Accept": "*/*",
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Host": "hq.sinajs.cn",
-        "Pragma": "no-cache",
-        "Proxy-Connection": "keep-alive",
-        "Referer": "https://vip.stock.finance.sina.com.cn/",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/97.0.4692.71 Safari/537.36",
-    }
-    r = requests.get(url, headers=headers)
-    data_text = r.text
-    data_list = data_text[data_text.find('"') + 1 : data_text.rfind('"')].split(",")
+    code = symbol
+    data_list = sina_hq_fetch([code]).get(code) or [""]
     field_list = [
         "证券简称",
         "今日开盘价",
@@ -691,22 +663,8 @@ def option_sse_greeks_sina(symbol: str = "10003045") -> pd.DataFrame:
     :return: 期权基本信息表
     :rtype: pandas.DataFrame
     """
-    url = f"https://hq.sinajs.cn/list=CON_SO_{symbol}"
-    headers = {
-        "Accept": "*/*",
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Host": "hq.sinajs.cn",
-        "Pragma": "no-cache",
-        "Proxy-Connection": "keep-alive",
-        "Referer": "https://vip.stock.finance.sina.com.cn/",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/97.0.4692.71 Safari/537.36",
-    }
-    r = requests.get(url, headers=headers)
-    data_text = r.text
-    data_list = data_text[data_text.find('"') + 1 : data_text.rfind('"')].split(",")
+    code = f"CON_SO_{symbol}"
+    data_list = sina_hq_fetch([code]).get(code) or [""]
     field_list = [
         "期权合约简称",
         "成交量",
@@ -729,6 +687,40 @@ def option_sse_greeks_sina(symbol: str = "10003045") -> pd.DataFrame:
     return data_df
 
 
+def option_sse_spot_price_batch_sina(
+    symbol_list: List[str] = ("10003720", "10003721"),
+    greeks: bool = True,
+) -> pd.DataFrame:
+    """
+    新浪财经-期权-多个期权合约的实时数据
+    所有合约的行情和希腊字母合并为少量批量请求, 可用于获取整个期权链的快照
+    https://stock.finance.sina.com.cn/option/quotes.html
+    :param symbol_list: 期权代码列表, 可以通过 ak.option_sse_codes_sina() 获取
+    :type symbol_list: list
+    :param greeks: 是否同时获取 Delta, Gamma, Theta, Vega, 隐含波动率 和 理论价值
+    :type greeks: bool
+    :return: 期权实时数据, 每个合约一行
+    :rtype: pandas.DataFrame
+    """
+    symbol_list = [str(item) for item in symbol_list]
+    code_list = [f"CON_OP_{item}" for item in symbol_list]
+    if greeks:
+        code_list += [f"CON_SO_{item}" for item in symbol_list]
+    raw_dict = sina_hq_fetch(code_list)
+    temp_df = sina_hq_frame(raw_dict, "CON_OP_")
+    temp_df.index = temp_df.index.str[7:]
+    if greeks:
+        greeks_df = sina_hq_frame(raw_dict, "CON_SO_")
+        greeks_df.index = greeks_df.index.str[7:]
+        temp_df = temp_df.join(
+            greeks_df[["Delta", "Gamma", "Theta", "Vega", "隐含波动率", "理论价值"]]
+        )
+    temp_df = temp_df.reindex([item for item in symbol_list if item in temp_df.index])
+    temp_df.index.name = "期权代码"
+    temp_df.reset_index(inplace=True)
+    return temp_df
+
+
 def option_sse_minute_sina(symbol: str = "10003720") -> pd.DataFrame:
     """
     指定期权品种在当前交易日的分钟数据, 只能获取当前交易日的数据, 不能获取历史分钟数据
@@ -963,6 +955,11 @@ if __name__ == "__main__":
     option_sse_greeks_sina_df = option_sse_greeks_sina(symbol="10004023")
     print(option_sse_greeks_sina_df)
 
+    option_sse_spot_price_batch_sina_df = option_sse_spot_price_batch_sina(
+        symbol_list=["10004023", "10003686"]
+    )
+    print(option_sse_spot_price_batch_sina_df)
+
     option_sse_minute_sina_df = option_sse_minute_sina(symbol="10004023")
     print(option_sse_minute_sina_df)
 
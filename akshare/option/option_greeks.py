@@ -0,0 +1,461 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 期权链隐含波动率和希腊字母
+整个期权链一次性向量化计算: 现货期权使用 Black-Scholes-Merton 模型, 期货或远期使用 Black-76 模型;
+隐含波动率使用带区间保护的牛顿法求解, 牛顿步越界时退化为二分
+Theta 为每个自然日的价值变化, Vega 为波动率变化 1% 的价值变化
+"""
+
+import datetime
+import math
+import re
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+_SQRT_2 = math.sqrt(2)
+_SQRT_2PI = math.sqrt(2 * math.pi)
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+
+# 到期日当天按剩余 1 天计算
+_MIN_YEARS = 1 / 365
+
+# 隐含波动率的求解区间
+_IV_LOWER = 1e-4
+_IV_UPPER = 5.0
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype="float64")
+    return 0.5 * np.asarray(_erfc(-x / _SQRT_2), dtype="float64")
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def _d1_d2(s, k, t, r, q, sigma):
+    sqrt_t = np.sqrt(t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(s / k) + (r - q + 0.5 * sigma * sigma) * t) / (sigma * sqrt_t)
+    return d1, d1 - sigma * sqrt_t
+
+
+def _bsm_price(is_call, s, k, t, r, q, sigma) -> np.ndarray:
+    """
+    Black-Scholes-Merton 期权价格, q 为连续股息率; q 等于 r 且 s 为期货价格时即为 Black-76
+    """
+    d1, d2 = _d1_d2(s, k, t, r, q, sigma)
+    sign = np.where(is_call, 1.0, -1.0)
+    return sign * (
+        s * np.exp(-q * t) * _norm_cdf(sign * d1)
+        - k * np.exp(-r * t) * _norm_cdf(sign * d2)
+    )
+
+
+def _bsm_vega(s, k, t, r, q, sigma) -> np.ndarray:
+    d1, _ = _d1_d2(s, k, t, r, q, sigma)
+    return s * np.exp(-q * t) * _norm_pdf(d1) * np.sqrt(t)
+
+
+def _bsm_greeks(is_call, s, k, t, r, q, sigma) -> pd.DataFrame:
+    """
+    Black-Scholes-Merton 希腊字母
+    """
+    d1, d2 = _d1_d2(s, k, t, r, q, sigma)
+    sign = np.where(is_call, 1.0, -1.0)
+    discount_q = np.exp(-q * t)
+    discount_r = np.exp(-r * t)
+    pdf_d1 = _norm_pdf(d1)
+    sqrt_t = np.sqrt(t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = discount_q * pdf_d1 / (s * sigma * sqrt_t)
+        theta = (
+            -s * discount_q * pdf_d1 * sigma / (2 * sqrt_t)
+            + sign * q * s * discount_q * _norm_cdf(sign * d1)
+            - sign * r * k * discount_r * _norm_cdf(sign * d2)
+        )
+    return pd.DataFrame(
+        {
+            "Delta": sign * discount_q * _norm_cdf(sign * d1),
+            "Gamma": gamma,
+            "Theta": theta / 365,
+            "Vega": s * discount_q * pdf_d1 * sqrt_t / 100,
+        }
+    )
+
+
+def option_implied_vol(
+    price: Union[float, np.ndarray],
+    is_call: Union[bool, np.ndarray],
+    s: Union[float, np.ndarray],
+    k: Union[float, np.ndarray],
+    t: Union[float, np.ndarray],
+    r: float = 0.02,
+    q: Union[float, np.ndarray] = 0.0,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """
+    向量化求解隐含波动率
+    :param price: 期权价格
+    :type price: numpy.ndarray
+    :param is_call: 是否为看涨期权
+    :type is_call: numpy.ndarray
+    :param s: 标的价格
+    :type s: numpy.ndarray
+    :param k: 行权价
+    :type k: numpy.ndarray
+    :param t: 剩余期限, 单位: 年
+    :type t: numpy.ndarray
+    :param r: 无风险利率
+    :type r: float
+    :param q: 连续股息率; Black-76 模型时与 r 相同
+    :type q: float
+    :param tol: 价格误差
+    :type tol: float
+    :param max_iter: 最大迭代次数
+    :type max_iter: int
+    :return: 隐含波动率, 价格超出无套利区间时为 NaN
+    :rtype: numpy.ndarray
+    """
+    price, is_call, s, k, t, q = np.broadcast_arrays(
+        np.asarray(price, dtype="float64"),
+        np.asarray(is_call, dtype=bool),
+        np.asarray(s, dtype="float64"),
+        np.asarray(k, dtype="float64"),
+        np.maximum(np.asarray(t, dtype="float64"), _MIN_YEARS),
+        np.asarray(q, dtype="float64"),
+    )
+    forward_pv = s * np.exp(-q * t)
+    strike_pv = k * np.exp(-r * t)
+    lower_bound = np.where(
+        is_call,
+        np.maximum(forward_pv - strike_pv, 0),
+        np.maximum(strike_pv - forward_pv, 0),
+    )
+    upper_bound = np.where(is_call, forward_pv, strike_pv)
+    valid = (price > lower_bound) & (price < upper_bound) & (k > 0) & (s > 0)
+
+    sigma = np.full(price.shape, np.nan)
+    lower = np.full(price.shape, _IV_LOWER)
+    upper = np.full(price.shape, _IV_UPPER)
+    # Brenner-Subrahmanyam 近似作为初始值
+    with np.errstate(divide="ignore", invalid="ignore"):
+        guess = np.sqrt(2 * np.pi / t) * price / s
+    sigma[valid] = np.clip(guess[valid], 0.05, 2.0)
+    active = valid.copy()
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        idx = np.flatnonzero(active)
+        args = (s[idx], k[idx], t[idx], r, q[idx])
+        diff = _bsm_price(is_call[idx], *args, sigma[idx]) - price[idx]
+        done = np.abs(diff) < tol
+        active[idx[done]] = False
+        too_high = diff > 0
+        upper[idx] = np.where(too_high, sigma[idx], upper[idx])
+        lower[idx] = np.where(too_high, lower[idx], sigma[idx])
+        vega = _bsm_vega(*args, sigma[idx])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = sigma[idx] - diff / vega
+        bisect = 0.5 * (lower[idx] + upper[idx])
+        step = np.where(
+            (step > lower[idx]) & (step < upper[idx]) & np.isfinite(step), step, bisect
+        )
+        sigma[idx] = np.where(done, sigma[idx], step)
+    return sigma
+
+
+def option_chain_greeks(
+    chain_df: pd.DataFrame,
+    rate: float = 0.02,
+    dividend: float = 0.0,
+    model: str = "bsm",
+) -> pd.DataFrame:
+    """
+    期权链的隐含波动率和希腊字母
+    :param chain_df: 期权链, 需包含 期权类型(看涨/看跌), 行权价, 期权价格, 标的价格, 剩余年限 字段
+    :type chain_df: pandas.DataFrame
+    :param rate: 无风险利率
+    :type rate: float
+    :param dividend: 连续股息率, 仅 bsm 模型使用
+    :type dividend: float
+    :param model: choice of {"bsm", "black76"}; black76 时标的价格为期货或远期价格
+    :type model: str
+    :return: 在期权链后增加 隐含波动率, Delta, Gamma, Theta, Vega 字段
+    :rtype: pandas.DataFrame
+    """
+    if model not in {"bsm", "black76"}:
+        raise ValueError("model 只能为 bsm 或 black76")
+    is_call = chain_df["期权类型"].isin(["看涨", "购", "C", "c", "call"]).to_numpy()
+    s = pd.to_numeric(chain_df["标的价格"], errors="coerce").to_numpy(dtype="float64")
+    k = pd.to_numeric(chain_df["行权价"], errors="coerce").to_numpy(dtype="float64")
+    t = np.maximum(
+        pd.to_numeric(chain_df["剩余年限"], errors="coerce").to_numpy(dtype="float64"),
+        _MIN_YEARS,
+    )
+    price = pd.to_numeric(chain_df["期权价格"], errors="coerce").to_numpy(
+        dtype="float64"
+    )
+    q = rate if model == "black76" else dividend
+    sigma = option_implied_vol(price, is_call, s, k, t, r=rate, q=q)
+    greeks_df = _bsm_greeks(is_call, s, k, t, rate, q, sigma)
+    temp_df = chain_df.reset_index(drop=True).copy()
+    temp_df["隐含波动率"] = sigma
+    for item in greeks_df.columns:
+        temp_df[item] = greeks_df[item].to_numpy()
+    return temp_df
+
+
+class OptionSurface:
+    """
+    隐含波动率曲面
+    每个到期日的波动率微笑按行权价线性插值, 不同到期日之间按总方差(波动率平方乘以期限)线性插值, 超出范围时取边界值
+    同一行权价同时有看涨和看跌期权时, 使用虚值期权的隐含波动率
+    """
+
+    def __init__(self, greeks_df: pd.DataFrame):
+        """
+        :param greeks_df: option_chain_greeks 的返回值
+        :type greeks_df: pandas.DataFrame
+        """
+        temp_df = greeks_df[
+            ["期权类型", "行权价", "标的价格", "剩余年限", "隐含波动率"]
+        ].dropna()
+        is_call = temp_df["期权类型"].isin(["看涨", "购", "C", "c", "call"])
+        otm = (is_call & (temp_df["行权价"] >= temp_df["标的价格"])) | (
+            ~is_call & (temp_df["行权价"] <= temp_df["标的价格"])
+        )
+        # 只有一侧报价的行权价保留该侧的数据
+        temp_df = temp_df.assign(_otm=otm.astype(int)).sort_values(
+            ["剩余年限", "行权价", "_otm"]
+        )
+        temp_df = temp_df.drop_duplicates(["剩余年限", "行权价"], keep="last")
+        self.data = temp_df[["剩余年限", "行权价", "隐含波动率"]].reset_index(
+            drop=True
+        )
+        self.expiries: List[float] = sorted(
+            float(item) for item in self.data["剩余年限"].unique()
+        )
+
+    def smile(self, expiry: float = None) -> pd.Series:
+        """
+        指定到期日的波动率微笑
+        :param expiry: 剩余年限, 默认为最近的到期日
+        :type expiry: float
+        :return: 索引为行权价的隐含波动率
+        :rtype: pandas.Series
+        """
+        if expiry is None:
+            expiry = self.expiries[0]
+        expiry = min(self.expiries, key=lambda item: abs(item - expiry))
+        temp_df = self.data[self.data["剩余年限"] == expiry]
+        return pd.Series(
+            temp_df["隐含波动率"].to_numpy(),
+            index=pd.Index(temp_df["行权价"].to_numpy(), name="行权价"),
+            name=expiry,
+        )
+
+    def iv(
+        self, strike: Union[float, np.ndarray], expiry: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """
+        插值计算指定行权价和剩余年限的隐含波动率
+        :param strike: 行权价
+        :type strike: float or numpy.ndarray
+        :param expiry: 剩余年限
+        :type expiry: float or numpy.ndarray
+        :return: 隐含波动率
+        :rtype: numpy.ndarray
+        """
+        strike, expiry = np.broadcast_arrays(
+            np.asarray(strike, dtype="float64"), np.asarray(expiry, dtype="float64")
+        )
+        expiry_arr = np.asarray(self.expiries)
+        # 每个到期日在各行权价上的总方差
+        total_variance = np.array(
+            [
+                np.interp(strike.ravel(), smile.index.to_numpy(), smile.to_numpy() ** 2)
+                * smile.name
+                for smile in (self.smile(item) for item in self.expiries)
+            ]
+        )
+        flat_expiry = np.clip(expiry.ravel(), expiry_arr[0], expiry_arr[-1])
+        right = np.searchsorted(expiry_arr, flat_expiry)
+        left = np.maximum(right - 1, 0)
+        t_left = expiry_arr[left]
+        t_right = expiry_arr[right]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.where(
+                t_right > t_left, (flat_expiry - t_left) / (t_right - t_left), 1.0
+            )
+        column = np.arange(flat_expiry.size)
+        variance = (1 - weight) * total_variance[left, column] + weight * total_variance[
+            right, column
+        ]
+        return np.sqrt(variance / flat_expiry).reshape(strike.shape)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        隐含波动率曲面
+        :return: 行为行权价, 列为剩余年限的隐含波动率
+        :rtype: pandas.DataFrame
+        """
+        return self.data.pivot(index="行权价", columns="剩余年限", values="隐含波动率")
+
+
+def option_sse_greeks_chain_sina(
+    symbol: str = "50ETF",
+    trade_date: str = "202402",
+    underlying: str = "510050",
+    rate: float = 0.02,
+) -> pd.DataFrame:
+    """
+    新浪财经-上交所期权-整个期权链的隐含波动率和希腊字母
+    合约代码、到期时间各请求一次, 所有合约和标的的行情合并为少量批量请求, 希腊字母在本地计算
+    https://stock.finance.sina.com.cn/option/quotes.html
+    :param symbol: 50ETF or 300ETF
+    :type symbol: str
+    :param trade_date: 到期月份
+    :type trade_date: str
+    :param underlying: 标的产品代码, e.g., 510050
+    :type underlying: str
+    :param rate: 无风险利率
+    :type rate: float
+    :return: 期权链的隐含波动率和希腊字母
+    :rtype: pandas.DataFrame
+    """
+    from akshare.option.option_finance_sina import (
+        option_sse_codes_sina,
+        option_sse_expire_day_sina,
+    )
+    from akshare.utils.sina_hq import sina_hq_fetch, sina_hq_frame
+
+    code_list = []
+    type_list = []
+    for option_type in ["看涨期权", "看跌期权"]:
+        codes_df = option_sse_codes_sina(
+            symbol=option_type, trade_date=trade_date, underlying=underlying
+        )
+        code_list.extend(codes_df["期权代码"].tolist())
+        type_list.extend([option_type[:2]] * len(codes_df))
+    expire_day, remainder_days = option_sse_expire_day_sina(
+        trade_date=trade_date, symbol=symbol
+    )
+    underlying_code = ("sh" if underlying.startswith("5") else "sz") + underlying
+    raw_dict = sina_hq_fetch([f"CON_OP_{item}" for item in code_list] + [underlying_code])
+    spot_df = sina_hq_frame(raw_dict, "CON_OP_")
+    underlying_df = sina_hq_frame(raw_dict, underlying_code[:2])
+    spot_df = spot_df.reindex([f"CON_OP_{item}" for item in code_list])
+    chain_df = pd.DataFrame(
+        {
+            "期权代码": code_list,
+            "期权合约简称": spot_df["期权合约简称"].to_numpy(),
+            "期权类型": type_list,
+            "到期日": expire_day,
+            "行权价": spot_df["行权价"].to_numpy(),
+            "期权价格": spot_df["最新价"].to_numpy(),
+            "标的价格": underlying_df["最近成交价"].iloc[0],
+            "剩余年限": remainder_days / 365,
+        }
+    )
+    return option_chain_greeks(chain_df, rate=rate, model="bsm")
+
+
+def _third_friday(year: int, month: int) -> datetime.date:
+    first_day = datetime.date(year, month, 1)
+    return first_day + datetime.timedelta(days=(4 - first_day.weekday()) % 7 + 14)
+
+
+def option_cffex_greeks_sina(
+    symbol: str = "io2404",
+    rate: float = 0.02,
+    trade_date: str = None,
+) -> pd.DataFrame:
+    """
+    新浪财经-中金所股指期权-指定合约月份的隐含波动率和希腊字母
+    到期日为合约月份的第三个星期五, 远期价格由平价公式根据看涨看跌价格最接近的行权价推出, 使用 Black-76 模型
+    https://stock.finance.sina.com.cn/futures/view/optionsCffexDP.php
+    :param symbol: 合约月份, e.g., "ho2404", "io2404", "mo2404"
+    :type symbol: str
+    :param rate: 无风险利率
+    :type rate: float
+    :param trade_date: 计算日期, 默认为今天, e.g., "20240320"
+    :type trade_date: str
+    :return: 看涨和看跌合约的隐含波动率和希腊字母
+    :rtype: pandas.DataFrame
+    """
+    from akshare.option.option_finance_sina import (
+        option_cffex_hs300_spot_sina,
+        option_cffex_sz50_spot_sina,
+        option_cffex_zz1000_spot_sina,
+    )
+
+    spot_func_map = {
+        "ho": option_cffex_sz50_spot_sina,
+        "io": option_cffex_hs300_spot_sina,
+        "mo": option_cffex_zz1000_spot_sina,
+    }
+    match = re.fullmatch(r"(ho|io|mo)(\d{2})(\d{2})", symbol)
+    if match is None:
+        raise ValueError("symbol 格式为 ho2404, io2404 或 mo2404")
+    spot_df = spot_func_map[match.group(1)](symbol=symbol)
+    expire_date = _third_friday(2000 + int(match.group(2)), int(match.group(3)))
+    today = (
+        datetime.date.today()
+        if trade_date is None
+        else datetime.datetime.strptime(trade_date, "%Y%m%d").date()
+    )
+    years = max((expire_date - today).days, 0) / 365
+    chain_df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "期权代码": spot_df[f"{side}合约-标识"].to_numpy(),
+                    "期权类型": side,
+                    "行权价": spot_df["行权价"].to_numpy(),
+                    "期权价格": spot_df[f"{side}合约-最新价"].to_numpy(),
+                }
+            )
+            for side in ["看涨", "看跌"]
+        ],
+        ignore_index=True,
+    )
+    parity = pd.DataFrame(
+        {
+            "行权价": spot_df["行权价"],
+            "diff": spot_df["看涨合约-最新价"] - spot_df["看跌合约-最新价"],
+        }
+    ).dropna()
+    parity = parity[
+        (spot_df.loc[parity.index, "看涨合约-最新价"] > 0)
+        & (spot_df.loc[parity.index, "看跌合约-最新价"] > 0)
+    ]
+    if parity.empty:
+        forward = np.nan
+    else:
+        row = parity.loc[parity["diff"].abs().idxmin()]
+        forward = row["行权价"] + row["diff"] * math.exp(
+            rate * max(years, _MIN_YEARS)
+        )
+    chain_df["到期日"] = expire_date
+    chain_df["标的价格"] = forward
+    chain_df["剩余年限"] = years
+    return option_chain_greeks(chain_df, rate=rate, model="black76")
+
+
+if __name__ == "__main__":
+    option_sse_greeks_chain_sina_df = option_sse_greeks_chain_sina(
+        symbol="50ETF", trade_date="202402", underlying="510050"
+    )
+    print(option_sse_greeks_chain_sina_df)
+
+    option_surface = OptionSurface(option_sse_greeks_chain_sina_df)
+    print(option_surface.smile())
+
+    option_cffex_greeks_sina_df = option_cffex_greeks_sina(symbol="io2404")
+    print(option_cffex_greeks_sina_df)
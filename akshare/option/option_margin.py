@@ -9,7 +9,6 @@ import requests
 import pandas as pd
 from io import StringIO
 
-from bs4 import BeautifulSoup
 from functools import lru_cache
 
 
@@ -20,6 +19,8 @@ def option_margin_symbol() -> pd.DataFrame:
     :return: 商品期权品种代码和名称
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.iweiai.com/qiquan/yuanyou"
     r = requests.get(url)
     soup = BeautifulSoup(r.content, features="lxml")
@@ -38,6 +39,8 @@ def option_margin(symbol: str = "原油期权") -> pd.DataFrame:
     :return: 商品期权保证金
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     option_margin_symbol_df = option_margin_symbol()
     url = option_margin_symbol_df[option_margin_symbol_df['symbol'] == symbol]['url'].values[0]
     r = requests.get(url)
@@ -0,0 +1,518 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: akshare 数据服务
+将公开接口发布为 HTTP 接口: GET /api/<接口名称>?参数=值&format=json|csv|arrow|parquet
+参数按接口函数签名中的类型注解校验和转换; 相同参数的请求共享结果缓存, 并发的相同请求只调用一次接口;
+按接口所在模块访问的上游主机限制并发数; 服务自身的请求数、延迟和缓存命中统计见 /metrics
+用法: python -m akshare.server --host 127.0.0.1 --port 8080
+"""
+
+import argparse
+import asyncio
+import functools
+import importlib
+import inspect
+import json
+import re
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from akshare.cache import DEFAULT_POLICY, MemoryStore
+
+# 不作为数据接口发布的名称前缀, 如设置类函数
+SERVER_EXCLUDE_PREFIX = ("set_", "enable", "disable", "clear")
+
+# 不作为数据接口发布的模块, 如缓存设置和文件读写工具
+SERVER_EXCLUDE_MODULES = ("akshare.server", "akshare.cache", "akshare.utils.")
+
+# 流式输出时每批的行数
+SERVER_CHUNK_ROWS = 5000
+
+# 延迟统计的分桶上界, 单位: 秒
+_LATENCY_BUCKETS = [0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+_module_host: Dict[str, str] = {}
+_module_host_lock = threading.Lock()
+
+
+def upstream_host(func: Callable) -> str:
+    """
+    接口访问的上游主机, 取接口所在模块中第一个地址的注册域名, e.g., "eastmoney.com"
+    :param func: 接口函数
+    :type func: callable
+    :return: 上游主机; 模块中没有地址时为模块名称
+    :rtype: str
+    """
+    module_name = getattr(func, "__module__", "") or ""
+    with _module_host_lock:
+        if module_name in _module_host:
+            return _module_host[module_name]
+    host = module_name
+    try:
+        source = inspect.getsource(importlib.import_module(module_name))
+        match = re.search(r"https?://([\w.-]+)", source)
+        if match:
+            label_list = match.group(1).lower().split(".")
+            # 国内域名保留三级, e.g., sina.com.cn
+            size = 3 if label_list[-1] == "cn" and label_list[-2] in ("com", "net", "org", "gov") else 2
+            host = ".".join(label_list[-size:])
+    except Exception:
+        pass
+    with _module_host_lock:
+        _module_host[module_name] = host
+    return host
+
+
+def _convert(value: str, annotation, default):
+    """
+    按类型注解转换查询参数
+    """
+    if annotation is inspect.Parameter.empty:
+        annotation = type(default) if default not in (None, inspect.Parameter.empty) else str
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        arg_list = [item for item in typing.get_args(annotation) if item is not type(None)]
+        annotation = arg_list[0] if arg_list else str
+        origin = typing.get_origin(annotation)
+    if annotation in (list, List) or origin is list:
+        return [item.strip() for item in value.split(",") if item.strip()]
+    if annotation is bool:
+        if value.lower() in ("1", "true", "yes"):
+            return True
+        if value.lower() in ("0", "false", "no"):
+            return False
+        raise ValueError(f"无法转换为 bool: {value}")
+    if annotation is int:
+        return int(value)
+    if annotation is float:
+        return float(value)
+    return value
+
+
+def bind_params(func: Callable, query: Dict[str, str]) -> dict:
+    """
+    按接口函数签名校验和转换查询参数
+    :param func: 接口函数
+    :type func: callable
+    :param query: 查询参数
+    :type query: dict
+    :return: 调用参数
+    :rtype: dict
+    """
+    signature = inspect.signature(func)
+    parameters = signature.parameters
+    unknown_list = [key for key in query if key not in parameters]
+    if unknown_list:
+        raise ValueError(f"未知参数: {', '.join(unknown_list)}")
+    kwargs = {}
+    for name, parameter in parameters.items():
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        if name in query:
+            try:
+                kwargs[name] = _convert(query[name], parameter.annotation, parameter.default)
+            except (TypeError, ValueError):
+                raise ValueError(f"参数 {name} 的值无效: {query[name]}")
+        elif parameter.default is inspect.Parameter.empty:
+            raise ValueError(f"缺少参数: {name}")
+    return kwargs
+
+
+def _schema(name: str, func: Callable) -> dict:
+    parameter_list = []
+    for key, parameter in inspect.signature(func).parameters.items():
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        annotation = parameter.annotation
+        parameter_list.append(
+            {
+                "name": key,
+                "type": (
+                    None
+                    if annotation is inspect.Parameter.empty
+                    else getattr(annotation, "__name__", str(annotation))
+                ),
+                "default": (
+                    None
+                    if parameter.default is inspect.Parameter.empty
+                    else parameter.default
+                ),
+                "required": parameter.default is inspect.Parameter.empty,
+            }
+        )
+    doc = (inspect.getdoc(func) or "").strip().splitlines()
+    return {
+        "name": name,
+        "doc": doc[0] if doc else "",
+        "host": upstream_host(func),
+        "params": parameter_list,
+    }
+
+
+class ServerMetrics:
+    """
+    服务的请求数、延迟、缓存命中和上游调用统计
+    """
+
+    def __init__(self):
+        self.counter: Dict[tuple, float] = {}
+        self.bucket: Dict[tuple, int] = {}
+        self.latency_sum: Dict[str, float] = {}
+        self.latency_count: Dict[str, int] = {}
+        self.inflight = 0
+        self.start = time.time()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        self.counter[key] = self.counter.get(key, 0) + value
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        self.latency_sum[endpoint] = self.latency_sum.get(endpoint, 0) + seconds
+        self.latency_count[endpoint] = self.latency_count.get(endpoint, 0) + 1
+        for bound in _LATENCY_BUCKETS + [float("inf")]:
+            if seconds <= bound:
+                key = (endpoint, bound)
+                self.bucket[key] = self.bucket.get(key, 0) + 1
+
+    def render(self) -> str:
+        """
+        Prometheus 文本格式
+        """
+        line_list = [
+            f"akshare_server_uptime_seconds {time.time() - self.start:.3f}",
+            f"akshare_server_inflight_requests {self.inflight}",
+        ]
+        for (name, labels), value in sorted(self.counter.items()):
+            label_text = ",".join(f'{key}="{item}"' for key, item in labels)
+            line_list.append(f"akshare_server_{name}{{{label_text}}} {value:g}")
+        for endpoint in sorted(self.latency_count):
+            for bound in _LATENCY_BUCKETS + [float("inf")]:
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                line_list.append(
+                    f'akshare_server_request_seconds_bucket{{endpoint="{endpoint}",le="{le}"}} '
+                    f"{self.bucket.get((endpoint, bound), 0)}"
+                )
+            line_list.append(
+                f'akshare_server_request_seconds_sum{{endpoint="{endpoint}"}} '
+                f"{self.latency_sum[endpoint]:.6f}"
+            )
+            line_list.append(
+                f'akshare_server_request_seconds_count{{endpoint="{endpoint}"}} '
+                f"{self.latency_count[endpoint]}"
+            )
+        return "\n".join(line_list) + "\n"
+
+
+def _json_default(value):
+    if isinstance(value, (pd.Timestamp,)):
+        return value.isoformat()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _arrow_chunks(temp_df: pd.DataFrame):
+    """
+    数据框转换为 Arrow IPC 流的分块, 按列转换, 逐批输出
+    """
+    from akshare.utils.serialize import iter_arrow_ipc
+
+    return iter_arrow_ipc(temp_df, chunk_rows=SERVER_CHUNK_ROWS)
+
+
+def _parquet_chunks(temp_df: pd.DataFrame):
+    """
+    数据框转换为 Parquet 文件; Parquet 的元数据在文件末尾, 只能整体输出
+    """
+    from akshare.utils.serialize import to_parquet_bytes
+
+    yield memoryview(to_parquet_bytes(temp_df))
+
+
+def _json_chunks(temp_df: pd.DataFrame):
+    """
+    数据框转换为 JSON 数组的分块, 逐批输出
+    """
+    yield b"["
+    for start in range(0, len(temp_df), SERVER_CHUNK_ROWS):
+        text = temp_df.iloc[start : start + SERVER_CHUNK_ROWS].to_json(
+            orient="records", force_ascii=False, date_format="iso"
+        )
+        yield (("," if start else "") + text[1:-1]).encode("utf-8")
+    yield b"]"
+
+
+def _csv_chunks(temp_df: pd.DataFrame):
+    """
+    数据框转换为 CSV 的分块, 逐批输出
+    """
+    for start in range(0, len(temp_df), SERVER_CHUNK_ROWS):
+        yield temp_df.iloc[start : start + SERVER_CHUNK_ROWS].to_csv(
+            index=False, header=start == 0
+        ).encode("utf-8")
+    if temp_df.empty:
+        yield temp_df.to_csv(index=False).encode("utf-8")
+
+
+SERVER_FORMATS = {
+    "json": ("application/json; charset=utf-8", _json_chunks),
+    "csv": ("text/csv; charset=utf-8", _csv_chunks),
+    "arrow": ("application/vnd.apache.arrow.stream", _arrow_chunks),
+    "parquet": ("application/vnd.apache.parquet", _parquet_chunks),
+}
+
+
+class AkshareServer:
+    """
+    akshare 数据服务
+    """
+
+    def __init__(
+        self,
+        functions: Dict[str, Callable] = None,
+        ttl: float = 60,
+        policy: Dict[str, float] = None,
+        max_per_host: int = 4,
+        max_workers: int = 16,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        :param functions: 发布的接口, 键为接口名称; 为空时发布 akshare 的所有公开接口
+        :type functions: dict
+        :param ttl: 结果缓存的默认有效期, 单位: 秒
+        :type ttl: float
+        :param policy: 按接口名称或接口类型(realtime, intraday, historical, daily)设置的有效期
+        :type policy: dict
+        :param max_per_host: 每个上游主机的最大并发数
+        :type max_per_host: int
+        :param max_workers: 调用接口的线程数
+        :type max_workers: int
+        :param max_bytes: 结果缓存占用的最大字节数
+        :type max_bytes: int
+        """
+        self._functions = functions
+        self.ttl = ttl
+        self.policy = dict(policy or {})
+        self.max_per_host = max_per_host
+        self.store = MemoryStore(max_bytes=max_bytes)
+        self.metrics = ServerMetrics()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="akshare-server"
+        )
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._semaphore: Dict[str, asyncio.Semaphore] = {}
+
+    def function_names(self) -> List[str]:
+        if self._functions is not None:
+            return sorted(self._functions)
+        from akshare._api_index import API_INDEX
+
+        return sorted(
+            name
+            for name, (module_name, attr) in API_INDEX.items()
+            if not name.startswith(SERVER_EXCLUDE_PREFIX)
+            and not module_name.startswith(SERVER_EXCLUDE_MODULES)
+        )
+
+    def resolve(self, name: str) -> Optional[Callable]:
+        if self._functions is not None:
+            return self._functions.get(name)
+        if name.startswith(SERVER_EXCLUDE_PREFIX):
+            return None
+        from akshare._api_index import API_INDEX
+
+        if name not in API_INDEX:
+            return None
+        module_name, attr = API_INDEX[name]
+        if module_name.startswith(SERVER_EXCLUDE_MODULES):
+            return None
+        func = getattr(importlib.import_module(module_name), attr, None)
+        if not inspect.isfunction(func):
+            return None
+        return func
+
+    def _ttl(self, name: str, func: Callable) -> float:
+        if name in self.policy:
+            return self.policy[name]
+        family = getattr(func, "cache_family", None)
+        if family in self.policy:
+            return self.policy[family]
+        if family is not None:
+            return DEFAULT_POLICY.get(family) or self.ttl
+        return self.ttl
+
+    async def _fetch(self, key: str, name: str, func: Callable, kwargs: dict):
+        """
+        在线程池中调用接口并写入结果缓存; 每个上游主机限制并发数
+        """
+        loop = asyncio.get_running_loop()
+        host = upstream_host(func)
+        semaphore = self._semaphore.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                value = await loop.run_in_executor(
+                    self._executor, functools.partial(func, **kwargs)
+                )
+            finally:
+                self.metrics.inc("upstream_calls_total", host=host)
+                self.metrics.inc(
+                    "upstream_seconds_total", time.monotonic() - start, host=host
+                )
+        if value is not None and not (isinstance(value, pd.DataFrame) and value.empty):
+            self.store.set(key, value, time.time() + self._ttl(name, func))
+        return value
+
+    async def call(self, name: str, func: Callable, kwargs: dict):
+        """
+        带缓存和合并的接口调用
+        相同参数的并发请求共享同一个调用任务, 任一请求被取消时任务继续执行, 不影响其他请求
+        :return: 接口返回值和来源, 来源为 cache, coalesced 或 upstream
+        :rtype: tuple
+        """
+        key = json.dumps([name, kwargs], sort_keys=True, ensure_ascii=False, default=str)
+        value = self.store.get(key)
+        if value is not None:
+            return value, "cache"
+        task = self._inflight.get(key)
+        source = "coalesced"
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, name, func, kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._fetch_done, key))
+            source = "upstream"
+        return await asyncio.shield(task), source
+
+    def _fetch_done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 所有请求都已取消时避免 "exception was never retrieved" 警告
+        if not task.cancelled():
+            task.exception()
+
+    def create_app(self):
+        """
+        创建 aiohttp 应用
+        :return: aiohttp 应用
+        :rtype: aiohttp.web.Application
+        """
+        from aiohttp import web
+
+        async def index(request):
+            return web.json_response(self.function_names())
+
+        async def schema(request):
+            name = request.match_info["name"]
+            func = self.resolve(name)
+            if func is None:
+                raise web.HTTPNotFound(text=f"接口不存在: {name}")
+            return web.json_response(_schema(name, func), dumps=_dumps)
+
+        async def metrics(request):
+            return web.Response(
+                text=self.metrics.render(), content_type="text/plain", charset="utf-8"
+            )
+
+        async def api(request):
+            name = request.match_info["name"]
+            start = time.monotonic()
+            self.metrics.inflight += 1
+            status = 200
+            # 不存在的接口统一记为 _unknown, 避免任意路径使指标的标签无限增长
+            endpoint = "_unknown"
+            try:
+                func = self.resolve(name)
+                if func is None:
+                    status = 404
+                    return web.json_response({"error": f"接口不存在: {name}"}, status=404)
+                endpoint = name
+                query = dict(request.query)
+                file_format = query.pop("format", "json")
+                if file_format not in SERVER_FORMATS:
+                    status = 400
+                    return web.json_response(
+                        {"error": f"format 只能为 {', '.join(SERVER_FORMATS)}"}, status=400
+                    )
+                try:
+                    kwargs = bind_params(func, query)
+                except ValueError as e:
+                    status = 400
+                    return web.json_response({"error": str(e)}, status=400)
+                try:
+                    value, source = await self.call(name, func, kwargs)
+                except Exception as e:
+                    status = 502
+                    return web.json_response(
+                        {"error": f"{type(e).__name__}: {e}"}, status=502
+                    )
+                self.metrics.inc("results_total", source=source)
+                if not isinstance(value, pd.DataFrame):
+                    return web.json_response(value, dumps=_dumps)
+                content_type, encoder = SERVER_FORMATS[file_format]
+                response = web.StreamResponse(headers={"Content-Type": content_type})
+                response.headers["X-Akshare-Source"] = source
+                await response.prepare(request)
+                for chunk in encoder(value):
+                    await response.write(chunk)
+                    self.metrics.inc("response_bytes_total", len(chunk), format=file_format)
+                await response.write_eof()
+                return response
+            finally:
+                self.metrics.inflight -= 1
+                self.metrics.inc("requests_total", endpoint=endpoint, status=status)
+                self.metrics.observe(endpoint, time.monotonic() - start)
+
+        async def on_cleanup(app):
+            self._executor.shutdown(wait=False)
+
+        app = web.Application()
+        app.router.add_get("/api", index)
+        app.router.add_get("/api/{name}/schema", schema)
+        app.router.add_get("/api/{name}", api)
+        app.router.add_get("/metrics", metrics)
+        app.on_cleanup.append(on_cleanup)
+        return app
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+def create_app(**kwargs):
+    """
+    创建 akshare 数据服务的 aiohttp 应用, 参数见 AkshareServer
+    :return: aiohttp 应用
+    :rtype: aiohttp.web.Application
+    """
+    return AkshareServer(**kwargs).create_app()
+
+
+def main(argv: List[str] = None) -> None:
+    from aiohttp import web
+
+    parser = argparse.ArgumentParser(
+        prog="python -m akshare.server", description="akshare 数据服务"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="监听地址")
+    parser.add_argument("--port", type=int, default=8080, help="监听端口")
+    parser.add_argument("--ttl", type=float, default=60, help="结果缓存的默认有效期, 单位: 秒")
+    parser.add_argument("--max-per-host", type=int, default=4, help="每个上游主机的最大并发数")
+    parser.add_argument("--workers", type=int, default=16, help="调用接口的线程数")
+    args = parser.parse_args(argv)
+    app = create_app(
+        ttl=args.ttl, max_per_host=args.max_per_host, max_workers=args.workers
+    )
+    web.run_app(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,6 @@ https://www.soozhu.com/price/data/center/
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def spot_hog_soozhu() -> pd.DataFrame:
@@ -18,6 +17,8 @@ def spot_hog_soozhu() -> pd.DataFrame:
     :return: 各省均价实时排行榜
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     session = requests.session()
     url = "https://www.soozhu.com/price/data/center/"
     r = session.get(url)
@@ -45,6 +46,8 @@ def spot_hog_year_trend_soozhu() -> pd.DataFrame:
     :return: 今年以来全国出栏均价走势
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     session = requests.session()
     url = "https://www.soozhu.com/price/data/center/"
     r = session.get(url)
@@ -69,6 +72,8 @@ def spot_hog_lean_price_soozhu() -> pd.DataFrame:
     :return: 全国瘦肉型肉猪
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     session = requests.session()
     url = "https://www.soozhu.com/price/data/center/"
     r = session.get(url)
@@ -93,6 +98,8 @@ def spot_hog_three_way_soozhu() -> pd.DataFrame:
     :return: 全国三元仔猪
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     session = requests.session()
     url = "https://www.soozhu.com/price/data/center/"
     r = session.get(url)
@@ -117,6 +124,8 @@ def spot_hog_crossbred_soozhu() -> pd.DataFrame:
     :return: 全国后备二元母猪
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     session = requests.session()
     url = "https://www.soozhu.com/price/data/center/"
     r = session.get(url)
@@ -141,6 +150,8 @@ def spot_corn_price_soozhu() -> pd.DataFrame:
     :return: 全国玉米价格走势
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     session = requests.session()
     url = "https://www.soozhu.com/price/data/center/"
     r = session.get(url)
@@ -165,6 +176,8 @@ def spot_soybean_price_soozhu() -> pd.DataFrame:
     :return: 全国豆粕价格走势
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     session = requests.session()
     url = "https://www.soozhu.com/price/data/center/"
     r = session.get(url)
@@ -189,6 +202,8 @@ def spot_mixed_feed_soozhu() -> pd.DataFrame:
     :return: 全国育肥猪合料（含自配料）半月走势
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     session = requests.session()
     url = "https://www.soozhu.com/price/data/center/"
     r = session.get(url)
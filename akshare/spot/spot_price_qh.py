@@ -10,7 +10,6 @@ import json
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def __get_item_of_spot_price_qh() -> pd.DataFrame:
@@ -20,6 +19,8 @@ def __get_item_of_spot_price_qh() -> pd.DataFrame:
     :return: 品种和 ID 对应表
     :rtype: str
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.99qh.com/data/spotTrend"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
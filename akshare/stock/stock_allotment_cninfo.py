@@ -7,7 +7,6 @@ https://webapi.cninfo.com.cn/#/dataBrowse
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
@@ -42,6 +41,8 @@ def stock_allotment_cninfo(
     :return: 配股实施方案
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/stock/p_stock2232"
     params = {
         "scode": symbol,
@@ -7,7 +7,6 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
@@ -36,6 +35,8 @@ def stock_cg_equity_mortgage_cninfo(date: str = "20210930") -> pd.DataFrame:
     :return: 股权质押
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1094"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
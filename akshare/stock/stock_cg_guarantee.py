@@ -8,7 +8,6 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
 
@@ -42,6 +41,8 @@ def stock_cg_guarantee_cninfo(
     :return: 对外担保
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     symbol_map = {
         "全部": "",
         "深市主板": "012002",
@@ -10,7 +10,6 @@ import time
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 js_str = """
     function mcode(input) {
@@ -58,6 +57,8 @@ def stock_cg_lawsuit_cninfo(
     :return: 对外担保
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     symbol_map = {
         "全部": "",
         "深市主板": "012002",
@@ -7,7 +7,6 @@ https://webapi.cninfo.com.cn/#/company?companyid=600009
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
@@ -36,6 +35,8 @@ def stock_dividend_cninfo(symbol: str = "600009") -> pd.DataFrame:
     :return: 历史分红
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1139"
     params = {"scode": symbol}
     js_code = py_mini_racer.MiniRacer()
@@ -12,7 +12,6 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 import datetime
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
@@ -41,6 +40,8 @@ def stock_hold_control_cninfo(symbol: str = "全部") -> pd.DataFrame:
     :return: 实际控制人持股变动
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     symbol_map = {
         "单独控制": "069001",
         "实际控制人": "069002",
@@ -112,6 +113,8 @@ def stock_hold_management_detail_cninfo(symbol: str = "增持") -> pd.DataFrame:
     :return: 高管持股变动明细
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     symbol_map = {
         "增持": "B",
         "减持": "S",
@@ -204,6 +207,8 @@ def stock_hold_change_cninfo(symbol: str = "全部") -> pd.DataFrame:
     :return: 股本变动
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     symbol_map = {
         "深市主板": "012002",
         "沪市": "012001",
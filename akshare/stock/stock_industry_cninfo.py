@@ -10,7 +10,6 @@ https://webapi.cninfo.com.cn/api/stock/p_stock2110
 import numpy as np
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
 
@@ -40,6 +39,8 @@ def stock_industry_category_cninfo(symbol: str = "巨潮行业分类标准") ->
     :return: 行业分类数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     symbol_map = {
         "证监会行业分类标准": "008001",
         "巨潮行业分类标准": "008002",
@@ -120,6 +121,8 @@ def stock_industry_change_cninfo(
     :return: 行业归属的变动情况
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/stock/p_stock2110"
     params = {
         "scode": symbol,
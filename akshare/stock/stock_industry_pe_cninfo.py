@@ -8,7 +8,6 @@ http://webapi.cninfo.com.cn/#/thematicStatistics?name=%E6%8A%95%E8%B5%84%E8%AF%8
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
 
@@ -40,6 +39,8 @@ def stock_industry_pe_ratio_cninfo(
     :return: 行业市盈率
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     sort_code_map = {"证监会行业分类": "008001", "国证行业分类": "008200"}
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1087"
     params = {
@@ -1,20 +1,39 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/10 18:00
+Date: 2026/10/19 15:00
 Desc: 东财财富-日内分时数据
 https://quote.eastmoney.com/f1.html?newcode=0.000001
+逐笔成交通过 SSE(server-sent events) 推送: 建立连接后先推送当日的成交明细, 之后只推送新增的成交
 """
 
+import asyncio
+import datetime
 import json
+import queue
+import threading
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterator, List
 
 import pandas as pd
 import requests
 
+if TYPE_CHECKING:
+    import aiohttp
 
-def __event_stream(url, params):
+_INTRADAY_URL = "https://70.push2.eastmoney.com/api/qt/stock/details/sse"
+
+# 续传时用于定位的已收到成交笔数
+_TAIL_SIZE = 32
+
+_SIDE_MAP = {"2": "买盘", "1": "卖盘", "4": "中性盘"}
+
+# 订阅时同时保持的最大推送连接数, 每只股票占用一个连接; 需要全市场行情时使用实时行情轮询接口
+INTRADAY_MAX_CONNECTIONS = 50
+
+
+def __event_stream(url, params, timeout=None):
     # 使用 stream=True 参数来启用流式请求
-    response = requests.get(url, params=params, stream=True)
+    response = requests.get(url, params=params, stream=True, timeout=timeout)
     event_data = ""
 
     for line in response.iter_lines():
@@ -26,18 +45,16 @@ def __event_stream(url, params):
             event_data = ""
 
 
-def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
+def _intraday_params(symbol: str) -> Dict:
     """
-    东方财富-分时数据
-    https://quote.eastmoney.com/f1.html?newcode=0.000001
-    :param symbol: 股票代码
+    东方财富-逐笔成交推送的请求参数
+    :param symbol: 股票代码, e.g., "000001"
     :type symbol: str
-    :return: 分时数据
-    :rtype: pandas.DataFrame
+    :return: 请求参数
+    :rtype: dict
     """
     market_code = 1 if symbol.startswith("6") else 0
-    url = "https://70.push2.eastmoney.com/api/qt/stock/details/sse"
-    params = {
+    return {
         "fields1": "f1,f2,f3,f4",
         "fields2": "f51,f52,f53,f54,f55",
         "mpi": "2000",
@@ -48,28 +65,260 @@ def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
         "wbp2u": "|0|0|0|web",
     }
 
-    big_df = pd.DataFrame()  # 创建一个空的 DataFrame
 
-    for event in __event_stream(url, params):
-        # 从每个事件的数据行中删除 "data: "，然后解析 JSON
-        event_json = json.loads(event.replace("data: ", ""))
-        # 将 JSON 数据转换为 DataFrame，然后添加到主 DataFrame 中
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in event_json["data"]["details"]]
-        )
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-        break
+def _event_details(event: str) -> List[str]:
+    """
+    解析一个推送事件中的成交明细
+    :param event: 推送事件, e.g., 'data: {"data": {"details": [...]}}'
+    :type event: str
+    :return: 成交明细, 每笔为 "时间,成交价,手数,-,买卖盘性质"
+    :rtype: list
+    """
+    event_json = json.loads(event.replace("data: ", ""))
+    if not event_json.get("data"):
+        return []
+    return event_json["data"].get("details") or []
 
-    big_df.columns = ["时间", "成交价", "手数", "-", "买卖盘性质"]
-    big_df["买卖盘性质"] = big_df["买卖盘性质"].map(
-        {"2": "买盘", "1": "卖盘", "4": "中性盘"}
+
+def _new_details(tail: List[str], details: List[str]) -> List[str]:
+    """
+    去掉重连后重复推送的成交明细
+    重连后服务器会重新推送当日的成交明细, 在其中查找已收到的最后若干笔, 只保留之后的成交;
+    找不到时, 推送的最后一笔不晚于已收到的最后一笔则没有新增成交, 否则全部保留
+    :param tail: 已收到的最后若干笔成交
+    :type tail: list
+    :param details: 重连后推送的成交明细
+    :type details: list
+    :return: 新增的成交明细
+    :rtype: list
+    """
+    if not tail or not details:
+        return list(details)
+    size = len(tail)
+    for i in range(len(details) - 1, size - 2, -1):
+        if details[i] == tail[-1] and details[i - size + 1 : i + 1] == tail:
+            return details[i + 1 :]
+    if details[-1].split(",")[0] <= tail[-1].split(",")[0]:
+        return []
+    return list(details)
+
+
+def _intraday_details_df(symbol: str, details: List[str]) -> pd.DataFrame:
+    """
+    成交明细转换为数据框
+    :param symbol: 股票代码
+    :type symbol: str
+    :param details: 成交明细
+    :type details: list
+    :return: 逐笔成交
+    :rtype: pandas.DataFrame
+    """
+    temp_df = pd.DataFrame(
+        [item.split(",") for item in details],
+        columns=["时间", "成交价", "手数", "-", "买卖盘性质"],
     )
-    big_df = big_df[["时间", "成交价", "手数", "买卖盘性质"]]
-    big_df["成交价"] = pd.to_numeric(big_df["成交价"], errors="coerce")
-    big_df["手数"] = pd.to_numeric(big_df["手数"], errors="coerce")
-    return big_df
+    temp_df["买卖盘性质"] = temp_df["买卖盘性质"].map(_SIDE_MAP)
+    temp_df["成交价"] = pd.to_numeric(temp_df["成交价"], errors="coerce")
+    temp_df["手数"] = pd.to_numeric(temp_df["手数"], errors="coerce")
+    temp_df.insert(0, "代码", symbol)
+    return temp_df[["代码", "时间", "成交价", "手数", "买卖盘性质"]]
+
+
+def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
+    """
+    东方财富-分时数据
+    https://quote.eastmoney.com/f1.html?newcode=0.000001
+    :param symbol: 股票代码
+    :type symbol: str
+    :return: 分时数据
+    :rtype: pandas.DataFrame
+    """
+    details = []
+    for event in __event_stream(_INTRADAY_URL, _intraday_params(symbol)):
+        # 第一个事件为当日的成交明细
+        details = _event_details(event)
+        break
+    temp_df = _intraday_details_df(symbol, details)
+    del temp_df["代码"]
+    return temp_df
+
+
+def _intraday_worker(
+    symbol: str,
+    out_queue: queue.Queue,
+    stop_event: threading.Event,
+    reconnect_delay: float,
+    timeout: float,
+) -> None:
+    """
+    保持单只股票的推送连接, 断线后自动重连续传, 新增的成交放入队列
+    """
+    tail = []
+    tail_date = datetime.date.today()
+    while not stop_event.is_set():
+        try:
+            first_event = True
+            for event in __event_stream(
+                _INTRADAY_URL, _intraday_params(symbol), timeout=(10, timeout)
+            ):
+                if stop_event.is_set():
+                    return
+                details = _event_details(event)
+                if first_event:
+                    if datetime.date.today() != tail_date:
+                        tail = []
+                    details = _new_details(tail, details)
+                    first_event = False
+                if details:
+                    tail = (tail + details)[-_TAIL_SIZE:]
+                    tail_date = datetime.date.today()
+                    out_queue.put(_intraday_details_df(symbol, details))
+        except (requests.RequestException, ValueError):
+            pass
+        stop_event.wait(reconnect_delay)
+
+
+def stock_intraday_em_subscribe(
+    symbol_list: List[str] = ("000001", "600000"),
+    reconnect_delay: float = 1.0,
+    timeout: float = 60,
+    max_connections: int = INTRADAY_MAX_CONNECTIONS,
+) -> Iterator[pd.DataFrame]:
+    """
+    东方财富-逐笔成交订阅
+    每只股票保持一个推送连接, 多只股票的新增成交合并输出; 连接断开后自动重连, 重连推送的成交明细会去重
+    连接数不超过 max_connections, 默认为 INTRADAY_MAX_CONNECTIONS; 全市场行情请使用实时行情接口轮询
+    首批数据为订阅时当日已有的成交, 之后每批为新增的成交; 关闭生成器时停止订阅
+    https://quote.eastmoney.com/f1.html?newcode=0.000001
+    :param symbol_list: 股票代码列表
+    :type symbol_list: list
+    :param reconnect_delay: 断线重连的等待时间, 单位: 秒
+    :type reconnect_delay: float
+    :param timeout: 连接无数据的超时时间, 超时后重连, 单位: 秒
+    :type timeout: float
+    :param max_connections: 最大推送连接数, 即最多订阅的股票数量, 超过时抛出 ValueError
+    :type max_connections: int
+    :return: 逐笔成交, 字段为 代码, 时间, 成交价, 手数, 买卖盘性质
+    :rtype: Iterator[pandas.DataFrame]
+    """
+    symbol_list = list(dict.fromkeys(symbol_list))
+    if len(symbol_list) > max_connections:
+        raise ValueError(
+            f"订阅 {len(symbol_list)} 只股票超过最大连接数 {max_connections}, "
+            "每只股票占用一个推送连接; 请减少股票数量或调大 max_connections"
+        )
+    out_queue = queue.Queue()
+    stop_event = threading.Event()
+    for symbol in symbol_list:
+        threading.Thread(
+            target=_intraday_worker,
+            args=(symbol, out_queue, stop_event, reconnect_delay, timeout),
+            daemon=True,
+        ).start()
+    try:
+        while True:
+            yield out_queue.get()
+    finally:
+        stop_event.set()
+
+
+async def _intraday_worker_async(
+    session: "aiohttp.ClientSession",
+    symbol: str,
+    out_queue: asyncio.Queue,
+    reconnect_delay: float,
+) -> None:
+    """
+    保持单只股票的推送连接的协程, 断线后自动重连续传, 新增的成交放入队列
+    """
+    import aiohttp
+
+    tail = []
+    tail_date = datetime.date.today()
+    while True:
+        try:
+            async with session.get(
+                _INTRADAY_URL, params=_intraday_params(symbol)
+            ) as response:
+                first_event = True
+                event_data = ""
+                async for line in response.content:
+                    line = line.strip()
+                    if line:
+                        event_data += line.decode() + "\n"
+                        continue
+                    if not event_data:
+                        continue
+                    details = _event_details(event_data)
+                    event_data = ""
+                    if first_event:
+                        if datetime.date.today() != tail_date:
+                            tail = []
+                        details = _new_details(tail, details)
+                        first_event = False
+                    if details:
+                        tail = (tail + details)[-_TAIL_SIZE:]
+                        tail_date = datetime.date.today()
+                        await out_queue.put(_intraday_details_df(symbol, details))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            pass
+        await asyncio.sleep(reconnect_delay)
+
+
+async def stock_intraday_em_subscribe_async(
+    symbol_list: List[str] = ("000001", "600000"),
+    reconnect_delay: float = 1.0,
+    timeout: float = 60,
+    max_connections: int = INTRADAY_MAX_CONNECTIONS,
+) -> AsyncIterator[pd.DataFrame]:
+    """
+    东方财富-逐笔成交订阅-异步接口, 需要安装 aiohttp
+    所有股票共用一个连接池, 规则与 stock_intraday_em_subscribe 一致
+    https://quote.eastmoney.com/f1.html?newcode=0.000001
+    :param symbol_list: 股票代码列表
+    :type symbol_list: list
+    :param reconnect_delay: 断线重连的等待时间, 单位: 秒
+    :type reconnect_delay: float
+    :param timeout: 连接无数据的超时时间, 超时后重连, 单位: 秒
+    :type timeout: float
+    :param max_connections: 最大推送连接数, 即最多订阅的股票数量, 超过时抛出 ValueError
+    :type max_connections: int
+    :return: 逐笔成交, 字段为 代码, 时间, 成交价, 手数, 买卖盘性质
+    :rtype: AsyncIterator[pandas.DataFrame]
+    """
+    import aiohttp
+
+    symbol_list = list(dict.fromkeys(symbol_list))
+    if len(symbol_list) > max_connections:
+        raise ValueError(
+            f"订阅 {len(symbol_list)} 只股票超过最大连接数 {max_connections}, "
+            "每只股票占用一个推送连接; 请减少股票数量或调大 max_connections"
+        )
+    out_queue = asyncio.Queue()
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=None, sock_read=timeout),
+        connector=aiohttp.TCPConnector(limit=max_connections),
+    ) as session:
+        task_list = [
+            asyncio.create_task(
+                _intraday_worker_async(session, symbol, out_queue, reconnect_delay)
+            )
+            for symbol in symbol_list
+        ]
+        try:
+            while True:
+                yield await out_queue.get()
+        finally:
+            for task in task_list:
+                task.cancel()
+            await asyncio.gather(*task_list, return_exceptions=True)
 
 
 if __name__ == "__main__":
     stock_intraday_em_df = stock_intraday_em(symbol="000001")
     print(stock_intraday_em_df)
+
+    for stock_intraday_em_batch_df in stock_intraday_em_subscribe(
+        symbol_list=["000001", "600000"]
+    ):
+        print(stock_intraday_em_batch_df)
@@ -8,7 +8,6 @@ https://webapi.cninfo.com.cn/#/company
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
 
@@ -36,6 +35,8 @@ def stock_ipo_summary_cninfo(symbol: str = "600030") -> pd.DataFrame:
     :return: 上市相关
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1134"
     params = {
         "scode": symbol,
@@ -7,7 +7,6 @@ https://webapi.cninfo.com.cn/#/xinguList
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
@@ -34,6 +33,8 @@ def stock_new_gh_cninfo() -> pd.DataFrame:
     :return: 新股过会
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1098"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
@@ -80,6 +81,8 @@ def stock_new_ipo_cninfo() -> pd.DataFrame:
     :return: 新股发行
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1097"
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
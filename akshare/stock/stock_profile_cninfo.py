@@ -7,7 +7,6 @@ https://webapi.cninfo.com.cn/#/company
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
@@ -37,6 +36,8 @@ def stock_profile_cninfo(symbol: str = "600030") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     :raise: Exception，如果服务器返回的数据无法被解析
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1133"
     params = {
         "scode": symbol,
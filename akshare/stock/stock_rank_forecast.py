@@ -8,7 +8,6 @@ https://webapi.cninfo.com.cn/#/thematicStatistics?name=%E6%8A%95%E8%B5%84%E8%AF%
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
 
@@ -36,6 +35,8 @@ def stock_rank_forecast_cninfo(date: str = "20230817") -> pd.DataFrame:
     :return: 投资评级
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1089"
     params = {"tdate": "-".join([date[:4], date[4:6], date[6:]])}
     js_code = py_mini_racer.MiniRacer()
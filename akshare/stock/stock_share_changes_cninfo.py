@@ -8,7 +8,6 @@ https://webapi.cninfo.com.cn/api/stock/p_stock2215
 
 import numpy as np
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.datasets import get_ths_js
@@ -46,6 +45,8 @@ def stock_share_change_cninfo(
     :return: 公司股本变动
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://webapi.cninfo.com.cn/api/stock/p_stock2215"
     params = {
         "scode": symbol,
@@ -13,7 +13,6 @@ from io import BytesIO, StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def stock_szse_summary(date: str = "20240830") -> pd.DataFrame:
@@ -115,6 +114,8 @@ def stock_szse_sector_summary(
     :return: 股票行业成交数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://www.szse.cn/market/periodical/month/index.html"
     r = requests.get(url)
     r.encoding = "utf8"
@@ -11,7 +11,6 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
-import py_mini_racer
 from tqdm import tqdm
 
 from akshare.stock.cons import (
@@ -31,6 +30,8 @@ def __get_us_page_count() -> int:
     :return: 美股总页数
     :rtype: int
     """
+    import py_mini_racer
+
     page = "1"
     us_js_decode = (
         f"US_CategoryService.getList?page={page}&num=20&sort=&asc=0&market=&id="
@@ -60,6 +61,8 @@ def get_us_stock_name() -> pd.DataFrame:
     :return: stock's english name, chinese name and symbol
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     big_df = pd.DataFrame()
     page_count = __get_us_page_count()
     for page in tqdm(range(1, page_count + 1), leave=False):
@@ -90,6 +93,8 @@ def stock_us_spot() -> pd.DataFrame:
     :return: 美股所有股票实时行情
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     big_df = pd.DataFrame()
     page_count = __get_us_page_count()
     for page in tqdm(range(1, page_count + 1), leave=False):
@@ -128,6 +133,8 @@ def stock_us_daily(symbol: str = "FB", adjust: str = "") -> pd.DataFrame:
     :return: 指定 adjust 的数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = f"https://finance.sina.com.cn/staticdata/us/{symbol}"
     res = requests.get(url)
     js_code = py_mini_racer.MiniRacer()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: A 股-本地复权计算
+本地只保存不复权的日线行情和新浪财经的后复权因子, 前复权和后复权数据均在本地计算
+前复权价格 = 不复权价格 * 当日后复权因子 / 最新后复权因子
+后复权价格 = 不复权价格 * 当日后复权因子
+发生除权除息时只需要更新后复权因子表, 历史不复权行情无需重新下载
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from akshare.futures.cons import get_calendar
+from akshare.stock.stock_zh_a_sina import stock_zh_a_daily
+from akshare.stock_feature.stock_hist_em import stock_zh_a_hist
+from akshare.utils.cache import load_object, save_object
+
+
+def _sina_symbol(symbol: str) -> str:
+    """
+    股票代码转换为新浪财经的代码
+    :param symbol: 股票代码, e.g., "000001"
+    :type symbol: str
+    :return: 新浪财经的股票代码, e.g., "sz000001"
+    :rtype: str
+    """
+    if symbol[:2] in ("sh", "sz", "bj"):
+        return symbol
+    if symbol.startswith(("6", "9")):
+        return f"sh{symbol}"
+    if symbol.startswith(("4", "8")):
+        return f"bj{symbol}"
+    return f"sz{symbol}"
+
+
+def _latest_close_date(now: datetime.datetime = None) -> str:
+    """
+    最近一个已收盘的交易日, 当天 15:30 之后包含当天; 交易日历未覆盖的日期按工作日处理
+    :param now: 当前时间, 为空时为系统时间
+    :type now: datetime.datetime
+    :return: 交易日, e.g., "20240105"
+    :rtype: str
+    """
+    if now is None:
+        now = datetime.datetime.now()
+    calendar = get_calendar()
+    date = now.date()
+    if now.time() < datetime.time(15, 30):
+        date -= datetime.timedelta(days=1)
+    while True:
+        date_str = date.strftime("%Y%m%d")
+        if date_str > calendar[-1]:
+            if date.weekday() < 5:
+                return date_str
+        elif date_str in calendar:
+            return date_str
+        date -= datetime.timedelta(days=1)
+
+
+def stock_zh_a_adjust_price(
+    bar_df: pd.DataFrame,
+    factor_df: pd.DataFrame,
+    adjust: str = "qfq",
+    date_column: str = "日期",
+    symbol_column: str = None,
+) -> pd.DataFrame:
+    """
+    A 股-根据后复权因子计算复权行情
+    通过按日期的 as-of 合并匹配每个交易日适用的复权因子, 支持多只股票的数据一次计算
+    :param bar_df: 不复权行情, 需包含 开盘, 收盘, 最高, 最低 字段; 也支持 open, close, high, low 字段
+    :type bar_df: pandas.DataFrame
+    :param factor_df: 后复权因子, 需包含 date 和 hfq_factor 字段; 多只股票时需包含 symbol_column 字段
+    :type factor_df: pandas.DataFrame
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param date_column: 行情数据中的日期字段
+    :type date_column: str
+    :param symbol_column: 股票代码字段; 为空时按单只股票计算
+    :type symbol_column: str
+    :return: 复权后的行情
+    :rtype: pandas.DataFrame
+    """
+    if adjust not in ("qfq", "hfq", ""):
+        raise ValueError("adjust 参数只能为 qfq, hfq 或空字符串")
+    if adjust == "" or bar_df.empty:
+        return bar_df.copy()
+    price_columns = [
+        item
+        for item in ["开盘", "收盘", "最高", "最低", "open", "close", "high", "low"]
+        if item in bar_df.columns
+    ]
+    close_column = "收盘" if "收盘" in bar_df.columns else "close"
+    by = [symbol_column] if symbol_column is not None else []
+
+    left_df = bar_df.copy()
+    left_df["_order"] = np.arange(len(left_df))
+    left_df["_date"] = pd.to_datetime(left_df[date_column]).astype("datetime64[ns]")
+    right_df = factor_df[by + ["date", "hfq_factor"]].copy()
+    right_df["_date"] = pd.to_datetime(right_df["date"]).astype("datetime64[ns]")
+    right_df["hfq_factor"] = pd.to_numeric(right_df["hfq_factor"], errors="coerce")
+    right_df = right_df[by + ["_date", "hfq_factor"]].sort_values("_date")
+    merged_df = pd.merge_asof(
+        left_df.sort_values("_date"),
+        right_df,
+        on="_date",
+        by=symbol_column,
+        direction="backward",
+    )
+    # 早于第一条复权因子的交易日, 复权因子与第一条相同
+    if by:
+        first_factor = right_df.groupby(symbol_column)["hfq_factor"].first()
+        merged_df["hfq_factor"] = merged_df["hfq_factor"].fillna(
+            merged_df[symbol_column].map(first_factor)
+        )
+    else:
+        merged_df["hfq_factor"] = merged_df["hfq_factor"].fillna(
+            right_df["hfq_factor"].iloc[0] if not right_df.empty else np.nan
+        )
+    factor = merged_df["hfq_factor"].to_numpy()
+    if adjust == "qfq":
+        if by:
+            latest_factor = merged_df[symbol_column].map(
+                right_df.groupby(symbol_column)["hfq_factor"].last()
+            )
+        else:
+            latest_factor = right_df["hfq_factor"].iloc[-1]
+        factor = factor / np.asarray(latest_factor, dtype="float64")
+
+    raw_close = merged_df[close_column].to_numpy(dtype="float64")
+    for item in price_columns:
+        merged_df[item] = merged_df[item].to_numpy(dtype="float64") * factor
+    if by:
+        pre_close = merged_df.groupby(by)[close_column].shift(1)
+    else:
+        pre_close = merged_df[close_column].shift(1)
+    if "涨跌额" in merged_df.columns:
+        merged_df["涨跌额"] = (merged_df[close_column] - pre_close).fillna(
+            merged_df["涨跌额"] * merged_df[close_column] / raw_close
+        )
+    if "涨跌幅" in merged_df.columns:
+        merged_df["涨跌幅"] = (
+            (merged_df[close_column] / pre_close - 1) * 100
+        ).fillna(merged_df["涨跌幅"])
+    if "振幅" in merged_df.columns and "最高" in merged_df.columns:
+        merged_df["振幅"] = (
+            (merged_df["最高"] - merged_df["最低"]) / pre_close * 100
+        ).fillna(merged_df["振幅"])
+    merged_df.sort_values("_order", inplace=True)
+    merged_df = merged_df[bar_df.columns]
+    merged_df.index = bar_df.index
+    return merged_df
+
+
+def _stock_zh_a_raw_bars(symbol: str, latest_date: str) -> pd.DataFrame:
+    """
+    不复权日线行情; 本地已保存的数据只增量请求缺少的交易日
+    :param symbol: 股票代码, e.g., "000001"
+    :type symbol: str
+    :param latest_date: 最近一个已收盘的交易日, e.g., "20240105"
+    :type latest_date: str
+    :return: 不复权日线行情
+    :rtype: pandas.DataFrame
+    """
+    bar_df = load_object("stock_zh_a_adjust/raw", symbol)
+    if bar_df is not None and not bar_df.empty:
+        last_date = pd.to_datetime(bar_df["日期"]).max().strftime("%Y%m%d")
+        if last_date >= latest_date:
+            return bar_df
+        next_date = (
+            pd.to_datetime(last_date) + datetime.timedelta(days=1)
+        ).strftime("%Y%m%d")
+        new_df = stock_zh_a_hist(symbol=symbol, start_date=next_date, adjust="")
+        if not new_df.empty:
+            bar_df = pd.concat([bar_df, new_df], ignore_index=True)
+            bar_df.drop_duplicates(subset=["日期"], keep="last", inplace=True)
+            bar_df.reset_index(drop=True, inplace=True)
+    else:
+        bar_df = stock_zh_a_hist(symbol=symbol, adjust="")
+    # 盘中请求时当天的行情尚未收盘, 不保存
+    if not bar_df.empty:
+        bar_df = bar_df[
+            pd.to_datetime(bar_df["日期"]) <= pd.to_datetime(latest_date)
+        ].reset_index(drop=True)
+    save_object("stock_zh_a_adjust/raw", symbol, bar_df)
+    return bar_df
+
+
+def _stock_zh_a_hfq_factor(
+    symbol: str, latest_date: str, refresh: bool = False
+) -> pd.DataFrame:
+    """
+    新浪财经-后复权因子; 本地保存的因子表每个交易日最多更新一次
+    :param symbol: 股票代码, e.g., "000001"
+    :type symbol: str
+    :param latest_date: 最近一个已收盘的交易日, e.g., "20240105"
+    :type latest_date: str
+    :param refresh: 是否强制更新因子表
+    :type refresh: bool
+    :return: 后复权因子
+    :rtype: pandas.DataFrame
+    """
+    data = load_object("stock_zh_a_adjust/hfq_factor", symbol)
+    if data is not None and not refresh and data["update_date"] >= latest_date:
+        return data["factor"]
+    factor_df = stock_zh_a_daily(symbol=_sina_symbol(symbol), adjust="hfq-factor")
+    save_object(
+        "stock_zh_a_adjust/hfq_factor",
+        symbol,
+        {"update_date": latest_date, "factor": factor_df},
+    )
+    return factor_df
+
+
+def stock_zh_a_hist_adjust(
+    symbol: str = "000001",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "qfq",
+    refresh_factor: bool = False,
+) -> pd.DataFrame:
+    """
+    A 股-日线行情-本地复权
+    不复权行情来自东方财富网, 复权因子来自新浪财经; 设置了本地缓存目录时, 不复权行情只增量更新,
+    复权因子表每个交易日最多更新一次, 不同复权方式共用同一份本地数据
+    :param symbol: 股票代码
+    :type symbol: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param refresh_factor: 是否强制更新复权因子表, 如盘中得知除权除息时
+    :type refresh_factor: bool
+    :return: 日线行情, 字段与 stock_zh_a_hist 一致
+    :rtype: pandas.DataFrame
+    """
+    latest_date = _latest_close_date()
+    bar_df = _stock_zh_a_raw_bars(symbol=symbol, latest_date=latest_date)
+    if bar_df.empty:
+        return bar_df
+    if adjust != "":
+        factor_df = _stock_zh_a_hfq_factor(
+            symbol=symbol, latest_date=latest_date, refresh=refresh_factor
+        )
+        bar_df = stock_zh_a_adjust_price(bar_df, factor_df, adjust=adjust)
+    date_series = pd.to_datetime(bar_df["日期"])
+    temp_df = bar_df[
+        (date_series >= pd.to_datetime(start_date))
+        & (date_series <= pd.to_datetime(end_date))
+    ].copy()
+    for item in ["开盘", "收盘", "最高", "最低", "涨跌额", "涨跌幅", "振幅"]:
+        temp_df[item] = temp_df[item].round(2)
+    temp_df.reset_index(drop=True, inplace=True)
+    return temp_df
+
+
+if __name__ == "__main__":
+    stock_zh_a_hist_adjust_df = stock_zh_a_hist_adjust(
+        symbol="000001", start_date="20240101", end_date="20241231", adjust="qfq"
+    )
+    print(stock_zh_a_hist_adjust_df)
+
+    stock_zh_a_hist_adjust_df = stock_zh_a_hist_adjust(
+        symbol="000001", start_date="20240101", end_date="20241231", adjust="hfq"
+    )
+    print(stock_zh_a_hist_adjust_df)
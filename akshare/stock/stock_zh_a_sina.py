@@ -10,7 +10,6 @@ import json
 import re
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.stock.cons import (
@@ -145,6 +144,8 @@ def stock_zh_a_daily(
     :rtype: pandas.DataFrame
     """
 
+    import py_mini_racer
+
     def _fq_factor(method: str) -> pd.DataFrame:
         if method == "hfq":
             r = requests.get(zh_sina_a_stock_hfq_url.format(symbol))
@@ -344,6 +345,8 @@ def stock_zh_a_cdr_daily(
     :return: specific data
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     res = requests.get(zh_sina_a_stock_hist_url.format(symbol))
     js_code = py_mini_racer.MiniRacer()
     js_code.eval(hk_js_decode)
@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 沪深京 A 股-多数据源实时行情
+东方财富、新浪财经和雪球的实时行情统一为相同的字段, 按各数据源的实时延迟和错误统计选择最快的可用数据源,
+数据源请求失败或返回空数据时自动切换到下一个数据源; 可选将多个数据源的结果合并以补齐缺失的股票
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from akshare.utils.hedge import HostLatency
+
+STOCK_SPOT_COLUMNS = [
+    "代码",
+    "名称",
+    "最新价",
+    "涨跌额",
+    "涨跌幅",
+    "今开",
+    "最高",
+    "最低",
+    "昨收",
+    "成交量",
+    "成交额",
+    "数据源",
+]
+
+# 各数据源: universe 表示是否能获取全市场行情, 否则需要指定股票代码; prior 为未请求过时的先验延迟, 单位: 秒
+STOCK_SPOT_SOURCES = {
+    "em": {"universe": True, "prior": 2.0},
+    "sina_hq": {"universe": False, "prior": 1.0},
+    "xq": {"universe": False, "prior": 3.0},
+    "sina": {"universe": True, "prior": 60.0},
+}
+
+# 雪球逐个股票请求, 超过该数量时不使用
+XQ_MAX_SYMBOLS = 50
+
+source_latency = HostLatency()
+
+
+def _code(series: pd.Series) -> pd.Series:
+    """
+    统一为 6 位股票代码, e.g., "sh600000" -> "600000"
+    """
+    return series.astype(str).str.extract(r"(\d{6})$", expand=False)
+
+
+def _exchange_prefix(code: str) -> str:
+    """
+    股票代码的交易所前缀
+    """
+    if code.startswith(("6", "9", "5")):
+        return "sh"
+    if code.startswith(("4", "8")):
+        return "bj"
+    return "sz"
+
+
+def _spot_em(symbol_list: Optional[List[str]]) -> pd.DataFrame:
+    from akshare.stock_feature.stock_hist_em import stock_zh_a_spot_em
+
+    temp_df = stock_zh_a_spot_em()
+    temp_df = temp_df.reindex(columns=STOCK_SPOT_COLUMNS[:-1])
+    # 东方财富的成交量单位为手
+    temp_df["成交量"] = temp_df["成交量"] * 100
+    return temp_df
+
+
+def _spot_sina(symbol_list: Optional[List[str]]) -> pd.DataFrame:
+    from akshare.stock.stock_zh_a_sina import stock_zh_a_spot
+
+    temp_df = stock_zh_a_spot()
+    return temp_df.reindex(columns=STOCK_SPOT_COLUMNS[:-1])
+
+
+def _spot_sina_hq(symbol_list: Optional[List[str]]) -> pd.DataFrame:
+    from akshare.utils.sina_hq import sina_hq_fetch, sina_hq_frame
+
+    code_list = [
+        _exchange_prefix(code) + code
+        for code in symbol_list
+        if _exchange_prefix(code) != "bj"
+    ]
+    raw_dict = sina_hq_fetch(code_list)
+    frame_list = [sina_hq_frame(raw_dict, prefix) for prefix in ["sh", "sz"]]
+    frame_list = [item for item in frame_list if not item.empty]
+    if not frame_list:
+        return pd.DataFrame(columns=STOCK_SPOT_COLUMNS[:-1])
+    temp_df = pd.concat(frame_list).reset_index()
+    temp_df = temp_df.rename(
+        columns={
+            "code": "代码",
+            "证券简称": "名称",
+            "最近成交价": "最新价",
+            "今日开盘价": "今开",
+            "最高成交价": "最高",
+            "最低成交价": "最低",
+            "昨日收盘价": "昨收",
+            "成交数量": "成交量",
+            "成交金额": "成交额",
+        }
+    )
+    # 停牌和集合竞价之前最新价为 0, 置为空值, 涨跌额和涨跌幅也为空值
+    for item in ["最新价", "今开", "最高", "最低", "昨收"]:
+        temp_df[item] = pd.to_numeric(temp_df[item], errors="coerce").replace(0, np.nan)
+    temp_df["涨跌额"] = temp_df["最新价"] - temp_df["昨收"]
+    temp_df["涨跌幅"] = temp_df["涨跌额"] / temp_df["昨收"] * 100
+    return temp_df.reindex(columns=STOCK_SPOT_COLUMNS[:-1])
+
+
+def _spot_xq(symbol_list: Optional[List[str]]) -> pd.DataFrame:
+    from akshare.stock.stock_xq import stock_individual_spot_xq
+
+    item_map = {
+        "代码": "代码",
+        "名称": "名称",
+        "现价": "最新价",
+        "涨跌": "涨跌额",
+        "涨幅": "涨跌幅",
+        "今开": "今开",
+        "最高": "最高",
+        "最低": "最低",
+        "昨收": "昨收",
+        "成交量": "成交量",
+        "成交额": "成交额",
+    }
+
+    def _fetch(code):
+        # 单只股票请求失败时跳过, 由其余数据源补齐
+        try:
+            temp_df = stock_individual_spot_xq(
+                symbol=_exchange_prefix(code).upper() + code, timeout=5
+            )
+        except Exception:
+            return None
+        return temp_df.set_index("item")["value"].reindex(list(item_map))
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        row_list = [item for item in ex.map(_fetch, symbol_list) if item is not None]
+    if not row_list:
+        return pd.DataFrame(columns=STOCK_SPOT_COLUMNS[:-1])
+    temp_df = pd.DataFrame(row_list).rename(columns=item_map)
+    return temp_df.reindex(columns=STOCK_SPOT_COLUMNS[:-1])
+
+
+_SOURCE_FUNC: Dict[str, Callable[[Optional[List[str]]], pd.DataFrame]] = {
+    "em": _spot_em,
+    "sina_hq": _spot_sina_hq,
+    "xq": _spot_xq,
+    "sina": _spot_sina,
+}
+
+
+def _normalize(temp_df: pd.DataFrame, source: str) -> pd.DataFrame:
+    temp_df = temp_df.reindex(columns=STOCK_SPOT_COLUMNS[:-1])
+    temp_df["代码"] = _code(temp_df["代码"])
+    temp_df = temp_df.dropna(subset=["代码"]).drop_duplicates(subset=["代码"])
+    for item in STOCK_SPOT_COLUMNS[2:-1]:
+        temp_df[item] = pd.to_numeric(temp_df[item], errors="coerce")
+    temp_df["数据源"] = source
+    return temp_df.reset_index(drop=True)
+
+
+def _run_source(source: str, symbol_list: Optional[List[str]]) -> pd.DataFrame:
+    """
+    请求单个数据源并记录延迟; 请求失败或返回空数据时记录错误并抛出异常
+    """
+    start = time.monotonic()
+    try:
+        temp_df = _SOURCE_FUNC[source](symbol_list)
+        temp_df = _normalize(temp_df, source)
+        if symbol_list is not None:
+            temp_df = temp_df[temp_df["代码"].isin(symbol_list)]
+        if temp_df.empty:
+            raise ValueError(f"{source} 返回空数据")
+    except Exception:
+        source_latency.record(source, error=True)
+        raise
+    source_latency.record(source, latency=time.monotonic() - start)
+    return temp_df
+
+
+def stock_zh_a_spot_sources(symbol_list: Optional[List[str]] = None) -> List[str]:
+    """
+    按实时延迟和错误统计排序的可用数据源
+    :param symbol_list: 股票代码; 为空时只包含能获取全市场行情的数据源
+    :type symbol_list: list
+    :return: 数据源
+    :rtype: list
+    """
+    source_list = [
+        source
+        for source, config in STOCK_SPOT_SOURCES.items()
+        if config["universe"]
+        or (
+            symbol_list is not None
+            and (source != "xq" or len(symbol_list) <= XQ_MAX_SYMBOLS)
+        )
+    ]
+    return sorted(
+        source_list,
+        key=lambda source: source_latency.score(
+            source, STOCK_SPOT_SOURCES[source]["prior"]
+        ),
+    )
+
+
+def stock_zh_a_spot_multi(
+    symbol: str = None, sources: List[str] = None, merge: bool = False
+) -> pd.DataFrame:
+    """
+    沪深京 A 股-多数据源实时行情
+    :param symbol: 股票代码, 多个代码用逗号分隔, e.g., "600000,000001"; 为空时获取全市场行情
+    :type symbol: str
+    :param sources: 候选数据源, choice of {"em", "sina_hq", "xq", "sina"}; 为空时使用所有可用的数据源
+    :type sources: list
+    :param merge: 是否用其余数据源补齐首选数据源缺失的股票
+    :type merge: bool
+    :return: 实时行情; 数据源列为每只股票实际使用的数据源
+    :rtype: pandas.DataFrame
+    """
+    symbol_list = (
+        None
+        if symbol is None
+        else [item.strip()[-6:] for item in symbol.split(",") if item.strip()]
+    )
+    source_list = stock_zh_a_spot_sources(symbol_list)
+    if sources is not None:
+        unknown_list = [item for item in sources if item not in STOCK_SPOT_SOURCES]
+        if unknown_list:
+            raise ValueError(f"sources 只能为 {', '.join(STOCK_SPOT_SOURCES)}")
+        source_list = [item for item in source_list if item in sources]
+    if not source_list:
+        raise ValueError("没有可用的数据源")
+    frame_list = []
+    error_list = []
+    for source in source_list:
+        try:
+            temp_df = _run_source(source, symbol_list)
+        except Exception as e:
+            error_list.append(f"{source}: {e!r}")
+            continue
+        if frame_list:
+            covered = pd.concat([item["代码"] for item in frame_list])
+            temp_df = temp_df[~temp_df["代码"].isin(covered)]
+        frame_list.append(temp_df)
+        if not merge:
+            break
+        if symbol_list is not None:
+            covered = pd.concat([item["代码"] for item in frame_list])
+            if set(symbol_list) <= set(covered):
+                break
+    if not frame_list:
+        raise ConnectionError(f"所有数据源均请求失败: {'; '.join(error_list)}")
+    big_df = pd.concat(frame_list, ignore_index=True)
+    if symbol_list is not None:
+        order = {code: i for i, code in enumerate(symbol_list)}
+        big_df = big_df.iloc[big_df["代码"].map(order).argsort(kind="stable")]
+    return big_df[STOCK_SPOT_COLUMNS].reset_index(drop=True)
+
+
+def stock_zh_a_spot_source_stats() -> pd.DataFrame:
+    """
+    各数据源的请求统计
+    :return: 请求统计
+    :rtype: pandas.DataFrame
+    host        数据源
+    latency     指数加权延迟, 单位: 秒
+    error       错误计数, 每次成功请求减半
+    count       请求次数
+    """
+    return source_latency.to_frame()
+
+
+if __name__ == "__main__":
+    stock_zh_a_spot_multi_df = stock_zh_a_spot_multi()
+    print(stock_zh_a_spot_multi_df)
+
+    stock_zh_a_spot_multi_df = stock_zh_a_spot_multi(
+        symbol="600000,000001,430139", merge=True
+    )
+    print(stock_zh_a_spot_multi_df)
+    print(stock_zh_a_spot_source_stats())
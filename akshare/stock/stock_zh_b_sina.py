@@ -12,7 +12,6 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.stock.cons import (
     zh_sina_a_stock_url,
@@ -142,6 +141,8 @@ def stock_zh_b_daily(
     :rtype: pandas.DataFrame
     """
 
+    import py_mini_racer
+
     def _fq_factor(method: str) -> pd.DataFrame:
         if method == "hfq":
             r = requests.get(zh_sina_a_stock_hfq_url.format(symbol))
@@ -8,14 +8,16 @@ https://quote.eastmoney.com/
 """
 
 import asyncio
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-import aiohttp
 import pandas as pd
 
+if TYPE_CHECKING:
+    import aiohttp
+
 
 async def fetch_single_page(
-    session: aiohttp.ClientSession, url: str, params: Dict
+    session: "aiohttp.ClientSession", url: str, params: Dict
 ) -> Dict:
     """异步获取单页数据"""
     async with session.get(url, params=params, ssl=False) as response:
@@ -24,6 +26,8 @@ async def fetch_single_page(
 
 async def fetch_all_pages_async(url: str, base_params: Dict) -> List[Dict]:
     """异步获取所有页面数据"""
+    import aiohttp
+
     # 首先获取总数以计算页数
     first_page_params = base_params.copy()
     first_page_params["pn"] = "1"
@@ -12,7 +12,6 @@ from hashlib import md5
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils.cons import headers
 
@@ -25,6 +24,8 @@ def get_cookie_csrf(url: str = "") -> dict:
     :rtype: pandas.DataFrame
     """
     # 创建独立的 session，避免污染全局状态
+    from bs4 import BeautifulSoup
+
     session = requests.Session()
     session.headers.update(headers)
     r = session.get(url)
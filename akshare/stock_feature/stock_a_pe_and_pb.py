@@ -9,7 +9,6 @@ https://legulegu.com/stockdata/shanghaiPE
 from datetime import datetime
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.stock_feature.stock_a_indicator import get_cookie_csrf
@@ -328,6 +327,8 @@ def stock_market_pe_lg(symbol: str = "深证") -> pd.DataFrame:
     :return: 指定市场的市盈率数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     js_functions = py_mini_racer.MiniRacer()
     js_functions.eval(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
@@ -404,6 +405,8 @@ def stock_index_pe_lg(symbol: str = "沪深300") -> pd.DataFrame:
     :return: 指定指数的市盈率数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     js_functions = py_mini_racer.MiniRacer()
     js_functions.eval(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
@@ -469,6 +472,8 @@ def stock_market_pb_lg(symbol: str = "上证") -> pd.DataFrame:
     :return: 指定市场的市净率数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     js_functions = py_mini_racer.MiniRacer()
     js_functions.eval(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
@@ -517,6 +522,8 @@ def stock_index_pb_lg(symbol: str = "上证50") -> pd.DataFrame:
     :return: 指定指数的市净率数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     js_functions = py_mini_racer.MiniRacer()
     js_functions.eval(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
@@ -13,8 +13,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
 from akshare.utils import demjson
@@ -42,6 +40,9 @@ def _get_stock_board_concept_name_ths() -> dict:
     :return: 获取同花顺概念板块代码和名称字典
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -97,6 +98,8 @@ def stock_board_concept_info_ths(symbol: str = "阿里巴巴概念") -> pd.DataF
     :return: 板块简介
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     stock_board_ths_map_df = stock_board_concept_name_ths()
     symbol_code = stock_board_ths_map_df[stock_board_ths_map_df["name"] == symbol][
         "code"
@@ -138,6 +141,9 @@ def stock_board_concept_index_ths(
     :return: 指数数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -239,6 +245,9 @@ def __stock_board_concept_summary_ths() -> Dict:
     :return: 概念时间表
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -277,6 +286,9 @@ def stock_board_concept_summary_ths() -> pd.DataFrame:
     :return: 概念时间表
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
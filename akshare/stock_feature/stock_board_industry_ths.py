@@ -12,8 +12,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
 from akshare.utils import demjson
@@ -41,6 +39,9 @@ def _get_stock_board_industry_name_ths() -> dict:
     :return: 获取同花顺行业代码和名称字典
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -94,6 +95,8 @@ def stock_board_industry_info_ths(symbol: str = "半导体") -> pd.DataFrame:
     :return: 板块简介
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     stock_board_ths_map_df = stock_board_industry_name_ths()
     symbol_code = stock_board_ths_map_df[stock_board_ths_map_df["name"] == symbol][
         "code"
@@ -135,6 +138,8 @@ def stock_board_industry_index_ths(
     :return: 指数数据
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     code_map = _get_stock_board_industry_name_ths()
     symbol_code = code_map[symbol]
     big_df = pd.DataFrame()
@@ -226,6 +231,9 @@ def stock_xgsr_ths() -> pd.DataFrame:
     :return: 新股上市首日
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -278,6 +286,9 @@ def stock_ipo_benefit_ths() -> pd.DataFrame:
     :return: IPO受益股
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -335,6 +346,9 @@ def stock_board_industry_summary_ths() -> pd.DataFrame:
     :return: 同花顺行业一览表
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
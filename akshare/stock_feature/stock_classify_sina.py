@@ -10,7 +10,6 @@ import math
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 
@@ -20,6 +19,8 @@ def stock_classify_board() -> dict:
     :return: 股票分类字典
     :rtype: dict
     """
+    from bs4 import BeautifulSoup
+
     url = "http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodes"
     r = requests.get(url)
     data_json = r.json()
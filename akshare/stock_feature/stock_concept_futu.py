@@ -10,7 +10,6 @@ import json
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def _stock_concept_cons_futu(symbol: str = "巴菲特持仓") -> pd.DataFrame:
@@ -22,6 +21,8 @@ def _stock_concept_cons_futu(symbol: str = "巴菲特持仓") -> pd.DataFrame:
     :return: 概念板块
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     symbol_map = {
         "巴菲特持仓": "BK2999",
         "佩洛西持仓": "BK20883",
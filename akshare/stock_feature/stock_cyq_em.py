@@ -1,223 +1,289 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/11/4 18:00
+Date: 2026/10/19 15:00
 Desc: 东方财富网-概念板-行情中心-日K-筹码分布
 https://quote.eastmoney.com/concept/sz000001.html
 """
 
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
-import py_mini_racer
 import requests
 
+from akshare.cache import cached
 
-def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
+
+def _round_significant(x: np.ndarray, digits: int = 12) -> np.ndarray:
     """
-    东方财富网-概念板-行情中心-日K-筹码分布
-    https://quote.eastmoney.com/concept/sz000001.html
-    :param symbol: 股票代码
-    :type symbol: str
-    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
-    :type adjust: str
-    :return: 筹码分布
-    :rtype: pandas.DataFrame
+    按有效数字四舍五入, 对应网页中的 x.toPrecision(12) / 1
+    :param x: 筹码堆叠
+    :type x: numpy.ndarray
+    :param digits: 有效数字位数
+    :type digits: int
+    :return: 四舍五入后的筹码堆叠
+    :rtype: numpy.ndarray
     """
-    html_str = """
-    // @ts-nocheck
+    abs_x = np.abs(x)
+    valid = (abs_x > 1e-200) & np.isfinite(x)
+    safe_x = np.where(valid, abs_x, 1.0)
+    scale = 10.0 ** (digits - 1 - np.floor(np.log10(safe_x)))
+    return np.where(valid, np.round(x * scale) / scale, x)
 
-    /**
-     * 计算分布及相关指标
-     * @param {number} index 当前选中的K线的索引
-     * @return {{x: Array.<number>, y: Array.<number>}}
-     */
-    /**
-    this.range = 120;
-    */
-    function CYQCalculator(index, klinedata) {
-        var maxprice = 0;
-        var minprice = 0;
-        var factor = 150;
-        var start = this.range ? Math.max(0, index - this.range + 1) : 0;
-        /**
-         * K图数据[time,open,close,high,low,volume,amount,amplitude,turnoverRate]
-         */
-        var kdata = klinedata.slice(start, Math.max(1, index + 1));
-        if (kdata.length === 0) throw 'invaild index';
-        for (var i = 0; i < kdata.length; i++) {
-            var elements = kdata[i];
-            maxprice = !maxprice ? elements.high : Math.max(maxprice, elements.high);
-            minprice = !minprice ? elements.low : Math.min(minprice, elements.low);
-        }
 
-        // 精度不小于0.01 产品逻辑
-        var accuracy = Math.max(0.01, (maxprice - minprice) / (factor - 1));
-        /**
-         * 值域
-         * @type {Array.<number>}
-         */
-        var yrange = [];
-        for (var i = 0; i < factor; i++) {
-            yrange.push((minprice + accuracy * i).toFixed(2) / 1);
-        }
-        /**
-         * 横轴数据
-         */
-        var xdata = createNumberArray(factor);
+def _cyq_kernel(
+    open_: np.ndarray,
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    min_price: np.ndarray,
+    accuracy: np.ndarray,
+    factor: int,
+) -> tuple:
+    """
+    K 线在价格网格上的三角形分布, 一字板时集中在均价所在的价格档位
+    只计算每根 K 线最低价和最高价之间的档位, 每根 K 线可以使用不同的价格网格
+    :param min_price: 每根 K 线所用价格网格的最低价
+    :type min_price: numpy.ndarray
+    :param accuracy: 每根 K 线所用价格网格的档位间距
+    :type accuracy: numpy.ndarray
+    :return: 非零元素的行号, 档位和数值
+    :rtype: tuple
+    """
+    if len(close) == 0:
+        empty = np.array([], dtype=int)
+        return empty, empty, np.array([], dtype="float64")
+    avg = (open_ + close + high + low) / 4
+    upper = np.floor((high - min_price) / accuracy).astype(int)
+    lower = np.ceil((low - min_price) / accuracy).astype(int)
+    flat = high == low
+    count = np.where(flat, 0, np.clip(np.minimum(upper, factor - 1) - lower + 1, 0, None))
+    row = np.repeat(np.arange(len(close)), count)
+    index = lower[row] + np.arange(len(row)) - np.repeat(np.cumsum(count) - count, count)
+    price = min_price[row] + accuracy[row] * index
+    low_, avg_, high_ = low[row], avg[row], high[row]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        g_x = 2 / (high_ - low_)
+        rise = np.where(
+            np.abs(avg_ - low_) < 1e-8, g_x, (price - low_) / (avg_ - low_) * g_x
+        )
+        fall = np.where(
+            np.abs(high_ - avg_) < 1e-8, g_x, (high_ - price) / (high_ - avg_) * g_x
+        )
+    value = np.where(price <= avg_, rise, fall)
+    flat_row = np.flatnonzero(flat)
+    flat_index = np.floor(
+        (avg[flat_row] - min_price[flat_row]) / accuracy[flat_row]
+    ).astype(int)
+    return (
+        np.concatenate([row, flat_row]),
+        np.concatenate([index, flat_index]),
+        np.concatenate([value, np.full(len(flat_row), (factor - 1) / 2)]),
+    )
 
-        for (var i = 0; i < kdata.length; i++) {
-            var eles = kdata[i];
 
-            var open = eles.open,
-                close = eles.close,
-                high = eles.high,
-                low = eles.low,
-                avg = (open + close + high + low) / 4,
-                turnoverRate = Math.min(1, eles.hsl / 100 || 0);
+def _cyq_cost_by_chip(
+    cum_chips: np.ndarray,
+    chip: np.ndarray,
+    min_price: np.ndarray,
+    accuracy: np.ndarray,
+) -> np.ndarray:
+    """
+    堆叠筹码首次超过指定数量处的价格, 对应网页中的 getCostByChip
+    """
+    above = cum_chips > chip[:, None]
+    index = above.argmax(axis=1)
+    return np.where(above.any(axis=1), min_price + index * accuracy, 0.0)
 
-            var H = Math.floor((high - minprice) / accuracy),
-                L = Math.ceil((low - minprice) / accuracy),
-                // G点坐标, 一字板时, X为进度因子
-                GPoint = [high == low ? factor - 1 : 2 / (high - low), Math.floor((avg - minprice) / accuracy)];
-            // 衰减
-            for (var n = 0; n < xdata.length; n++) {
-                xdata[n] *= (1 - turnoverRate);
-            }
 
-            if (high == low) {
-                // 一字板时，画矩形面积是三角形的2倍
-                xdata[GPoint[1]] += GPoint[0] * turnoverRate / 2;
-            } else {
-                for (var j = L; j <= H; j++) {
-                    var curprice = minprice + accuracy * j;
-                    if (curprice <= avg) {
-                        // 上半三角叠加分布分布
-                        if (Math.abs(avg - low) < 1e-8) {
-                            xdata[j] += GPoint[0] * turnoverRate;
-                        } else {
-                            xdata[j] += (curprice - low) / (avg - low) * GPoint[0] * turnoverRate;
-                        }
-                    } else {
-                        // 下半三角叠加分布分布
-                        if (Math.abs(high - avg) < 1e-8) {
-                            xdata[j] += GPoint[0] * turnoverRate;
-                        } else {
-                            xdata[j] += (high - curprice) / (high - avg) * GPoint[0] * turnoverRate;
-                        }
-                    }
-                }
-            }
+def _cyq_calculate(
+    open_: np.ndarray,
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    turnover: np.ndarray,
+    factor: int = 150,
+) -> dict:
+    """
+    筹码分布计算引擎, 逐根 K 线计算从第一根 K 线到当前 K 线的筹码分布
+    价格网格由历史最高价和最低价决定, 只在出现新高或新低时变化; 网格变化时把之前的 K 线按
+    turnover[j] * prod(1 - turnover[j+1..i]) 的权重一次性叠加到新网格上, 网格不变时逐根衰减叠加
+    :param open_: 开盘价
+    :type open_: numpy.ndarray
+    :param close: 收盘价
+    :type close: numpy.ndarray
+    :param high: 最高价
+    :type high: numpy.ndarray
+    :param low: 最低价
+    :type low: numpy.ndarray
+    :param turnover: 换手率, 单位: %
+    :type turnover: numpy.ndarray
+    :param factor: 价格档位数
+    :type factor: int
+    :return: 获利比例, 平均成本和 90, 70 成本区间及集中度
+    :rtype: dict
+    """
+    n = len(close)
+    rate = np.minimum(1.0, np.nan_to_num(turnover / 100, nan=0.0))
+    rate = np.where(rate > 0, rate, 0.0)
+    keep = 1 - rate
+    # 累计衰减取对数, 避免长历史下连乘下溢
+    log_keep = np.cumsum(np.log(np.maximum(keep, 1e-300)))
+    max_price = np.fmax.accumulate(high)
+    min_price = np.fmin.accumulate(low)
+    accuracy = np.maximum(0.01, (max_price - min_price) / (factor - 1))
 
-        }
+    # 每根 K 线在其所属区段的价格网格上的分布
+    row, col, value = _cyq_kernel(
+        open_, close, high, low, min_price, accuracy, factor
+    )
+    own_kernel = np.zeros((n, factor))
+    own_kernel[row, col] = value
 
+    # 网格变化时, 之前的 K 线在新网格上的筹码堆叠
+    seg_start = np.flatnonzero(
+        (np.diff(max_price, prepend=np.nan) != 0)
+        | (np.diff(min_price, prepend=np.nan) != 0)
+    )
+    pair_seg = np.repeat(np.arange(len(seg_start)), seg_start)
+    pair_bar = np.arange(len(pair_seg)) - np.repeat(
+        np.cumsum(seg_start) - seg_start, seg_start
+    )
+    pair_start = seg_start[pair_seg]
+    row, col, value = _cyq_kernel(
+        open_[pair_bar],
+        close[pair_bar],
+        high[pair_bar],
+        low[pair_bar],
+        min_price[pair_start],
+        accuracy[pair_start],
+        factor,
+    )
+    with np.errstate(over="ignore", invalid="ignore"):
+        pair_weight = rate[pair_bar] * np.exp(
+            log_keep[pair_start - 1] - log_keep[pair_bar]
+        )
+    carry = np.bincount(
+        pair_seg[row] * factor + col,
+        weights=pair_weight[row] * value,
+        minlength=len(seg_start) * factor,
+    ).reshape(len(seg_start), factor)
 
-        var currentprice = klinedata[index].close;
-        var totalChips = 0;
-        for (var i = 0; i < factor; i++) {
-            var x = xdata[i].toPrecision(12) / 1;
-            //if (x < 0) xdata[i] = 0;
-            totalChips += x;
-        }
-        var result = new CYQData();
-        result.x = xdata;
-        result.y = yrange;
-        result.benefitPart = result.getBenefitPart(currentprice);
-        result.avgCost = getCostByChip(totalChips * 0.5).toFixed(2);
-        result.percentChips = {
-            '90': result.computePercentChips(0.9),
-            '70': result.computePercentChips(0.7)
-        };
-        return result;
+    # 逐根 K 线衰减并叠加当日分布
+    chips = np.empty((n, factor))
+    is_start = np.zeros(n, dtype=bool)
+    is_start[seg_start] = True
+    seg_index = np.cumsum(is_start) - 1
+    x = np.zeros(factor)
+    for i in range(n):
+        if is_start[i]:
+            x = carry[seg_index[i]]
+        x = x * keep[i] + rate[i] * own_kernel[i]
+        chips[i] = x
+    chips = _round_significant(chips)
+
+    cum_chips = np.cumsum(chips, axis=1)
+    total = cum_chips[:, -1]
+    price = min_price[:, None] + np.arange(factor) * accuracy[:, None]
+    below = np.where(close[:, None] >= price, chips, 0.0).sum(axis=1)
+    result = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result["benefit_part"] = np.where(total == 0, 0.0, below / total)
+        result["avg_cost"] = _cyq_cost_by_chip(
+            cum_chips, total * 0.5, min_price, accuracy
+        )
+        for percent in [90, 70]:
+            cost_low = _cyq_cost_by_chip(
+                cum_chips, total * (1 - percent / 100) / 2, min_price, accuracy
+            )
+            cost_high = _cyq_cost_by_chip(
+                cum_chips, total * (1 + percent / 100) / 2, min_price, accuracy
+            )
+            result[f"{percent}_low"] = cost_low
+            result[f"{percent}_high"] = cost_high
+            result[f"{percent}_con"] = np.where(
+                cost_low + cost_high == 0,
+                0.0,
+                (cost_high - cost_low) / (cost_low + cost_high),
+            )
+    return result
 
-        /**
-         * 获取指定筹码处的成本
-         * @param {number} chip 堆叠筹码
-         */
-        function getCostByChip(chip) {
-            var result = 0,
-                sum = 0;
-            for (var i = 0; i < factor; i++) {
-                var x = xdata[i].toPrecision(12) / 1;
-                if (sum + x > chip) {
-                    result = minprice + i * accuracy;
-                    break;
-                }
-                sum += x;
-            }
-            return result;
-        }
 
-        /**
-         * 筹码分布数据
-         */
-        function CYQData() {
-            /**
-             * 筹码堆叠
-             * @type {Array.<number>}
-             */
-            this.x = arguments[0];
-            /**
-             * 价格分布
-             * @type {Array.<number>}
-             */
-            this.y = arguments[1];
-            /**
-             * 获利比例
-             * @type {number}
-             */
-            this.benefitPart = arguments[2];
-            /**
-             * 平均成本
-             * @type {number}
-             */
-            this.avgCost = arguments[3];
-            /**
-             * 百分比筹码
-             * @type {{Object.<string, {{priceRange: number[], concentration: number}}>}}
-             */
-            this.percentChips = arguments[4];
-            /**
-             * 计算指定百分比的筹码
-             * @param {number} percent 百分比大于0，小于1
-             */
-            this.computePercentChips = function (percent) {
-                if (percent > 1 || percent < 0) throw 'argument "percent" out of range';
-                var ps = [(1 - percent) / 2, (1 + percent) / 2];
-                var pr = [getCostByChip(totalChips * ps[0]), getCostByChip(totalChips * ps[1])];
-                return {
-                    priceRange: [pr[0].toFixed(2), pr[1].toFixed(2)],
-                    concentration: pr[0] + pr[1] === 0 ? 0 : (pr[1] - pr[0]) / (pr[0] + pr[1])
-                };
-            };
-            /**
-             * 获取指定价格的获利比例
-             * @param {number} price 价格
-             */
-            this.getBenefitPart = function (price) {
-                var below = 0;
-                for (var i = 0; i < factor; i++) {
-                    var x = xdata[i].toPrecision(12) / 1;
-                    if (price >= minprice + i * accuracy) {
-                        below += x;
-                    }
-                }
-                return totalChips == 0 ? 0 : below / totalChips;
-            };
-        }
+def stock_cyq_calculate(
+    bar_df: pd.DataFrame,
+    symbol_column: str = None,
+    factor: int = 150,
+) -> pd.DataFrame:
+    """
+    根据日线行情计算筹码分布, 算法与东方财富网日 K 筹码分布一致; 支持任意长度的历史数据和多只股票一次计算
+    :param bar_df: 日线行情, 需包含 日期, 开盘, 收盘, 最高, 最低, 换手率 字段; 也支持 date, open, close, high, low, hsl 字段
+    :type bar_df: pandas.DataFrame
+    :param symbol_column: 股票代码字段; 为空时按单只股票计算
+    :type symbol_column: str
+    :param factor: 价格档位数
+    :type factor: int
+    :return: 筹码分布
+    :rtype: pandas.DataFrame
+    """
+    column_map = {
+        "日期": "date",
+        "开盘": "open",
+        "收盘": "close",
+        "最高": "high",
+        "最低": "low",
+        "换手率": "hsl",
     }
+    temp_df = bar_df.rename(columns=column_map)
+    group_list = (
+        temp_df.groupby(symbol_column, sort=False)
+        if symbol_column is not None
+        else [(None, temp_df)]
+    )
+    result_list = []
+    for symbol, group_df in group_list:
+        data = _cyq_calculate(
+            open_=group_df["open"].to_numpy(dtype="float64"),
+            close=group_df["close"].to_numpy(dtype="float64"),
+            high=group_df["high"].to_numpy(dtype="float64"),
+            low=group_df["low"].to_numpy(dtype="float64"),
+            turnover=group_df["hsl"].to_numpy(dtype="float64"),
+            factor=factor,
+        )
+        result_df = pd.DataFrame(
+            {
+                "日期": pd.to_datetime(group_df["date"], errors="coerce").dt.date,
+                "获利比例": data["benefit_part"],
+                "平均成本": np.round(data["avg_cost"], 2),
+                "90成本-低": np.round(data["90_low"], 2),
+                "90成本-高": np.round(data["90_high"], 2),
+                "90集中度": data["90_con"],
+                "70成本-低": np.round(data["70_low"], 2),
+                "70成本-高": np.round(data["70_high"], 2),
+                "70集中度": data["70_con"],
+            }
+        )
+        if symbol_column is not None:
+            result_df.insert(0, symbol_column, symbol)
+        result_list.append(result_df)
+    if not result_list:
+        return pd.DataFrame()
+    big_df = pd.concat(result_list, ignore_index=True)
+    return big_df
 
 
-    function createNumberArray(count) {
-        var array = [];
-        for (var i = 0; i < count; i++) {
-            array.push(0);
-        }
-        return array;
-    }
+@cached(family="daily")
+def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
+    """
+    东方财富网-概念板-行情中心-日K-筹码分布
+    https://quote.eastmoney.com/concept/sz000001.html
+    :param symbol: 股票代码
+    :type symbol: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :return: 筹码分布
+    :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(html_str)
     adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
     market_code = 1 if symbol.startswith("6") else 0
     url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
@@ -248,61 +314,7 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
     ]
     for item in temp_df.columns[1:]:
         temp_df[item] = pd.to_numeric(temp_df[item])
-    temp_df["index"] = range(0, len(temp_df))
-    records = temp_df.to_dict(orient="records")
-    date_list = []
-    benefit_part = []
-    avg_cost = []
-    pct_70_low = []
-    pct_70_high = []
-    pct_90_low = []
-    pct_90_high = []
-    pct_70_con = []
-    pct_90_con = []
-    for i in range(0, len(records)):
-        mcode = js_code.call("CYQCalculator", i, records)
-        date_list.append(records[i]["date"])
-        benefit_part.append(mcode["benefitPart"])
-        avg_cost.append(mcode["avgCost"])
-        pct_70_low.append(mcode["percentChips"]["70"]["priceRange"][0])
-        pct_70_high.append(mcode["percentChips"]["70"]["priceRange"][1])
-        pct_90_low.append(mcode["percentChips"]["90"]["priceRange"][0])
-        pct_90_high.append(mcode["percentChips"]["90"]["priceRange"][1])
-        pct_70_con.append(mcode["percentChips"]["70"]["concentration"])
-        pct_90_con.append(mcode["percentChips"]["90"]["concentration"])
-    temp_df = pd.DataFrame(
-        [
-            date_list,
-            benefit_part,
-            avg_cost,
-            pct_90_low,
-            pct_90_high,
-            pct_90_con,
-            pct_70_low,
-            pct_70_high,
-            pct_70_con,
-        ]
-    ).T
-    temp_df.columns = [
-        "日期",
-        "获利比例",
-        "平均成本",
-        "90成本-低",
-        "90成本-高",
-        "90集中度",
-        "70成本-低",
-        "70成本-高",
-        "70集中度",
-    ]
-    temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["获利比例"] = pd.to_numeric(temp_df["获利比例"], errors="coerce")
-    temp_df["平均成本"] = pd.to_numeric(temp_df["平均成本"], errors="coerce")
-    temp_df["90成本-低"] = pd.to_numeric(temp_df["90成本-低"], errors="coerce")
-    temp_df["90成本-高"] = pd.to_numeric(temp_df["90成本-高"], errors="coerce")
-    temp_df["90集中度"] = pd.to_numeric(temp_df["90集中度"], errors="coerce")
-    temp_df["70成本-低"] = pd.to_numeric(temp_df["70成本-低"], errors="coerce")
-    temp_df["70成本-高"] = pd.to_numeric(temp_df["70成本-高"], errors="coerce")
-    temp_df["70集中度"] = pd.to_numeric(temp_df["70集中度"], errors="coerce")
+    temp_df = stock_cyq_calculate(temp_df)
     temp_df = temp_df.iloc[-90:, :].copy()
     temp_df.reset_index(inplace=True, drop=True)
     return temp_df
@@ -311,3 +323,11 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
 if __name__ == "__main__":
     stock_cyq_em_df = stock_cyq_em(symbol="000001", adjust="")
     print(stock_cyq_em_df)
+
+    from akshare.stock_feature.stock_hist_em import stock_zh_a_hist
+
+    stock_zh_a_hist_df = stock_zh_a_hist(
+        symbol="000001", start_date="20200101", adjust="qfq"
+    )
+    stock_cyq_calculate_df = stock_cyq_calculate(stock_zh_a_hist_df)
+    print(stock_cyq_calculate_df)
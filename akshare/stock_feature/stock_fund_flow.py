@@ -17,8 +17,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
-import py_mini_racer
 from akshare.utils.tqdm import get_tqdm
 
 from akshare.datasets import get_ths_js
@@ -47,6 +45,9 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
     :return: 个股资金流
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -143,6 +144,9 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
     :return: 概念资金流
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -249,6 +253,9 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
     :return: 行业资金流
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -353,6 +360,9 @@ def stock_fund_flow_big_deal() -> pd.DataFrame:
     :return: 大单追踪
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
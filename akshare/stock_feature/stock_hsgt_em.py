@@ -9,7 +9,6 @@ https://data.eastmoney.com/hsgtcg/
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
 from akshare.utils.func import fetch_paginated_data
@@ -181,6 +180,8 @@ def stock_hsgt_hold_stock_em(
     :return: 指定 sector 和 indicator 的数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://data.eastmoney.com/hsgtcg/list.html"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -1200,6 +1201,8 @@ def stock_hsgt_board_rank_em(
     :return: 北向资金增持行业板块排行
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://data.eastmoney.com/hsgtcg/hy.html"
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -10,7 +10,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
 from akshare.utils.cons import headers
@@ -23,6 +22,8 @@ def stock_lh_yyb_most() -> pd.DataFrame:
     :return: 上榜次数最多
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/sbcs/field/sbcs/sort/desc/page/1/"
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -46,6 +47,8 @@ def stock_lh_yyb_capital() -> pd.DataFrame:
     :return: 资金实力最强
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/zjsl/field/zgczje/sort/desc/page/1/"
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -69,6 +72,8 @@ def stock_lh_yyb_control() -> pd.DataFrame:
     :return: 抱团操作实力
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/btcz/field/xsjs/sort/desc/page/1/"
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
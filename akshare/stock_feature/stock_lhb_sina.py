@@ -10,7 +10,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
 
@@ -24,6 +23,8 @@ def stock_lhb_detail_daily_sina(date: str = "20240222") -> pd.DataFrame:
     :return: 龙虎榜-每日详情
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     date = "-".join([date[:4], date[4:6], date[6:]])
     url = "https://vip.stock.finance.sina.com.cn/q/go.php/vInvestConsult/kind/lhb/index.phtml"
     params = {"tradedate": date}
@@ -61,6 +62,8 @@ def _find_last_page(
     url: str = "https://vip.stock.finance.sina.com.cn/q/go.php/vLHBData/kind/ggtj/index.phtml",
     recent_day: str = "60",
 ):
+    from bs4 import BeautifulSoup
+
     params = {
         "last": recent_day,
         "p": "1",
@@ -212,6 +215,8 @@ def stock_lhb_jgmx_sina() -> pd.DataFrame:
     :return: 龙虎榜-机构席位成交明细
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = (
         "https://vip.stock.finance.sina.com.cn/q/go.php/vLHBData/kind/jgmx/index.phtml"
     )
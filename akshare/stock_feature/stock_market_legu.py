@@ -10,7 +10,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils.cons import headers
 
@@ -22,6 +21,8 @@ def stock_market_activity_legu() -> pd.DataFrame:
     :return: 乐咕乐股网-赚钱效应分析
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "https://legulegu.com/stockdata/market-activity"
     r = requests.get(url, headers=headers)
     temp_df = pd.read_html(StringIO(r.text))[0]
@@ -11,7 +11,6 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
 
@@ -24,6 +23,8 @@ def _fetch_stock_uid() -> dict:
     :return: 代码ID映射
     :rtype: str
     """
+    from bs4 import BeautifulSoup
+
     url = "https://sns.sseinfo.com/allcompany.do"
     data = {
         "code": "0",
@@ -62,6 +63,8 @@ def stock_sns_sseinfo(symbol: str = "603119") -> pd.DataFrame:
     :return: 提问与回答
     :rtype: str
     """
+    from bs4 import BeautifulSoup
+
     code_uid_map = _fetch_stock_uid()
     url = "https://sns.sseinfo.com/ajax/userfeeds.do"
     params = {
@@ -9,9 +9,7 @@ https://data.10jqka.com.cn/rank/cxg/
 from io import StringIO
 
 import pandas as pd
-import py_mini_racer
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.datasets import get_ths_js
 from akshare.utils.tqdm import get_tqdm
@@ -40,6 +38,9 @@ def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
     :return: 创新高数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     symbol_map = {
         "创月新高": "4",
         "半年新高": "3",
@@ -115,6 +116,9 @@ def stock_rank_cxd_ths(symbol: str = "创月新低") -> pd.DataFrame:
     :return: 创新低数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     symbol_map = {
         "创月新低": "4",
         "半年新低": "3",
@@ -188,6 +192,9 @@ def stock_rank_lxsz_ths() -> pd.DataFrame:
     :return: 连续上涨
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -249,6 +256,9 @@ def stock_rank_lxxd_ths() -> pd.DataFrame:
     :return: 连续下跌
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -310,6 +320,9 @@ def stock_rank_cxfl_ths() -> pd.DataFrame:
     :return: 持续放量
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -370,6 +383,9 @@ def stock_rank_cxsl_ths() -> pd.DataFrame:
     :return: 持续缩量
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -432,6 +448,9 @@ def stock_rank_xstp_ths(symbol: str = "500日均线") -> pd.DataFrame:
     :return: 向上突破
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     symbol_map = {
         "5日均线": 5,
         "10日均线": 10,
@@ -504,6 +523,9 @@ def stock_rank_xxtp_ths(symbol: str = "500日均线") -> pd.DataFrame:
     :return: 向下突破
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     symbol_map = {
         "5日均线": 5,
         "10日均线": 10,
@@ -574,6 +596,9 @@ def stock_rank_ljqs_ths() -> pd.DataFrame:
     :return: 量价齐升
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -632,6 +657,9 @@ def stock_rank_ljqd_ths() -> pd.DataFrame:
     :return: 量价齐跌
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
@@ -690,6 +718,8 @@ def stock_rank_xzjp_ths() -> pd.DataFrame:
     :return: 险资举牌
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
     js_code.eval(js_content)
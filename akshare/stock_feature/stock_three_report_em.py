@@ -9,7 +9,6 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
 
@@ -24,6 +23,8 @@ def _stock_balance_sheet_by_report_ctype_em(symbol: str = "SH600519") -> str:
     :return: 东方财富-股票-财务分析-资产负债表-按报告期-公司类型判断
     :rtype: str
     """
+    from bs4 import BeautifulSoup
+
     url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/Index"
     params = {"type": "web", "code": symbol.lower()}
     r = requests.get(url, params=params)
@@ -16,7 +16,6 @@ from io import StringIO
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
 
@@ -238,6 +237,8 @@ def stock_financial_analysis_indicator(
     :return: 新浪财经-财务分析-财务指标
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = (
         f"https://money.finance.sina.com.cn/corp/go.php/vFD_FinancialGuideLine/"
         f"stockid/{symbol}/ctrl/2020/displaytype/4.phtml"
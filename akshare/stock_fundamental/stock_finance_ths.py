@@ -10,7 +10,6 @@ import json
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from akshare.utils.cons import headers
 
@@ -28,6 +27,8 @@ def stock_financial_abstract_ths(
     :return: 同花顺-财务指标-主要指标
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = f"https://basic.10jqka.com.cn/new/{symbol}/finance.html"
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
@@ -174,6 +175,8 @@ def stock_management_change_ths(symbol: str = "688981") -> pd.DataFrame:
     :return: 同花顺-公司大事-高管持股变动
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = f"https://basic.10jqka.com.cn/new/{symbol}/event.html"
     r = requests.get(url, headers=headers)
     r.encoding = "gb2312"
@@ -222,6 +225,8 @@ def stock_shareholder_change_ths(symbol: str = "688981") -> pd.DataFrame:
     :return: 同花顺-公司大事-股东持股变动
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = f"https://basic.10jqka.com.cn/new/{symbol}/event.html"
     r = requests.get(url, headers=headers)
     r.encoding = "gb2312"
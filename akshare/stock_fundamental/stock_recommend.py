@@ -8,7 +8,6 @@ http://stock.finance.sina.com.cn/stock/go.php/vIR_RatingNewest/index.phtml
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def stock_institute_recommend(symbol: str = "投资评级选股") -> pd.DataFrame:
@@ -20,6 +19,8 @@ def stock_institute_recommend(symbol: str = "投资评级选股") -> pd.DataFram
     :return: 最新投资评级数据
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = "http://stock.finance.sina.com.cn/stock/go.php/vIR_RatingNewest/index.phtml"
     params = {
         "num": "40",
@@ -8,7 +8,6 @@ https://basic.10jqka.com.cn/new/000066/operate.html
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 
 def stock_zyjs_ths(symbol: str = "000066") -> pd.DataFrame:
@@ -20,6 +19,8 @@ def stock_zyjs_ths(symbol: str = "000066") -> pd.DataFrame:
     :return: 主营介绍
     :rtype: pandas.DataFrame
     """
+    from bs4 import BeautifulSoup
+
     url = f"https://basic.10jqka.com.cn/new/{symbol}/operate.html"
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 全市场批量下载工具
+按股票列表并发下载日线、分钟线、财务指标、主要股东或资金流向数据, 每个股票保存为一个 Parquet 分区:
+<输出目录>/<数据集>/code=<股票代码>/data.parquet
+每个数据源单独限速; 已完成的股票记录在 <输出目录>/<数据集>/_progress.jsonl 中, 任务中断后再次运行即可从中断处继续;
+数据集参数不同时为新的任务, 重新下载所有股票; 未指定结束日期时结束日期为创建任务时的当前交易日
+用法: akshare-dl daily --universe all.txt --output data --start-date 20240101 --workers 8
+     python -m akshare.tool.downloader minute --period 1
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import pathlib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Tuple
+
+import pandas as pd
+
+from akshare.futures import cons
+from akshare.utils.ratelimit import get_rate_limiter
+
+
+def _market(code: str) -> str:
+    """
+    股票代码的交易所, e.g., "600000" -> "sh"
+    """
+    if code.startswith(("6", "9", "5")):
+        return "sh"
+    if code.startswith(("4", "8")):
+        return "bj"
+    return "sz"
+
+
+def _minute_time(date: str, clock: str) -> str:
+    date = date.replace("-", "")
+    return f"{date[:4]}-{date[4:6]}-{date[6:8]} {clock}"
+
+
+# 数据集: func 为 "模块:函数", kwargs 根据股票代码、交易所和命令行参数生成调用参数, host 和 rate 为限速的数据源和每秒请求数
+DOWNLOAD_DATASETS: Dict[str, Dict] = {
+    "daily": {
+        "func": "akshare.stock_feature.stock_hist_em:stock_zh_a_hist",
+        "kwargs": lambda code, market, opts: {
+            "symbol": code,
+            "period": "daily",
+            "start_date": opts["start_date"],
+            "end_date": opts["end_date"],
+            "adjust": opts["adjust"],
+        },
+        "host": "push2his.eastmoney.com",
+        "rate": 5,
+    },
+    "minute": {
+        "func": "akshare.stock_feature.stock_hist_em:stock_zh_a_hist_min_em",
+        "kwargs": lambda code, market, opts: {
+            "symbol": code,
+            "start_date": _minute_time(opts["start_date"], "09:30:00"),
+            "end_date": _minute_time(opts["end_date"], "15:00:00"),
+            "period": opts["period"],
+            "adjust": opts["adjust"],
+        },
+        "host": "push2his.eastmoney.com",
+        "rate": 5,
+    },
+    "financial": {
+        "func": "akshare.stock_fundamental.stock_finance_sina:stock_financial_abstract",
+        "kwargs": lambda code, market, opts: {"symbol": code},
+        "host": "vip.stock.finance.sina.com.cn",
+        "rate": 2,
+    },
+    "shareholders": {
+        "func": "akshare.stock_fundamental.stock_finance_sina:stock_main_stock_holder",
+        "kwargs": lambda code, market, opts: {"stock": code},
+        "host": "vip.stock.finance.sina.com.cn",
+        "rate": 2,
+    },
+    "fund_flow": {
+        "func": "akshare.stock.stock_fund_em:stock_individual_fund_flow",
+        "kwargs": lambda code, market, opts: {"stock": code, "market": market},
+        "host": "push2his.eastmoney.com",
+        "rate": 5,
+    },
+}
+
+DEFAULT_OPTIONS = {
+    "start_date": "19700101",
+    "adjust": "",
+    "period": "1",
+}
+
+
+def load_universe(path: str = None) -> List[Tuple[str, str]]:
+    """
+    股票列表
+    :param path: 股票列表文件, 每行一个代码, 支持 "000001.SZ", "sz000001" 和 "000001"; 为空时使用 stock_info_a_code_name 获取沪深京 A 股列表
+    :type path: str
+    :return: 股票代码和交易所
+    :rtype: list
+    """
+    if path is None:
+        from akshare.stock.stock_info import stock_info_a_code_name
+
+        code_list = stock_info_a_code_name()["code"].astype(str).tolist()
+        return [(code, _market(code)) for code in code_list]
+    universe_list = []
+    for line in pathlib.Path(path).read_text(encoding="utf-8-sig").splitlines():
+        item = line.strip().split(",")[0].strip()
+        if not item or item.startswith("#"):
+            continue
+        if "." in item:
+            code, market = item.split(".", 1)
+        elif item[:2].isalpha():
+            market, code = item[:2], item[2:]
+        else:
+            code, market = item, _market(item)
+        universe_list.append((code.zfill(6), market.lower()))
+    return list(dict.fromkeys(universe_list))
+
+
+def _resolve(func_path: str) -> Callable:
+    module_name, attr = func_path.split(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _write_parquet(temp_df: pd.DataFrame, path: pathlib.Path) -> None:
+    """
+    写入 Parquet 文件; 混合类型的字段转换为字符串
+    """
+    from akshare.utils.cache import _atomic_write
+
+    try:
+        data = temp_df.to_parquet(index=False)
+    except Exception:
+        temp_df = temp_df.copy()
+        for item in temp_df.columns[temp_df.dtypes == object]:
+            temp_df[item] = temp_df[item].astype(str)
+        data = temp_df.to_parquet(index=False)
+    _atomic_write(path, data)
+
+
+def _job_fingerprint(dataset: str, opts: dict) -> str:
+    """
+    任务标识, 由数据集和数据集参数生成; 参数不同时视为新的任务
+    """
+    source = json.dumps([dataset, opts], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+
+
+class _Progress:
+    """
+    断点记录, 每完成一个股票追加一行; 只有任务标识相同的记录可用于断点续传
+    """
+
+    def __init__(self, path: pathlib.Path, job: str, resume: bool):
+        self.path = path
+        self.job = job
+        self.done = {}
+        line_list = []
+        if resume and path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    # 中断时可能留下不完整的最后一行
+                    continue
+                if item.get("job") != job:
+                    continue
+                line_list.append(line)
+                if item["status"] in ("ok", "empty"):
+                    self.done[item["code"]] = item
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 只保留当前任务的记录
+        path.write_text("".join(line + "\n" for line in line_list), encoding="utf-8")
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def record(self, item: dict) -> None:
+        with self._lock:
+            self._file.write(json.dumps(dict(item, job=self.job), ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def download_universe(
+    dataset: str = "daily",
+    universe: List[Tuple[str, str]] = None,
+    output: str = "akshare_data",
+    workers: int = 8,
+    rate: float = None,
+    retries: int = 2,
+    resume: bool = True,
+    report_interval: float = 10,
+    **options,
+) -> pd.DataFrame:
+    """
+    按股票列表批量下载数据集
+    :param dataset: choice of {"daily", "minute", "financial", "shareholders", "fund_flow"}
+    :type dataset: str
+    :param universe: 股票代码和交易所, e.g., [("000001", "sz")]; 为空时为沪深京 A 股
+    :type universe: list
+    :param output: 输出目录
+    :type output: str
+    :param workers: 并发数
+    :type workers: int
+    :param rate: 每秒请求数; 为空时使用数据集的默认值
+    :type rate: float
+    :param retries: 失败后的重试次数
+    :type retries: int
+    :param resume: 是否跳过断点记录中同一任务已完成的股票; 任务由数据集和数据集参数确定
+    :type resume: bool
+    :param report_interval: 输出进度的间隔秒数; 0 表示不输出
+    :type report_interval: float
+    :param options: 数据集参数: start_date, end_date, adjust, period; end_date 为空时为当前交易日
+    :return: 本次下载的结果
+    :rtype: pandas.DataFrame
+    code        股票代码
+    status      ok, empty 或 error
+    rows        行数
+    seconds     耗时
+    error       错误信息
+    """
+    if dataset not in DOWNLOAD_DATASETS:
+        raise ValueError(f"dataset 只能为 {', '.join(DOWNLOAD_DATASETS)}")
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("保存 Parquet 文件需要安装 pyarrow: pip install pyarrow")
+    spec = DOWNLOAD_DATASETS[dataset]
+    opts = dict(DEFAULT_OPTIONS, **{k: v for k, v in options.items() if v is not None})
+    # 结束日期固定为创建任务时的交易日, 跨过零点后继续运行仍为同一个任务
+    if "end_date" not in opts:
+        opts["end_date"] = cons.get_current_trading_day()
+    func = _resolve(spec["func"])
+    if universe is None:
+        universe = load_universe()
+    root = pathlib.Path(output).expanduser() / dataset
+    progress = _Progress(
+        root / "_progress.jsonl", job=_job_fingerprint(dataset, opts), resume=resume
+    )
+    task_list = [item for item in universe if item[0] not in progress.done]
+    limiter = get_rate_limiter(spec["host"], rate=rate or spec["rate"])
+    start = time.monotonic()
+    stats = {"done": 0, "rows": 0, "error": 0}
+
+    def _download(task):
+        code, market = task
+        task_start = time.monotonic()
+        error = ""
+        for attempt in range(retries + 1):
+            try:
+                with limiter:
+                    temp_df = func(**spec["kwargs"](code, market, opts))
+                break
+            except Exception as e:
+                error = repr(e)
+                temp_df = None
+                if attempt < retries:
+                    time.sleep(min(2**attempt, 10) * 0.5)
+        if temp_df is None:
+            status, rows = "error", 0
+        elif temp_df.empty:
+            status, rows = "empty", 0
+        else:
+            temp_df = temp_df.copy()
+            if "代码" not in temp_df.columns:
+                temp_df.insert(0, "代码", code)
+            _write_parquet(temp_df, root / f"code={code}" / "data.parquet")
+            status, rows = "ok", len(temp_df)
+        item = {
+            "code": code,
+            "status": status,
+            "rows": rows,
+            "seconds": round(time.monotonic() - task_start, 3),
+            "error": error if status == "error" else "",
+        }
+        progress.record(item)
+        return item
+
+    def _report(final=False):
+        elapsed = max(time.monotonic() - start, 1e-9)
+        print(
+            f"{dataset}: {stats['done']}/{len(task_list)} "
+            f"({len(progress.done)} 已跳过), {stats['rows']} 行, "
+            f"{stats['done'] / elapsed:.2f} 个/秒, {stats['rows'] / elapsed:.0f} 行/秒, "
+            f"失败 {stats['error']}" + (f", 耗时 {elapsed:.1f} 秒" if final else ""),
+            file=sys.stderr,
+            flush=True,
+        )
+
+    result_list = []
+    last_report = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as ex:
+            future_list = [ex.submit(_download, task) for task in task_list]
+            for future in as_completed(future_list):
+                item = future.result()
+                result_list.append(item)
+                stats["done"] += 1
+                stats["rows"] += item["rows"]
+                stats["error"] += item["status"] == "error"
+                if report_interval and time.monotonic() - last_report >= report_interval:
+                    last_report = time.monotonic()
+                    _report()
+    finally:
+        progress.close()
+    if report_interval:
+        _report(final=True)
+    return pd.DataFrame(
+        result_list, columns=["code", "status", "rows", "seconds", "error"]
+    )
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="akshare-dl",
+        description="按股票列表批量下载 akshare 数据, 保存为按股票分区的 Parquet 文件",
+    )
+    parser.add_argument("dataset", choices=list(DOWNLOAD_DATASETS), help="数据集")
+    parser.add_argument(
+        "--universe", default=None, help="股票列表文件, 为空时使用沪深京 A 股列表"
+    )
+    parser.add_argument("--output", default="akshare_data", help="输出目录")
+    parser.add_argument("--start-date", default=None, help="开始日期, e.g., 20240101")
+    parser.add_argument("--end-date", default=None, help="结束日期, e.g., 20241231")
+    parser.add_argument("--adjust", default=None, help='复权方式, choice of {"", "qfq", "hfq"}')
+    parser.add_argument("--period", default=None, help="分钟线周期, choice of {1, 5, 15, 30, 60}")
+    parser.add_argument("--workers", type=int, default=8, help="并发数")
+    parser.add_argument("--rate", type=float, default=None, help="每秒请求数")
+    parser.add_argument("--retries", type=int, default=2, help="失败后的重试次数")
+    parser.add_argument(
+        "--restart", action="store_true", help="忽略断点记录, 重新下载所有股票"
+    )
+    parser.add_argument("--report-interval", type=float, default=10, help="输出进度的间隔秒数")
+    args = parser.parse_args(argv)
+    result_df = download_universe(
+        dataset=args.dataset,
+        universe=load_universe(args.universe),
+        output=args.output,
+        workers=args.workers,
+        rate=args.rate,
+        retries=args.retries,
+        resume=not args.restart,
+        report_interval=args.report_interval,
+        start_date=args.start_date,
+        end_date=args.end_date,
+        adjust=args.adjust,
+        period=args.period,
+    )
+    error_df = result_df[result_df["status"] == "error"]
+    if not error_df.empty:
+        print(error_df.to_string(index=False), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
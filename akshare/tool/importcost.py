@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 接口模块的导入开销报告
+每个模块在独立的 Python 进程中导入, 统计导入耗时、常驻内存增量和加载的重型依赖
+用法: python -m akshare.tool.importcost [模块 ...] [--top 30] [--workers 4]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pandas as pd
+
+# 导入开销较大的第三方依赖, 接口模块应在函数内部按需导入
+HEAVY_MODULES = [
+    "py_mini_racer",
+    "bs4",
+    "lxml",
+    "openpyxl",
+    "xlrd",
+    "jsonpath",
+    "matplotlib",
+    "aiohttp",
+]
+
+_MEASURE_CODE = """
+import importlib, json, sys, time
+try:
+    import resource
+except ImportError:
+    resource = None
+import pandas, requests
+
+def rss():
+    if resource is None:
+        return 0
+    value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return value // 1024 if sys.platform == "darwin" else value
+
+before_modules = set(sys.modules)
+before_rss = rss()
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+loaded = set(sys.modules) - before_modules
+print(json.dumps({
+    "time": elapsed,
+    "rss": rss() - before_rss,
+    "modules": len(loaded),
+    "heavy": sorted(item for item in json.loads(sys.argv[2]) if item in loaded),
+}))
+"""
+
+
+def _measure(module: str) -> dict:
+    """
+    在独立的进程中导入模块并统计开销
+    :param module: 模块名称, e.g., "akshare.futures.futures_zh_sina"
+    :type module: str
+    :return: 导入开销
+    :rtype: dict
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _MEASURE_CODE, module, json.dumps(HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().split("\n")[-1]
+        return {
+            "module": module,
+            "time": None,
+            "rss": None,
+            "modules": None,
+            "heavy": "",
+            "error": error,
+        }
+    data = json.loads(result.stdout.strip().split("\n")[-1])
+    return {
+        "module": module,
+        "time": data["time"],
+        "rss": data["rss"],
+        "modules": data["modules"],
+        "heavy": ",".join(data["heavy"]),
+        "error": "",
+    }
+
+
+def import_cost(module_list: List[str] = None, max_workers: int = 4) -> pd.DataFrame:
+    """
+    接口模块的导入开销; pandas 和 requests 预先导入, 不计入各模块的开销
+    :param module_list: 模块名称列表; 为空时统计 akshare 登记的全部接口模块
+    :type module_list: list
+    :param max_workers: 同时运行的进程数
+    :type max_workers: int
+    :return: 各模块的导入耗时(秒)、常驻内存峰值增量(KB)、新加载的模块数和加载的重型依赖
+    :rtype: pandas.DataFrame
+    """
+    if not module_list:
+        from akshare._api_index import API_INDEX
+
+        module_list = sorted({module for module, _ in API_INDEX.values()})
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        result_list = list(executor.map(_measure, module_list))
+    temp_df = pd.DataFrame(
+        result_list,
+        columns=["module", "time", "rss", "modules", "heavy", "error"],
+    )
+    temp_df.sort_values(
+        "time", ascending=False, na_position="last", inplace=True, ignore_index=True
+    )
+    return temp_df
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m akshare.tool.importcost",
+        description="统计 akshare 接口模块的导入开销",
+    )
+    parser.add_argument("modules", nargs="*", help="模块名称, 为空时统计全部接口模块")
+    parser.add_argument("--top", type=int, default=30, help="显示开销最大的模块数")
+    parser.add_argument("--workers", type=int, default=4, help="同时运行的进程数")
+    args = parser.parse_args(argv)
+    temp_df = import_cost(module_list=args.modules, max_workers=args.workers)
+    with pd.option_context("display.max_rows", None, "display.width", 200):
+        print(temp_df.head(args.top).to_string(index=False))
+    heavy_df = temp_df[temp_df["heavy"] != ""]
+    print(f"\n共 {len(temp_df)} 个模块, {len(heavy_df)} 个模块在导入时加载了重型依赖")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 生成 akshare 按需加载使用的接口索引
+akshare/__init__.py 中 if TYPE_CHECKING: 代码块内的导入语句是接口的唯一登记处,
+新增接口后运行 python -m akshare.tool.lazy_index 重新生成 akshare/_api_index.py
+"""
+
+import ast
+import pathlib
+from typing import Dict, Tuple
+
+PACKAGE_DIR = pathlib.Path(__file__).resolve().parent.parent
+INDEX_FILE = PACKAGE_DIR / "_api_index.py"
+
+INDEX_HEADER = '''#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Desc: 接口名称与所在模块的对应关系, 供 akshare 按需加载使用
+本文件由 python -m akshare.tool.lazy_index 根据 akshare/__init__.py 生成, 请勿手动修改
+值为 (模块, 属性), 属性为 None 时表示接口就是该模块本身
+API_ALL 为 akshare 的 __all__, 供 from akshare import * 使用
+"""
+
+API_INDEX = {
+'''
+
+
+def _type_checking_body(tree: ast.Module) -> list:
+    """
+    找到 akshare/__init__.py 中 if TYPE_CHECKING: 代码块
+    :param tree: akshare/__init__.py 的语法树
+    :type tree: ast.Module
+    :return: 代码块中的语句
+    :rtype: list
+    """
+    for node in tree.body:
+        if (
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Name)
+            and node.test.id == "TYPE_CHECKING"
+        ):
+            return node.body
+    raise ValueError("akshare/__init__.py 中没有找到 if TYPE_CHECKING: 代码块")
+
+
+def build_index(init_file: pathlib.Path = None) -> Dict[str, Tuple[str, str]]:
+    """
+    解析 akshare/__init__.py 中的导入语句, 得到接口名称与所在模块的对应关系
+    同名接口以最后一次导入为准, 与直接执行导入语句的结果一致
+    :param init_file: akshare/__init__.py 的路径
+    :type init_file: pathlib.Path
+    :return: 接口名称 -> (模块, 属性)
+    :rtype: dict
+    """
+    if init_file is None:
+        init_file = PACKAGE_DIR / "__init__.py"
+    tree = ast.parse(pathlib.Path(init_file).read_text(encoding="utf-8"))
+    index = {}
+    for node in _type_checking_body(tree):
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        module = node.module or ""
+        if node.level:
+            module = "akshare" + ("." + module if module else "")
+        for alias in node.names:
+            name = alias.asname or alias.name
+            if module == "akshare":
+                # from akshare import cache 导入的是子模块
+                index[name] = (f"akshare.{alias.name}", None)
+            else:
+                index[name] = (module, alias.name)
+    return index
+
+
+def render_index(index: Dict[str, Tuple[str, str]]) -> str:
+    """
+    生成索引文件的内容
+    :param index: 接口名称 -> (模块, 属性)
+    :type index: dict
+    :return: 索引文件的内容
+    :rtype: str
+    """
+    lines = [INDEX_HEADER]
+    for name, (module, attr) in index.items():
+        attr_repr = "None" if attr is None else f'"{attr}"'
+        lines.append(f'    "{name}": ("{module}", {attr_repr}),\n')
+    lines.append("}\n")
+    lines.append("\nAPI_ALL = list(API_INDEX)\n")
+    return "".join(lines)
+
+
+def main() -> None:
+    index = build_index()
+    INDEX_FILE.write_text(render_index(index), encoding="utf-8")
+    print(f"{len(index)} 个接口已写入 {INDEX_FILE}")
+
+
+if __name__ == "__main__":
+    main()
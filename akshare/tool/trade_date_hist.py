@@ -11,7 +11,6 @@ import datetime
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.stock.cons import hk_js_decode
 
@@ -23,6 +22,8 @@ def tool_trade_date_hist_sina() -> pd.DataFrame:
     :return: 交易日历
     :rtype: pandas.DataFrame
     """
+    import py_mini_racer
+
     url = "https://finance.sina.com.cn/realstock/company/klc_td_sh.txt"
     r = requests.get(url)
     js_code = py_mini_racer.MiniRacer()
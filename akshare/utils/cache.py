@@ -0,0 +1,320 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 本地磁盘缓存工具
+历史交易日的数据不会再变化, 此类数据可以缓存在本地磁盘, 再次请求时直接读取
+原始文件按内容寻址存储: raw/objects/<sha256 前两位>/<sha256> 保存文件内容,
+raw/refs/<交易所>/<产品>/<日期> 保存对应内容的 sha256, 相同内容只保存一份
+缓存目录通过环境变量 AKSHARE_CACHE_DIR 或 akshare.utils.context.set_cache_dir 设置, 未设置时不缓存
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+import tempfile
+import zipfile
+from io import BytesIO
+from typing import Callable, Optional
+
+import pandas as pd
+
+from akshare.utils.context import get_cache_dir
+
+
+def cache_root() -> Optional[pathlib.Path]:
+    """
+    本地缓存根目录
+    :return: 缓存根目录; 未设置缓存目录时返回 None
+    :rtype: pathlib.Path or None
+    """
+    cache_dir = get_cache_dir()
+    if not cache_dir:
+        return None
+    return pathlib.Path(cache_dir).expanduser()
+
+
+def is_immutable_date(date: str) -> bool:
+    """
+    判断该交易日的数据是否已经固定: 早于最近一个已结算交易日的数据不会再变化
+    :param date: 交易日, e.g., "20240105"
+    :type date: str
+    :return: 是否可以永久缓存
+    :rtype: bool
+    """
+    from akshare.futures.cons import get_latest_data_date
+
+    latest_date = get_latest_data_date(datetime.datetime.now())
+    return str(date).replace("-", "") < latest_date
+
+
+def _atomic_write(path: pathlib.Path, data: bytes) -> None:
+    """
+    先写入临时文件再替换, 避免并发写入或中断时留下不完整的缓存文件
+    :param path: 目标文件路径
+    :type path: pathlib.Path
+    :param data: 文件内容
+    :type data: bytes
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_object(namespace: str, key: str):
+    """
+    读取缓存的 Python 对象
+    :param namespace: 缓存命名空间, e.g., "rank_store/DCE"
+    :type namespace: str
+    :param key: 缓存键, e.g., "20240105"
+    :type key: str
+    :return: 缓存的对象; 未命中时返回 None
+    :rtype: object
+    """
+    root = cache_root()
+    if root is None:
+        return None
+    path = root / "frame" / namespace / f"{key}.pkl"
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def save_object(namespace: str, key: str, obj) -> None:
+    """
+    缓存 Python 对象, 如数据框或由数据框组成的字典
+    :param namespace: 缓存命名空间, e.g., "rank_store/DCE"
+    :type namespace: str
+    :param key: 缓存键, e.g., "20240105"
+    :type key: str
+    :param obj: 需要缓存的对象
+    :type obj: object
+    """
+    root = cache_root()
+    if root is None:
+        return
+    path = root / "frame" / namespace / f"{key}.pkl"
+    _atomic_write(path, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def list_keys(namespace: str) -> list:
+    """
+    列出缓存命名空间下已经保存的缓存键
+    :param namespace: 缓存命名空间, e.g., "rank_store/DCE"
+    :type namespace: str
+    :return: 排序后的缓存键
+    :rtype: list
+    """
+    root = cache_root()
+    if root is None:
+        return []
+    path = root / "frame" / namespace
+    if not path.exists():
+        return []
+    return sorted(
+        {item.stem for item in path.glob("*.pkl")}
+        | {item.stem for item in path.glob("*.arrow")}
+    )
+
+
+def load_frame(namespace: str, key: str) -> Optional[pd.DataFrame]:
+    """
+    读取缓存的数据框
+    :param namespace: 缓存命名空间, e.g., "futures_daily/DCE"
+    :type namespace: str
+    :param key: 缓存键, e.g., "20240105"
+    :type key: str
+    :return: 缓存的数据, 数值列引用内存映射的文件, 为只读; 未命中时返回 None
+    :rtype: pandas.DataFrame or None
+    """
+    root = cache_root()
+    if root is None:
+        return None
+    path = root / "frame" / namespace / f"{key}.arrow"
+    if path.exists():
+        try:
+            from akshare.utils.serialize import read_arrow
+
+            return read_arrow(path)
+        except Exception:
+            return None
+    return load_object(namespace, key)
+
+
+def save_frame(namespace: str, key: str, df: pd.DataFrame) -> None:
+    """
+    缓存数据框
+    :param namespace: 缓存命名空间, e.g., "futures_daily/DCE"
+    :type namespace: str
+    :param key: 缓存键, e.g., "20240105"
+    :type key: str
+    :param df: 需要缓存的数据
+    :type df: pandas.DataFrame
+    """
+    root = cache_root()
+    if root is None:
+        return
+    # 安装了 pyarrow 时保存为 Arrow IPC 文件, 读取时使用内存映射
+    try:
+        from akshare.utils.serialize import write_arrow
+
+        write_arrow(df, root / "frame" / namespace / f"{key}.arrow")
+    except Exception:
+        save_object(namespace, key, df)
+        return
+    pickle_path = root / "frame" / namespace / f"{key}.pkl"
+    if pickle_path.exists():
+        pickle_path.unlink()
+
+
+def _raw_ref_path(
+    root: pathlib.Path, exchange: str, date: str, product: str
+) -> pathlib.Path:
+    return root / "raw" / "refs" / exchange.upper() / product / str(date)
+
+
+def _raw_object_path(root: pathlib.Path, digest: str) -> pathlib.Path:
+    return root / "raw" / "objects" / digest[:2] / digest
+
+
+def load_raw(exchange: str, date: str, product: str) -> Optional[bytes]:
+    """
+    读取缓存的原始文件
+    :param exchange: 交易所代码, e.g., "DCE"
+    :type exchange: str
+    :param date: 日期, e.g., "20240105"
+    :type date: str
+    :param product: 文件类别, e.g., "daily"
+    :type product: str
+    :return: 原始文件内容; 未命中时返回 None
+    :rtype: bytes or None
+    """
+    root = cache_root()
+    if root is None:
+        return None
+    ref_path = _raw_ref_path(root, exchange, date, product)
+    if not ref_path.exists():
+        return None
+    digest = ref_path.read_text(encoding="utf-8").strip()
+    object_path = _raw_object_path(root, digest)
+    if not object_path.exists():
+        return None
+    data = object_path.read_bytes()
+    if hashlib.sha256(data).hexdigest() != digest:
+        return None
+    return data
+
+
+def save_raw(exchange: str, date: str, product: str, data: bytes) -> None:
+    """
+    缓存原始文件
+    :param exchange: 交易所代码, e.g., "DCE"
+    :type exchange: str
+    :param date: 日期, e.g., "20240105"
+    :type date: str
+    :param product: 文件类别, e.g., "daily"
+    :type product: str
+    :param data: 原始文件内容
+    :type data: bytes
+    """
+    root = cache_root()
+    if root is None:
+        return
+    digest = hashlib.sha256(data).hexdigest()
+    object_path = _raw_object_path(root, digest)
+    if not object_path.exists():
+        _atomic_write(object_path, data)
+    _atomic_write(
+        _raw_ref_path(root, exchange, date, product), digest.encode("utf-8")
+    )
+
+
+def fetch_raw(
+    exchange: str,
+    date: str,
+    product: str,
+    fetch: Callable[[], Optional[bytes]],
+    validate: Optional[Callable[[bytes], bool]] = None,
+    immutable: Optional[bool] = None,
+) -> Optional[bytes]:
+    """
+    获取原始文件: 已经固定的历史数据优先从本地缓存读取, 未命中时请求网络并写入缓存
+    :param exchange: 交易所代码, e.g., "DCE"
+    :type exchange: str
+    :param date: 日期, e.g., "20240105"; 按月或按年发布的文件可以使用 "202401" 或 "2010"
+    :type date: str
+    :param product: 文件类别, e.g., "daily"
+    :type product: str
+    :param fetch: 请求网络并返回原始文件内容的函数
+    :type fetch: callable
+    :param validate: 校验文件内容是否完整的函数, 校验不通过的内容不会写入缓存
+    :type validate: callable
+    :param immutable: 数据是否已经固定; 默认根据 date 判断
+    :type immutable: bool
+    :return: 原始文件内容
+    :rtype: bytes or None
+    """
+    if immutable is None:
+        immutable = is_immutable_date(date)
+    if immutable:
+        data = load_raw(exchange, date, product)
+        if data is not None:
+            return data
+    data = fetch()
+    if data is None or not immutable or cache_root() is None:
+        return data
+    try:
+        is_valid = validate(data) if validate is not None else len(data) > 0
+    except Exception:
+        is_valid = False
+    if is_valid:
+        save_raw(exchange, date, product, data)
+    return data
+
+
+def is_json(data: bytes) -> bool:
+    """
+    校验内容是否为 JSON
+    :param data: 原始文件内容
+    :type data: bytes
+    :return: 是否为 JSON
+    :rtype: bool
+    """
+    json.loads(data)
+    return True
+
+
+def is_zip(data: bytes) -> bool:
+    """
+    校验内容是否为 zip 压缩文件
+    :param data: 原始文件内容
+    :type data: bytes
+    :return: 是否为 zip 压缩文件
+    :rtype: bool
+    """
+    return zipfile.is_zipfile(BytesIO(data))
+
+
+def is_excel(data: bytes) -> bool:
+    """
+    校验内容是否为 Excel 文件(xls 或 xlsx)
+    :param data: 原始文件内容
+    :type data: bytes
+    :return: 是否为 Excel 文件
+    :rtype: bool
+    """
+    return data[:4] == b"\xd0\xcf\x11\xe0" or is_zip(data)
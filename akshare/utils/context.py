@@ -1,3 +1,6 @@
+import os
+
+
 class AkshareConfig:
     _instance = None
 
@@ -5,6 +8,7 @@ class AkshareConfig:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.proxies = None
+            cls._instance.cache_dir = os.environ.get("AKSHARE_CACHE_DIR") or None
         return cls._instance
 
     @classmethod
@@ -15,6 +19,14 @@ class AkshareConfig:
     def get_proxies(cls):
         return cls().proxies
 
+    @classmethod
+    def set_cache_dir(cls, cache_dir):
+        cls().cache_dir = cache_dir
+
+    @classmethod
+    def get_cache_dir(cls):
+        return cls().cache_dir
+
 
 config = AkshareConfig()
 
@@ -28,6 +40,15 @@ def get_proxies():
     return config.get_proxies()
 
 
+# 导出 set_cache_dir 函数, 设置为 None 时关闭本地磁盘缓存
+def set_cache_dir(cache_dir):
+    config.set_cache_dir(cache_dir)
+
+
+def get_cache_dir():
+    return config.get_cache_dir()
+
+
 class ProxyContext:
     def __init__(self, proxies):
         self.proxies = proxies
@@ -5,11 +5,11 @@ Desc: 通用帮助函数
 """
 
 import math
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 import pandas as pd
-import requests
 
+from akshare.utils.hedge import hedged_get
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -29,7 +29,7 @@ def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
     # 复制参数以避免修改原始参数
     params = base_params.copy()
     # 获取第一页数据，用于确定分页信息
-    r = requests.get(url, params=params, timeout=timeout)
+    r = hedged_get(url, params=params, timeout=timeout)
     data_json = r.json()
     # 计算分页信息
     per_page_num = len(data_json["data"]["diff"])
@@ -43,7 +43,7 @@ def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
     # 获取剩余页面数据
     for page in tqdm(range(2, total_page + 1), leave=False):
         params.update({"pn": page})
-        r = requests.get(url, params=params, timeout=timeout)
+        r = hedged_get(url, params=params, timeout=timeout)
         data_json = r.json()
         inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
         temp_list.append(inner_temp_df)
@@ -56,6 +56,70 @@ def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
     return temp_df
 
 
+# 东方财富分时接口 ndays 参数支持的最大天数; 始终请求最大天数, 再由 em_filter_rows 按时间窗口筛选,
+# 避免按交易日历计算天数时日历未覆盖的日期少请求数据
+EM_TRENDS_NDAYS = "5"
+
+# 东方财富 K 线时间字段补齐为 YYYY-MM-DD HH:MM:SS 时使用的模板
+_TIME_TEMPLATE = "0000-00-00 00:00:00"
+
+
+def em_time_window(start_date: str, end_date: str) -> Tuple[str, str]:
+    """
+    开始和结束时间转换为 YYYY-MM-DD HH:MM:SS 格式的比较键
+    只有日期的结束时间包含当天的全部数据, 与 pandas 按时间字符串切片的规则一致
+    :param start_date: 开始时间, e.g., "2024-01-02 09:30:00" 或 "20240102"
+    :type start_date: str
+    :param end_date: 结束时间, e.g., "2024-01-02 15:00:00" 或 "20240102"
+    :type end_date: str
+    :return: 开始和结束时间的比较键
+    :rtype: tuple
+    """
+    start_key = pd.Timestamp(start_date).strftime("%Y-%m-%d %H:%M:%S")
+    end = pd.Timestamp(end_date)
+    if ":" not in str(end_date):
+        end = end.normalize() + pd.Timedelta(seconds=86399)
+    return start_key, end.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def em_kline_range(start_key: str, end_key: str) -> Dict[str, str]:
+    """
+    东方财富 K 线接口的 beg 和 end 参数, 只请求时间窗口所在的交易日
+    :param start_key: 开始时间的比较键, 参见 em_time_window
+    :type start_key: str
+    :param end_key: 结束时间的比较键, 参见 em_time_window
+    :type end_key: str
+    :return: beg 和 end 参数
+    :rtype: dict
+    """
+    beg = start_key[:10].replace("-", "")
+    end = end_key[:10].replace("-", "")
+    return {
+        "beg": beg if beg > "19900101" else "0",
+        "end": end if end < "20500000" else "20500000",
+    }
+
+
+def em_filter_rows(rows: List[str], start_key: str, end_key: str) -> List[List[str]]:
+    """
+    按时间窗口筛选东方财富 K 线数据, 只拆分窗口内的行
+    :param rows: K 线数据, 每行以时间开头并以逗号分隔, e.g., "2024-01-02 09:35,9.39,..."
+    :type rows: list
+    :param start_key: 开始时间的比较键, 参见 em_time_window
+    :type start_key: str
+    :param end_key: 结束时间的比较键, 参见 em_time_window
+    :type end_key: str
+    :return: 拆分后的 K 线数据
+    :rtype: list
+    """
+    result = []
+    for item in rows:
+        time_str = item[: item.find(",")]
+        if start_key <= time_str + _TIME_TEMPLATE[len(time_str) :] <= end_key:
+            result.append(item.split(","))
+    return result
+
+
 def set_df_columns(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
     """
     设置 pandas.DataFrame 为空的情况
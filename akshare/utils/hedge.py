@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 东方财富镜像主机的对冲请求
+同一接口有多个编号镜像主机, 如 82.push2, 80.push2, 70.push2 和 push2his; 任一主机偶尔会停顿数秒
+请求先发往延迟最低的主机, 超过延迟阈值仍未返回时向另一个镜像发送相同的请求, 以先返回的结果为准
+各主机的延迟和错误按指数加权统计, 用于选择首选主机; 延迟阈值和镜像列表按接口类型分别设置
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import pandas as pd
+import requests
+
+# 接口类型: host 为主机名的正则, path 为接口路径, hosts 为可用镜像, delay 为发送对冲请求前等待的秒数,
+# max_hedges 为最多额外发送的请求数
+EM_HEDGE_POLICY = {
+    "snapshot": {
+        "host": r"(\d+\.)?push2\.eastmoney\.com",
+        "path": "/api/qt/clist/get",
+        "hosts": [
+            "82.push2.eastmoney.com",
+            "80.push2.eastmoney.com",
+            "70.push2.eastmoney.com",
+            "push2.eastmoney.com",
+        ],
+        "delay": 0.5,
+        "max_hedges": 1,
+        "enabled": True,
+    },
+    "kline": {
+        "host": r"(\d+\.)?push2his\.eastmoney\.com",
+        "path": "/api/qt/stock/kline/get",
+        "hosts": [
+            "push2his.eastmoney.com",
+            "7.push2his.eastmoney.com",
+            "33.push2his.eastmoney.com",
+            "63.push2his.eastmoney.com",
+            "91.push2his.eastmoney.com",
+        ],
+        "delay": 1.0,
+        "max_hedges": 1,
+        "enabled": True,
+    },
+    "trends": {
+        "host": r"(\d+\.)?push2his\.eastmoney\.com",
+        "path": "/api/qt/stock/trends2/get",
+        "hosts": [
+            "push2his.eastmoney.com",
+            "7.push2his.eastmoney.com",
+            "33.push2his.eastmoney.com",
+        ],
+        "delay": 1.0,
+        "max_hedges": 1,
+        "enabled": True,
+    },
+}
+
+# 延迟的指数加权系数和每次错误增加的惩罚秒数
+_EWMA_ALPHA = 0.2
+_ERROR_PENALTY = 5.0
+
+_policy_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class HostLatency:
+    """
+    各主机的请求延迟和错误统计, 线程安全
+    """
+
+    def __init__(self):
+        self._latency: Dict[str, float] = {}
+        self._error: Dict[str, float] = {}
+        self._count: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, host: str, latency: float = None, error: bool = False) -> None:
+        with self._lock:
+            self._count[host] = self._count.get(host, 0) + 1
+            if error:
+                self._error[host] = self._error.get(host, 0) + 1
+                return
+            self._error[host] = self._error.get(host, 0) * 0.5
+            if host in self._latency:
+                self._latency[host] += _EWMA_ALPHA * (latency - self._latency[host])
+            else:
+                self._latency[host] = latency
+
+    def score(self, host: str, prior: float) -> float:
+        """
+        主机的期望延迟; 未请求过的主机使用先验值
+        """
+        with self._lock:
+            return (
+                self._latency.get(host, prior)
+                + self._error.get(host, 0) * _ERROR_PENALTY
+            )
+
+    def rank(self, host_list: List[str], prior: float) -> List[str]:
+        """
+        按期望延迟排序, 期望延迟相同时保持原有顺序
+        """
+        return sorted(host_list, key=lambda host: self.score(host, prior))
+
+    def to_frame(self) -> pd.DataFrame:
+        with self._lock:
+            host_list = sorted(self._count)
+            return pd.DataFrame(
+                {
+                    "host": host_list,
+                    "latency": [self._latency.get(host) for host in host_list],
+                    "error": [self._error.get(host, 0) for host in host_list],
+                    "count": [self._count[host] for host in host_list],
+                }
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._latency.clear()
+            self._error.clear()
+            self._count.clear()
+
+
+host_latency = HostLatency()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=16, thread_name_prefix="akshare-hedge"
+            )
+        return _executor
+
+
+def em_hedge_family(url: str) -> Optional[str]:
+    """
+    URL 对应的接口类型
+    :param url: 请求地址, e.g., "https://82.push2.eastmoney.com/api/qt/clist/get"
+    :type url: str
+    :return: 接口类型; 不支持对冲请求的地址返回 None
+    :rtype: str
+    """
+    parts = urlsplit(url)
+    for family, policy in EM_HEDGE_POLICY.items():
+        if parts.path == policy["path"] and re.fullmatch(
+            policy["host"], parts.hostname or ""
+        ):
+            return family
+    return None
+
+
+def set_em_hedge_policy(
+    family: str,
+    hosts: List[str] = None,
+    delay: float = None,
+    max_hedges: int = None,
+    enabled: bool = None,
+) -> dict:
+    """
+    设置接口类型的对冲请求参数, 未指定的参数保持不变
+    :param family: choice of {"snapshot", "kline", "trends"}
+    :type family: str
+    :param hosts: 可用镜像主机
+    :type hosts: list
+    :param delay: 发送对冲请求前等待的秒数
+    :type delay: float
+    :param max_hedges: 最多额外发送的请求数
+    :type max_hedges: int
+    :param enabled: 是否启用对冲请求; 关闭后只请求原地址
+    :type enabled: bool
+    :return: 设置后的参数
+    :rtype: dict
+    """
+    if family not in EM_HEDGE_POLICY:
+        raise ValueError(f"family 只能为 {', '.join(EM_HEDGE_POLICY)}")
+    with _policy_lock:
+        policy = EM_HEDGE_POLICY[family]
+        if hosts is not None:
+            policy["hosts"] = list(hosts)
+        if delay is not None:
+            policy["delay"] = float(delay)
+        if max_hedges is not None:
+            policy["max_hedges"] = int(max_hedges)
+        if enabled is not None:
+            policy["enabled"] = bool(enabled)
+        return dict(policy)
+
+
+def em_hedge_stats() -> pd.DataFrame:
+    """
+    各镜像主机的请求统计
+    :return: 请求统计
+    :rtype: pandas.DataFrame
+    host        主机
+    latency     指数加权延迟, 单位: 秒
+    error       错误计数, 每次成功请求减半
+    count       请求次数
+    """
+    return host_latency.to_frame()
+
+
+def _timed_get(url: str, host: str, **kwargs) -> requests.Response:
+    start = time.monotonic()
+    try:
+        r = requests.get(url, **kwargs)
+    except Exception:
+        host_latency.record(host, error=True)
+        raise
+    if r.ok:
+        host_latency.record(host, latency=time.monotonic() - start)
+    else:
+        host_latency.record(host, error=True)
+    return r
+
+
+def hedged_get(
+    url: str,
+    params: dict = None,
+    timeout: float = 15,
+    family: str = None,
+    **kwargs,
+) -> requests.Response:
+    """
+    对冲请求: 首选主机在延迟阈值内未返回时向另一个镜像发送相同的请求, 返回先成功的结果
+    不支持对冲请求的地址等同于 requests.get
+    :param url: 请求地址
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :param timeout: 单个请求的超时时间
+    :type timeout: float
+    :param family: 接口类型; 为空时根据 url 判断
+    :type family: str
+    :return: 响应
+    :rtype: requests.Response
+    """
+    family = family or em_hedge_family(url)
+    policy = EM_HEDGE_POLICY.get(family)
+    if policy is None or not policy["enabled"]:
+        return requests.get(url, params=params, timeout=timeout, **kwargs)
+    parts = urlsplit(url)
+    host_list = [parts.hostname] + [
+        item for item in policy["hosts"] if item != parts.hostname
+    ]
+    host_list = host_latency.rank(host_list, prior=policy["delay"])
+    executor = _get_executor()
+    pending = {}
+    hedge_count = 0
+    last_error = None
+    last_response = None
+
+    def _submit():
+        host = host_list.pop(0)
+        host_url = urlunsplit(parts._replace(netloc=host))
+        future = executor.submit(
+            _timed_get, host_url, host, params=params, timeout=timeout, **kwargs
+        )
+        pending[future] = host
+
+    _submit()
+    while pending:
+        can_hedge = host_list and hedge_count < policy["max_hedges"]
+        done, _ = wait(
+            list(pending),
+            timeout=policy["delay"] if can_hedge else None,
+            return_when=FIRST_COMPLETED,
+        )
+        if not done:
+            hedge_count += 1
+            _submit()
+            continue
+        for future in done:
+            pending.pop(future)
+            try:
+                r = future.result()
+            except Exception as e:
+                last_error = e
+                continue
+            if r.ok:
+                return r
+            last_response = r
+        # 请求失败时立即改用下一个镜像
+        if not pending and host_list:
+            _submit()
+    if last_response is not None:
+        return last_response
+    raise last_error
+
+
+if __name__ == "__main__":
+    hedged_r = hedged_get(
+        "https://push2his.eastmoney.com/api/qt/stock/kline/get",
+        params={
+            "fields1": "f1,f2,f3,f4,f5,f6",
+            "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61,f116",
+            "ut": "7eea3edcaed734bea9cbfc24409ed989",
+            "klt": "101",
+            "fqt": "0",
+            "secid": "0.000001",
+            "beg": "20240101",
+            "end": "20240201",
+        },
+    )
+    print(hedged_r.json())
+    print(em_hedge_stats())
@@ -0,0 +1,348 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 实时行情轮询
+按固定间隔在后台线程或协程中请求实时行情, 最新快照保存在预先分配的列式缓冲区中, 每次只输出发生变化的行和变化字段的掩码;
+可选在内存中保留日内历史快照(环形缓冲区)
+例如:
+import akshare as ak
+poller = ak.SpotPoller("stock_zh_a_spot_em", interval=3, callbacks=[lambda delta, mask: print(delta)])
+poller.start()
+"""
+
+import asyncio
+import importlib
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# 支持轮询的实时行情接口: 接口名称 -> (模块, 代码字段)
+SPOT_POLLER_SOURCES = {
+    "stock_zh_a_spot_em": ("akshare.stock_feature.stock_hist_em", "代码"),
+    "stock_hk_spot_em": ("akshare.stock_feature.stock_hist_em", "代码"),
+    "stock_us_spot_em": ("akshare.stock_feature.stock_hist_em", "代码"),
+    "fund_etf_spot_em": ("akshare.fund.fund_etf_em", "代码"),
+    "futures_zh_spot": ("akshare.futures.futures_zh_sina", "symbol"),
+}
+
+# 每次请求都会变化但不代表行情变化的字段, 不参与比较
+DEFAULT_IGNORE_COLUMNS = ["序号", "更新时间", "数据日期"]
+
+
+class SpotPoller:
+    """
+    实时行情轮询器
+    回调函数的参数为 (delta_df, mask_df): delta_df 为发生变化的行, mask_df 为对应的字段是否变化; 新出现的代码所有字段均视为变化
+    设置 out_queue 时, 每次轮询向队列放入 (时间戳, delta_df, mask_df)
+    """
+
+    def __init__(
+        self,
+        source: Union[str, Callable[..., pd.DataFrame]] = "stock_zh_a_spot_em",
+        interval: float = 3.0,
+        key_column: str = None,
+        ignore_columns: List[str] = None,
+        history_size: int = 0,
+        callbacks: List[Callable] = None,
+        out_queue: queue.Queue = None,
+        capacity: int = 8192,
+        **kwargs,
+    ):
+        """
+        :param source: SPOT_POLLER_SOURCES 中的接口名称, 或返回实时行情数据框的函数
+        :type source: str or callable
+        :param interval: 轮询间隔, 单位: 秒
+        :type interval: float
+        :param key_column: 代码字段; source 为接口名称时可以为空
+        :type key_column: str
+        :param ignore_columns: 不参与比较的字段, 默认为 DEFAULT_IGNORE_COLUMNS
+        :type ignore_columns: list
+        :param history_size: 内存中保留的历史快照数量, 0 表示不保留
+        :type history_size: int
+        :param callbacks: 行情变化时调用的函数列表
+        :type callbacks: list
+        :param out_queue: 接收行情变化的队列
+        :type out_queue: queue.Queue
+        :param capacity: 缓冲区预先分配的行数, 代码数量超过时自动扩容
+        :type capacity: int
+        :param kwargs: 传给行情接口的参数, 如 futures_zh_spot 的 symbol
+        """
+        if isinstance(source, str):
+            if source not in SPOT_POLLER_SOURCES:
+                raise ValueError(
+                    f"source 只能为 {', '.join(SPOT_POLLER_SOURCES)} 或函数"
+                )
+            module, default_key = SPOT_POLLER_SOURCES[source]
+            source = getattr(importlib.import_module(module), source)
+            key_column = key_column or default_key
+        elif key_column is None:
+            raise ValueError("source 为函数时需要设置 key_column")
+        # 轮询时跳过接口结果缓存
+        self._func = getattr(source, "__wrapped__", source)
+        self._kwargs = kwargs
+        self.interval = float(interval)
+        self.key_column = key_column
+        self.ignore_columns = (
+            DEFAULT_IGNORE_COLUMNS if ignore_columns is None else list(ignore_columns)
+        )
+        self.history_size = int(history_size)
+        self.callbacks = list(callbacks) if callbacks else []
+        self.out_queue = out_queue
+        self.last_error: Optional[Exception] = None
+        self.poll_count = 0
+
+        self._capacity = int(capacity)
+        self._size = 0
+        self._key_pos = {}
+        self._keys = np.empty(self._capacity, dtype=object)
+        self._numeric_columns: Optional[List[str]] = None
+        self._object_columns: List[str] = []
+        self._numeric = np.empty((0, 0))
+        self._objects = np.empty((0, 0), dtype=object)
+        self._history = np.empty((0, 0, 0))
+        self._history_time = np.full(self.history_size, np.nan)
+        self._history_count = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _init_columns(self, temp_df: pd.DataFrame) -> None:
+        """
+        根据第一次请求的数据确定参与比较的数值字段和其他字段, 并分配缓冲区
+        """
+        compare_columns = [
+            item
+            for item in temp_df.columns
+            if item != self.key_column and item not in self.ignore_columns
+        ]
+        self._numeric_columns = [
+            item
+            for item in compare_columns
+            if pd.api.types.is_numeric_dtype(temp_df[item])
+        ]
+        self._object_columns = [
+            item for item in compare_columns if item not in self._numeric_columns
+        ]
+        self._numeric = np.full(
+            (self._capacity, len(self._numeric_columns)), np.nan
+        )
+        self._objects = np.full(
+            (self._capacity, len(self._object_columns)), None, dtype=object
+        )
+        if self.history_size > 0:
+            self._history = np.full(
+                (self.history_size, self._capacity, len(self._numeric_columns)),
+                np.nan,
+            )
+
+    def _grow(self, size: int) -> None:
+        """
+        缓冲区容量不足时按倍数扩容
+        """
+        capacity = self._capacity
+        while capacity < size:
+            capacity *= 2
+        if capacity == self._capacity:
+            return
+        extra = capacity - self._capacity
+        self._keys = np.concatenate([self._keys, np.empty(extra, dtype=object)])
+        self._numeric = np.concatenate(
+            [self._numeric, np.full((extra, self._numeric.shape[1]), np.nan)]
+        )
+        self._objects = np.concatenate(
+            [
+                self._objects,
+                np.full((extra, self._objects.shape[1]), None, dtype=object),
+            ]
+        )
+        if self.history_size > 0:
+            self._history = np.concatenate(
+                [
+                    self._history,
+                    np.full(
+                        (self.history_size, extra, self._history.shape[2]), np.nan
+                    ),
+                ],
+                axis=1,
+            )
+        self._capacity = capacity
+
+    def update(self, temp_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        用一次请求的结果更新缓冲区
+        :param temp_df: 实时行情
+        :type temp_df: pandas.DataFrame
+        :return: 发生变化的行, 及对应字段是否变化
+        :rtype: tuple
+        """
+        temp_df = temp_df.drop_duplicates(subset=[self.key_column], keep="last")
+        temp_df.reset_index(drop=True, inplace=True)
+        with self._lock:
+            if self._numeric_columns is None:
+                self._init_columns(temp_df)
+            key_list = temp_df[self.key_column].astype(str).tolist()
+            new_key_list = [item for item in key_list if item not in self._key_pos]
+            if new_key_list:
+                self._grow(self._size + len(new_key_list))
+                for item in new_key_list:
+                    self._key_pos[item] = self._size
+                    self._keys[self._size] = item
+                    self._size += 1
+            pos = np.fromiter(
+                (self._key_pos[item] for item in key_list), dtype="int64"
+            )
+            numeric = (
+                temp_df.reindex(columns=self._numeric_columns)
+                .apply(pd.to_numeric, errors="coerce")
+                .to_numpy(dtype="float64")
+            )
+            objects = temp_df.reindex(columns=self._object_columns).to_numpy(
+                dtype=object
+            )
+            old_numeric = self._numeric[pos]
+            numeric_changed = ~(
+                (old_numeric == numeric)
+                | (np.isnan(old_numeric) & np.isnan(numeric))
+            )
+            object_changed = self._objects[pos] != objects
+            mask = np.concatenate([numeric_changed, object_changed], axis=1)
+            mask[np.isin(temp_df[self.key_column].astype(str), new_key_list)] = True
+            self._numeric[pos] = numeric
+            self._objects[pos] = objects
+            if self.history_size > 0:
+                slot = self._history_count % self.history_size
+                self._history[slot] = self._numeric
+                self._history_time[slot] = time.time()
+                self._history_count += 1
+            self.poll_count += 1
+        row_changed = mask.any(axis=1)
+        delta_df = temp_df[row_changed].reset_index(drop=True)
+        mask_df = pd.DataFrame(
+            mask[row_changed],
+            columns=self._numeric_columns + self._object_columns,
+        )
+        mask_df.insert(0, self.key_column, delta_df[self.key_column].to_numpy())
+        return delta_df, mask_df
+
+    def poll_once(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        请求一次实时行情, 更新缓冲区并通知回调函数和队列
+        :return: 发生变化的行, 及对应字段是否变化
+        :rtype: tuple
+        """
+        temp_df = self._func(**self._kwargs)
+        delta_df, mask_df = self.update(temp_df)
+        if self.out_queue is not None:
+            self.out_queue.put((time.time(), delta_df, mask_df))
+        for callback in self.callbacks:
+            callback(delta_df, mask_df)
+        return delta_df, mask_df
+
+    def snapshot(self) -> pd.DataFrame:
+        """
+        缓冲区中每个代码的最新行情
+        :return: 最新行情
+        :rtype: pandas.DataFrame
+        """
+        with self._lock:
+            if self._numeric_columns is None:
+                return pd.DataFrame()
+            temp_df = pd.DataFrame(
+                self._numeric[: self._size].copy(), columns=self._numeric_columns
+            )
+            for i, item in enumerate(self._object_columns):
+                temp_df[item] = self._objects[: self._size, i]
+            temp_df.insert(0, self.key_column, self._keys[: self._size].copy())
+        return temp_df
+
+    def history(self, column: str) -> pd.DataFrame:
+        """
+        内存中保留的历史快照
+        :param column: 数值字段, e.g., "最新价"
+        :type column: str
+        :return: 历史快照, 索引为请求时间, 字段为代码
+        :rtype: pandas.DataFrame
+        """
+        if self.history_size <= 0:
+            raise ValueError("创建 SpotPoller 时需设置 history_size")
+        with self._lock:
+            if self._numeric_columns is None or self._history_count == 0:
+                return pd.DataFrame()
+            i = self._numeric_columns.index(column)
+            count = min(self._history_count, self.history_size)
+            order = (
+                np.arange(self._history_count - count, self._history_count)
+                % self.history_size
+            )
+            temp_df = pd.DataFrame(
+                self._history[order, : self._size, i],
+                index=pd.to_datetime(self._history_time[order], unit="s"),
+                columns=self._keys[: self._size],
+            )
+        return temp_df
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            start = time.monotonic()
+            try:
+                self.poll_once()
+            except Exception as e:
+                self.last_error = e
+            self._stop_event.wait(max(self.interval - (time.monotonic() - start), 0))
+
+    def start(self) -> "SpotPoller":
+        """
+        在后台线程中开始轮询
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = None) -> None:
+        """
+        停止后台线程中的轮询
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    async def run_async(self) -> None:
+        """
+        在协程中轮询, 请求在线程池中执行; 取消该协程即停止轮询
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            start = time.monotonic()
+            try:
+                await loop.run_in_executor(None, self.poll_once)
+            except Exception as e:
+                self.last_error = e
+            await asyncio.sleep(max(self.interval - (time.monotonic() - start), 0))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+
+if __name__ == "__main__":
+    spot_poller = SpotPoller(
+        "stock_zh_a_spot_em",
+        interval=3,
+        history_size=100,
+        callbacks=[lambda delta_df, mask_df: print(delta_df)],
+    )
+    with spot_poller:
+        time.sleep(10)
+    print(spot_poller.history("最新价"))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 请求限速工具, 多线程并发抓取时按数据源(交易所、主机)限制请求频率
+"""
+
+import threading
+import time
+from typing import Dict
+
+
+class RateLimiter:
+    """
+    令牌桶限速器, 线程安全
+    rate 为每秒允许的请求数, burst 为允许瞬时突发的请求数
+    """
+
+    def __init__(self, rate: float = 2.0, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate 必须大于 0")
+        self.rate = float(rate)
+        self.burst = max(int(burst), 1)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        获取一个令牌, 令牌不足时阻塞等待
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, rate: float = 2.0, burst: int = 1) -> RateLimiter:
+    """
+    获取指定数据源的共享限速器, 同一个 key 在进程内共用一个令牌桶
+    :param key: 数据源标识, 如交易所代码 "DCE" 或主机名
+    :type key: str
+    :param rate: 每秒请求数; 仅在首次创建时生效
+    :type rate: float
+    :param burst: 允许瞬时突发的请求数; 仅在首次创建时生效
+    :type burst: int
+    :return: 限速器
+    :rtype: RateLimiter
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(rate=rate, burst=burst)
+            _limiters[key] = limiter
+        return limiter
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 数据框的 Arrow IPC 和 Parquet 序列化
+直接按列转换为 Arrow 格式, 不逐行生成字典或文本; 读取磁盘上的 Arrow 文件时使用内存映射, 数值列不复制数据
+需要安装 pyarrow: pip install pyarrow
+"""
+
+import pathlib
+from typing import Iterator, Optional, Union
+
+import pandas as pd
+
+# Arrow IPC 文件格式的文件头, 流格式没有文件头
+_ARROW_FILE_MAGIC = b"ARROW1"
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("Arrow IPC 和 Parquet 格式需要安装 pyarrow: pip install pyarrow")
+    return pa
+
+
+def to_arrow_table(temp_df: pd.DataFrame, preserve_index: Optional[bool] = None):
+    """
+    数据框转换为 Arrow 表; 混合类型的字段转换为字符串
+    :param temp_df: 数据框
+    :type temp_df: pandas.DataFrame
+    :param preserve_index: 是否保存索引; None 表示 RangeIndex 只保存元数据, 其他索引保存为字段
+    :type preserve_index: bool
+    :return: Arrow 表
+    :rtype: pyarrow.Table
+    """
+    pa = _pyarrow()
+    try:
+        return pa.Table.from_pandas(temp_df, preserve_index=preserve_index)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        temp_df = temp_df.copy()
+        for item in temp_df.columns[temp_df.dtypes == object]:
+            temp_df[item] = temp_df[item].astype(str)
+        return pa.Table.from_pandas(temp_df, preserve_index=preserve_index)
+
+
+class _ChunkSink:
+    """
+    收集 Arrow 写入的数据, 每写完一批后取出
+    """
+
+    closed = False
+
+    def __init__(self):
+        self.chunk_list = []
+
+    def write(self, data) -> int:
+        self.chunk_list.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self.chunk_list)
+        self.chunk_list = []
+        return data
+
+
+def iter_arrow_ipc(
+    temp_df: pd.DataFrame,
+    chunk_rows: int = 65536,
+    preserve_index: Optional[bool] = None,
+) -> Iterator[bytes]:
+    """
+    数据框转换为 Arrow IPC 流, 逐批输出, 适合边转换边发送
+    :param temp_df: 数据框
+    :type temp_df: pandas.DataFrame
+    :param chunk_rows: 每批的最大行数
+    :type chunk_rows: int
+    :param preserve_index: 是否保存索引, 见 to_arrow_table
+    :type preserve_index: bool
+    :return: 依次为 schema 和各批数据, 拼接后即为完整的 Arrow IPC 流
+    :rtype: iterator
+    """
+    pa = _pyarrow()
+    table = to_arrow_table(temp_df, preserve_index=preserve_index)
+    sink = _ChunkSink()
+    writer = pa.ipc.new_stream(sink, table.schema)
+    yield sink.take()
+    for batch in table.to_batches(max_chunksize=chunk_rows):
+        writer.write_batch(batch)
+        yield sink.take()
+    writer.close()
+    yield sink.take()
+
+
+def to_arrow_ipc(temp_df: pd.DataFrame, preserve_index: Optional[bool] = None):
+    """
+    数据框转换为 Arrow IPC 流
+    :param temp_df: 数据框
+    :type temp_df: pandas.DataFrame
+    :param preserve_index: 是否保存索引, 见 to_arrow_table
+    :type preserve_index: bool
+    :return: Arrow IPC 流; 支持缓冲区协议, 可直接写入文件或套接字, bytes(buffer) 转换为 bytes
+    :rtype: pyarrow.Buffer
+    """
+    pa = _pyarrow()
+    table = to_arrow_table(temp_df, preserve_index=preserve_index)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def to_parquet_bytes(
+    temp_df: pd.DataFrame,
+    compression: str = "zstd",
+    preserve_index: Optional[bool] = None,
+):
+    """
+    数据框转换为 Parquet 文件内容
+    :param temp_df: 数据框
+    :type temp_df: pandas.DataFrame
+    :param compression: 压缩方式, choice of {"zstd", "snappy", "gzip", "none"}
+    :type compression: str
+    :param preserve_index: 是否保存索引, 见 to_arrow_table
+    :type preserve_index: bool
+    :return: Parquet 文件内容; 支持缓冲区协议
+    :rtype: pyarrow.Buffer
+    """
+    pa = _pyarrow()
+    import pyarrow.parquet as pq
+
+    table = to_arrow_table(temp_df, preserve_index=preserve_index)
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, compression=compression)
+    return sink.getvalue()
+
+
+def from_arrow_ipc(data) -> pd.DataFrame:
+    """
+    读取 Arrow IPC 流或文件格式的数据
+    :param data: Arrow IPC 数据, bytes 或 pyarrow.Buffer
+    :type data: bytes
+    :return: 数据框
+    :rtype: pandas.DataFrame
+    """
+    pa = _pyarrow()
+    buffer = pa.py_buffer(data) if not isinstance(data, pa.Buffer) else data
+    if buffer.size >= 6 and buffer[:6].to_pybytes() == _ARROW_FILE_MAGIC:
+        table = pa.ipc.open_file(buffer).read_all()
+    else:
+        table = pa.ipc.open_stream(buffer).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def read_arrow(path: Union[str, pathlib.Path]) -> pd.DataFrame:
+    """
+    使用内存映射读取 Arrow IPC 文件, 支持流格式和文件格式; 数值列直接引用映射的内存, 不复制数据
+    :param path: 文件路径
+    :type path: str
+    :return: 数据框; 引用映射内存的列为只读, 需要原地修改时先 copy()
+    :rtype: pandas.DataFrame
+    """
+    pa = _pyarrow()
+    with pa.memory_map(str(path), "r") as source:
+        if source.read(6) == _ARROW_FILE_MAGIC:
+            table = pa.ipc.open_file(source).read_all()
+        else:
+            source.seek(0)
+            table = pa.ipc.open_stream(source).read_all()
+    # split_blocks 避免合并同类型的列时复制数据
+    return table.to_pandas(split_blocks=True)
+
+
+def write_arrow(
+    temp_df: pd.DataFrame,
+    path: Union[str, pathlib.Path],
+    preserve_index: Optional[bool] = None,
+) -> None:
+    """
+    保存为 Arrow IPC 文件格式, 先写入临时文件再替换, 读取时可使用内存映射
+    :param temp_df: 数据框
+    :type temp_df: pandas.DataFrame
+    :param path: 文件路径
+    :type path: str
+    :param preserve_index: 是否保存索引, 见 to_arrow_table
+    :type preserve_index: bool
+    """
+    pa = _pyarrow()
+    from akshare.utils.cache import _atomic_write
+
+    table = to_arrow_table(temp_df, preserve_index=preserve_index)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    _atomic_write(pathlib.Path(path), sink.getvalue())
+
+
+if __name__ == "__main__":
+    demo_df = pd.DataFrame({"代码": ["600000", "000001"], "最新价": [10.0, 11.0]})
+    print(len(to_arrow_ipc(demo_df)), len(to_parquet_bytes(demo_df)))
+    print(from_arrow_ipc(to_arrow_ipc(demo_df)))
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 共享数据源
+多个接口读取同一份原始数据再各取所需时, 原始数据在有效期内只下载和解析一次;
+并发调用时只有一个线程请求, 其余线程等待结果
+"""
+
+import functools
+import threading
+import time
+from typing import Callable, Dict, Tuple
+
+
+def shared_source(ttl: float = 300) -> Callable:
+    """
+    共享数据源装饰器, 按调用参数缓存被装饰函数的返回值
+    被装饰的函数应返回解析后的完整数据, 调用方不应修改返回值; 返回值为空或抛出异常时不缓存
+    :param ttl: 有效期, 单位: 秒
+    :type ttl: float
+    :return: 装饰器; 被装饰的函数增加 clear() 方法用于清空缓存
+    :rtype: callable
+    """
+
+    def decorator(func: Callable) -> Callable:
+        entries: Dict[Tuple, Tuple[float, object]] = {}
+        locks: Dict[Tuple, threading.Lock] = {}
+        guard = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            with guard:
+                lock = locks.setdefault(key, threading.Lock())
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return entry[1]
+                value = func(*args, **kwargs)
+                if value is not None and not getattr(value, "empty", False):
+                    entries[key] = (time.monotonic() + ttl, value)
+                return value
+
+        def clear() -> None:
+            with guard:
+                entries.clear()
+
+        wrapper.clear = clear
+        return wrapper
+
+    return decorator
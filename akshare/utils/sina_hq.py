@@ -0,0 +1,382 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 新浪财经-实时行情 hq.sinajs.cn 批量请求
+一次 list= 请求可以包含多个代码, 代码按 URL 长度拆分为尽量少的请求并发获取, 返回的 var hq_str_X="..." 按代码前缀对应的字段解析
+支持的前缀: CON_OP_(上交所期权行情), CON_SO_(上交所期权希腊字母), nf_(国内期货), hf_(外盘期货), sh/sz(沪深证券)
+"""
+
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import pandas as pd
+import requests
+
+from akshare.utils.ratelimit import get_rate_limiter
+
+SINA_HQ_URL = "https://hq.sinajs.cn/"
+
+# 单个请求的代码数量和 list= 参数长度上限
+SINA_HQ_CHUNK_SIZE = 400
+SINA_HQ_MAX_LIST_LENGTH = 6000
+
+SINA_HQ_RATE_LIMIT = 10
+
+_HQ_HEADERS = {
+    "Accept": "*/*",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Cache-Control": "no-cache",
+    "Host": "hq.sinajs.cn",
+    "Pragma": "no-cache",
+    "Referer": "https://finance.sina.com.cn/",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/97.0.4692.71 Safari/537.36",
+}
+
+_HQ_PATTERN = re.compile(r'hq_str_([^=\s]+)="([^"]*)"')
+
+# 各前缀的字段, "_" 为不使用的字段; text 中的字段保留为字符串, 其余转换为数值
+SINA_HQ_SCHEMAS = {
+    "CON_OP_": {
+        "columns": [
+            "买量",
+            "买价",
+            "最新价",
+            "卖价",
+            "卖量",
+            "持仓量",
+            "涨幅",
+            "行权价",
+            "昨收价",
+            "开盘价",
+            "涨停价",
+            "跌停价",
+            "申卖价五",
+            "申卖量五",
+            "申卖价四",
+            "申卖量四",
+            "申卖价三",
+            "申卖量三",
+            "申卖价二",
+            "申卖量二",
+            "申卖价一",
+            "申卖量一",
+            "申买价一",
+            "申买量一",
+            "申买价二",
+            "申买量二",
+            "申买价三",
+            "申买量三",
+            "申买价四",
+            "申买量四",
+            "申买价五",
+            "申买量五",
+            "行情时间",
+            "主力合约标识",
+            "状态码",
+            "标的证券类型",
+            "标的股票",
+            "期权合约简称",
+            "振幅",
+            "最高价",
+            "最低价",
+            "成交量",
+            "成交额",
+        ],
+        "text": ["行情时间", "主力合约标识", "状态码", "标的证券类型", "标的股票", "期权合约简称"],
+    },
+    "CON_SO_": {
+        "columns": [
+            "期权合约简称",
+            "_",
+            "_",
+            "_",
+            "成交量",
+            "Delta",
+            "Gamma",
+            "Theta",
+            "Vega",
+            "隐含波动率",
+            "最高价",
+            "最低价",
+            "交易代码",
+            "行权价",
+            "最新价",
+            "理论价值",
+        ],
+        "text": ["期权合约简称", "交易代码"],
+    },
+    "nf_": {
+        "columns": [
+            "symbol",
+            "time",
+            "open",
+            "high",
+            "low",
+            "last_close",
+            "bid_price",
+            "ask_price",
+            "current_price",
+            "avg_price",
+            "last_settle_price",
+            "buy_vol",
+            "sell_vol",
+            "hold",
+            "volume",
+        ],
+        "text": ["symbol", "time"],
+    },
+    # 金融期货的字段顺序与商品期货不同, 第一个字段为数值
+    "nf_FF": {
+        "columns": ["open", "high", "low", "current_price", "volume", "amount", "hold"]
+        + ["_"] * 30
+        + ["time"]
+        + ["_"] * 11
+        + ["symbol"],
+        "text": ["symbol", "time"],
+    },
+    "hf_": {
+        "columns": [
+            "current_price",
+            "_",
+            "bid",
+            "ask",
+            "high",
+            "low",
+            "time",
+            "last_settle_price",
+            "open",
+            "hold",
+            "_",
+            "_",
+            "date",
+            "symbol",
+            "current_price_rmb",
+        ],
+        "text": ["time", "date", "symbol"],
+    },
+    "sh": {
+        "columns": [
+            "证券简称",
+            "今日开盘价",
+            "昨日收盘价",
+            "最近成交价",
+            "最高成交价",
+            "最低成交价",
+            "买入价",
+            "卖出价",
+            "成交数量",
+            "成交金额",
+            "买数量一",
+            "买价位一",
+            "买数量二",
+            "买价位二",
+            "买数量三",
+            "买价位三",
+            "买数量四",
+            "买价位四",
+            "买数量五",
+            "买价位五",
+            "卖数量一",
+            "卖价位一",
+            "卖数量二",
+            "卖价位二",
+            "卖数量三",
+            "卖价位三",
+            "卖数量四",
+            "卖价位四",
+            "卖数量五",
+            "卖价位五",
+            "行情日期",
+            "行情时间",
+            "停牌状态",
+        ],
+        "text": ["证券简称", "行情日期", "行情时间", "停牌状态"],
+    },
+}
+SINA_HQ_SCHEMAS["sz"] = SINA_HQ_SCHEMAS["sh"]
+
+_PREFIX_LIST = ["CON_OP_", "CON_SO_", "nf_", "hf_", "sh", "sz"]
+
+
+def sina_hq_prefix(code: str) -> str:
+    """
+    新浪行情代码的前缀
+    :param code: 行情代码, e.g., "CON_OP_10003720"
+    :type code: str
+    :return: 前缀, 不支持的代码返回空字符串
+    :rtype: str
+    """
+    for prefix in _PREFIX_LIST:
+        if code.startswith(prefix):
+            return prefix
+    return ""
+
+
+def _hq_chunks(code_list: List[str], chunk_size: int) -> List[List[str]]:
+    """
+    按代码数量和 list= 参数长度拆分请求
+    """
+    chunk_list = []
+    chunk = []
+    length = 0
+    for code in code_list:
+        if chunk and (
+            len(chunk) >= chunk_size or length + len(code) + 1 > SINA_HQ_MAX_LIST_LENGTH
+        ):
+            chunk_list.append(chunk)
+            chunk = []
+            length = 0
+        chunk.append(code)
+        length += len(code) + 1
+    if chunk:
+        chunk_list.append(chunk)
+    return chunk_list
+
+
+def _hq_request(chunk: List[str]) -> str:
+    """
+    请求一组代码的实时行情
+    """
+    # 与网页中 Math.round(Math.random() * 2147483648).toString(16) 的随机数一致
+    rn_code = format(random.randint(0, 2147483648), "x")
+    url = f"{SINA_HQ_URL}rn={rn_code}&list={','.join(chunk)}"
+    with get_rate_limiter("hq.sinajs.cn", rate=SINA_HQ_RATE_LIMIT):
+        r = requests.get(url, headers=_HQ_HEADERS, timeout=15)
+    r.encoding = "gbk"
+    return r.text
+
+
+def sina_hq_parse(text: str) -> Dict[str, List[str]]:
+    """
+    解析 hq.sinajs.cn 返回的文本
+    :param text: 返回的文本, e.g., 'var hq_str_nf_V2309="PVC2309,...";'
+    :type text: str
+    :return: 代码对应的原始字段, 无数据的代码对应空列表
+    :rtype: dict
+    """
+    return {
+        code: value.split(",") if value else []
+        for code, value in _HQ_PATTERN.findall(text)
+    }
+
+
+def sina_hq_fetch(
+    code_list: List[str],
+    chunk_size: int = SINA_HQ_CHUNK_SIZE,
+    max_workers: int = 4,
+) -> Dict[str, List[str]]:
+    """
+    新浪财经-批量请求实时行情的原始字段
+    :param code_list: 带前缀的行情代码, 可以混合不同前缀, e.g., ["CON_OP_10003720", "CON_SO_10003720", "sh510050"]
+    :type code_list: list
+    :param chunk_size: 单个请求的最大代码数量
+    :type chunk_size: int
+    :param max_workers: 并发请求数
+    :type max_workers: int
+    :return: 代码对应的原始字段, 顺序与 code_list 一致
+    :rtype: dict
+    """
+    code_list = list(dict.fromkeys(code_list))
+    chunk_list = _hq_chunks(code_list, chunk_size)
+    if len(chunk_list) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunk_list))) as ex:
+            text_list = list(ex.map(_hq_request, chunk_list))
+    else:
+        text_list = [_hq_request(chunk) for chunk in chunk_list]
+    raw_dict = {}
+    for text in text_list:
+        raw_dict.update(sina_hq_parse(text))
+    return {code: raw_dict[code] for code in code_list if code in raw_dict}
+
+
+def _schema_key(prefix: str, fields: List[str]) -> str:
+    """
+    根据前缀和字段内容选择字段定义
+    """
+    if prefix == "nf_":
+        try:
+            float(fields[0])
+            return "nf_FF"
+        except ValueError:
+            return "nf_"
+    return prefix
+
+
+def sina_hq_frame(raw_dict: Dict[str, List[str]], prefix: str) -> pd.DataFrame:
+    """
+    同一前缀的原始字段转换为数据框
+    :param raw_dict: sina_hq_fetch 的返回值
+    :type raw_dict: dict
+    :param prefix: 代码前缀, e.g., "CON_OP_"
+    :type prefix: str
+    :return: 实时行情, 索引为行情代码, 无数据的代码被过滤
+    :rtype: pandas.DataFrame
+    """
+    group_dict = {}
+    for code, fields in raw_dict.items():
+        if fields and sina_hq_prefix(code) == prefix:
+            group_dict.setdefault(_schema_key(prefix, fields), []).append(
+                (code, fields)
+            )
+    frame_list = []
+    for key, item_list in group_dict.items():
+        schema = SINA_HQ_SCHEMAS[key]
+        columns = schema["columns"]
+        position_list = [i for i, item in enumerate(columns) if item != "_"]
+        temp_df = pd.DataFrame(
+            [
+                [fields[i] if i < len(fields) else None for i in position_list]
+                for _, fields in item_list
+            ],
+            index=pd.Index([code for code, _ in item_list], name="code"),
+            columns=[columns[i] for i in position_list],
+        )
+        for item in temp_df.columns:
+            if item not in schema["text"]:
+                temp_df[item] = pd.to_numeric(temp_df[item], errors="coerce")
+        frame_list.append(temp_df)
+    if not frame_list:
+        return pd.DataFrame(index=pd.Index([], name="code"))
+    temp_df = pd.concat(frame_list) if len(frame_list) > 1 else frame_list[0]
+    return temp_df.reindex([code for code in raw_dict if code in temp_df.index])
+
+
+def sina_hq_quote(
+    code_list: List[str],
+    chunk_size: int = SINA_HQ_CHUNK_SIZE,
+    max_workers: int = 4,
+) -> Dict[str, pd.DataFrame]:
+    """
+    新浪财经-批量实时行情
+    https://hq.sinajs.cn/
+    :param code_list: 带前缀的行情代码, 可以混合不同前缀, e.g., ["CON_OP_10003720", "nf_V2309", "hf_CL", "sh510050"]
+    :type code_list: list
+    :param chunk_size: 单个请求的最大代码数量
+    :type chunk_size: int
+    :param max_workers: 并发请求数
+    :type max_workers: int
+    :return: 前缀对应的实时行情, 索引为行情代码
+    :rtype: dict
+    """
+    unknown_list = [code for code in code_list if not sina_hq_prefix(code)]
+    if unknown_list:
+        raise ValueError(
+            f"不支持的代码: {', '.join(unknown_list[:5])}, 前缀只能为 {', '.join(_PREFIX_LIST)}"
+        )
+    raw_dict = sina_hq_fetch(code_list, chunk_size=chunk_size, max_workers=max_workers)
+    prefix_list = list(dict.fromkeys(sina_hq_prefix(code) for code in raw_dict))
+    return {prefix: sina_hq_frame(raw_dict, prefix) for prefix in prefix_list}
+
+
+if __name__ == "__main__":
+    sina_hq_quote_dict = sina_hq_quote(
+        code_list=["CON_OP_10003720", "CON_SO_10003720", "nf_V2309", "sh510050"]
+    )
+    for sina_hq_prefix_name, sina_hq_quote_df in sina_hq_quote_dict.items():
+        print(sina_hq_prefix_name)
+        print(sina_hq_quote_df)
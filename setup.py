@@ -67,6 +67,11 @@ setuptools.setup(
             "akqmt",
         ],
     },
+    entry_points={
+        "console_scripts": [
+            "akshare-dl=akshare.tool.downloader:main",
+        ],
+    },
     package_data={"": ["*.py", "*.json", "*.pk", "*.js", "*.zip"]},
     keywords=[
         "stock",
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: K 线周期转换测试
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from akshare.cal.bar_resample import bar_resample
+
+
+def _minute_bars(day: str, sessions: list) -> pd.DatetimeIndex:
+    """
+    生成交易时段内每分钟的 K 线时间, 包含每个时段的开始时刻
+    """
+    ts_list = []
+    for start, end in sessions:
+        start_ts = pd.Timestamp(f"{day} {start}")
+        end_ts = pd.Timestamp(f"{day} {end}")
+        if end_ts < start_ts:
+            end_ts += pd.Timedelta(days=1)
+        ts_list.extend(pd.date_range(start_ts, end_ts, freq="min"))
+    return pd.DatetimeIndex(ts_list)
+
+
+def test_stock_minute_bars():
+    """
+    A 股分钟线不跨午间休市, 集合竞价并入第一根 K 线
+    """
+    ts = _minute_bars("2024-01-02", [("09:30", "11:30"), ("13:01", "15:00")])
+    close = 10 + np.arange(len(ts)) * 0.01
+    bar_df = pd.DataFrame(
+        {
+            "时间": ts.strftime("%Y-%m-%d %H:%M:%S"),
+            "开盘": close,
+            "收盘": close,
+            "最高": close + 0.05,
+            "最低": close - 0.05,
+            "成交量": 1,
+            "成交额": 10.0,
+        }
+    )
+    hour_df = bar_resample(bar_df, period="60")
+    assert list(hour_df["时间"].str[11:16]) == ["10:30", "11:30", "14:00", "15:00"]
+    assert list(hour_df["成交量"]) == [61, 60, 60, 60]
+    assert hour_df["开盘"].iloc[0] == pytest.approx(10)
+    assert hour_df["收盘"].iloc[-1] == pytest.approx(close[-1])
+    five_df = bar_resample(bar_df, period="5")
+    assert len(five_df) == 48
+    assert five_df["时间"].iloc[0] == "2024-01-02 09:35:00"
+    assert five_df["成交量"].sum() == len(bar_df)
+
+
+def test_futures_night_session():
+    """
+    周五夜盘属于下一个交易日, 小节休息不计入 K 线时长
+    """
+    ts = _minute_bars("2024-01-05", [("21:00", "23:00")]).append(
+        _minute_bars(
+            "2024-01-08", [("09:00", "10:15"), ("10:30", "11:30"), ("13:30", "15:00")]
+        )
+    )
+    bar_df = pd.DataFrame(
+        {
+            "datetime": ts,
+            "open": 1.0,
+            "high": 2.0,
+            "low": 0.5,
+            "close": 1.5,
+            "volume": 1,
+            "hold": np.arange(len(ts)),
+        }
+    )
+    hour_df = bar_resample(bar_df, period="60", sessions="futures")
+    assert list(hour_df["datetime"].dt.strftime("%d %H:%M")) == [
+        "05 22:00",
+        "05 23:00",
+        "08 10:00",
+        "08 11:15",
+        "08 14:15",
+        "08 15:00",
+    ]
+    daily_df = bar_resample(bar_df, period="daily", sessions="futures")
+    assert list(daily_df["datetime"]) == [pd.Timestamp("2024-01-08")]
+    assert daily_df["volume"].iloc[0] == len(bar_df)
+    assert daily_df["hold"].iloc[0] == len(bar_df) - 1
+
+
+def test_holiday_week():
+    """
+    春节所在的周没有交易日; 周线的涨跌幅相对上一周的收盘价计算
+    """
+    date_list = pd.bdate_range("2024-02-05", "2024-02-23")
+    date_list = date_list[(date_list < "2024-02-09") | (date_list > "2024-02-18")]
+    close = np.arange(2, len(date_list) + 2, dtype="float64")
+    bar_df = pd.DataFrame(
+        {
+            "日期": date_list.date,
+            "股票代码": "000001",
+            "开盘": close,
+            "收盘": close,
+            "最高": close + 1,
+            "最低": close - 1,
+            "成交量": 100,
+            "涨跌额": 1.0,
+            "涨跌幅": 1 / (close - 1) * 100,
+            "振幅": 0.0,
+            "换手率": 0.5,
+        }
+    )
+    weekly_df = bar_resample(bar_df, period="weekly")
+    assert list(weekly_df["日期"]) == [
+        datetime.date(2024, 2, 8),
+        datetime.date(2024, 2, 23),
+    ]
+    assert list(weekly_df["成交量"]) == [400, 500]
+    assert list(weekly_df["涨跌额"]) == [4.0, 5.0]
+    assert weekly_df["涨跌幅"].iloc[1] == pytest.approx(100.0)
+    assert weekly_df["振幅"].iloc[1] == pytest.approx((11 - 5) / 5 * 100)
+    assert weekly_df["换手率"].iloc[1] == pytest.approx(2.5)
+    assert list(weekly_df.columns) == list(bar_df.columns)
+
+
+def test_night_session_beyond_calendar():
+    """
+    交易日历未覆盖的日期, 周五夜盘属于下周一
+    """
+    ts = _minute_bars("2026-10-16", [("21:00", "23:00")]).append(
+        _minute_bars("2026-10-19", [("09:00", "10:15")])
+    )
+    bar_df = pd.DataFrame(
+        {"datetime": ts, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5}
+    )
+    daily_df = bar_resample(bar_df, period="daily", sessions="futures")
+    assert list(daily_df["datetime"]) == [pd.Timestamp("2026-10-19")]
+
+
+def test_average_price():
+    """
+    均价为周期内的成交额除以成交量, 成交量以手为单位时换算为每股价格
+    """
+    ts = _minute_bars("2024-01-02", [("09:31", "09:40")])
+    close = np.array([10.0] * 5 + [11.0] * 5)
+    volume = np.array([1] * 5 + [3] * 5)
+    bar_df = pd.DataFrame(
+        {
+            "时间": ts.strftime("%Y-%m-%d %H:%M:%S"),
+            "开盘": close,
+            "收盘": close,
+            "最高": close,
+            "最低": close,
+            "成交量": volume,
+            "成交额": close * volume * 100,
+            "均价": close,
+        }
+    )
+    ten_df = bar_resample(bar_df, period="10")
+    assert ten_df["均价"].iloc[0] == pytest.approx((50 + 165) / 20)
+    five_df = bar_resample(bar_df, period="5")
+    assert list(five_df["均价"]) == pytest.approx([10.0, 11.0])
+
+
+if __name__ == "__main__":
+    test_stock_minute_bars()
+    test_futures_night_session()
+    test_holiday_week()
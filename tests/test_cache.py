@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 本地磁盘缓存测试
+"""
+
+import pandas as pd
+
+from akshare import cache as result_cache
+from akshare.utils import cache
+from akshare.utils.context import get_cache_dir, set_cache_dir
+
+
+def test_fetch_raw(tmp_path):
+    """
+    历史日期只请求一次网络, 相同内容只保存一份
+    """
+    old_cache_dir = get_cache_dir()
+    set_cache_dir(str(tmp_path))
+    call_list = []
+
+    def fetch():
+        call_list.append(1)
+        return b'{"data": [1]}'
+
+    try:
+        for date in ["20200102", "20200103"]:
+            for _ in range(3):
+                data = cache.fetch_raw(
+                    "DCE", date, "daily", fetch, validate=cache.is_json
+                )
+                assert data == b'{"data": [1]}'
+        assert len(call_list) == 2
+        object_list = (tmp_path / "raw" / "objects").rglob("*")
+        assert len([item for item in object_list if item.is_file()]) == 1
+        cache.fetch_raw("DCE", "29991231", "daily", fetch)
+        cache.fetch_raw("DCE", "29991231", "daily", fetch)
+        assert len(call_list) == 4
+    finally:
+        set_cache_dir(old_cache_dir)
+
+
+def test_result_cache():
+    """
+    相同参数的调用命中缓存, 缓存关闭时直接调用原接口
+    """
+    call_list = []
+
+    @result_cache.cached(family="historical")
+    def demo(symbol: str = "000001", end_date: str = "20200110") -> pd.DataFrame:
+        call_list.append(symbol)
+        return pd.DataFrame({"symbol": [symbol], "value": [1.0]})
+
+    demo()
+    assert len(call_list) == 1
+    result_cache.enable(backend="memory")
+    try:
+        demo()
+        demo(symbol="000001")
+        temp_df = demo("000001", end_date="20200110")
+        temp_df["value"] = 2.0
+        assert demo()["value"].iloc[0] == 1.0
+        assert len(call_list) == 2
+        stats_df = result_cache.stats()
+        assert stats_df.set_index("name").loc["demo", "hits"] == 3
+    finally:
+        result_cache.disable()
+        result_cache.clear()
+
+
+def test_result_cache_ttl():
+    """
+    结束日期早于今天的历史行情永久有效, 前复权数据按每日更新
+    """
+    arguments = {"end_date": "20200110", "adjust": ""}
+    assert result_cache._ttl("demo", "historical", arguments, "end_date") is None
+    arguments["adjust"] = "hfq"
+    assert result_cache._ttl("demo", "historical", arguments, "end_date") is None
+    arguments["adjust"] = "qfq"
+    assert (
+        result_cache._ttl("demo", "historical", arguments, "end_date")
+        == result_cache.DEFAULT_POLICY["daily"]
+    )
+    arguments = {"end_date": "20500101", "adjust": ""}
+    assert (
+        result_cache._ttl("demo", "historical", arguments, "end_date")
+        == result_cache.DEFAULT_POLICY["historical"]
+    )
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    test_fetch_raw(pathlib.Path(tempfile.mkdtemp()))
+    test_result_cache()
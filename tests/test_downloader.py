@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 全市场批量下载工具测试
+"""
+
+import pandas as pd
+
+from akshare.tool import downloader
+
+
+def test_download_universe(monkeypatch, tmp_path):
+    """
+    每个股票保存为一个 Parquet 分区; 再次运行相同任务时只下载失败的股票
+    未指定结束日期时结束日期为当前交易日, 同一交易日内跨过零点再次运行仍为同一个任务
+    """
+    call_list = []
+    end_date_list = []
+    broken = {"000002"}
+
+    def fake_hist(symbol, period, start_date, end_date, adjust):
+        call_list.append(symbol)
+        end_date_list.append(end_date)
+        if symbol in broken:
+            raise ConnectionError
+        if symbol == "430139":
+            return pd.DataFrame()
+        return pd.DataFrame({"日期": ["2024-01-02", "2024-01-03"], "收盘": [1.0, 2.0]})
+
+    monkeypatch.setattr(downloader, "_resolve", lambda func_path: fake_hist)
+    monkeypatch.setattr(downloader.cons, "get_current_trading_day", lambda: "20240105")
+    universe_path = tmp_path / "all.txt"
+    universe_path.write_text("000001.SZ\nsh600000\n000002\n430139.BJ\n000001.SZ\n")
+    universe = downloader.load_universe(str(universe_path))
+    assert universe == [
+        ("000001", "sz"),
+        ("600000", "sh"),
+        ("000002", "sz"),
+        ("430139", "bj"),
+    ]
+    result_df = downloader.download_universe(
+        "daily",
+        universe=universe,
+        output=str(tmp_path / "out"),
+        retries=0,
+        report_interval=0,
+        start_date="20240101",
+    )
+    assert dict(zip(result_df["code"], result_df["status"])) == {
+        "000001": "ok",
+        "600000": "ok",
+        "000002": "error",
+        "430139": "empty",
+    }
+    temp_df = pd.read_parquet(tmp_path / "out" / "daily" / "code=600000" / "data.parquet")
+    assert temp_df["代码"].tolist() == ["600000", "600000"]
+    assert temp_df["收盘"].tolist() == [1.0, 2.0]
+    assert set(end_date_list) == {"20240105"}
+
+    call_list.clear()
+    broken.clear()
+    result_df = downloader.download_universe(
+        "daily",
+        universe=universe,
+        output=str(tmp_path / "out"),
+        report_interval=0,
+        start_date="20240101",
+    )
+    assert call_list == ["000002"]
+    assert result_df["status"].tolist() == ["ok"]
+
+    # 显式指定相同的结束日期时为同一个任务
+    call_list.clear()
+    downloader.download_universe(
+        "daily",
+        universe=universe,
+        output=str(tmp_path / "out"),
+        report_interval=0,
+        start_date="20240101",
+        end_date="20240105",
+    )
+    assert call_list == []
+
+    # 数据集参数不同时为新的任务, 不跳过已完成的股票
+    call_list.clear()
+    downloader.download_universe(
+        "daily",
+        universe=universe,
+        output=str(tmp_path / "out"),
+        report_interval=0,
+        start_date="20240102",
+    )
+    assert sorted(call_list) == ["000001", "000002", "430139", "600000"]
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 东方财富分钟行情时间窗口测试
+"""
+
+import pandas as pd
+import pytest
+
+from akshare.stock_feature import stock_hist_em
+from akshare.utils import hedge
+from akshare.utils.func import em_filter_rows, em_kline_range, em_time_window
+
+ROWS = [
+    f"{day} {minute},10.0,10.1,10.2,9.9,100,1000.0,1.0,0.1,0.01,0.02"
+    for day in ["2024-01-02", "2024-01-03"]
+    for minute in ["09:35", "09:40", "15:00"]
+]
+
+
+@pytest.mark.parametrize(
+    "start_date, end_date",
+    [
+        ("1979-09-01 09:32:00", "2222-01-01 09:32:00"),
+        ("2024-01-02 09:40:00", "2024-01-03 09:35:00"),
+        ("2024-01-02 09:36:00", "2024-01-02 09:39:00"),
+        ("2024-01-03", "2024-01-03"),
+        ("20240102", "20240102"),
+    ],
+)
+def test_em_filter_rows(start_date, end_date):
+    """
+    按时间窗口筛选的结果与 pandas 按时间字符串切片一致
+    """
+    start_key, end_key = em_time_window(start_date, end_date)
+    temp_df = pd.DataFrame([item.split(",") for item in ROWS])
+    temp_df.index = pd.to_datetime(temp_df[0])
+    expected = temp_df[start_date:end_date][0].tolist()
+    result = [item[0] for item in em_filter_rows(ROWS, start_key, end_key)]
+    assert result == expected
+
+
+def test_stock_zh_a_hist_min_em_window(monkeypatch):
+    """
+    时间窗口作为 beg 和 end 参数传给接口, 窗口外没有数据时返回带字段的空表
+    """
+    params_list = []
+
+    class FakeResponse:
+        ok = True
+
+        def json(self):
+            return {"data": {"klines": ROWS}}
+
+    def fake_get(url, timeout=None, params=None):
+        params_list.append(params)
+        return FakeResponse()
+
+    monkeypatch.setattr(hedge.requests, "get", fake_get)
+    temp_df = stock_hist_em.stock_zh_a_hist_min_em.__wrapped__(
+        symbol="000001",
+        start_date="2024-01-03 09:00:00",
+        end_date="2024-01-03 10:00:00",
+        period="5",
+    )
+    assert params_list[0]["beg"] == "20240103"
+    assert params_list[0]["end"] == "20240103"
+    assert list(temp_df["时间"]) == ["2024-01-03 09:35:00", "2024-01-03 09:40:00"]
+    empty_df = stock_hist_em.stock_zh_a_hist_min_em.__wrapped__(
+        symbol="000001",
+        start_date="2024-01-04 09:00:00",
+        end_date="2024-01-04 10:00:00",
+        period="5",
+    )
+    assert empty_df.empty
+    assert "收盘" in empty_df.columns
+    assert em_kline_range(*em_time_window("1979-09-01", "2222-01-01")) == {
+        "beg": "0",
+        "end": "20500000",
+    }
+
+
+def test_stock_zh_a_hist_min_em_trends(monkeypatch):
+    """
+    1 分钟数据始终请求接口支持的最大天数, 交易日历未覆盖的日期也不会少请求数据
+    """
+    params_list = []
+    trend_list = [
+        f"{day} 09:31,10.0,10.1,10.2,9.9,100,1000.0,10.0"
+        for day in ["2026-10-14", "2026-10-15", "2026-10-16"]
+    ]
+
+    class FakeResponse:
+        ok = True
+
+        def json(self):
+            return {"data": {"trends": trend_list}}
+
+    def fake_get(url, timeout=None, params=None):
+        params_list.append(params)
+        return FakeResponse()
+
+    monkeypatch.setattr(hedge.requests, "get", fake_get)
+    temp_df = stock_hist_em.stock_zh_a_hist_min_em.__wrapped__(
+        symbol="000001",
+        start_date="2026-10-15 09:30:00",
+        end_date="2026-10-16 15:00:00",
+        period="1",
+    )
+    assert params_list[0]["ndays"] == "5"
+    assert list(temp_df["时间"]) == ["2026-10-15 09:31:00", "2026-10-16 09:31:00"]
+
+
+if __name__ == "__main__":
+    test_em_filter_rows("2024-01-03", "2024-01-03")
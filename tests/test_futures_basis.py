@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 现货价格及基差测试
+"""
+
+import pandas as pd
+import pytest
+
+from akshare.futures import futures_basis
+
+
+def _spot_price_table(date: str, offset: float = 0) -> pd.DataFrame:
+    """
+    模拟生意社现货价格网页中的原始表格
+    """
+    table_df = pd.DataFrame(
+        {
+            "symbol": [
+                "商品",
+                "上海期货交易所",
+                "螺纹钢",
+                "郑州商品交易所",
+                "PTA",
+                "大连商品交易所",
+                "鸡蛋",
+                "未知商品",
+            ],
+            "spot_price": [
+                "现货价格",
+                "",
+                3500 + offset,
+                "",
+                5000,
+                "",
+                4.5,
+                1,
+            ],
+            "near_contract": [
+                "最近合约代码",
+                "",
+                "rb2405",
+                "",
+                "TA2405",
+                "",
+                "jd2405",
+                "x2405",
+            ],
+            "near_contract_price": [
+                "价格",
+                "",
+                3600,
+                "",
+                5100,
+                "",
+                4000,
+                1,
+            ],
+            "dominant_contract": [
+                "主力合约代码",
+                "",
+                "rb2410",
+                "",
+                "TA2409",
+                "",
+                "jd2409",
+                "x2409",
+            ],
+            "dominant_contract_price": [
+                "价格",
+                "",
+                3700,
+                "",
+                5200,
+                "",
+                4100,
+                1,
+            ],
+        },
+        dtype=object,
+    )
+    table_df.insert(0, "date", date)
+    return table_df
+
+
+def test_spot_price_records():
+    """
+    表头、交易所分组行和无法识别的商品被过滤, 换算现货单位后计算基差
+    """
+    records = futures_basis._spot_price_records(_spot_price_table("20240102"))
+    records = records.set_index("symbol")
+    assert list(records.index) == ["RB", "TA", "JD"]
+    assert list(records["near_contract"]) == ["rb2405", "TA405", "jd2405"]
+    assert list(records["dominant_contract"]) == ["rb2410", "TA409", "jd2409"]
+    assert records.loc["JD", "spot_price"] == pytest.approx(2250)
+    assert records.loc["RB", "dom_basis"] == pytest.approx(200)
+    assert records.loc["TA", "near_basis_rate"] == pytest.approx(5100 / 5000 - 1)
+
+
+def test_spot_price_range(monkeypatch):
+    """
+    多个交易日合并计算的结果与逐日请求的结果一致
+    """
+    date_list = []
+
+    def fake_table(date):
+        date_list.append(date)
+        return _spot_price_table(date.strftime("%Y%m%d"), offset=date.day)
+
+    monkeypatch.setattr(futures_basis, "_futures_spot_price_table", fake_table)
+    range_df = futures_basis.futures_spot_price_range(
+        start_day="20240102", end_day="20240110", vars_list=["TA", "RB"]
+    )
+    assert len(date_list) == 7
+    daily_df = pd.concat(
+        [
+            futures_basis.futures_spot_price.__wrapped__(
+                date=date, vars_list=["TA", "RB"]
+            )
+            for date in sorted(date_list)
+        ],
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(range_df, daily_df)
+    assert list(range_df["symbol"][:2]) == ["TA", "RB"]
+
+
+if __name__ == "__main__":
+    test_spot_price_records()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 期货品种交易参数库测试
+"""
+
+import pandas as pd
+
+from akshare.futures import futures_contract_spec, futures_zh_sina
+from akshare.utils import sina_hq
+
+
+def _fake_rule(date):
+    return pd.DataFrame(
+        {
+            "交易所": ["大商所", "中金所", "能源中心"],
+            "品种": ["PVC", "沪深300股指", "原油"],
+            "代码": ["v2409", "IF2406", "sc2407"],
+            "交易保证金比例": [7.0, 12.0, 10.0],
+            "合约乘数": [5, 300, 1000],
+            "最小变动价位": [1.0, 0.2, 0.1],
+        }
+    )
+
+
+def _fake_dce():
+    return pd.DataFrame(
+        {
+            "品种名称": ["PVC", "豆一"],
+            "合约": ["v2409", "a2409"],
+            "交易单位": ["5", "10"],
+            "最小变动价位": ["5", "1"],
+        }
+    )
+
+
+def test_futures_contract_spec(monkeypatch):
+    """
+    各数据源合并后按品种关联; adjust="1" 时实时行情只请求一次, 不再逐个合约请求合约详情
+    """
+    call_list = []
+
+    def fake_rule(date):
+        call_list.append(date)
+        return _fake_rule(date)
+
+    monkeypatch.setattr(futures_contract_spec, "_spec_memory", {})
+    monkeypatch.setattr(futures_contract_spec, "futures_rule", fake_rule)
+    monkeypatch.setattr(futures_contract_spec, "futures_contract_info_dce", _fake_dce)
+    monkeypatch.setattr(futures_contract_spec, "futures_contract_info_gfex", pd.DataFrame)
+    monkeypatch.setattr(
+        futures_contract_spec, "futures_contract_info_czce", lambda date: pd.DataFrame()
+    )
+    monkeypatch.setattr(
+        futures_contract_spec.cons, "get_current_trading_day", lambda: "20240603"
+    )
+    spec_df = futures_contract_spec.futures_contract_spec()
+    assert spec_df.loc["V", "tick_size"] == 1.0
+    assert spec_df.loc["A", "tick_size"] == 1.0
+    assert spec_df.loc["A", "multiplier"] == 10
+    assert spec_df.loc["SC", "exchange"] == "ine"
+    assert spec_df.loc["IF", "exchange_name"] == "中国金融期货交易所"
+    assert spec_df.loc["CU", "exchange"] == "shfe"
+
+    request_list = []
+
+    def fake_request(chunk):
+        request_list.append(chunk)
+        value = ",".join(["PVC2409", "100000", "6000"] + ["6001"] * 25)
+        return "\n".join(f'var hq_str_{code}="{value}";' for code in chunk)
+
+    monkeypatch.setattr(sina_hq, "_hq_request", fake_request)
+    temp_df = futures_zh_sina.futures_zh_spot(
+        symbol="V2409,A2409,IF2406", market="CF", adjust="1"
+    )
+    assert len(request_list) == 1
+    assert len(call_list) == 1
+    assert temp_df["exchange"].tolist() == [
+        "大连商品交易所",
+        "大连商品交易所",
+        "中国金融期货交易所",
+    ]
+    assert temp_df["contract_min_change"].tolist() == [1.0, 1.0, 0.2]
+    assert temp_df["contract_multiplier"].tolist() == [5, 10, 300]
+    assert temp_df["margin_rate"].iloc[0] == 7.0
+
+
+def test_futures_contract_spec_partial(monkeypatch):
+    """
+    交易规则请求失败时只有部分交易所的交易参数, 不缓存
+    """
+    call_list = []
+
+    def broken_rule(date):
+        call_list.append(date)
+        raise ConnectionError
+
+    monkeypatch.setattr(futures_contract_spec, "_spec_memory", {})
+    monkeypatch.setattr(futures_contract_spec, "futures_rule", broken_rule)
+    monkeypatch.setattr(futures_contract_spec, "futures_contract_info_dce", _fake_dce)
+    monkeypatch.setattr(futures_contract_spec, "futures_contract_info_gfex", pd.DataFrame)
+    monkeypatch.setattr(
+        futures_contract_spec, "futures_contract_info_czce", lambda date: pd.DataFrame()
+    )
+    spec_df = futures_contract_spec.futures_contract_spec(date="20240603")
+    assert spec_df.loc["V", "tick_size"] == 5.0
+    assert pd.isna(spec_df.loc["IF", "tick_size"])
+    assert futures_contract_spec._spec_memory == {}
+    first_count = len(call_list)
+    futures_contract_spec.futures_contract_spec(date="20240603")
+    assert len(call_list) == 2 * first_count
+
+
+if __name__ == "__main__":
+    pass
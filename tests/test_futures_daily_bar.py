@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 期货交易所日线行情测试
+"""
+
+import random
+import time
+
+import pandas as pd
+import requests
+
+from akshare.futures import futures_daily_bar
+from akshare.utils.context import get_cache_dir, set_cache_dir
+
+
+def test_czce_daily_error_page(monkeypatch, tmp_path):
+    """
+    郑商所返回错误状态码时不保存到原始数据库
+    """
+
+    class FakeResponse:
+        status_code = 502
+        text = "<html>Bad Gateway</html>"
+        content = text.encode("utf-8")
+
+        def raise_for_status(self):
+            raise requests.exceptions.HTTPError(response=self)
+
+    monkeypatch.setattr(
+        futures_daily_bar.requests, "get", lambda url, headers=None: FakeResponse()
+    )
+    old_cache_dir = get_cache_dir()
+    set_cache_dir(str(tmp_path))
+    try:
+        temp_df = futures_daily_bar.get_czce_daily(date="20240105")
+    finally:
+        set_cache_dir(old_cache_dir)
+    assert temp_df.empty
+    assert not (tmp_path / "raw").exists()
+
+
+def test_get_futures_daily(monkeypatch, tmp_path):
+    """
+    多个交易所并发请求时按交易日和交易所排序; 历史交易日的数据再次请求时从本地缓存读取
+    """
+    call_list = []
+
+    def fake_fetcher(market):
+        def fetcher(date):
+            call_list.append((market, date))
+            time.sleep(random.random() * 0.05)
+            return pd.DataFrame(
+                {
+                    "symbol": [f" {market}{date[-2:]} ", f"{market}efp"],
+                    "close": ["100", "101"],
+                    "variety": [market, market],
+                }
+            )
+
+        return fetcher
+
+    for market in futures_daily_bar._futures_daily_func_map:
+        monkeypatch.setitem(
+            futures_daily_bar._futures_daily_func_map, market, fake_fetcher(market)
+        )
+    market_list = list(futures_daily_bar._futures_daily_func_map)
+    old_cache_dir = get_cache_dir()
+    set_cache_dir(str(tmp_path))
+    try:
+        temp_df = futures_daily_bar.get_futures_daily(
+            start_date="20240104", end_date="20240107", market="ALL"
+        )
+        assert len(call_list) == 2 * len(market_list)
+        assert temp_df["date"].tolist() == ["20240104"] * len(market_list) + [
+            "20240105"
+        ] * len(market_list)
+        assert temp_df["market"].tolist() == market_list * 2
+        assert temp_df["symbol"].tolist()[:2] == [
+            f"{market_list[0]}04",
+            f"{market_list[1]}04",
+        ]
+        assert temp_df["close"].dtype == "float64"
+
+        call_list.clear()
+        cached_df = futures_daily_bar.get_futures_daily(
+            start_date="20240104", end_date="20240107", market="ALL"
+        )
+        assert call_list == []
+        pd.testing.assert_frame_equal(cached_df, temp_df)
+
+        single_df = futures_daily_bar.get_futures_daily(
+            start_date="20240104", end_date="20240105", market="dce", use_cache=False
+        )
+        assert call_list == [("DCE", "20240104"), ("DCE", "20240105")]
+        assert "market" not in single_df.columns
+    finally:
+        set_cache_dir(old_cache_dir)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 新浪财经-期货-主力合约批量识别测试
+"""
+
+from akshare.futures import futures_main_contract, futures_zh_sina
+from akshare.utils.context import get_cache_dir, set_cache_dir
+
+_NODE_DATA = {
+    "pvc_qh": [
+        {"symbol": "V0", "name": "PVC连续", "trade": "6000", "position": "900", "volume": "50"},
+        {"symbol": "V2409", "name": "PVC2409", "trade": "6000", "position": "900", "volume": "50"},
+        {"symbol": "V2501", "name": "PVC2501", "trade": "6100", "position": "300", "volume": "80"},
+    ],
+    "if_qh": [
+        {"symbol": "IF2406", "name": "IF2406", "trade": "3500", "position": "100", "volume": "20"},
+        {"symbol": "IF2407", "name": "IF2407", "trade": "3510", "position": "100", "volume": "30"},
+    ],
+    "empty_qh": [],
+}
+
+
+def test_futures_main_contract_sina(monkeypatch, tmp_path):
+    """
+    品种列表只请求一次; 剔除连续合约后按持仓量和成交量识别主力合约, 同一交易日只请求一次并记录切换
+    """
+    old_cache_dir = get_cache_dir()
+    set_cache_dir(str(tmp_path))
+    try:
+        monkeypatch.setattr(futures_main_contract, "_main_contract_memory", {})
+        exchange_call_list = []
+        node_call_list = []
+
+        def fake_exchange():
+            exchange_call_list.append(1)
+            return {
+                "dce": [("PVC", "pvc_qh"), ("空", "empty_qh")],
+                "cffex": [("沪深300", "if_qh")],
+            }
+
+        def fake_node(node):
+            node_call_list.append(node)
+            return _NODE_DATA[node]
+
+        monkeypatch.setattr(futures_main_contract, "_exchange_node_dict", fake_exchange)
+        monkeypatch.setattr(futures_main_contract, "_node_request", fake_node)
+        monkeypatch.setattr(futures_main_contract.cons, "get_current_trading_day", lambda: "20240603")
+        temp_df = futures_main_contract.futures_main_contract_sina()
+        assert temp_df["symbol"].tolist() == ["V2409", "IF2407"]
+        assert temp_df["position"].tolist() == [900, 100]
+        assert futures_zh_sina.match_main_contract(symbol="cffex") == "IF2407"
+        assert len(exchange_call_list) == 1
+        assert sorted(node_call_list) == ["empty_qh", "if_qh", "pvc_qh"]
+
+        _NODE_DATA["pvc_qh"][2]["position"] = "1000"
+        monkeypatch.setattr(futures_main_contract, "_main_contract_memory", {})
+        monkeypatch.setattr(futures_main_contract.cons, "get_current_trading_day", lambda: "20240604")
+        futures_main_contract.futures_main_contract_sina()
+        _NODE_DATA["pvc_qh"][2]["position"] = "300"
+        roll_df = futures_main_contract.futures_main_contract_roll_sina()
+        assert roll_df.to_dict("records") == [
+            {
+                "date": "20240604",
+                "exchange": "dce",
+                "variety": "PVC",
+                "from": "V2409",
+                "to": "V2501",
+            }
+        ]
+
+        # 部分品种请求失败时返回已获取的结果, 不缓存
+        node_call_list.clear()
+        monkeypatch.setattr(futures_main_contract.time, "sleep", lambda seconds: None)
+        monkeypatch.setattr(futures_main_contract.cons, "get_current_trading_day", lambda: "20240605")
+
+        def broken_node(node):
+            node_call_list.append(node)
+            if node == "pvc_qh":
+                raise ConnectionError
+            return _NODE_DATA[node]
+
+        monkeypatch.setattr(futures_main_contract, "_node_request", broken_node)
+        temp_df = futures_main_contract.futures_main_contract_sina()
+        assert temp_df["symbol"].tolist() == ["IF2407"]
+        assert node_call_list.count("pvc_qh") == 2
+        assert "20240605" not in futures_main_contract.list_keys("futures_main_contract")
+        monkeypatch.setattr(futures_main_contract, "_node_request", fake_node)
+        temp_df = futures_main_contract.futures_main_contract_sina()
+        assert temp_df["symbol"].tolist() == ["V2409", "IF2407"]
+    finally:
+        set_cache_dir(old_cache_dir)
+
+
+if __name__ == "__main__":
+    pass
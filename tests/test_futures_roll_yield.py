@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 展期收益率测试
+"""
+
+import pandas as pd
+import pytest
+
+from akshare.futures.futures_roll_yield import _roll_yield_panel, get_roll_yield
+
+
+def test_roll_yield_panel():
+    """
+    分组计算的结果与逐个品种计算的 get_roll_yield 一致
+    """
+    daily_df = pd.DataFrame(
+        {
+            "date": ["20240103"] * 7,
+            "symbol": ["rb2405", "rb2410", "rb2501", "MA405", "MA501", "MAefp", "IO2401"],
+            "variety": ["RB", "RB", "RB", "MA", "MA", "MA", "IO"],
+            "close": [3900.0, 3800.0, 3700.0, 2500.0, 2400.0, 1.0, 10.0],
+            "open_interest": [1000, 3000, 10, 500, 900, 99999, 99999],
+        }
+    )
+    panel_df = _roll_yield_panel(daily_df).set_index("variety")
+    assert sorted(panel_df.index) == ["MA", "RB"]
+    for var in ["RB", "MA"]:
+        roll_yield, near_by, deferred = get_roll_yield("20240103", var, df=daily_df)
+        assert panel_df.loc[var, "roll_yield"] == pytest.approx(roll_yield)
+        assert panel_df.loc[var, "near_by"] == near_by
+        assert panel_df.loc[var, "deferred"] == deferred
+    assert panel_df.loc["RB", "dominant"] == "rb2410"
+
+
+if __name__ == "__main__":
+    test_roll_yield_panel()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 东方财富镜像主机对冲请求测试
+"""
+
+import time
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from akshare.utils import hedge
+
+URL = "https://82.push2.eastmoney.com/api/qt/clist/get"
+
+
+class FakeResponse:
+    def __init__(self, host):
+        self.host = host
+        self.ok = True
+
+
+@pytest.fixture()
+def policy():
+    old_policy = dict(hedge.EM_HEDGE_POLICY["snapshot"])
+    hedge.host_latency.clear()
+    hedge.set_em_hedge_policy(
+        "snapshot",
+        hosts=["82.push2.eastmoney.com", "80.push2.eastmoney.com"],
+        delay=0.05,
+    )
+    yield
+    hedge.EM_HEDGE_POLICY["snapshot"] = old_policy
+    hedge.host_latency.clear()
+
+
+def test_hedged_get(monkeypatch, policy):
+    """
+    首选主机停顿时向镜像发送对冲请求并返回先到的结果; 之后首选延迟较低的主机, 请求失败时改用下一个镜像
+    """
+    call_list = []
+    slow_host = {"82.push2.eastmoney.com"}
+
+    def fake_get(url, params=None, timeout=None):
+        host = urlsplit(url).hostname
+        call_list.append(host)
+        if host in slow_host:
+            time.sleep(0.5)
+        return FakeResponse(host)
+
+    monkeypatch.setattr(hedge.requests, "get", fake_get)
+    assert hedge.em_hedge_family(URL) == "snapshot"
+    assert hedge.em_hedge_family("https://push2his.eastmoney.com/api/qt/clist/get") is None
+    start = time.monotonic()
+    r = hedge.hedged_get(URL, params={"pn": "1"})
+    assert r.host == "80.push2.eastmoney.com"
+    assert time.monotonic() - start < 0.4
+    assert call_list == ["82.push2.eastmoney.com", "80.push2.eastmoney.com"]
+
+    call_list.clear()
+    assert hedge.hedged_get(URL).host == "80.push2.eastmoney.com"
+    assert call_list == ["80.push2.eastmoney.com"]
+
+    def broken_get(url, params=None, timeout=None):
+        host = urlsplit(url).hostname
+        call_list.append(host)
+        if host == "80.push2.eastmoney.com":
+            raise requests.exceptions.ConnectionError
+        return FakeResponse(host)
+
+    call_list.clear()
+    monkeypatch.setattr(hedge.requests, "get", broken_get)
+    assert hedge.hedged_get(URL).host == "82.push2.eastmoney.com"
+    assert call_list == ["80.push2.eastmoney.com", "82.push2.eastmoney.com"]
+    stats_df = hedge.em_hedge_stats().set_index("host")
+    assert stats_df.loc["80.push2.eastmoney.com", "error"] == 1
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 按需加载测试
+"""
+
+import subprocess
+import sys
+
+import akshare as ak
+from akshare._api_index import API_INDEX
+from akshare.tool.importcost import import_cost
+from akshare.tool.lazy_index import build_index
+
+# import akshare 自身(不含 pandas)允许的最大耗时, 单位: 秒
+IMPORT_TIME_BUDGET = 0.3
+
+
+def test_api_index_up_to_date():
+    """
+    akshare/_api_index.py 与 akshare/__init__.py 中登记的接口一致
+    """
+    assert build_index() == API_INDEX
+
+
+def test_api_index_resolves():
+    """
+    索引中的每个接口都可以正常访问, 且出现在 dir(ak) 中
+    """
+    name_list = dir(ak)
+    for name in API_INDEX:
+        assert getattr(ak, name) is not None
+        assert name in name_list
+
+
+def test_star_import():
+    """
+    from akshare import * 导入所有登记的接口
+    """
+    assert ak.__all__ == list(API_INDEX)
+    namespace = {}
+    exec("from akshare import *", namespace)
+    assert "stock_zh_a_hist" in namespace
+    assert callable(namespace["futures_zh_spot"])
+
+
+def test_import_time():
+    """
+    import akshare 不导入任何接口模块, 耗时不超过预算
+    """
+    code = (
+        "import sys, time\n"
+        "import pandas\n"
+        "start = time.perf_counter()\n"
+        "import akshare\n"
+        "print(time.perf_counter() - start)\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split("\n")
+    module_list = output[1].split()
+    assert "akshare.stock_feature.stock_hist_em" not in module_list
+    assert "bs4" not in module_list
+    assert "py_mini_racer" not in module_list
+    assert float(output[0]) < IMPORT_TIME_BUDGET
+
+
+def test_heavy_dependency_deferred():
+    """
+    导入接口模块时不加载 py_mini_racer, bs4 等重型依赖
+    """
+    temp_df = import_cost(
+        module_list=[
+            "akshare.futures.futures_zh_sina",
+            "akshare.futures.cot",
+            "akshare.stock.stock_zh_a_sina",
+            "akshare.stock_a.stock_zh_a_spot",
+        ]
+    )
+    assert (temp_df["error"] == "").all()
+    assert (temp_df["heavy"] == "").all()
+
+
+if __name__ == "__main__":
+    test_api_index_up_to_date()
+    test_api_index_resolves()
+    test_import_time()
+    test_heavy_dependency_deferred()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 期权链隐含波动率和希腊字母测试
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from akshare.option import option_finance_sina, option_greeks
+
+
+def test_implied_vol_round_trip():
+    """
+    由模型价格反解的隐含波动率与原波动率一致, 超出无套利区间的价格返回 NaN
+    """
+    strike = np.linspace(2.0, 3.0, 21)
+    is_call = np.arange(21) % 2 == 0
+    sigma = 0.15 + 0.2 * (strike - 2.5) ** 2
+    price = option_greeks._bsm_price(is_call, 2.5, strike, 0.25, 0.02, 0.0, sigma)
+    implied = option_greeks.option_implied_vol(price, is_call, 2.5, strike, 0.25)
+    np.testing.assert_allclose(implied, sigma, atol=1e-6)
+    assert np.isnan(option_greeks.option_implied_vol(0.01, True, 2.5, 2.0, 0.25)[()])
+
+
+def test_option_surface():
+    """
+    虚值期权构成波动率微笑, 到期日之间按总方差插值
+    """
+    chain_df = pd.DataFrame(
+        {
+            "期权类型": ["看涨", "看跌"] * 4,
+            "行权价": [2.4, 2.4, 2.6, 2.6] * 2,
+            "期权价格": np.nan,
+            "标的价格": 2.5,
+            "剩余年限": [0.1] * 4 + [0.5] * 4,
+        }
+    )
+    sigma = np.where(chain_df["剩余年限"] == 0.1, 0.3, 0.2)
+    chain_df["期权价格"] = option_greeks._bsm_price(
+        chain_df["期权类型"] == "看涨",
+        2.5,
+        chain_df["行权价"],
+        chain_df["剩余年限"],
+        0.02,
+        0.0,
+        sigma,
+    )
+    greeks_df = option_greeks.option_chain_greeks(chain_df)
+    assert greeks_df["Delta"].iloc[0] > 0 > greeks_df["Delta"].iloc[1]
+    surface = option_greeks.OptionSurface(greeks_df)
+    assert surface.expiries == [0.1, 0.5]
+    assert list(surface.smile().index) == [2.4, 2.6]
+    expected = np.sqrt((0.3**2 * 0.1 + 0.2**2 * 0.5) / 2 / 0.3)
+    assert surface.iv(2.5, 0.3)[()] == pytest.approx(expected, rel=1e-5)
+
+
+def test_cffex_greeks(monkeypatch):
+    """
+    中金所期权由平价公式推出远期价格, 使用 Black-76 模型
+    """
+    strike = np.array([3400.0, 3500.0, 3600.0])
+    forward = 3520.0
+    years = (pd.Timestamp("2024-04-19") - pd.Timestamp("2024-03-20")).days / 365
+    call = option_greeks._bsm_price(True, forward, strike, years, 0.02, 0.02, 0.2)
+    put = option_greeks._bsm_price(False, forward, strike, years, 0.02, 0.02, 0.2)
+    spot_df = pd.DataFrame(
+        {
+            "看涨合约-最新价": call,
+            "行权价": strike,
+            "看涨合约-标识": [f"io2404C{int(item)}" for item in strike],
+            "看跌合约-最新价": put,
+            "看跌合约-标识": [f"io2404P{int(item)}" for item in strike],
+        }
+    )
+    monkeypatch.setattr(
+        option_finance_sina, "option_cffex_hs300_spot_sina", lambda symbol: spot_df
+    )
+    greeks_df = option_greeks.option_cffex_greeks_sina(
+        symbol="io2404", trade_date="20240320"
+    )
+    assert len(greeks_df) == 6
+    assert greeks_df["标的价格"].iloc[0] == pytest.approx(forward)
+    np.testing.assert_allclose(greeks_df["隐含波动率"], 0.2, atol=1e-6)
+
+
+if __name__ == "__main__":
+    test_implied_vol_round_trip()
+    test_option_surface()
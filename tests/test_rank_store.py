@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 期货持仓排名库测试
+"""
+
+import datetime
+
+import pandas as pd
+
+from akshare.futures import cot
+from akshare.utils.cache import list_keys
+from akshare.utils.context import get_cache_dir, set_cache_dir
+
+
+def test_rank_store_update(monkeypatch, tmp_path):
+    """
+    请求失败和部分品种请求失败的交易日不保存, 没有数据的交易日保存为空字典;
+    再次更新时从最后一个已保存交易日之后继续, 指定开始日期时补齐之前的空缺
+    """
+    call_list = []
+    broken = {"20200106"}
+    partial = {"20200107"}
+    empty = {"20200108"}
+
+    def fake_fetch(exchange, date, vars_list):
+        date_str = date.strftime("%Y%m%d")
+        call_list.append(date_str)
+        if date_str in broken:
+            return {}, False
+        if date_str in empty:
+            return {}, True
+        data = {"A2005": pd.DataFrame({"rank": [1], "vol": [100]})}
+        if date_str in partial:
+            return data, False
+        return data, True
+
+    monkeypatch.setattr(cot, "_rank_table_fetch", fake_fetch)
+    monkeypatch.setattr(
+        cot,
+        "calendar",
+        ["20200102", "20200103", "20200106", "20200107", "20200108", "20200109"],
+    )
+    monkeypatch.setattr(cot, "rank_start_date", {"DCE": "20200102"})
+    old_cache_dir = get_cache_dir()
+    set_cache_dir(str(tmp_path))
+    try:
+        result_df = cot.get_rank_store_update(end_day="20200108")
+        assert result_df["count"].tolist()[:2] == [1, 1]
+        assert result_df["count"].isna().tolist() == [False, False, True, True, False]
+        assert result_df["count"].iloc[-1] == 0
+        assert list_keys("rank_store/DCE") == ["20200102", "20200103", "20200108"]
+
+        # 没有数据的交易日不再请求, 从最后一个已保存交易日之后继续
+        call_list.clear()
+        result_df = cot.get_rank_store_update(end_day="20200109")
+        assert call_list == ["20200109"]
+        assert cot._rank_table_exchange("DCE", "20200108", ["A"]) == {}
+        assert call_list == ["20200109"]
+
+        call_list.clear()
+        broken.clear()
+        partial.clear()
+        result_df = cot.get_rank_store_update(start_day="20200102", end_day="20200109")
+        assert call_list == ["20200106", "20200107"]
+        assert result_df["count"].tolist() == [1, 1]
+        assert len(list_keys("rank_store/DCE")) == 6
+
+        call_list.clear()
+        data = cot._rank_table_exchange("DCE", "20200106", ["A"])
+        assert call_list == []
+        assert data["A2005"]["vol"].tolist() == [100]
+    finally:
+        set_cache_dir(old_cache_dir)
+
+
+def test_rank_table_fetch_partial(monkeypatch):
+    """
+    单个合约以空字典或空表代替明细时视为部分品种请求失败
+    """
+    monkeypatch.setattr(
+        cot,
+        "futures_dce_position_rank",
+        lambda date, vars_list: {
+            "a2005": pd.DataFrame({"rank": [1]}),
+            "a2009": {},
+        },
+    )
+    data, complete = cot._rank_table_fetch("DCE", datetime.date(2020, 1, 2), ["A"])
+    assert not complete
+    assert list(data) == ["a2005", "a2009"]
+
+
+if __name__ == "__main__":
+    pass
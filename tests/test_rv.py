@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 已实现波动率测试
+"""
+
+import numpy as np
+import pandas as pd
+
+from akshare.cal.rv import (
+    RealizedVolatilityEngine,
+    volatility_rv_daily,
+    volatility_rv_rolling,
+)
+
+
+def _minute_panel(symbol_list: list, days: int = 3, bars: int = 48) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    time_list = [
+        pd.Timestamp("2024-01-02 09:30") + pd.Timedelta(days=day, minutes=5 * i)
+        for day in range(days)
+        for i in range(bars)
+    ]
+    big_df = []
+    for symbol in symbol_list:
+        close = 10 * np.exp(np.cumsum(rng.normal(0, 0.002, len(time_list))))
+        open_ = close * np.exp(rng.normal(0, 0.001, len(time_list)))
+        high = np.maximum(open_, close) * np.exp(rng.uniform(0, 0.002, len(time_list)))
+        low = np.minimum(open_, close) * np.exp(-rng.uniform(0, 0.002, len(time_list)))
+        big_df.append(
+            pd.DataFrame(
+                {
+                    "symbol": symbol,
+                    "datetime": time_list,
+                    "open": open_,
+                    "high": high,
+                    "low": low,
+                    "close": close,
+                }
+            )
+        )
+    return pd.concat(big_df, ignore_index=True)
+
+
+def test_volatility_rv_daily():
+    """
+    按交易日的 Yang-Zhang 波动率与逐日直接计算的结果一致
+    """
+    panel_df = _minute_panel(["000001", "600000"])
+    daily_df = volatility_rv_daily(panel_df)
+    temp_df = panel_df.copy()
+    temp_df["prev_close"] = temp_df.groupby("symbol")["close"].shift(1)
+    temp_df = temp_df.dropna()
+    temp_df["o"] = np.log(temp_df["open"] / temp_df["prev_close"])
+    temp_df["c"] = np.log(temp_df["close"] / temp_df["open"])
+    u = np.log(temp_df["high"] / temp_df["open"])
+    d = np.log(temp_df["low"] / temp_df["open"])
+    temp_df["rs"] = u * (u - temp_df["c"]) + d * (d - temp_df["c"])
+    expected = []
+    for _, group_df in temp_df.groupby(["symbol", temp_df["datetime"].dt.date]):
+        n = len(group_df)
+        k = 0.34 / (1.34 + (n + 1) / (n - 1))
+        expected.append(
+            np.sqrt(
+                group_df["o"].var()
+                + k * group_df["c"].var()
+                + (1 - k) * group_df["rs"].mean()
+            )
+        )
+    np.testing.assert_allclose(daily_df["yz"].to_numpy(), expected, rtol=1e-9)
+
+
+def test_volatility_rv_rolling():
+    """
+    滚动窗口的结果与逐只标的的 pandas 滚动计算一致, 增量计算与一次性计算一致
+    """
+    panel_df = _minute_panel(["000001", "000002", "600000"])
+    rolling_df = volatility_rv_rolling(panel_df, window=20)
+    for symbol, group_df in panel_df.groupby("symbol"):
+        hl = np.log(group_df["high"] / group_df["low"])
+        expected = np.sqrt((hl**2 / (4 * np.log(2))).rolling(20).mean())
+        result = rolling_df[rolling_df["symbol"] == symbol]["parkinson"]
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-9)
+
+    engine = RealizedVolatilityEngine(window=20)
+    update_list = [
+        engine.update(group_df) for _, group_df in panel_df.groupby("datetime")
+    ]
+    update_df = pd.concat(update_list).sort_values(["symbol", "datetime"])
+    pd.testing.assert_frame_equal(
+        update_df.reset_index(drop=True), rolling_df, check_exact=False, rtol=1e-9
+    )
+    pd.testing.assert_frame_equal(
+        engine.daily(), volatility_rv_daily(panel_df), check_exact=False, rtol=1e-9
+    )
+
+
+if __name__ == "__main__":
+    test_volatility_rv_daily()
+    test_volatility_rv_rolling()
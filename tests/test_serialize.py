@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: Arrow IPC 和 Parquet 序列化测试
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from akshare.cache import DiskStore
+from akshare.utils import cache, serialize
+from akshare.utils.cache import list_keys, load_frame, save_frame
+from akshare.utils.context import get_cache_dir, set_cache_dir
+
+
+def _frame(rows=10):
+    return pd.DataFrame(
+        {
+            "代码": [f"{i:06d}" for i in range(rows)],
+            "最新价": np.arange(rows, dtype="float64"),
+            "成交量": np.arange(rows, dtype="int64"),
+            "备注": ["a", 1] * (rows // 2),
+        }
+    )
+
+
+def test_serialize_roundtrip():
+    """
+    分批输出的 Arrow IPC 流与一次输出的结果一致; 混合类型的字段转换为字符串
+    """
+    temp_df = _frame()
+    chunk_list = list(serialize.iter_arrow_ipc(temp_df, chunk_rows=3))
+    assert len(chunk_list) == 6
+    result_df = serialize.from_arrow_ipc(b"".join(chunk_list))
+    assert result_df.equals(serialize.from_arrow_ipc(serialize.to_arrow_ipc(temp_df)))
+    assert result_df["最新价"].tolist() == temp_df["最新价"].tolist()
+    assert result_df["备注"].tolist() == ["a", "1"] * 5
+    result_df = pd.read_parquet(io.BytesIO(serialize.to_parquet_bytes(temp_df)))
+    assert result_df["代码"].tolist() == temp_df["代码"].tolist()
+
+
+def test_serialize_memory_map(tmp_path):
+    """
+    缓存的数据框保存为 Arrow IPC 文件, 读取时数值列引用映射的内存
+    """
+    temp_df = _frame().drop(columns="备注")
+    old_dir = get_cache_dir()
+    set_cache_dir(str(tmp_path))
+    try:
+        save_frame("futures_daily/DCE", "20240105", temp_df)
+        assert (tmp_path / "frame" / "futures_daily" / "DCE" / "20240105.arrow").exists()
+        assert list_keys("futures_daily/DCE") == ["20240105"]
+        result_df = load_frame("futures_daily/DCE", "20240105")
+    finally:
+        set_cache_dir(old_dir)
+    assert result_df.equals(temp_df)
+    value = result_df["最新价"].to_numpy()
+    assert not value.flags.owndata and not value.flags.writeable
+
+    store = DiskStore(str(tmp_path / "store"), file_format="arrow")
+    store.set("ab1234", temp_df, None)
+    assert store.get("ab1234").equals(temp_df)
+    # 兼容流格式的旧缓存文件
+    path = tmp_path / "stream.arrow"
+    path.write_bytes(serialize.to_arrow_ipc(temp_df))
+    assert serialize.read_arrow(path).equals(temp_df)
+    assert isinstance(serialize.to_arrow_ipc(temp_df), pa.Buffer)
+
+
+def test_disk_store_write_error(monkeypatch, tmp_path):
+    """
+    缓存文件写入失败时不缓存, 也不抛出异常, 如 Windows 下替换内存映射中的文件
+    """
+
+    def fake_write(path, data):
+        raise PermissionError("file is mapped")
+
+    store = DiskStore(str(tmp_path / "store"), file_format="arrow")
+    monkeypatch.setattr(cache, "_atomic_write", fake_write)
+    with pytest.warns(UserWarning):
+        store.set("ab1234", _frame().drop(columns="备注"), None)
+    assert store.get("ab1234") is None
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: akshare 数据服务测试
+"""
+
+import asyncio
+import io
+import threading
+import time
+
+import pandas as pd
+import pyarrow as pa
+from aiohttp.test_utils import TestClient, TestServer
+
+from akshare import server
+
+
+def test_server():
+    """
+    参数校验; 相同请求只调用一次接口; JSON, CSV, Arrow 和 Parquet 输出一致; /metrics 统计请求
+    """
+    call_list = []
+    lock = threading.Lock()
+
+    def stock_demo(symbol: str, days: int = 2, adjust: bool = False) -> pd.DataFrame:
+        """
+        演示接口
+        """
+        with lock:
+            call_list.append((symbol, days, adjust))
+        time.sleep(0.2)
+        return pd.DataFrame(
+            {"代码": [symbol] * days, "收盘": [float(i) for i in range(days)]}
+        )
+
+    async def _run():
+        app = server.create_app(functions={"stock_demo": stock_demo}, ttl=60)
+        async with TestClient(TestServer(app)) as client:
+            response = await client.get("/api")
+            assert await response.json() == ["stock_demo"]
+            response = await client.get("/api/stock_demo/schema")
+            schema = await response.json()
+            assert schema["doc"] == "演示接口"
+            assert [item["type"] for item in schema["params"]] == ["str", "int", "bool"]
+
+            assert (await client.get("/api/stock_demo")).status == 400
+            assert (await client.get("/api/stock_demo?symbol=1&days=x")).status == 400
+            assert (await client.get("/api/stock_demo?symbol=1&foo=1")).status == 400
+            assert (await client.get("/api/missing")).status == 404
+            assert (await client.get("/api/missing_2")).status == 404
+
+            response_list = await asyncio.gather(
+                *[client.get("/api/stock_demo?symbol=600000&days=3") for _ in range(5)]
+            )
+            assert [item.status for item in response_list] == [200] * 5
+            record_list = await response_list[0].json()
+            assert record_list == [
+                {"代码": "600000", "收盘": 0.0},
+                {"代码": "600000", "收盘": 1.0},
+                {"代码": "600000", "收盘": 2.0},
+            ]
+            assert call_list == [("600000", 3, False)]
+
+            response = await client.get(
+                "/api/stock_demo?symbol=600000&days=3&format=csv"
+            )
+            assert response.headers["X-Akshare-Source"] == "cache"
+            temp_df = pd.read_csv(io.StringIO(await response.text()), dtype={"代码": str})
+            assert temp_df["收盘"].tolist() == [0.0, 1.0, 2.0]
+            response = await client.get(
+                "/api/stock_demo?symbol=600000&days=3&format=arrow"
+            )
+            table = pa.ipc.open_stream(await response.read()).read_all()
+            assert table.column("代码").to_pylist() == ["600000"] * 3
+            response = await client.get(
+                "/api/stock_demo?symbol=600000&days=3&format=parquet"
+            )
+            temp_df = pd.read_parquet(io.BytesIO(await response.read()))
+            assert temp_df["收盘"].tolist() == [0.0, 1.0, 2.0]
+            assert call_list == [("600000", 3, False)]
+
+            await client.get("/api/stock_demo?symbol=600000&days=3&adjust=true")
+            assert call_list[-1] == ("600000", 3, True)
+
+            text = await (await client.get("/metrics")).text()
+            assert 'akshare_server_results_total{source="cache"} 3' in text
+            assert 'akshare_server_requests_total{endpoint="stock_demo",status="400"} 3' in text
+            assert 'akshare_server_requests_total{endpoint="_unknown",status="404"} 2' in text
+            assert "missing" not in text
+            assert "akshare_server_request_seconds_count" in text
+
+    asyncio.run(_run())
+
+
+def test_server_call_cancel():
+    """
+    首个请求被取消时, 合并等待的请求仍然得到结果
+    """
+    call_list = []
+
+    def stock_demo(symbol: str) -> pd.DataFrame:
+        call_list.append(symbol)
+        time.sleep(0.2)
+        return pd.DataFrame({"代码": [symbol]})
+
+    async def _run():
+        akshare_server = server.AkshareServer(functions={"stock_demo": stock_demo})
+        leader = asyncio.ensure_future(
+            akshare_server.call("stock_demo", stock_demo, {"symbol": "600000"})
+        )
+        await asyncio.sleep(0.05)
+        follower = asyncio.ensure_future(
+            akshare_server.call("stock_demo", stock_demo, {"symbol": "600000"})
+        )
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        value, source = await asyncio.wait_for(follower, timeout=2)
+        assert source == "coalesced"
+        assert value["代码"].tolist() == ["600000"]
+        assert leader.cancelled()
+        assert call_list == ["600000"]
+        assert akshare_server._inflight == {}
+
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    pass
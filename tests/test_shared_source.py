@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 共享数据源测试
+"""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from akshare.economic import macro_china
+from akshare.index import index_option_qvix
+from akshare.utils.shared_source import shared_source
+
+
+def test_shared_source_ttl():
+    """
+    有效期内并发调用只请求一次, 过期后重新请求
+    """
+    call_list = []
+
+    @shared_source(ttl=0.2)
+    def source(name):
+        call_list.append(name)
+        time.sleep(0.05)
+        return pd.DataFrame({"value": [1]})
+
+    thread_list = [threading.Thread(target=source, args=("a",)) for _ in range(5)]
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+    source("b")
+    assert call_list == ["a", "b"]
+    time.sleep(0.25)
+    source("a")
+    assert call_list == ["a", "b", "a"]
+
+
+def test_qvix_views(monkeypatch):
+    """
+    所有品种的 QVIX 日线只下载一次 k.csv
+    """
+    url_list = []
+
+    def fake_read_csv(url, **kwargs):
+        url_list.append(url)
+        temp_df = pd.DataFrame(np.arange(2 * 90).reshape(2, 90))
+        temp_df[0] = ["2024-01-02", "2024-01-03"]
+        return temp_df
+
+    index_option_qvix._optbbs_daily.clear()
+    monkeypatch.setattr(index_option_qvix.pd, "read_csv", fake_read_csv)
+    qvix_df = index_option_qvix.index_option_300etf_qvix()
+    qvix_dict = index_option_qvix.index_option_qvix_all()
+    index_option_qvix._optbbs_daily.clear()
+    assert len(url_list) == 1
+    assert list(qvix_df.columns) == ["date", "open", "high", "low", "close"]
+    assert list(qvix_df["open"]) == [9, 99]
+    assert list(qvix_dict["kcb"]["close"]) == [86, 176]
+
+
+def test_price_index_views(monkeypatch):
+    """
+    单个价格指数只请求该指标; 所有价格指数合并为一次请求, 从中截取各指标
+    """
+    params_list = []
+    record_list = [
+        {
+            "REPORT_DATE": f"2024-01-0{day} 00:00:00",
+            "INDICATOR_ID": indicator_id,
+            "INDICATOR_VALUE": day,
+            "CHANGE_RATE": 0.1,
+        }
+        for indicator_id in macro_china.EM_PRICE_INDEX_IDS.values()
+        for day in [2, 1]
+    ]
+
+    class FakeResponse:
+        def json(self):
+            return {"result": {"pages": 1, "data": record_list}}
+
+    def fake_get(url, params=None, **kwargs):
+        params_list.append(dict(params))
+        return FakeResponse()
+
+    macro_china._em_industry_index_source.clear()
+    monkeypatch.setattr(macro_china.requests, "get", fake_get)
+    energy_df = macro_china.macro_china_energy_index()
+    assert params_list[0]["filter"] == '(INDICATOR_ID in ("EMI00662539"))'
+    assert params_list[0]["sortColumns"] == "REPORT_DATE,INDICATOR_ID"
+    price_dict = macro_china.macro_china_price_index_all()
+    macro_china.macro_china_price_index_all()
+    macro_china._em_industry_index_source.clear()
+    assert len(params_list) == 4
+    assert params_list[2]["filter"].startswith('(INDICATOR_ID in ("EMI00009275",')
+    assert list(energy_df["最新值"]) == [1, 2]
+    assert "指标代码" not in energy_df.columns
+    assert len(price_dict) == len(macro_china.EM_PRICE_INDEX_IDS)
+
+
+if __name__ == "__main__":
+    test_shared_source_ttl()
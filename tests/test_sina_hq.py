@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 新浪财经-批量实时行情测试
+"""
+
+from akshare.option import option_finance_sina
+from akshare.utils import sina_hq
+
+_OP_FIELDS = ["1", "0.1"] + ["0"] * 30 + ["2024-01-02 10:00:00", "M", "T 01", "EBS", "510050", "50ETF购1月2400"] + ["0"] * 5
+_SO_FIELDS = ["50ETF购1月2400", "", "", "", "10", "0.5", "1.2", "-0.3", "0.2", "0.18", "0.11", "0.09", "510050C2401M02400", "2.4", "0.1", "0.098"]
+
+
+def _fake_request(requested):
+    def fake(chunk):
+        requested.append(chunk)
+        line_list = []
+        for code in chunk:
+            if code.startswith("CON_OP_"):
+                value = ",".join(_OP_FIELDS)
+            elif code.startswith("CON_SO_"):
+                value = ",".join(_SO_FIELDS)
+            elif code.startswith("nf_IF"):
+                value = ",".join(["3500"] * 37 + ["10:00:00"] + ["0"] * 11 + ["沪深300指数期货2401"])
+            elif code.startswith("nf_"):
+                value = ",".join(["PVC2401", "100000", "6000"] + ["6001"] * 25)
+            else:
+                value = ""
+            line_list.append(f'var hq_str_{code}="{value}";')
+        return "\n".join(line_list)
+
+    return fake
+
+
+def test_sina_hq_quote(monkeypatch):
+    """
+    多个前缀合并请求并按代码数量拆分; 每个前缀按各自的字段解析, 无数据的代码被过滤
+    """
+    requested = []
+    monkeypatch.setattr(sina_hq, "_hq_request", _fake_request(requested))
+    quote_dict = sina_hq.sina_hq_quote(
+        ["CON_OP_10000001", "nf_V2401", "nf_IF2401", "sh000000", "CON_SO_10000001"],
+        chunk_size=2,
+    )
+    assert [len(item) for item in requested] == [2, 2, 1]
+    assert list(quote_dict) == ["CON_OP_", "nf_", "sh", "CON_SO_"]
+    assert quote_dict["CON_OP_"].loc["CON_OP_10000001", "买价"] == 0.1
+    assert quote_dict["CON_OP_"].loc["CON_OP_10000001", "标的股票"] == "510050"
+    nf_df = quote_dict["nf_"]
+    assert list(nf_df.index) == ["nf_V2401", "nf_IF2401"]
+    assert nf_df.loc["nf_V2401", "open"] == 6000
+    assert nf_df.loc["nf_IF2401", "symbol"] == "沪深300指数期货2401"
+    assert nf_df.loc["nf_IF2401", "time"] == "10:00:00"
+    assert quote_dict["sh"].empty
+
+
+def test_option_spot_price_batch(monkeypatch):
+    """
+    期权链的行情和希腊字母在一次请求中获取
+    """
+    requested = []
+    monkeypatch.setattr(sina_hq, "_hq_request", _fake_request(requested))
+    temp_df = option_finance_sina.option_sse_spot_price_batch_sina(
+        symbol_list=[str(10000001 + i) for i in range(300)]
+    )
+    assert len(requested) == 2
+    assert len(temp_df) == 300
+    assert temp_df["期权代码"].iloc[0] == "10000001"
+    assert temp_df["Delta"].iloc[-1] == 0.5
+    assert temp_df["理论价值"].iloc[0] == 0.098
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 实时行情轮询测试
+"""
+
+import queue
+
+import numpy as np
+import pandas as pd
+
+from akshare.utils.poller import SpotPoller
+
+
+def test_spot_poller_delta():
+    """
+    只输出变化的行; 新代码所有字段视为变化, 序号不参与比较, 缓冲区自动扩容
+    """
+    snapshot_list = [
+        pd.DataFrame(
+            {
+                "序号": [1, 2],
+                "代码": ["000001", "600000"],
+                "名称": ["平安银行", "浦发银行"],
+                "最新价": [10.0, np.nan],
+                "成交量": [100, 200],
+            }
+        ),
+        pd.DataFrame(
+            {
+                "序号": [1, 2, 3],
+                "代码": ["600000", "000001", "000002"],
+                "名称": ["浦发银行", "平安银行", "万科A"],
+                "最新价": [np.nan, 10.5, 8.0],
+                "成交量": [200, 100, 50],
+            }
+        ),
+    ]
+    out_queue = queue.Queue()
+    received = []
+    poller = SpotPoller(
+        lambda: snapshot_list.pop(0),
+        key_column="代码",
+        history_size=3,
+        callbacks=[lambda delta_df, mask_df: received.append(delta_df)],
+        out_queue=out_queue,
+        capacity=2,
+    )
+    delta_df, mask_df = poller.poll_once()
+    assert len(delta_df) == 2 and mask_df.drop(columns="代码").all().all()
+    delta_df, mask_df = poller.poll_once()
+    assert list(delta_df["代码"]) == ["000001", "000002"]
+    assert list(mask_df.loc[0, ["最新价", "成交量", "名称"]]) == [True, False, False]
+    assert len(received) == 2 and out_queue.qsize() == 2
+    snapshot_df = poller.snapshot().set_index("代码")
+    assert snapshot_df.loc["000001", "最新价"] == 10.5
+    assert snapshot_df.loc["000002", "名称"] == "万科A"
+    history_df = poller.history("最新价")
+    assert list(history_df["000001"]) == [10.0, 10.5]
+    assert np.isnan(history_df["000002"].iloc[0])
+
+
+if __name__ == "__main__":
+    test_spot_poller_delta()
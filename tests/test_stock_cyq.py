@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 筹码分布计算测试
+与东方财富网页中的 JS 算法逐日对比
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from akshare.stock_feature.stock_cyq_em import stock_cyq_calculate
+
+CYQ_JS = """
+// @ts-nocheck
+
+/**
+ * 计算分布及相关指标
+ * @param {number} index 当前选中的K线的索引
+ * @return {{x: Array.<number>, y: Array.<number>}}
+ */
+/**
+this.range = 120;
+*/
+function CYQCalculator(index, klinedata) {
+    var maxprice = 0;
+    var minprice = 0;
+    var factor = 150;
+    var start = this.range ? Math.max(0, index - this.range + 1) : 0;
+    /**
+     * K图数据[time,open,close,high,low,volume,amount,amplitude,turnoverRate]
+     */
+    var kdata = klinedata.slice(start, Math.max(1, index + 1));
+    if (kdata.length === 0) throw 'invaild index';
+    for (var i = 0; i < kdata.length; i++) {
+        var elements = kdata[i];
+        maxprice = !maxprice ? elements.high : Math.max(maxprice, elements.high);
+        minprice = !minprice ? elements.low : Math.min(minprice, elements.low);
+    }
+
+    // 精度不小于0.01 产品逻辑
+    var accuracy = Math.max(0.01, (maxprice - minprice) / (factor - 1));
+    /**
+     * 值域
+     * @type {Array.<number>}
+     */
+    var yrange = [];
+    for (var i = 0; i < factor; i++) {
+        yrange.push((minprice + accuracy * i).toFixed(2) / 1);
+    }
+    /**
+     * 横轴数据
+     */
+    var xdata = createNumberArray(factor);
+
+    for (var i = 0; i < kdata.length; i++) {
+        var eles = kdata[i];
+
+        var open = eles.open,
+            close = eles.close,
+            high = eles.high,
+            low = eles.low,
+            avg = (open + close + high + low) / 4,
+            turnoverRate = Math.min(1, eles.hsl / 100 || 0);
+
+        var H = Math.floor((high - minprice) / accuracy),
+            L = Math.ceil((low - minprice) / accuracy),
+            // G点坐标, 一字板时, X为进度因子
+            GPoint = [high == low ? factor - 1 : 2 / (high - low), Math.floor((avg - minprice) / accuracy)];
+        // 衰减
+        for (var n = 0; n < xdata.length; n++) {
+            xdata[n] *= (1 - turnoverRate);
+        }
+
+        if (high == low) {
+            // 一字板时，画矩形面积是三角形的2倍
+            xdata[GPoint[1]] += GPoint[0] * turnoverRate / 2;
+        } else {
+            for (var j = L; j <= H; j++) {
+                var curprice = minprice + accuracy * j;
+                if (curprice <= avg) {
+                    // 上半三角叠加分布分布
+                    if (Math.abs(avg - low) < 1e-8) {
+                        xdata[j] += GPoint[0] * turnoverRate;
+                    } else {
+                        xdata[j] += (curprice - low) / (avg - low) * GPoint[0] * turnoverRate;
+                    }
+                } else {
+                    // 下半三角叠加分布分布
+                    if (Math.abs(high - avg) < 1e-8) {
+                        xdata[j] += GPoint[0] * turnoverRate;
+                    } else {
+                        xdata[j] += (high - curprice) / (high - avg) * GPoint[0] * turnoverRate;
+                    }
+                }
+            }
+        }
+
+    }
+
+
+    var currentprice = klinedata[index].close;
+    var totalChips = 0;
+    for (var i = 0; i < factor; i++) {
+        var x = xdata[i].toPrecision(12) / 1;
+        //if (x < 0) xdata[i] = 0;
+        totalChips += x;
+    }
+    var result = new CYQData();
+    result.x = xdata;
+    result.y = yrange;
+    result.benefitPart = result.getBenefitPart(currentprice);
+    result.avgCost = getCostByChip(totalChips * 0.5).toFixed(2);
+    result.percentChips = {
+        '90': result.computePercentChips(0.9),
+        '70': result.computePercentChips(0.7)
+    };
+    return result;
+
+    /**
+     * 获取指定筹码处的成本
+     * @param {number} chip 堆叠筹码
+     */
+    function getCostByChip(chip) {
+        var result = 0,
+            sum = 0;
+        for (var i = 0; i < factor; i++) {
+            var x = xdata[i].toPrecision(12) / 1;
+            if (sum + x > chip) {
+                result = minprice + i * accuracy;
+                break;
+            }
+            sum += x;
+        }
+        return result;
+    }
+
+    /**
+     * 筹码分布数据
+     */
+    function CYQData() {
+        /**
+         * 筹码堆叠
+         * @type {Array.<number>}
+         */
+        this.x = arguments[0];
+        /**
+         * 价格分布
+         * @type {Array.<number>}
+         */
+        this.y = arguments[1];
+        /**
+         * 获利比例
+         * @type {number}
+         */
+        this.benefitPart = arguments[2];
+        /**
+         * 平均成本
+         * @type {number}
+         */
+        this.avgCost = arguments[3];
+        /**
+         * 百分比筹码
+         * @type {{Object.<string, {{priceRange: number[], concentration: number}}>}}
+         */
+        this.percentChips = arguments[4];
+        /**
+         * 计算指定百分比的筹码
+         * @param {number} percent 百分比大于0，小于1
+         */
+        this.computePercentChips = function (percent) {
+            if (percent > 1 || percent < 0) throw 'argument "percent" out of range';
+            var ps = [(1 - percent) / 2, (1 + percent) / 2];
+            var pr = [getCostByChip(totalChips * ps[0]), getCostByChip(totalChips * ps[1])];
+            return {
+                priceRange: [pr[0].toFixed(2), pr[1].toFixed(2)],
+                concentration: pr[0] + pr[1] === 0 ? 0 : (pr[1] - pr[0]) / (pr[0] + pr[1])
+            };
+        };
+        /**
+         * 获取指定价格的获利比例
+         * @param {number} price 价格
+         */
+        this.getBenefitPart = function (price) {
+            var below = 0;
+            for (var i = 0; i < factor; i++) {
+                var x = xdata[i].toPrecision(12) / 1;
+                if (price >= minprice + i * accuracy) {
+                    below += x;
+                }
+            }
+            return totalChips == 0 ? 0 : below / totalChips;
+        };
+    }
+}
+
+
+function createNumberArray(count) {
+    var array = [];
+    for (var i = 0; i < count; i++) {
+        array.push(0);
+    }
+    return array;
+}
+"""
+
+
+def _random_bar_df(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.round(10 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), 2)
+    open_ = np.round(close * (1 + rng.normal(0, 0.01, n)), 2)
+    high = np.round(np.maximum(open_, close) * (1 + rng.uniform(0, 0.02, n)), 2)
+    low = np.round(np.minimum(open_, close) * (1 - rng.uniform(0, 0.02, n)), 2)
+    # 一字板
+    high[n // 3] = low[n // 3] = open_[n // 3] = close[n // 3]
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=n).strftime("%Y-%m-%d"),
+            "open": open_,
+            "close": close,
+            "high": high,
+            "low": low,
+            "hsl": np.round(rng.uniform(0.2, 8, n), 2),
+        }
+    )
+
+
+def test_stock_cyq_calculate():
+    """
+    与网页 JS 算法的计算结果一致
+    """
+    py_mini_racer = pytest.importorskip("py_mini_racer")
+    ctx = py_mini_racer.MiniRacer()
+    ctx.eval(CYQ_JS)
+    bar_df = _random_bar_df(n=120, seed=1)
+    records = bar_df.to_dict(orient="records")
+    temp_df = stock_cyq_calculate(bar_df)
+    for i in range(len(records)):
+        data = ctx.call("CYQCalculator", i, records)
+        row = temp_df.iloc[i]
+        assert row["获利比例"] == pytest.approx(data["benefitPart"], abs=1e-9)
+        assert row["平均成本"] == pytest.approx(float(data["avgCost"]), abs=1e-9)
+        for percent in ["90", "70"]:
+            chips = data["percentChips"][percent]
+            assert row[f"{percent}成本-低"] == pytest.approx(
+                float(chips["priceRange"][0]), abs=1e-9
+            )
+            assert row[f"{percent}成本-高"] == pytest.approx(
+                float(chips["priceRange"][1]), abs=1e-9
+            )
+            assert row[f"{percent}集中度"] == pytest.approx(
+                chips["concentration"], abs=1e-9
+            )
+
+
+def test_stock_cyq_calculate_batch():
+    """
+    多只股票一次计算与逐只计算的结果一致
+    """
+    bar_df = pd.concat(
+        [
+            _random_bar_df(n=80, seed=2).assign(symbol="000001"),
+            _random_bar_df(n=60, seed=3).assign(symbol="600000"),
+        ],
+        ignore_index=True,
+    )
+    batch_df = stock_cyq_calculate(bar_df, symbol_column="symbol")
+    single_df = stock_cyq_calculate(bar_df[bar_df["symbol"] == "600000"])
+    pd.testing.assert_frame_equal(
+        batch_df[batch_df["symbol"] == "600000"]
+        .drop(columns="symbol")
+        .reset_index(drop=True),
+        single_df,
+    )
+
+
+if __name__ == "__main__":
+    test_stock_cyq_calculate()
+    test_stock_cyq_calculate_batch()
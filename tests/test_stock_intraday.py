@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 逐笔成交订阅测试
+"""
+
+import asyncio
+import json
+
+import pytest
+import requests
+
+from akshare.stock import stock_intraday_em
+
+DETAILS = [f"09:30:{i:02d},10.0{i % 10},{i + 1},0,{1 + i % 2}" for i in range(40)]
+
+
+def _event(details: list) -> str:
+    return "data: " + json.dumps({"data": {"details": details}}) + "\n"
+
+
+def test_new_details():
+    """
+    重连后推送的当日成交明细只保留未收到的部分
+    """
+    tail = DETAILS[:30][-stock_intraday_em._TAIL_SIZE :]
+    assert stock_intraday_em._new_details(tail, DETAILS) == DETAILS[30:]
+    assert stock_intraday_em._new_details(tail, DETAILS[:30]) == []
+    assert stock_intraday_em._new_details([], DETAILS[:3]) == DETAILS[:3]
+    # 推送的成交不晚于已收到的成交时没有新增
+    assert stock_intraday_em._new_details(["15:00:00,9.0,1,0,1"], DETAILS) == []
+    assert stock_intraday_em._new_details(["09:00:00,9.0,1,0,1"], DETAILS) == DETAILS
+
+
+def test_subscribe_reconnect(monkeypatch):
+    """
+    断线重连后不重复输出已收到的成交
+    """
+    connection_list = []
+
+    def fake_event_stream(url, params, timeout=None):
+        connection_list.append(params["secid"])
+        if len(connection_list) == 1:
+            yield _event(DETAILS[:20])
+            yield _event(DETAILS[20:25])
+            raise requests.ConnectionError("reset")
+        yield _event(DETAILS[:35])
+        yield _event(DETAILS[35:])
+
+    monkeypatch.setattr(stock_intraday_em, "__event_stream", fake_event_stream)
+    subscription = stock_intraday_em.stock_intraday_em_subscribe(
+        symbol_list=["000001"], reconnect_delay=0
+    )
+    batch_list = [next(subscription) for _ in range(4)]
+    subscription.close()
+    assert [len(item) for item in batch_list] == [20, 5, 10, 5]
+    assert list(batch_list[0].columns) == ["代码", "时间", "成交价", "手数", "买卖盘性质"]
+    assert batch_list[2]["时间"].iloc[0] == "09:30:25"
+    assert batch_list[0]["买卖盘性质"].iloc[0] == "卖盘"
+    assert connection_list[:2] == ["0.000001", "0.000001"]
+
+
+def test_subscribe_max_connections(monkeypatch):
+    """
+    订阅的股票数量超过最大连接数时不建立任何连接
+    """
+    connection_list = []
+
+    def fake_event_stream(url, params, timeout=None):
+        connection_list.append(params["secid"])
+        yield _event(DETAILS[:1])
+
+    monkeypatch.setattr(stock_intraday_em, "__event_stream", fake_event_stream)
+    subscription = stock_intraday_em.stock_intraday_em_subscribe(
+        symbol_list=["000001", "000002", "600000"], max_connections=2
+    )
+    with pytest.raises(ValueError):
+        next(subscription)
+
+    async def main():
+        subscription = stock_intraday_em.stock_intraday_em_subscribe_async(
+            symbol_list=["000001", "000002", "600000"], max_connections=2
+        )
+        with pytest.raises(ValueError):
+            await subscription.__anext__()
+
+    asyncio.run(main())
+    assert connection_list == []
+
+
+def test_subscribe_async(monkeypatch):
+    """
+    异步订阅: 服务端断开后重连, 不重复输出已收到的成交
+    """
+    web = pytest.importorskip("aiohttp.web")
+    request_count = []
+
+    async def handler(request):
+        request_count.append(request.query["secid"])
+        response = web.StreamResponse()
+        await response.prepare(request)
+        if len(request_count) == 1:
+            await response.write((_event(DETAILS[:20]) + "\n").encode())
+            return response
+        await response.write((_event(DETAILS[:30]) + "\n").encode())
+        await asyncio.sleep(1)
+        return response
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/sse", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        monkeypatch.setattr(
+            stock_intraday_em, "_INTRADAY_URL", f"http://127.0.0.1:{port}/sse"
+        )
+        batch_list = []
+        subscription = stock_intraday_em.stock_intraday_em_subscribe_async(
+            symbol_list=["600000"], reconnect_delay=0
+        )
+        async for batch in subscription:
+            batch_list.append(batch)
+            if len(batch_list) == 2:
+                break
+        await subscription.aclose()
+        await runner.cleanup()
+        return batch_list
+
+    batch_list = asyncio.run(main())
+    assert [len(item) for item in batch_list] == [20, 10]
+    assert request_count[:2] == ["1.600000", "1.600000"]
+
+
+if __name__ == "__main__":
+    test_new_details()
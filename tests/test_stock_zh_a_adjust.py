@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: A 股-本地复权计算测试
+"""
+
+import datetime
+
+import pandas as pd
+import pytest
+
+from akshare.stock import stock_zh_a_adjust
+from akshare.utils.context import get_cache_dir, set_cache_dir
+
+
+def _bar(date_list, close_list):
+    return pd.DataFrame(
+        {
+            "日期": date_list,
+            "开盘": close_list,
+            "收盘": close_list,
+            "最高": close_list,
+            "最低": close_list,
+            "涨跌额": [0.0] * len(date_list),
+            "涨跌幅": [0.0] * len(date_list),
+            "振幅": [0.0] * len(date_list),
+        }
+    )
+
+
+FACTOR_DF = pd.DataFrame(
+    {"date": ["2024-01-01", "2024-01-04"], "hfq_factor": [2.0, 4.0]}
+)
+
+
+def test_stock_zh_a_adjust_price():
+    """
+    按日期匹配当日适用的后复权因子; 前复权 = 不复权 * 当日后复权因子 / 最新后复权因子
+    """
+    bar_df = _bar(["2024-01-03", "2024-01-02", "2024-01-04", "2024-01-05"], [10.0, 10.0, 6.0, 6.0])
+    hfq_df = stock_zh_a_adjust.stock_zh_a_adjust_price(bar_df, FACTOR_DF, adjust="hfq")
+    assert hfq_df["收盘"].tolist() == [20.0, 20.0, 24.0, 24.0]
+    assert hfq_df["日期"].tolist() == bar_df["日期"].tolist()
+    qfq_df = stock_zh_a_adjust.stock_zh_a_adjust_price(bar_df, FACTOR_DF, adjust="qfq")
+    assert qfq_df["收盘"].tolist() == [5.0, 5.0, 6.0, 6.0]
+    assert qfq_df["涨跌幅"].iloc[2] == pytest.approx(20.0)
+
+    multi_df = pd.concat(
+        [bar_df.assign(code="A"), bar_df.assign(code="B")], ignore_index=True
+    )
+    factor_df = pd.concat(
+        [FACTOR_DF.assign(code="A"), FACTOR_DF.assign(code="B", hfq_factor=[1.0, 1.0])],
+        ignore_index=True,
+    )
+    multi_df = stock_zh_a_adjust.stock_zh_a_adjust_price(
+        multi_df, factor_df, adjust="qfq", symbol_column="code"
+    )
+    assert multi_df["收盘"].tolist() == [5.0, 5.0, 6.0, 6.0, 10.0, 10.0, 6.0, 6.0]
+
+
+def test_stock_zh_a_hist_adjust(monkeypatch, tmp_path):
+    """
+    交易日历结束后按工作日更新; 盘中当天未收盘的行情不保存
+    """
+    assert (
+        stock_zh_a_adjust._latest_close_date(datetime.datetime(2026, 10, 19, 10, 0))
+        == "20261016"
+    )
+    assert (
+        stock_zh_a_adjust._latest_close_date(datetime.datetime(2026, 10, 19, 16, 0))
+        == "20261019"
+    )
+    call_list = []
+
+    def fake_hist(symbol, start_date="19700101", adjust=""):
+        call_list.append(start_date)
+        date_list = [
+            item
+            for item in ["2026-10-15", "2026-10-16", "2026-10-19"]
+            if item.replace("-", "") >= start_date
+        ]
+        return _bar(date_list, [10.0] * len(date_list))
+
+    monkeypatch.setattr(stock_zh_a_adjust, "stock_zh_a_hist", fake_hist)
+    monkeypatch.setattr(
+        stock_zh_a_adjust, "stock_zh_a_daily", lambda symbol, adjust: FACTOR_DF
+    )
+    old_cache_dir = get_cache_dir()
+    set_cache_dir(str(tmp_path))
+    try:
+        monkeypatch.setattr(stock_zh_a_adjust, "_latest_close_date", lambda: "20261016")
+        temp_df = stock_zh_a_adjust.stock_zh_a_hist_adjust(symbol="000001", adjust="hfq")
+        assert temp_df["日期"].tolist() == ["2026-10-15", "2026-10-16"]
+        assert temp_df["收盘"].tolist() == [40.0, 40.0]
+        stock_zh_a_adjust.stock_zh_a_hist_adjust(symbol="000001")
+        assert call_list == ["19700101"]
+
+        monkeypatch.setattr(stock_zh_a_adjust, "_latest_close_date", lambda: "20261019")
+        temp_df = stock_zh_a_adjust.stock_zh_a_hist_adjust(symbol="000001", adjust="")
+        assert call_list == ["19700101", "20261017"]
+        assert temp_df["日期"].tolist() == ["2026-10-15", "2026-10-16", "2026-10-19"]
+    finally:
+        set_cache_dir(old_cache_dir)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 沪深京 A 股-多数据源实时行情测试
+"""
+
+import pandas as pd
+import pytest
+
+from akshare.stock import stock_zh_a_spot_multi
+from akshare.utils.hedge import HostLatency
+
+
+def _frame(code_list, price):
+    return pd.DataFrame(
+        {
+            "代码": code_list,
+            "名称": [f"股票{code}" for code in code_list],
+            "最新价": [price] * len(code_list),
+            "成交量": [100] * len(code_list),
+        }
+    )
+
+
+def test_stock_zh_a_spot_multi(monkeypatch):
+    """
+    首选数据源失败时切换到下一个数据源并降低其排序; merge 时用其余数据源补齐缺失的股票
+    """
+    call_list = []
+    health = {"em": False}
+
+    def fake_em(symbol_list):
+        call_list.append("em")
+        if not health["em"]:
+            raise ConnectionError
+        return _frame(["600000", "000001"], 10.0)
+
+    def fake_sina_hq(symbol_list):
+        call_list.append("sina_hq")
+        return _frame(["sh600000"], 11.0)
+
+    def fake_xq(symbol_list):
+        call_list.append("xq")
+        return _frame(["SH600000", "BJ430139"], 12.0)
+
+    def fake_sina(symbol_list):
+        call_list.append("sina")
+        return _frame(["sh600000", "sz000001", "bj430139"], 13.0)
+
+    monkeypatch.setattr(stock_zh_a_spot_multi, "source_latency", HostLatency())
+    monkeypatch.setattr(
+        stock_zh_a_spot_multi,
+        "_SOURCE_FUNC",
+        {"em": fake_em, "sina_hq": fake_sina_hq, "xq": fake_xq, "sina": fake_sina},
+    )
+    temp_df = stock_zh_a_spot_multi.stock_zh_a_spot_multi()
+    assert call_list == ["em", "sina"]
+    assert temp_df["数据源"].unique().tolist() == ["sina"]
+    assert temp_df["代码"].tolist() == ["600000", "000001", "430139"]
+    assert stock_zh_a_spot_multi.stock_zh_a_spot_sources() == ["sina", "em"]
+
+    call_list.clear()
+    monkeypatch.setattr(stock_zh_a_spot_multi, "source_latency", HostLatency())
+    temp_df = stock_zh_a_spot_multi.stock_zh_a_spot_multi(
+        symbol="430139,600000,000001", merge=True
+    )
+    assert call_list == ["sina_hq", "em", "xq", "sina"]
+    assert temp_df["代码"].tolist() == ["430139", "600000", "000001"]
+    assert temp_df["数据源"].tolist() == ["xq", "sina_hq", "sina"]
+    assert temp_df["最新价"].tolist() == [12.0, 11.0, 13.0]
+
+    monkeypatch.setattr(
+        stock_zh_a_spot_multi,
+        "_SOURCE_FUNC",
+        {key: fake_em for key in stock_zh_a_spot_multi.STOCK_SPOT_SOURCES},
+    )
+    with pytest.raises(ConnectionError):
+        stock_zh_a_spot_multi.stock_zh_a_spot_multi(symbol="600000")
+
+
+def test_spot_sina_hq_zero_price(monkeypatch):
+    """
+    停牌或集合竞价之前最新价为 0 时, 最新价、涨跌额和涨跌幅为空值
+    """
+    from akshare.utils import sina_hq
+
+    def fake_request(chunk):
+        line_list = []
+        for code in chunk:
+            price = "0.000" if code == "sh600000" else "11.000"
+            value = ",".join(
+                ["股票", price, "10.000", price, price, price, "0", "0", "100", "1000"]
+                + ["0"] * 20
+                + ["2026-10-19", "09:20:00", "00"]
+            )
+            line_list.append(f'var hq_str_{code}="{value}";')
+        return "\n".join(line_list)
+
+    monkeypatch.setattr(sina_hq, "_hq_request", fake_request)
+    temp_df = stock_zh_a_spot_multi._normalize(
+        stock_zh_a_spot_multi._spot_sina_hq(["600000", "000001"]), "sina_hq"
+    ).set_index("代码")
+    assert temp_df.loc["600000", ["最新价", "涨跌额", "涨跌幅"]].isna().all()
+    assert temp_df.loc["600000", "昨收"] == 10.0
+    assert temp_df.loc["000001", "涨跌幅"] == pytest.approx(10.0)
+
+
+if __name__ == "__main__":
+    pass